@@ -0,0 +1,794 @@
+#!/usr/bin/env python3
+
+import lojbanParser
+import sys
+import os
+import pickle
+import re
+import copy
+import time
+from io import StringIO
+from contextlib import redirect_stderr, redirect_stdout
+from concurrent.futures import ThreadPoolExecutor
+
+_USAGE = """Usage: benchLojbanParser.py BENCHMARK FILE [-n REPEAT] [PARSER OPTIONS]
+
+Benchmarks:
+	check	not a benchmark: runs the checks of the results on FILE (shared
+		memory released by parseMany, trees and messages of parseMany and
+		trees and errors of threads against serial parses, with the packrat
+		memo against without, and compounds and parses with the FIRST sets
+		of the compounder against without), and exits with status 1 at the
+		first one that fails; many, transport and threads also check theirs.
+	compound	the compounder alone (tokens read through _compound up to the
+		end of FILE); use a text heavy in tenses and connectives.
+	dumps	Token.dumps and Token.loads of the tree of FILE, against pickling the
+		same tree as nested tuples (type, text, children).
+	reduce	YACC reductions per second, replaying the token stream of FILE
+		through _yyparse so that the lexer and compounder are not timed.
+	core	shifts and reductions per second of _yyparse alone, replaying the
+		token stream of FILE with semantic actions that build nothing.
+	utterances	parses each non empty line of FILE as a separate text with
+		one parser, as a service does (try with and without --reusetokens).
+	lex	splitting of the words of FILE into cmene, brivla and cmavo, with
+		and without the cache of LojbanParser._lexword.
+	many	parses each non empty line of FILE as a separate document with
+		parseMany in 1, 2, 4, ... processes (up to the number of CPUs) and
+		checks the results against serial parseString calls.
+	packrat	compounder on 8 to 1024 copies of the tense or connective string
+		in FILE (such as "pu je ba je'i"), without (up to 128 copies) and
+		with --packrat.
+	transport	parses 8 copies of FILE with parseMany and gets the trees
+		back dumped through pipes, or in shared memory (and checks them).
+	selmao	classification of the cmavo of FILE: one _CMAVOTYPES lookup per
+		word against Constants.get_selmao.
+	threads	stress test: parses 32 texts cut from FILE in 32 threads, each with
+		its own LojbanParser, and checks the results against serial runs.
+"""
+
+def _expect(what, actual, expected):
+	"""
+	Checks that actual equals expected, or prints what differs and exits
+	with status 1.
+	"""
+	if actual != expected:
+		print("check failed: {:s}: got {:.200s}, expected {:.200s}".format( \
+			what, repr(actual), repr(expected)), file = sys.__stderr__)
+		sys.exit(1)
+	# end if actual != expected:
+# end def _expect(what, actual, expected):
+
+def _record(parser, txt):
+	"""
+	Parses txt once and returns the list of (type, value) pairs that
+	_yylex handed to the YACC parser, and the list of tokens of that parse
+	(which must be kept alive while the stream is replayed).
+	"""
+	stream = []
+	yylex = parser._yylex
+	def _recorder():
+		ttype = yylex()
+		stream.append((ttype, parser._yylval))
+		return ttype
+	# end def _recorder():
+	parser._yylex = _recorder
+	with redirect_stderr(StringIO()):
+		parser.parseString(txt)
+	# end with redirect_stderr(StringIO()):
+	del parser._yylex
+	return (stream, parser._tokenslist)
+# end def _record(parser, txt):
+
+def _replay(parser, stream):
+	"""
+	Runs _yyparse over a recorded token stream.
+	"""
+	tokens = iter(stream)
+	def _player():
+		(ttype, parser._yylval) = next(tokens, stream[-1])
+		return ttype
+	# end def _player():
+	parser._yylex = _player
+	parser.reset()
+	failed = parser._yyparse(yymaxdepth = parser._parameters.yymaxdepth, \
+		yyredmax = parser._parameters.yyredmax)
+	del parser._yylex
+	return failed
+# end def _replay(parser, stream):
+
+def bench_packrat(parser, txt, repeat):
+	"""
+	Worst case of the compounder: texts made of 8, 16, ... 1024 copies of a
+	tense or connective string txt (such as "pu je ba je'i") between "mi"
+	and "klama", compounded without (up to 128 copies) and with the packrat
+	memo, with the time per compound.
+	"""
+	unit = " ".join(txt.split()) + " "
+	print("copies  plain ms  backtracks  packrat ms  backtracks  us/compound")
+	for copies in (8, 16, 32, 64, 128, 256, 512, 1024):
+		text = "mi " + unit * copies + "klama"
+		row = "{:6d}".format(copies)
+		for packrat in (False, True):
+			if not packrat and copies > 128:
+				row += "  {:8s}  {:10s}".format("", "")
+				continue
+			# end if not packrat and copies > 128:
+			parser._parameters._packrat = packrat
+			(ntokens, best) = _compounding(parser, text, repeat)
+			row += "  {:8.1f}  {:10d}".format(best * 1000, parser.backtracks)
+		# end for packrat in (False, True):
+		print(row + "  {:11.1f}".format(best * 1e6 / ntokens))
+	# end for copies in (8, 16, 32, 64, 128, 256, 512, 1024):
+# end def bench_packrat(parser, txt, repeat):
+
+def bench_reduce(parser, txt, repeat):
+	"""
+	Measures YACC reductions per second.
+	"""
+	(stream, tokens) = _record(parser, txt)
+	reductions = [0]
+	def _counted(method):
+		def _count(*args):
+			reductions[0] += 1
+			return method(*args)
+		# end def _count(*args):
+		return _count
+	# end def _counted(method):
+	for name in ("_node", "_elidable", "_toplevel"):
+		setattr(parser, name, _counted(getattr(parser, name)))
+	# end for name in ("_node", "_elidable", "_toplevel"):
+	failed = _replay(parser, stream)
+	for name in ("_node", "_elidable", "_toplevel"):
+		delattr(parser, name)
+	# end for name in ("_node", "_elidable", "_toplevel"):
+	best = None
+	for i in range(repeat):
+		starttime = time.perf_counter()
+		_replay(parser, stream)
+		elapsed = time.perf_counter() - starttime
+		best = elapsed if best is None or elapsed < best else best
+	# end for i in range(repeat):
+	print("tokens          : {:d}".format(len(stream)))
+	print("reductions      : {:d}{:s}".format(reductions[0], \
+		" (syntax error)" if failed else ""))
+	print("best of {:d}       : {:.3f} s".format(repeat, best))
+	print("reductions/s    : {:.0f}".format(reductions[0] / best))
+# end def bench_reduce(parser, txt, repeat):
+
+def bench_core(parser, txt, repeat):
+	"""
+	Measures the table driven part of _yyparse alone: the token stream of
+	txt is replayed with semantic actions that build nothing.
+	"""
+	(stream, tokens) = _record(parser, txt)
+	reductions = [0]
+	def _action(*args):
+		reductions[0] += 1
+		return None
+	# end def _action(*args):
+	for name in ("_node", "_elidable", "_toplevel"):
+		setattr(parser, name, _action)
+	# end for name in ("_node", "_elidable", "_toplevel"):
+	failed = _replay(parser, stream)
+	count = reductions[0]
+	best = None
+	for i in range(repeat):
+		starttime = time.perf_counter()
+		_replay(parser, stream)
+		elapsed = time.perf_counter() - starttime
+		best = elapsed if best is None or elapsed < best else best
+	# end for i in range(repeat):
+	for name in ("_node", "_elidable", "_toplevel"):
+		delattr(parser, name)
+	# end for name in ("_node", "_elidable", "_toplevel"):
+	print("tokens          : {:d}".format(len(stream)))
+	print("reductions      : {:d}{:s}".format(count, \
+		" (syntax error)" if failed else ""))
+	print("best of {:d}       : {:.3f} s".format(repeat, best))
+	print("actions/s       : {:.0f}".format((len(stream) + count) / best))
+# end def bench_core(parser, txt, repeat):
+
+def bench_utterances(parser, txt, repeat):
+	"""
+	Measures parses per second of short texts (the lines of txt) with one
+	parser, and the memory used for tokens.
+	"""
+	utterances = [line for line in txt.splitlines() if line.strip()]
+	best = None
+	maxspace = 0
+	with redirect_stderr(StringIO()):
+		for i in range(repeat):
+			starttime = time.perf_counter()
+			for utterance in utterances:
+				parser.parseString(utterance)
+				maxspace = max(maxspace, parser.tokspace)
+			# end for utterance in utterances:
+			elapsed = time.perf_counter() - starttime
+			best = elapsed if best is None or elapsed < best else best
+		# end for i in range(repeat):
+	# end with redirect_stderr(StringIO()):
+	print("utterances      : {:d}".format(len(utterances)))
+	print("best of {:d}       : {:.3f} s".format(repeat, best))
+	print("utterances/s    : {:.0f}".format(len(utterances) / best))
+	print("max tokspace    : {:d} bytes".format(maxspace))
+	if parser.tokenarena:
+		print("arena high-water: {:d} tokens, {:d} bytes".format( \
+			parser.tokenarena.highwater, parser.tokenarena.highwaterspace))
+		print("arena capacity  : {:d} tokens, {:d} bytes".format( \
+			len(parser.tokenarena), parser.tokenarena.space))
+	# end if parser.tokenarena:
+# end def bench_utterances(parser, txt, repeat):
+
+def _nested(tok):
+	"""
+	Returns a tree of tokens as nested tuples (type, text, children).
+	"""
+	children = []
+	child = tok.downleft
+	while not child is None:
+		children.append(_nested(child))
+		child = child.right
+	# end while not child is None:
+	return (tok.ttype, tok.text, tuple(children))
+# end def _nested(tok):
+
+def _unnested(nested):
+	"""
+	Returns the tree of tokens of nested tuples made by _nested.
+	"""
+	(ttype, text, children) = nested
+	tok = lojbanParser.Token(ttype)
+	tok.text = text
+	for child in children:
+		tok.add(_unnested(child))
+	# end for child in children:
+	return tok
+# end def _unnested(nested):
+
+def _compounding(parser, txt, repeat):
+	"""
+	Reads the tokens of txt through _compound up to the end of text, repeat
+	times, and returns the number of compounds and the best time.
+	"""
+	best = None
+	with redirect_stderr(StringIO()):
+		for i in range(repeat):
+			parser.reset()
+			parser._source = lojbanParser.InputSource(txt)
+			ntokens = 0
+			starttime = time.perf_counter()
+			while parser._compound().ttype != 0:
+				ntokens += 1
+			# end while parser._compound().ttype != 0:
+			elapsed = time.perf_counter() - starttime
+			best = elapsed if best is None or elapsed < best else best
+		# end for i in range(repeat):
+	# end with redirect_stderr(StringIO()):
+	return (ntokens, best)
+# end def _compounding(parser, txt, repeat):
+
+def bench_compound(parser, txt, repeat):
+	"""
+	Measures the compounder alone: the tokens of txt read through _compound
+	(lexer, selma'o assignment, absorption and compounding) up to the end of
+	text, without the YACC parser.  Use a text heavy in tenses and
+	connectives (BAI, PA, GA, JA ...) to time the compounder drivers.
+	"""
+	(ntokens, best) = _compounding(parser, txt, repeat)
+	print("compounds       : {:d}".format(ntokens))
+	print("best of {:d}       : {:.3f} s".format(repeat, best))
+	print("compounds/s     : {:.0f}".format(ntokens / best))
+	print("backtracks      : {:d}".format(parser.backtracks))
+	print("pruned          : {:d}".format(parser.prunedbacktracks))
+# end def bench_compound(parser, txt, repeat):
+
+def bench_dumps(parser, txt, repeat):
+	"""
+	Measures Token.dumps and Token.loads against pickling the same tree as
+	nested tuples.
+	"""
+	with redirect_stderr(StringIO()):
+		t = parser.parseString(txt)
+	# end with redirect_stderr(StringIO()):
+	if t is None:
+		print("syntax error")
+		sys.exit(1)
+	# end if t is None:
+	sys.setrecursionlimit(100000)
+	def _best(function, *args):
+		best = None
+		for i in range(repeat):
+			starttime = time.perf_counter()
+			function(*args)
+			elapsed = time.perf_counter() - starttime
+			best = elapsed if best is None or elapsed < best else best
+		# end for i in range(repeat):
+		return best
+	# end def _best(function, *args):
+	data = lojbanParser.Token.dumps(t)
+	nested = _nested(t)
+	pickled = pickle.dumps(nested, pickle.HIGHEST_PROTOCOL)
+	print("token count     : {:d}".format(memoryview(data)[:16].cast('i')[2]))
+	print("dumps           : {:d} bytes, {:.4f} s".format(len(data), \
+		_best(lojbanParser.Token.dumps, t)))
+	print("loads           : {:.4f} s".format(_best(lojbanParser.Token.loads, data)))
+	print("tuples          : {:.4f} s".format(_best(_nested, t)))
+	print("pickle dumps    : {:d} bytes, {:.4f} s".format(len(pickled), \
+		_best(pickle.dumps, nested, pickle.HIGHEST_PROTOCOL)))
+	print("pickle loads    : {:.4f} s".format(_best(pickle.loads, pickled)))
+	print("tokens          : {:.4f} s".format(_best(_unnested, nested)))
+# end def bench_dumps(parser, txt, repeat):
+
+def bench_lex(parser, txt, repeat):
+	"""
+	Measures splitting the words of txt into pieces (cmene, brivla, cmavo)
+	with the cache of LojbanParser._lexword against without it.
+	"""
+	words = re.findall("[a-z']+", txt.lower())
+	lexword = lojbanParser.LojbanParser._lexword
+	def _cached():
+		for word in words:
+			lexword(word)
+		# end for word in words:
+	# end def _cached():
+	def _uncached():
+		for word in words:
+			lexword.__wrapped__(word)
+		# end for word in words:
+	# end def _uncached():
+	times = []
+	for function in (_uncached, _cached):
+		best = None
+		for i in range(repeat):
+			lexword.cache_clear()
+			starttime = time.perf_counter()
+			function()
+			elapsed = time.perf_counter() - starttime
+			best = elapsed if best is None or elapsed < best else best
+		# end for i in range(repeat):
+		times.append(best)
+	# end for function in (_uncached, _cached):
+	print("words           : {:d}".format(len(words)))
+	print("uncached        : {:.1f} ns per word".format(times[0] * 1e9 / len(words)))
+	print("cached          : {:.1f} ns per word".format(times[1] * 1e9 / len(words)))
+	print("cache           : {:s}".format(str(parser.lexcacheinfo)))
+# end def bench_lex(parser, txt, repeat):
+
+def bench_many(parser, txt, repeat):
+	"""
+	Measures documents per second of parseMany against serial parses, and
+	checks that both produce the same trees and messages.
+	"""
+	documents = [line for line in txt.splitlines() if line.strip()]
+	starttime = time.perf_counter()
+	expected = [_serial(parser, document) for document in documents]
+	serial = time.perf_counter() - starttime
+	print("documents       : {:d}".format(len(documents)))
+	print("serial          : {:.3f} s".format(serial))
+	workers = 1
+	while workers <= (os.cpu_count() or 1):
+		best = None
+		for i in range(repeat):
+			starttime = time.perf_counter()
+			results = list(parser.parseMany(documents, workers))
+			elapsed = time.perf_counter() - starttime
+			best = elapsed if best is None or elapsed < best else best
+		# end for i in range(repeat):
+		for (index, output, errors) in results:
+			_expect("document {:d} from parseMany".format(index), \
+				(output or "", _messages(errors)), expected[index])
+		# end for (index, output, errors) in results:
+		print("{:3d} workers     : {:.3f} s, speedup {:.2f}".format( \
+			workers, best, serial / best))
+		workers *= 2
+	# end while workers <= (os.cpu_count() or 1):
+	check_many(parser, txt)
+# end def bench_many(parser, txt, repeat):
+
+def bench_transport(parser, txt, repeat, ndocuments = 8):
+	"""
+	Parses ndocuments copies of txt with parseMany and measures getting the
+	trees back dumped (trees) against in shared memory (shared).
+	"""
+	documents = [txt] * ndocuments
+	with redirect_stderr(StringIO()):
+		expected = _result(parser, txt)[0]
+	# end with redirect_stderr(StringIO()):
+	for (name, options) in (("dumped", {"trees" : True}), ("shared", {"shared" : True})):
+		best = None
+		for i in range(repeat):
+			starttime = time.perf_counter()
+			trees = []
+			nbytes = 0
+			for (index, output, errors) in parser.parseMany(documents, **options):
+				if options.get("trees"):
+					nbytes += len(output)
+					trees.append(lojbanParser.Token.loads(output))
+				else: # if options.get("trees"):
+					nbytes += len(output.ttype) * output.nodesize
+					trees.append(output)
+				# end if options.get("trees"):
+			# end for (index, output, errors) in parser.parseMany(documents, **options):
+			elapsed = time.perf_counter() - starttime
+			best = elapsed if best is None or elapsed < best else best
+			for tree in trees:
+				_expect("tree {:s} by parseMany".format(name), _printed(parser, \
+					tree if options.get("trees") else tree.tree), expected)
+			# end for tree in trees:
+			for tree in trees:
+				if not options.get("trees"):
+					tree.close()
+				# end if not options.get("trees"):
+			# end for tree in trees:
+		# end for i in range(repeat):
+		print("{:s}          : {:.3f} s, {:d} bytes per tree".format(name, best, \
+			nbytes // ndocuments))
+	# end for (name, options) in (("dumped", {"trees" : True}), ("shared", {"shared" : True})):
+	check_shared(parser, txt)
+# end def bench_transport(parser, txt, repeat, ndocuments = 8):
+
+def _sharedblocks():
+	"""
+	Returns the set of the names of the shared memory blocks of the machine
+	(those of multiprocessing.shared_memory, in /dev/shm).
+	"""
+	return set(name for name in os.listdir("/dev/shm") if name.startswith("psm_"))
+# end def _sharedblocks():
+
+def check_shared(parser, txt):
+	"""
+	Checks that parseMany(shared = True) leaves no shared memory block behind
+	when the generator is closed after the first document, with documents
+	parsed and not yielded (where the blocks can be seen, in /dev/shm).
+	"""
+	if not os.path.isdir("/dev/shm"):
+		print("shared          : skipped (no /dev/shm)")
+		return
+	# end if not os.path.isdir("/dev/shm"):
+	documents = [line for line in txt.splitlines() if line.strip()]
+	documents = documents * (1 + 32 // max(len(documents), 1))
+	for ordered in (True, False):
+		before = _sharedblocks()
+		results = parser.parseMany(documents, 2, ordered = ordered, \
+			chunksize = 2, shared = True)
+		(index, output, errors) = next(results)
+		time.sleep(0.5)
+		results.close()
+		if not output is None:
+			output.close()
+		# end if not output is None:
+		_expect("shared memory blocks left (ordered = {:s})".format(str(ordered)), \
+			sorted(_sharedblocks() - before), [])
+	# end for ordered in (True, False):
+	print("shared          : ok")
+# end def check_shared(parser, txt):
+
+def check_many(parser, txt, workers = 2):
+	"""
+	Checks that parseMany gives for each non empty line of txt, as a
+	document, the tree of a serial parse and all that it printed, errors
+	and messages, in the order printed: the tree printed, dumped (trees)
+	and in shared memory (shared), in the order of the documents and as soon
+	as they are ready.
+	"""
+	documents = [line for line in txt.splitlines() if line.strip()]
+	expected = [_serial(parser, document) for document in documents]
+	for ordered in (True, False):
+		for mode in ("print", "trees", "shared"):
+			what = "parseMany ({:s}, ordered = {:s})".format(mode, str(ordered))
+			results = {}
+			for (index, output, errors) in parser.parseMany(documents, workers, \
+					ordered = ordered, chunksize = 4, trees = mode == "trees", \
+					shared = mode == "shared"):
+				if output is None or mode == "print":
+					printed = output or ""
+				elif mode == "trees":
+					printed = _printed(parser, lojbanParser.Token.loads(output))
+				else: # if output is None or mode == "print":
+					printed = _printed(parser, output.tree)
+					output.close()
+				# end if output is None or mode == "print":
+				results[index] = (printed, _messages(errors))
+			# end for (index, output, errors) in parser.parseMany(...):
+			_expect("documents returned by " + what, sorted(results), \
+				list(range(len(documents))))
+			for (index, e) in enumerate(expected):
+				_expect("document {:d} from {:s}".format(index, what), \
+					results[index], e)
+			# end for (index, e) in enumerate(expected):
+		# end for mode in ("print", "trees", "shared"):
+	# end for ordered in (True, False):
+	print("many            : ok")
+# end def check_many(parser, txt, workers = 2):
+
+def check_threads(parser, txt, nthreads = 32):
+	"""
+	Checks that nthreads texts cut from txt, parsed concurrently in threads
+	with a parser each, give the trees and errors of serial parses, and so
+	do they with one StringPool for all (the sharestrings parameter), whose
+	count of the characters interned must then add up.
+	"""
+	lines = txt.splitlines(True)
+	texts = ["".join(lines[i::nthreads]) for i in range(nthreads)]
+	switchinterval = sys.getswitchinterval()
+	with redirect_stderr(StringIO()):
+		expected = [_result(parser, text) for text in texts]
+		for sharestrings in (False, True):
+			what = " (sharestrings)" if sharestrings else ""
+			parameters = copy.copy(parser._parameters)
+			parameters._sharestrings = sharestrings
+			pool = lojbanParser._sharedstrings()
+			totalspace = pool.totalspace
+			def _parse(text):
+				threadparser = lojbanParser.LojbanParser(parameters)
+				return (_result(threadparser, text), threadparser)
+			# end def _parse(text):
+			# switches threads as often as possible, to bring out the races
+			sys.setswitchinterval(1e-6)
+			try:
+				with ThreadPoolExecutor(max_workers = nthreads) as executor:
+					results = list(executor.map(_parse, texts))
+				# end with ThreadPoolExecutor(max_workers = nthreads) as executor:
+			finally:
+				sys.setswitchinterval(switchinterval)
+			# end try finally:
+			for (index, ((result, threadparser), e)) in enumerate(zip(results, expected)):
+				_expect("text {:d} parsed in a thread{:s}".format(index, what), result, e)
+			# end for (index, ((result, threadparser), e)) in ...:
+			if sharestrings and all(threadparser.strings is pool \
+					for (result, threadparser) in results):
+				_expect("characters interned in the shared StringPool", \
+					pool.totalspace - totalspace, sum(threadparser.stringtotalspace \
+					for (result, threadparser) in results))
+			# end if sharestrings and all(...):
+		# end for sharestrings in (False, True):
+	# end with redirect_stderr(StringIO()):
+	print("threads         : ok")
+# end def check_threads(parser, txt, nthreads = 32):
+
+def check_packrat(parser, txt):
+	"""
+	Checks that the packrat memo of the compounder (the packrat parameter)
+	changes no parse: txt and each of its non empty lines give the same
+	trees and errors with and without it.
+	"""
+	texts = [txt] + [line for line in txt.splitlines() if line.strip()]
+	results = []
+	with redirect_stderr(StringIO()):
+		for packrat in (False, True):
+			parameters = copy.copy(parser._parameters)
+			parameters._packrat = packrat
+			packratparser = lojbanParser.LojbanParser(parameters)
+			results.append([_result(packratparser, text) for text in texts])
+		# end for packrat in (False, True):
+	# end with redirect_stderr(StringIO()):
+	for (index, (plain, packrat)) in enumerate(zip(*results)):
+		_expect("text {:d} parsed with the packrat memo".format(index), \
+			packrat, plain)
+	# end for (index, (plain, packrat)) in enumerate(zip(*results)):
+	print("packrat         : ok")
+# end def check_packrat(parser, txt):
+
+def check_pruning(parser, txt):
+	"""
+	Checks that the FIRST sets of the compounder (_COMPOUNDFIRST) change
+	nothing but the time: txt and each of its non empty lines give, with
+	and without them, the same compounds through _compound with the lexer
+	at the same line and column after each, and the same trees, errors and
+	error positions.
+	"""
+	texts = [txt] + [line for line in txt.splitlines() if line.strip()]
+	unpruned = lojbanParser.LojbanParser(parser._parameters)
+	reset = unpruned.reset
+	def _reset():
+		reset()
+		unpruned._context.compound_prune = False
+	# end def _reset():
+	unpruned.reset = _reset
+	pruned = 0
+	with redirect_stderr(StringIO()):
+		for (index, text) in enumerate(texts):
+			results = []
+			for compounder in (unpruned, parser):
+				compounder.reset()
+				compounder._source = lojbanParser.InputSource(text)
+				compounds = []
+				tok = compounder._compound()
+				while tok.ttype != 0:
+					compounds.append((_nested(tok), compounder._line, \
+						compounder._column))
+					tok = compounder._compound()
+				# end while tok.ttype != 0:
+				results.append((compounds, _result(compounder, text)))
+			# end for compounder in (unpruned, parser):
+			pruned += parser.prunedbacktracks
+			_expect("text {:d} compounded with the FIRST sets".format(index), \
+				results[1], results[0])
+		# end for (index, text) in enumerate(texts):
+	# end with redirect_stderr(StringIO()):
+	print("pruning         : ok, {:d} matches ruled out".format(pruned))
+# end def check_pruning(parser, txt):
+
+# the checks run by the check "benchmark"
+_CHECKS = (check_shared, check_many, check_threads, check_packrat, \
+	check_pruning)
+
+def check(parser, txt, repeat):
+	"""
+	Runs the checks of _CHECKS (repeat is not used).
+	"""
+	for function in _CHECKS:
+		function(parser, txt)
+	# end for function in _CHECKS:
+# end def check(parser, txt, repeat):
+
+def _printed(parser, t):
+	"""
+	Returns tree t (or list of trees, with --recover) printed as
+	testLojbanParser and parseMany print it.
+	"""
+	buffer = StringIO()
+	for tree in (t if isinstance(t, list) else [t]):
+		if parser.treemode:
+			parser.tprint(tree, file = buffer)
+		elif parser.rulemode:
+			parser.rprint(tree, file = buffer)
+		else:
+			parser.print(tree, file = buffer)
+	# end for tree in (t if isinstance(t, list) else [t]):
+	return buffer.getvalue()
+# end def _printed(parser, t):
+
+def _result(parser, txt):
+	"""
+	Parses txt and returns what the parse produced: the printed tree, the
+	error position and type, and the messages of its errors.
+	"""
+	t = parser.parseString(txt)
+	return (_printed(parser, t) if t else "", parser._errline, parser._errcol, \
+		parser._errtype, [str(error) for error in parser.errors])
+# end def _result(parser, txt):
+
+def _serial(parser, txt):
+	"""
+	Parses txt as a worker of parseMany does, and returns the printed tree
+	and all that the parse printed to sys.stdout and sys.stderr.
+	"""
+	messages = StringIO()
+	with redirect_stdout(messages), redirect_stderr(messages):
+		t = parser.parseString(txt)
+	# end with redirect_stdout(messages), redirect_stderr(messages):
+	return (_printed(parser, t) if t else "", messages.getvalue())
+# end def _serial(parser, txt):
+
+def _messages(errors):
+	"""
+	Returns the errors of a document returned by parseMany as what the
+	parse printed.
+	"""
+	return "".join(str(error) + "\n" for error in errors)
+# end def _messages(errors):
+
+def bench_selmao(parser, txt, repeat):
+	"""
+	Measures the classification of the cmavo of txt with one lookup in
+	_CMAVOTYPES against computing it with Constants.get_selmao (the way
+	_selmao did it before).
+	"""
+	words = [word for word in re.findall("[a-z']+", txt.lower()) \
+		if word in lojbanParser._CMAVOTYPES]
+	def _lookup():
+		cmavotypes = lojbanParser._CMAVOTYPES
+		get_selmao = lojbanParser.Constants.get_selmao
+		for word in words:
+			ttype = cmavotypes.get(word)
+			if ttype is None:
+				ttype = get_selmao(word)
+			# end if ttype is None:
+		# end for word in words:
+	# end def _lookup():
+	def _compute():
+		get_selmao = lojbanParser.Constants.get_selmao
+		for word in words:
+			ttype = get_selmao(word)
+		# end for word in words:
+	# end def _compute():
+	times = []
+	for function in (_compute, _lookup):
+		best = None
+		for i in range(repeat):
+			starttime = time.perf_counter()
+			function()
+			elapsed = time.perf_counter() - starttime
+			best = elapsed if best is None or elapsed < best else best
+		# end for i in range(repeat):
+		times.append(best)
+	# end for function in (_compute, _lookup):
+	print("cmavo           : {:d}".format(len(words)))
+	print("get_selmao      : {:.1f} ns per word".format(times[0] * 1e9 / len(words)))
+	print("_CMAVOTYPES     : {:.1f} ns per word".format(times[1] * 1e9 / len(words)))
+	print("speedup         : {:.1f}".format(times[0] / times[1]))
+# end def bench_selmao(parser, txt, repeat):
+
+def bench_threads(parser, txt, repeat, nthreads = 32):
+	"""
+	Parses nthreads different texts concurrently, each in its own thread with
+	its own LojbanParser, and checks the results against serial runs.
+	"""
+	lines = txt.splitlines(True)
+	texts = ["".join(lines[i::nthreads]) for i in range(nthreads)]
+	with redirect_stderr(StringIO()):
+		starttime = time.perf_counter()
+		expected = [_result(parser, text) for text in texts]
+		serial = time.perf_counter() - starttime
+		def _parse(text):
+			threadparser = lojbanParser.LojbanParser(parser._parameters)
+			return _result(threadparser, text)
+		# end def _parse(text):
+		best = None
+		for i in range(repeat):
+			starttime = time.perf_counter()
+			with ThreadPoolExecutor(max_workers = nthreads) as executor:
+				results = list(executor.map(_parse, texts))
+			# end with ThreadPoolExecutor(max_workers = nthreads) as executor:
+			elapsed = time.perf_counter() - starttime
+			best = elapsed if best is None or elapsed < best else best
+			for (index, (r, e)) in enumerate(zip(results, expected)):
+				_expect("text {:d} parsed in a thread".format(index), r, e)
+			# end for (index, (r, e)) in enumerate(zip(results, expected)):
+		# end for i in range(repeat):
+	# end with redirect_stderr(StringIO()):
+	print("texts           : {:d}".format(nthreads))
+	print("serial          : {:.3f} s".format(serial))
+	print("threads best    : {:.3f} s".format(best))
+	check_threads(parser, txt, nthreads)
+# end def bench_threads(parser, txt, repeat, nthreads = 32):
+
+_BENCHMARKS = { \
+	"check" : check, \
+	"compound" : bench_compound, \
+	"core" : bench_core, \
+	"dumps" : bench_dumps, \
+	"lex" : bench_lex, \
+	"many" : bench_many, \
+	"packrat" : bench_packrat, \
+	"reduce" : bench_reduce, \
+	"selmao" : bench_selmao, \
+	"threads" : bench_threads, \
+	"transport" : bench_transport, \
+	"utterances" : bench_utterances, \
+	}
+
+if __name__ == '__main__':
+	argv = sys.argv[1:]
+	if len(argv) < 2 or argv[0] not in _BENCHMARKS:
+		print(_USAGE)
+		sys.exit(1)
+	# end if len(argv) < 2 or argv[0] not in _BENCHMARKS:
+	bench = _BENCHMARKS[argv[0]]
+	infile = argv[1]
+	argv = argv[2:]
+	repeat = 5
+	if "-n" in argv:
+		iarg = argv.index("-n")
+		try:
+			repeat = int(argv[iarg + 1])
+		except (IndexError, ValueError) as e:
+			print("Error: argument -n requires an integer value.")
+			sys.exit(1)
+		# end try except (IndexError, ValueError) as e:
+		del argv[iarg:iarg + 2]
+	# end if "-n" in argv:
+	try:
+		with open(infile, "r") as file:
+			txt = file.read()
+		# end with open(infile, "r") as file:
+	except Exception as e:
+		print(e)
+		sys.exit(1)
+	# end try except Exception as e:
+
+	parser = lojbanParser.LojbanParser(lojbanParser.Parameters())
+	parser.setparameters(*argv)
+	bench(parser, txt, repeat)
+# end if __name__ == '__main__':
@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+
+import lojbanParser
+import sys
+import os
+
+_USAGE = """Usage: genLojbanParser.py [OUTPUT]
+
+Writes OUTPUT (lojbanParserStates.py beside lojbanParser.py by default), the
+YACC parser of lojbanParser made into one Python function per state, with
+the default reductions and their semantic actions inlined.  The parser uses
+it instead of interpreting its tables with the --generated parameter.
+Run it again whenever the parser tables of lojbanParser.py change.
+"""
+
+# constants of the tables (local to LojbanParser._yyparse)
+_PCYYFLAG = -1000
+_YYERRCODE = 256
+_YYLAST = len(lojbanParser._YYACT)
+
+def _shifts(state):
+	"""
+	Returns the shifts of state: {token: next state}.
+	"""
+	shifts = {}
+	base = lojbanParser._YYPACT[state]
+	if base > _PCYYFLAG:
+		for n in range(max(base, 0), _YYLAST):
+			if lojbanParser._YYCHK[lojbanParser._YYACT[n]] == n - base:
+				shifts[n - base] = lojbanParser._YYACT[n]
+			# end if lojbanParser._YYCHK[lojbanParser._YYACT[n]] == n - base:
+		# end for n in range(max(base, 0), _YYLAST):
+	# end if base > _PCYYFLAG:
+	return shifts
+# end def _shifts(state):
+
+def _errorshift(state):
+	"""
+	Returns the state reached by shifting "error" in state, or None.
+	"""
+	n = lojbanParser._YYPACT[state] + _YYERRCODE
+	if n >= 0 and n < _YYLAST and \
+		lojbanParser._YYCHK[lojbanParser._YYACT[n]] == _YYERRCODE:
+		return lojbanParser._YYACT[n]
+	# end if n >= 0 and n < _YYLAST and \
+	return None
+# end def _errorshift(state):
+
+def _gotos(nonterminal):
+	"""
+	Returns the gotos on nonterminal as ({state: next state}, default), the
+	dict holding only the states whose next state is not the default.
+	"""
+	act = lojbanParser._YYACT
+	pgo = lojbanParser._YYPGO[nonterminal]
+	default = act[pgo]
+	gotos = {}
+	for state in range(len(lojbanParser._YYPACT)):
+		j = pgo + state + 1
+		if j < _YYLAST and lojbanParser._YYCHK[act[j]] == -nonterminal:
+			if act[j] != default:
+				gotos[state] = act[j]
+			# end if act[j] != default:
+		# end if j < _YYLAST and lojbanParser._YYCHK[act[j]] == -nonterminal:
+	# end for state in range(len(lojbanParser._YYPACT)):
+	return (gotos, default)
+# end def _gotos(nonterminal):
+
+def _exceptions(state):
+	"""
+	Returns the actions of _YYEXCAMAP for state as a list of (tokens,
+	action), and the action for any other token.
+	"""
+	actions = {}
+	for ((excastate, token), action) in lojbanParser._YYEXCAMAP.items():
+		if excastate == state and token >= 0:
+			actions.setdefault(action, []).append(token)
+		# end if excastate == state and token >= 0:
+	# end for ((excastate, token), action) in lojbanParser._YYEXCAMAP.items():
+	return ([(tuple(tokens), action) for (action, tokens) in actions.items()], \
+		lojbanParser._YYEXCAMAP[(state, -1)])
+# end def _exceptions(state):
+
+def _reduction(rule, indent):
+	"""
+	Returns the lines reducing rule: its semantic action, the pop of its
+	symbols and the goto.
+	"""
+	(kind, ttype, first, last) = lojbanParser._YYREDUCE[rule]
+	length = lojbanParser._YYR2[rule]
+	nonterminal = lojbanParser._YYR1[rule]
+	if kind == lojbanParser._YYNODE:
+		value = "p._node({:d}{:s})".format(ttype, "".join(", vs[{:d}]".format(-1 - k) \
+			for k in range(first, last - 1, -1)))
+	elif kind == lojbanParser._YYTOPLEVEL:
+		value = "p._toplevel(vs[{:d}])".format(-1 - first)
+	else: # if kind == lojbanParser._YYNODE:
+		value = "p._elidable({:d})".format(ttype)
+	# end if kind == lojbanParser._YYNODE:
+	(gotos, default) = _gotos(nonterminal)
+	below = "ss[-1]" if length == 0 else "ss[-2]"
+	if gotos:
+		goto = "_GOTO{:d}.get({:s}, {:d})".format(nonterminal, below, default)
+	else: # if gotos:
+		goto = "{:d}".format(default)
+	# end if gotos:
+	lines = ["# reduce rule {:d} ({:s})".format(rule, \
+		lojbanParser.Constants.rulename(ttype)), "v = " + value]
+	codes = ""
+	if length == 0:
+		lines += ["n = " + goto, "ss.append(n)", "vs.append(v)"]
+		codes += " | _GREW"
+	else: # if length == 0:
+		if length > 1:
+			lines += ["del ss[{:d}:]".format(1 - length), \
+				"del vs[{:d}:]".format(1 - length)]
+		# end if length > 1:
+		lines += ["n = " + goto, "ss[-1] = n", "vs[-1] = v"]
+	# end if length == 0:
+	if kind == lojbanParser._YYELIDABLEOK:
+		codes += " | _ERROK"
+	# end if kind == lojbanParser._YYELIDABLEOK:
+	lines.append("return n" + codes)
+	return [indent + line for line in lines]
+# end def _reduction(rule, indent):
+
+def _action(action, indent):
+	"""
+	Returns the lines of an action of _YYDEF or _YYEXCAMAP: a reduction,
+	a syntax error (0) or the acceptance of the text (negative).
+	"""
+	if action < 0:
+		return [indent + "return _ACCEPT"]
+	elif action == 0:
+		return [indent + "return _ERROR"]
+	# end if action < 0:
+	return _reduction(action, indent)
+# end def _action(action, indent):
+
+def _state(state, shiftnames):
+	"""
+	Returns the lines of the body of the function of state.
+	"""
+	lines = []
+	shifts = _shifts(state)
+	default = lojbanParser._YYDEF[state]
+	if lojbanParser._YYPACT[state] > _PCYYFLAG or default == -2:
+		lines += [ \
+			"tok = p._pcyytoken", \
+			"if tok < 0:", \
+			"\ttok = p._yylex()", \
+			"\tif tok < 0:", \
+			"\t\ttok = 0", \
+			"\t# end if tok < 0:", \
+			"\tp._pcyytoken = tok", \
+			"# end if tok < 0:"]
+	# end if lojbanParser._YYPACT[state] > _PCYYFLAG or default == -2:
+	if len(shifts) == 1:
+		((token, n),) = shifts.items()
+		lines += [ \
+			"if tok == {:d}:".format(token), \
+			"\tp._pcyytoken = -1", \
+			"\tss.append({:d})".format(n), \
+			"\tvs.append(p._yylval)", \
+			"\treturn {:d} | _SHIFTED".format(n), \
+			"# end if tok == {:d}:".format(token)]
+	elif shifts:
+		lines += [ \
+			"n = {:s}.get(tok)".format(shiftnames[state]), \
+			"if not n is None:", \
+			"\tp._pcyytoken = -1", \
+			"\tss.append(n)", \
+			"\tvs.append(p._yylval)", \
+			"\treturn n | _SHIFTED", \
+			"# end if not n is None:"]
+	# end if len(shifts) == 1:
+	if default == -2:
+		(exceptions, other) = _exceptions(state)
+		for (tokens, action) in exceptions:
+			test = "tok == {:d}".format(tokens[0]) if len(tokens) == 1 \
+				else "tok in {:s}".format(str(tokens))
+			lines.append("if {:s}:".format(test))
+			lines += _action(action, "\t")
+			lines.append("# end if {:s}:".format(test))
+		# end for (tokens, action) in exceptions:
+		lines += _action(other, "")
+	else: # if default == -2:
+		lines += _action(default, "")
+	# end if default == -2:
+	return lines
+# end def _state(state, shiftnames):
+
+def _dictlines(name, items):
+	"""
+	Returns the lines of the assignment of a dict literal to name.
+	"""
+	entries = ["{:d} : {:d}".format(key, value) for (key, value) in sorted(items)]
+	lines = ["{:s} = {{ \\".format(name)]
+	for k in range(0, len(entries), 8):
+		lines.append("\t" + ", ".join(entries[k:k + 8]) + ", \\")
+	# end for k in range(0, len(entries), 8):
+	lines.append("\t}")
+	return lines
+# end def _dictlines(name, items):
+
+def _generate(file):
+	"""
+	Writes the module of state functions to file.
+	"""
+	nstates = len(lojbanParser._YYPACT)
+	if nstates > lojbanParser._YYSTATEMASK + 1:
+		raise ValueError("{:d} states do not fit in _YYSTATEMASK".format(nstates))
+	# end if nstates > lojbanParser._YYSTATEMASK + 1:
+	def write(line = ""):
+		file.write(line + "\n")
+	# end def write(line = ""):
+	write("#" * 71)
+	write("# lojbanParserStates: the YACC parser of lojbanParser as one function per")
+	write("# state.  Generated by genLojbanParser.py, do not edit.")
+	write("#" * 71)
+	write()
+	write("# checksum of the parser tables this module was generated from")
+	write("CHECKSUM = {:d}".format(lojbanParser._tableschecksum()))
+	write()
+	write("# codes added to the next state returned by a state function")
+	for name in ("SHIFTED", "GREW", "ERROK", "ERROR", "ACCEPT"):
+		write("_{:s} = {:d}".format(name, getattr(lojbanParser, "_YY" + name)))
+	# end for name in ("SHIFTED", "GREW", "ERROK", "ERROR", "ACCEPT"):
+	write()
+	write("# shifts of the states that have several: {token: next state}")
+	shiftnames = {}
+	shiftdicts = {}
+	for state in range(nstates):
+		shifts = _shifts(state)
+		if len(shifts) > 1:
+			key = tuple(sorted(shifts.items()))
+			if not key in shiftdicts:
+				shiftdicts[key] = "_SHIFT{:d}".format(state)
+				for line in _dictlines(shiftdicts[key], key):
+					write(line)
+				# end for line in _dictlines(shiftdicts[key], key):
+			# end if not key in shiftdicts:
+			shiftnames[state] = shiftdicts[key]
+		# end if len(shifts) > 1:
+	# end for state in range(nstates):
+	write()
+	write("# gotos on the nonterminals: {state below: next state}, for the states")
+	write("# below whose next state is not the default (written in the reductions)")
+	for nonterminal in range(len(lojbanParser._YYPGO)):
+		(gotos, default) = _gotos(nonterminal)
+		if gotos:
+			for line in _dictlines("_GOTO{:d}".format(nonterminal), gotos.items()):
+				write(line)
+			# end for line in _dictlines("_GOTO{:d}".format(nonterminal), gotos.items()):
+		# end if gotos:
+	# end for nonterminal in range(len(lojbanParser._YYPGO)):
+	write()
+	write("# state reached by shifting \"error\" in each state that can")
+	errorshifts = [(state, _errorshift(state)) for state in range(nstates) \
+		if not _errorshift(state) is None]
+	for line in _dictlines("ERRORSHIFTS", errorshifts):
+		write(line)
+	# end for line in _dictlines("ERRORSHIFTS", errorshifts):
+	write()
+	names = []
+	bodies = {}
+	for state in range(nstates):
+		body = "\n".join(_state(state, shiftnames))
+		if not body in bodies:
+			bodies[body] = "_state{:d}".format(state)
+			write()
+			write("def {:s}(p, ss, vs):".format(bodies[body]))
+			for line in body.split("\n"):
+				write("\t" + line)
+			# end for line in body.split("\n"):
+			write("# end def {:s}(p, ss, vs):".format(bodies[body]))
+		# end if not body in bodies:
+		names.append(bodies[body])
+	# end for state in range(nstates):
+	write()
+	write("# function of each state, called with the parser, the state stack and")
+	write("# the value stack (the state being on top); returns the next state")
+	write("STATES = ( \\")
+	for k in range(0, nstates, 8):
+		write("\t" + ", ".join(names[k:k + 8]) + ", \\")
+	# end for k in range(0, nstates, 8):
+	write(")")
+# end def _generate(file):
+
+if __name__ == '__main__':
+	argv = sys.argv[1:]
+	if len(argv) > 1 or (argv and argv[0].startswith("-")):
+		print(_USAGE)
+		sys.exit(1)
+	# end if len(argv) > 1 or (argv and argv[0].startswith("-")):
+	outfile = argv[0] if argv else os.path.join( \
+		os.path.dirname(os.path.abspath(lojbanParser.__file__)), "lojbanParserStates.py")
+	try:
+		with open(outfile, "w") as file:
+			_generate(file)
+		# end with open(outfile, "w") as file:
+	except Exception as e:
+		print(e)
+		sys.exit(1)
+	# end try except Exception as e:
+	print("{:s}: {:d} states".format(outfile, len(lojbanParser._YYPACT)))
+# end if __name__ == '__main__':
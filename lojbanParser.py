@@ -1,10 +1,21 @@
 #######################################################################
 # imports
 
+import os
+import re
 import sys
+import codecs
+import zlib
+from array import array
 import inspect
-import weakref
+import itertools
+import functools
+import threading
 from io import StringIO
+from contextlib import redirect_stderr, redirect_stdout
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from multiprocessing import shared_memory, resource_tracker
+from types import MappingProxyType
 
 #######################################################################
 ## LojbanException
@@ -64,6 +75,56 @@ class LojbanException(Exception):
 	# end def msg(self):
 # end class LojbanException(Exception):
 
+#######################################################################
+## ParseError
+#######################################################################
+
+class ParseError:
+	"""
+	class ParseError records a syntax error found by the parser: the line and
+	column at or before which it was found, the type (selma'o) of the token
+	in error and the type of the last construct reduced before it.
+	""" 
+	def __init__(self, line, column, errtype, lastreduce):
+		self._line = line
+		self._column = column
+		self._errtype = errtype
+		self._lastreduce = lastreduce
+	# end def __init__(self, line, column, errtype, lastreduce):
+
+	def __str__(self):
+		return "Problem with selma'o {:s} at or before line {:d} column {:d}".format(\
+			Constants.rulename(self._errtype), self._line, self._column) + \
+			"\nLast good construct was: {:s}".format( \
+			Constants.rulename(self._lastreduce))
+	# end def __str__(self):
+
+	def __repr__(self):
+		return "ParseError({:d}, {:d}, {:d}, {:d})".format(self._line, \
+			self._column, self._errtype, self._lastreduce)
+	# end def __repr__(self):
+
+	@property
+	def line(self):
+		return self._line
+	# end def line(self):
+
+	@property
+	def column(self):
+		return self._column
+	# end def column(self):
+
+	@property
+	def errtype(self):
+		return self._errtype
+	# end def errtype(self):
+
+	@property
+	def lastreduce(self):
+		return self._lastreduce
+	# end def lastreduce(self):
+# end class ParseError:
+
 #######################################################################
 ## Parameters
 #######################################################################
@@ -107,9 +168,10 @@ class Parameters:
 		-c displays cmavo and exits.
 		
 	3. Related to processing of the input
-		--maxdepth MAXDEPTH sets maximum parsing tree depth
+		--maxdepth MAXDEPTH sets maximum parsing tree depth (the limit of the
+			parser stacks, which grow as needed up to it)
 			MAXDEPTH should be an integer. 
-			Zero of negative values for default value (200).
+			Zero of negative values for default value (10000).
 		
 		--redmax REDMAX sets maximum number of parsing reductions
 			REDMAX should be an integer. 
@@ -117,6 +179,27 @@ class Parameters:
 
 		-d sets grammar debug mode on
 		
+		--checktokens checks the type of every value stored in a token
+		
+		--tokenstore keeps the parse tree in a TokenStore (arrays of integers)
+		
+		--reusetokens reuses the tokens of a TokenArena from one parse to the
+			next (a parse overwrites the tree returned by the previous one)
+		
+		--recover parses the text sentence by sentence, skipping the sentences
+			with syntax errors (parse then returns a list of trees)
+		
+		--sharestrings interns the words of all parsers in one StringPool, kept
+			from one parse to the next until it holds 65536 words, when a new
+			one is started (each parser has its own otherwise)
+		
+		--packrat memoizes the matches of the compounder rules at each token
+			position (packrat parsing), for texts with long tenses or connectives
+		
+		--generated parses with the state functions of lojbanParserStates.py (written
+			by genLojbanParser.py) rather than by interpreting the YACC tables
+			(except with -d or -g, which trace the tables)
+		
 		-g sets grammar error logging mode on
 		
 		--tfile FILE sets grammar error logging file.
@@ -130,11 +213,18 @@ class Parameters:
 		self._elidemode = self._singlemode = False
 		self._rulemode = self._mkcmavo = False
 		self._maxline = 75
-		self._yymaxdepth = 200
+		self._yymaxdepth = 10000
 		self._yyredmax = 100
 		self._yydebug = False
 		self._yytflag = False
 		self._yytfilen = "grammar.tmp"
+		self._checktokens = False
+		self._tokenstore = False
+		self._reusetokens = False
+		self._recover = False
+		self._sharestrings = False
+		self._packrat = False
+		self._generated = False
 	# end def __init__(self):
 
 	def __str__(self):
@@ -156,7 +246,14 @@ class Parameters:
 			" yyredmax=" + str(self._yyredmax) + \
 			" yydebug=" + str("True" if self._yydebug else "False") + \
 			" yytflag=" + str("True" if self._ else "False") + \
-			" yytfilen=" + str(self._yytfilen)
+			" yytfilen=" + str(self._yytfilen) + \
+			" checktokens=" + str("True" if self._checktokens else "False") + \
+			" tokenstore=" + str("True" if self._tokenstore else "False") + \
+			" reusetokens=" + str("True" if self._reusetokens else "False") + \
+			" recover=" + str("True" if self._recover else "False") + \
+			" sharestrings=" + str("True" if self._sharestrings else "False") + \
+			" packrat=" + str("True" if self._packrat else "False") + \
+			" generated=" + str("True" if self._generated else "False")
 	# end def __str__(self):
 
 	def ___repr__(self):
@@ -225,6 +322,7 @@ class Parameters:
 					except ValueError as e:
 						raise LojbanException(self, "Error: invalid value " + str(argv[iarg]) +" for maxline (should be an integer).")
 					# end try except ValueError as e:
+					iarg = iarg + 1
 				else: # if iarg < len(argv):
 						raise LojbanException(self, "Error: argument maxline (-m) requires an integer value.")
 				# end if (iarg + 1) < len(argv):
@@ -234,11 +332,12 @@ class Parameters:
 					try:
 						self._yymaxdepth = int(argv[iarg])
 						if self._yymaxdepth < 1:
-							self._yymaxdepth = 200
+							self._yymaxdepth = 10000
 						# end if self._yymaxdepth < 1:
 					except ValueError as e:
 						raise LojbanException(self, "Error: invalid value " + str(argv[iarg]) +" for maxdepth (should be an integer).")
 					# end try except ValueError as e:
+					iarg = iarg + 1
 				else: # if iarg < len(argv):
 						raise LojbanException(self, "Error: argument maxdepth (--maxdepth) requires an integer value.")
 				# end if (iarg + 1) < len(argv):
@@ -253,17 +352,42 @@ class Parameters:
 					except ValueError as e:
 						raise LojbanException(self, "Error: invalid value " + str(argv[iarg]) +" for redmax (should be an integer).")
 					# end try except ValueError as e:
+					iarg = iarg + 1
 				else: # if iarg < len(argv):
 						raise LojbanException(self, "Error: argument redmax (--redmax) requires an integer value.")
 				# end if (iarg + 1) < len(argv):
 			elif arg == "-d":
 				self._yydebug = True
+				iarg = iarg + 1
 			elif arg == "-g":
 				self._yytflag = True
+				iarg = iarg + 1
+			elif arg == "--checktokens":
+				self._checktokens = True
+				iarg = iarg + 1
+			elif arg == "--tokenstore":
+				self._tokenstore = True
+				iarg = iarg + 1
+			elif arg == "--reusetokens":
+				self._reusetokens = True
+				iarg = iarg + 1
+			elif arg == "--recover":
+				self._recover = True
+				iarg = iarg + 1
+			elif arg == "--sharestrings":
+				self._sharestrings = True
+				iarg = iarg + 1
+			elif arg == "--packrat":
+				self._packrat = True
+				iarg = iarg + 1
+			elif arg == "--generated":
+				self._generated = True
+				iarg = iarg + 1
 			elif arg == "--tfile":
 				iarg = iarg + 1
 				if iarg < len(argv):
 					self._yytfilen = argv[iarg]
+					iarg = iarg + 1
 				else: # if iarg < len(argv):
 						raise LojbanException(self, "Error: argument tmpfile (--tfile) requires a string value.")
 				# end if (iarg + 1) < len(argv):
@@ -308,6 +432,15 @@ class Parameters:
 		return self._elidemode
 	# end def elidemode(self):
 
+	@property
+	def prunedbacktracks(self):
+		"""
+		Matches of the compounder that the FIRST sets ruled out in the last
+		parse, each of them a backtrack avoided.
+		"""
+		return self._context.compound_pruned
+	# end def prunedbacktracks(self):
+
 	@property
 	def rulemode(self):
 		return self._rulemode
@@ -362,6 +495,41 @@ class Parameters:
 	def mkcmavo(self):
 		return self._mkcmavo
 	# end def mkcmavo(self):
+
+	@property
+	def checktokens(self):
+		return self._checktokens
+	# end def checktokens(self):
+
+	@property
+	def tokenstore(self):
+		return self._tokenstore
+	# end def tokenstore(self):
+
+	@property
+	def reusetokens(self):
+		return self._reusetokens
+	# end def reusetokens(self):
+
+	@property
+	def recover(self):
+		return self._recover
+	# end def recover(self):
+
+	@property
+	def sharestrings(self):
+		return self._sharestrings
+	# end def sharestrings(self):
+
+	@property
+	def packrat(self):
+		return self._packrat
+	# end def packrat(self):
+
+	@property
+	def generated(self):
+		return self._generated
+	# end def generated(self):
 # end class Parameters:
 
 #######################################################################
@@ -372,7 +540,8 @@ class Constants:
 	"""
 	This class contains:
 		Application constants for cmavo, selmao types and lexer IDs.
-		Utility methods based on constant values (rulename, isC, isV, get_vowels)
+		Utility methods based on constant values (rulename, ruleid, prologname,
+			prologize, isC, isV, get_vowels)
 	"""
 	def __init__(self):
 		pass
@@ -383,349 +552,53 @@ class Constants:
 		"""
 		Returns the rule name given its ID.
 		"""
-		_rulename = { \
-			0 : "EOT", \
-			10000 :  "text_0", \
-			1 :  "text_A_1", \
-			2 :  "text_B_2", \
-			3 :  "text_C_3", \
-			4 :  "paragraphs_4", \
-			10 :  "paragraph_10", \
-			11 :  "paragraph_A_11", \
-			12 :  "paragraph_B_12", \
-			20 :  "utterance_20", \
-			30 :  "prenex_30", \
-			32 :  "free_modifier_32", \
-			33 :  "free_modifier_A_33", \
-			34 :  "discursive_bridi_34", \
-			35 :  "vocative_35", \
-			36 :  "parenthetical_36", \
-			40 :  "sentence_40", \
-			41 :  "sentence_A_41", \
-			42 :  "statement_42", \
-			50 :  "bridi_tail_50", \
-			51 :  "bridi_tail_A_51", \
-			52 :  "bridi_tail_B_52", \
-			53 :  "bridi_tail_C_53", \
-			54 :  "gek_bridi_tail_54", \
-			71 :  "tail_terms_71", \
-			80 :  "terms_80", \
-			81 :  "term_81", \
-			82 :  "modifier_82", \
-			83 :  "term_set_83", \
-			90 :  "sumti_90", \
-			91 :  "sumti_A_91", \
-			92 :  "sumti_B_92", \
-			93 :  "sumti_C_93", \
-			94 :  "sumti_D_94", \
-			95 :  "sumti_E_95", \
-			96 :  "sumti_F_96", \
-			110 :  "description_110", \
-			111 :  "sumti_tail_111", \
-			112 :  "sumti_tail_A_112", \
-			121 :  "relative_clauses_121", \
-			122 :  "relative_clause_122", \
-			130 :  "selbri_130", \
-			131 :  "selbri_A_131", \
-			132 :  "selbri_B_132", \
-			133 :  "selbri_C_133", \
-			134 :  "selbri_D_134", \
-			135 :  "selbri_E_135", \
-			136 :  "selbri_F_136", \
-			137 :  "GUhEK_selbri_137", \
-			150 :  "tanru_unit_150", \
-			151 :  "tanru_unit_A_151", \
-			152 :  "tanru_unit_B_152", \
-			160 :  "linkargs_160", \
-			161 :  "links_161", \
-			300 :  "quantifier_300", \
-			310 :  "MEX_310", \
-			311 :  "MEX_A_311", \
-			312 :  "MEX_B_312", \
-			313 :  "MEX_C_313", \
-			330 :  "rp_expression_330", \
-			332 :  "rp_operand_332", \
-			370 :  "operator_370", \
-			371 :  "operator_A_371", \
-			372 :  "operator_B_372", \
-			374 :  "MEX_operator_374", \
-			381 :  "operand_381", \
-			382 :  "operand_A_382", \
-			383 :  "operand_B_383", \
-			385 :  "operand_C_385", \
-			400 :  "anaphora_400", \
-			404 :  "cmene_404", \
-			405 :  "cmene_A_405", \
-			407 :  "bridi_valsi_407", \
-			408 :  "bridi_valsi_A_408", \
-			410 :  "para_mark_410", \
-			411 :  "indicators_411", \
-			412 :  "indicators_A_412", \
-			413 :  "indicator_413", \
-			415 :  "DOI_415", \
-			416 :  "COI_416", \
-			417 :  "COI_A_417", \
-			421 :  "JOIK_EK_421", \
-			422 :  "JOIK_JEK_422", \
-			425 :  "NU_425", \
-			426 :  "NU_A_426", \
-			432 :  "quote_arg_432", \
-			433 :  "quote_arg_A_433", \
-			434 :  "ZOI_quote_434", \
-			435 :  "ZO_quote_435", \
-			436 :  "LOhU_quote_436", \
-			440 :  "SEI_440", \
-			443 :  "CO_443", \
-			444 :  "CEI_444", \
-			445 :  "NA_445", \
-			447 :  "TUhE_447", \
-			448 :  "LIhU_gap_448", \
-			450 :  "gap_450", \
-			451 :  "front_gap_451", \
-			452 :  "MEX_gap_452", \
-			453 :  "KEI_gap_453", \
-			454 :  "TUhU_gap_454", \
-			456 :  "VAU_gap_456", \
-			457 :  "DOhU_gap_457", \
-			458 :  "FEhU_gap_458", \
-			459 :  "SEhU_gap_459", \
-			460 :  "NUhU_gap_460", \
-			461 :  "BOI_gap_461", \
-			462 :  "sub_gap_462", \
-			463 :  "LUhU_gap_463", \
-			464 :  "GEhU_gap_464", \
-			465 :  "MEhU_gap_465", \
-			466 :  "KEhE_gap_466", \
-			467 :  "BEhO_gap_467", \
-			468 :  "TOI_gap_468", \
-			469 :  "KUhO_gap_469", \
-			470 :  "left_bracket_470", \
-			471 :  "right_bracket_gap_471", \
-			472 :  "LOhO_gap_472", \
-			473 :  "TEhU_gap_473", \
-			474 :  "right_br_no_free_474", \
-			480 :  "SE_480", \
-			481 :  "FA_481", \
-			482 :  "NAhE_482", \
-			483 :  "qualifier_483", \
-			486 :  "subscript_486", \
-			490 :  "mod_head_490", \
-			491 :  "tag_491", \
-			801 :  "utterance_ordinal_801", \
-			802 :  "EK_802", \
-			803 :  "EK_BO_803", \
-			804 :  "EK_KE_804", \
-			805 :  "JEK_805", \
-			806 :  "JOIK_806", \
-			807 :  "GEK_807", \
-			808 :  "GUhEK_808", \
-			809 :  "NAhE_BO_809", \
-			810 :  "NA_KU_810", \
-			811 :  "I_BO_811", \
-			812 :  "number_812", \
-			813 :  "GIhEK_BO_813", \
-			814 :  "GIhEK_KE_814", \
-			815 :  "tense_modal_815", \
-			816 :  "GIK_816", \
-			817 :  "lerfu_string_817", \
-			818 :  "GIhEK_818", \
-			819 :  "I_819", \
-			821 :  "JEK_BO_821", \
-			822 :  "JOIK_BO_822", \
-			823 :  "JOIK_KE_823", \
-			824 :  "PA_MOI_824", \
-			906 :  "utt_ordinal_root_906", \
-			911 :  "EK_root_911", \
-			926 :  "JEK_root_926", \
-			931 :  "JOIK_root_931", \
-			932 :  "interval_932", \
-			956 :  "I_root_956", \
-			957 :  "simple_JOIK_JEK_957", \
-			961 :  "number_root_961", \
-			971 :  "simple_tag_971", \
-			972 :  "simple_tense_modal_972", \
-			973 :  "simple_tense_modal_A_973:", \
-			974 :  "modal_974", \
-			975 :  "modal_A_975", \
-			977 :  "tense_A_977", \
-			978 :  "tense_B_978", \
-			979 :  "tense_C_979", \
-			981 :  "GIK_root_981", \
-			986 :  "lerfu_string_root_986", \
-			987 :  "lerfu_word_987", \
-			991 :  "GIhEK_root_991", \
-			1030 :  "time_1030", \
-			1031 :  "time_A_1031", \
-			1032 :  "time_B_1032", \
-			1033 :  "time_offset_1033", \
-			1034 :  "time_interval_1034", \
-			1035 :  "time_direction_1035", \
-			1040 :  "space_1040", \
-			1041 :  "space_motion_1041", \
-			1042 :  "space_A_1042", \
-			1043 :  "space_B_1043", \
-			1044 :  "space_C_1044", \
-			1045 :  "space_offset_1045", \
-			1046 :  "space_intval_1046", \
-			1047 :  "space_intval_A_1047", \
-			1048 :  "space_direction_1048", \
-			1050 :  "interval_modifier_1050", \
-			1051 :  "interval_property_1051", \
-			1052 :  "event_mod_1052", \
-			1053 :  "event_mod_A_1053", \
-			# 0 :  "YYSTYPE", \
-			501 :  "A", \
-			502 :  "BAI", \
-			503 :  "BA'E", \
-			504 :  "BE", \
-			505 :  "BEI", \
-			506 :  "BE'O", \
-			507 :  "BI'I", \
-			508 :  "BO", \
-			509 :  "BRIVLA", \
-			511 :  "BU", \
-			513 :  "BY", \
-			514 :  "CA'A", \
-			515 :  "CAI", \
-			516 :  "CEI", \
-			517 :  "CMENE", \
-			518 :  "CO", \
-			519 :  "COI", \
-			520 :  "CU", \
-			521 :  "CU'E", \
-			524 :  "DA'O", \
-			525 :  "DOI", \
-			526 :  "DO'U", \
-			527 :  "FA", \
-			528 :  "FA'A", \
-			529 :  "FA'O", \
-			530 :  "FE'E", \
-			531 :  "FE'U", \
-			532 :  "FI'O", \
-			533 :  "FOI", \
-			535 :  "FU'E", \
-			536 :  "FU'O", \
-			537 :  "GA", \
-			538 :  "GE'U", \
-			539 :  "GI", \
-			541 :  "GI'A", \
-			542 :  "GOI", \
-			543 :  "GO'A", \
-			544 :  "GU'A", \
-			545 :  "I", \
-			546 :  "JA", \
-			547 :  "JAI", \
-			548 :  "JOI", \
-			550 :  "KE'E", \
-			551 :  "KE", \
-			552 :  "KEI", \
-			554 :  "KI", \
-			555 :  "KO'A", \
-			556 :  "KU", \
-			557 :  "KU'O", \
-			558 :  "LA", \
-			559 :  "LAU", \
-			561 :  "LA'E", \
-			562 :  "LE", \
-			565 :  "LE'U", \
-			566 :  "LI", \
-			567 :  "LI'U", \
-			568 :  "LO'O", \
-			569 :  "LO'U", \
-			571 :  "LU", \
-			573 :  "LU'U", \
-			574 :  "ME", \
-			575 :  "ME'U", \
-			577 :  "MO'I", \
-			578 :  "NA", \
-			581 :  "NAI", \
-			583 :  "NA'E", \
-			584 :  "NI'O", \
-			585 :  "NOI", \
-			586 :  "NU", \
-			587 :  "NU'I", \
-			588 :  "NU'U", \
-			592 :  "PU", \
-			593 :  "RA'O", \
-			594 :  "ROI", \
-			595 :  "SA", \
-			596 :  "SE", \
-			597 :  "SEI", \
-			598 :  "SE'U", \
-			601 :  "SI", \
-			602 :  "SOI", \
-			603 :  "SU", \
-			604 :  "TA'E", \
-			605 :  "TEI", \
-			606 :  "TO", \
-			607 :  "TOI", \
-			610 :  "TU'E", \
-			611 :  "TU'U", \
-			612 :  "UI", \
-			613 :  "VA", \
-			614 :  "VAU", \
-			615 :  "VE'A", \
-			616 :  "VI'A", \
-			617 :  "XI", \
-			618 :  "Y", \
-			621 :  "ZA'O", \
-			622 :  "ZE'A", \
-			623 :  "ZEI", \
-			624 :  "ZI", \
-			625 :  "ZI'E", \
-			626 :  "ZO", \
-			627 :  "ZOI", \
-			628 :  "ZO'U", \
-			651 :  "BOI", \
-			655 :  "FU'A", \
-			656 :  "GA'O", \
-			657 :  "JO'I", \
-			658 :  "KU'E", \
-			661 :  "MAI", \
-			662 :  "MA'O", \
-			663 :  "MOI", \
-			664 :  "MO'E", \
-			665 :  "NA'U", \
-			666 :  "NI'E", \
-			667 :  "NU'A", \
-			672 :  "PA", \
-			673 :  "PE'O", \
-			675 :  "TE'U", \
-			677 :  "VEI", \
-			678 :  "VE'O", \
-			679 :  "VU'U", \
-			697 :  "any", \
-			698 :  "any", \
-			699 :  "anyt'ing", \
-			905 :  "lexer_A (utterance ordinal)", \
-			910 :  "lexer_B (ek)", \
-			915 :  "lexer_C (ek with BO)", \
-			916 :  "lexer_D (ek with KE)", \
-			925 :  "lexer_E (jek)", \
-			930 :  "lexer_F (joik)", \
-			935 :  "lexer_G (gek)", \
-			940 :  "lexer_H (guhek)", \
-			945 :  "lexer_I (NAhE BO)", \
-			950 :  "lexer_J (NA KU)", \
-			955 :  "lexer_K (i with BO)", \
-			960 :  "lexer_L (number)", \
-			965 :  "lexer_M (gihek with BO)", \
-			966 :  "lexer_N (gihek with KE)", \
-			970 :  "lexer_O (tense/modal)", \
-			980 :  "lexer_P (gik)", \
-			985 :  "lexer_Q (lerfu string)", \
-			990 :  "lexer_R (gihek)", \
-			995 :  "lexer_S (i or ijek)", \
-			1000 :  "lexer", \
-			1005 :  "lexer_U (jek with BO)", \
-			1010 :  "lexer_V (joik with BO)", \
-			1015 :  "lexer_W (joik with KE)", \
-			1020 :  "lexer", \
-			1025 :  "lexer_Y (numeric selbri)" \
-			}
-		return _rulename[ruleid] if ruleid in _rulename else ""
+		if isinstance(ruleid, int) and 0 <= ruleid <= _RULENAME_MAX:
+			return _RULENAME_TABLE[ruleid]
+		# end if isinstance(ruleid, int) and 0 <= ruleid <= _RULENAME_MAX:
+		return _RULENAMES.get(ruleid, "")
 	# end def rulename(ruleid):
 
+	@staticmethod
+	def ruleid(name):
+		"""
+		Returns the rule ID given its name, or None if the name is unknown.
+		"""
+		return _RULEIDS.get(name)
+	# end def ruleid(name):
+
+	@staticmethod
+	def prologname(ruleid):
+		"""
+		Returns the rule name given its ID, in the form used for Prolog functors.
+		"""
+		if isinstance(ruleid, int) and 0 <= ruleid <= _RULENAME_MAX:
+			return _PROLOGNAME_TABLE[ruleid]
+		# end if isinstance(ruleid, int) and 0 <= ruleid <= _RULENAME_MAX:
+		return Constants.prologize(_RULENAMES.get(ruleid, ""))
+	# end def prologname(ruleid):
+
+	@staticmethod
+	def prologize(p):
+		"""
+		Replaces single quotes with "h" and non alphanumeric characters 
+		with underscores.
+		"""
+		if p is None:
+			return None
+		# end if p is None:
+		r = ""
+		for c in p:
+			if c == "'":
+				r += "h"
+			elif not c.isalnum():
+				r += "_"
+			else:
+				r += c
+			# end if
+		# end for c in p:
+		return r
+	# end def prologize(p):
+
 	@staticmethod
 	def isC(c):
 		"""
@@ -747,7 +620,7 @@ class Constants:
 		"""
 		Checks if the token is an indicator according to its type.
 		"""
-		if tok().ttype in [Constants.UI_612, Constants.CAI_515, Constants.Y_618, \
+		if tok.ttype in [Constants.UI_612, Constants.CAI_515, Constants.Y_618, \
 			Constants.DAhO_524, Constants.FUhO_536, Constants.FUhE_535, \
 			Constants.NAI_581]:
 			return True
@@ -917,6 +790,24 @@ class Constants:
 		# end try except IndexError as e:
 	# end def get_vowels(text):
 
+	@staticmethod
+	def get_selmao(text):
+		"""
+		Returns the selma'o of cmavo text from the tables below, UNK_M1 for
+		an unknown cmavo or XAI_M2 for an experimental one.
+		This is slow: the lexer looks cmavo up in _CMAVOTYPES, made with this
+		method, and only calls it for the words that are not there.
+		"""
+		i = text[0]
+		i = Constants.cmavo_cons[ord(i) - ord('a')] if i.islower() else 0
+		# skips the initial consonant if i is nonzero
+		j = Constants.get_vowels(text[(1 if (i != 0) else 0):])
+		if i != 0 and j > 34:
+			j = Constants.UNK_M1
+		# end if i != 0 and j > 34:
+		return Constants.UNK_M1 if j == Constants.UNK_M1 else Constants.cmavo[i][j]
+	# end def get_selmao(text):
+
 	# constants for selmao
 	A_501 = 501
 	BAI_502 = 502
@@ -1279,12 +1170,407 @@ class Constants:
 		t_cmavo, v_cmavo, x_cmavo, \
 		z_cmavo \
 	)
+
+	## This table gives the index in cmavo of the table for each initial
+	## letter from a to z (0 for vowels and letters not starting cmavo).
+	##
+
+	cmavo_cons = (0, 1, 2, 3, 0, 4, 5, 0, 0, 6, 7, 8, 9, \
+		10, 0, 11, 0, 12, 13, 14, 0, 15, 0, 16, 0, 17 )
 # end class Constants:
 
+#######################################################################
+## Cmavo types
+#######################################################################
+
+# The vowel parts of cmavo known to Constants.get_vowels: V, VV and V'V.
+_CMAVOVOWELS = tuple(v for v in "aeiouy") + \
+	tuple(v + w for v in "aeiouy" for w in "aeiouy") + \
+	tuple(v + "'" + w for v in "aeiouy" for w in "aeiouy")
+
+# Type of every cmavo of the tables in Constants (all the words for which
+# Constants.get_selmao is not UNK_M1), so that the lexer classifies a
+# cmavo with one lookup; words that are not here go to get_selmao.
+_CMAVOTYPES = MappingProxyType({text : ttype for (text, ttype) in \
+	((c + v, Constants.get_selmao(c + v)) \
+		for c in [""] + [chr(ord('a') + i) for (i, index) in \
+			enumerate(Constants.cmavo_cons) if index != 0] \
+		for v in _CMAVOVOWELS) \
+	if ttype != Constants.UNK_M1})
+
+#######################################################################
+## Rule names
+#######################################################################
+
+# Rule and selmao names by ID (from rulename.c).
+_RULENAMES = MappingProxyType({ \
+		0 : "EOT", \
+		10000 :  "text_0", \
+		1 :  "text_A_1", \
+		2 :  "text_B_2", \
+		3 :  "text_C_3", \
+		4 :  "paragraphs_4", \
+		10 :  "paragraph_10", \
+		11 :  "paragraph_A_11", \
+		12 :  "paragraph_B_12", \
+		20 :  "utterance_20", \
+		30 :  "prenex_30", \
+		32 :  "free_modifier_32", \
+		33 :  "free_modifier_A_33", \
+		34 :  "discursive_bridi_34", \
+		35 :  "vocative_35", \
+		36 :  "parenthetical_36", \
+		40 :  "sentence_40", \
+		41 :  "sentence_A_41", \
+		42 :  "statement_42", \
+		50 :  "bridi_tail_50", \
+		51 :  "bridi_tail_A_51", \
+		52 :  "bridi_tail_B_52", \
+		53 :  "bridi_tail_C_53", \
+		54 :  "gek_bridi_tail_54", \
+		71 :  "tail_terms_71", \
+		80 :  "terms_80", \
+		81 :  "term_81", \
+		82 :  "modifier_82", \
+		83 :  "term_set_83", \
+		90 :  "sumti_90", \
+		91 :  "sumti_A_91", \
+		92 :  "sumti_B_92", \
+		93 :  "sumti_C_93", \
+		94 :  "sumti_D_94", \
+		95 :  "sumti_E_95", \
+		96 :  "sumti_F_96", \
+		110 :  "description_110", \
+		111 :  "sumti_tail_111", \
+		112 :  "sumti_tail_A_112", \
+		121 :  "relative_clauses_121", \
+		122 :  "relative_clause_122", \
+		130 :  "selbri_130", \
+		131 :  "selbri_A_131", \
+		132 :  "selbri_B_132", \
+		133 :  "selbri_C_133", \
+		134 :  "selbri_D_134", \
+		135 :  "selbri_E_135", \
+		136 :  "selbri_F_136", \
+		137 :  "GUhEK_selbri_137", \
+		150 :  "tanru_unit_150", \
+		151 :  "tanru_unit_A_151", \
+		152 :  "tanru_unit_B_152", \
+		160 :  "linkargs_160", \
+		161 :  "links_161", \
+		300 :  "quantifier_300", \
+		310 :  "MEX_310", \
+		311 :  "MEX_A_311", \
+		312 :  "MEX_B_312", \
+		313 :  "MEX_C_313", \
+		330 :  "rp_expression_330", \
+		332 :  "rp_operand_332", \
+		370 :  "operator_370", \
+		371 :  "operator_A_371", \
+		372 :  "operator_B_372", \
+		374 :  "MEX_operator_374", \
+		381 :  "operand_381", \
+		382 :  "operand_A_382", \
+		383 :  "operand_B_383", \
+		385 :  "operand_C_385", \
+		400 :  "anaphora_400", \
+		404 :  "cmene_404", \
+		405 :  "cmene_A_405", \
+		407 :  "bridi_valsi_407", \
+		408 :  "bridi_valsi_A_408", \
+		410 :  "para_mark_410", \
+		411 :  "indicators_411", \
+		412 :  "indicators_A_412", \
+		413 :  "indicator_413", \
+		415 :  "DOI_415", \
+		416 :  "COI_416", \
+		417 :  "COI_A_417", \
+		421 :  "JOIK_EK_421", \
+		422 :  "JOIK_JEK_422", \
+		425 :  "NU_425", \
+		426 :  "NU_A_426", \
+		432 :  "quote_arg_432", \
+		433 :  "quote_arg_A_433", \
+		434 :  "ZOI_quote_434", \
+		435 :  "ZO_quote_435", \
+		436 :  "LOhU_quote_436", \
+		440 :  "SEI_440", \
+		443 :  "CO_443", \
+		444 :  "CEI_444", \
+		445 :  "NA_445", \
+		447 :  "TUhE_447", \
+		448 :  "LIhU_gap_448", \
+		450 :  "gap_450", \
+		451 :  "front_gap_451", \
+		452 :  "MEX_gap_452", \
+		453 :  "KEI_gap_453", \
+		454 :  "TUhU_gap_454", \
+		456 :  "VAU_gap_456", \
+		457 :  "DOhU_gap_457", \
+		458 :  "FEhU_gap_458", \
+		459 :  "SEhU_gap_459", \
+		460 :  "NUhU_gap_460", \
+		461 :  "BOI_gap_461", \
+		462 :  "sub_gap_462", \
+		463 :  "LUhU_gap_463", \
+		464 :  "GEhU_gap_464", \
+		465 :  "MEhU_gap_465", \
+		466 :  "KEhE_gap_466", \
+		467 :  "BEhO_gap_467", \
+		468 :  "TOI_gap_468", \
+		469 :  "KUhO_gap_469", \
+		470 :  "left_bracket_470", \
+		471 :  "right_bracket_gap_471", \
+		472 :  "LOhO_gap_472", \
+		473 :  "TEhU_gap_473", \
+		474 :  "right_br_no_free_474", \
+		480 :  "SE_480", \
+		481 :  "FA_481", \
+		482 :  "NAhE_482", \
+		483 :  "qualifier_483", \
+		486 :  "subscript_486", \
+		490 :  "mod_head_490", \
+		491 :  "tag_491", \
+		801 :  "utterance_ordinal_801", \
+		802 :  "EK_802", \
+		803 :  "EK_BO_803", \
+		804 :  "EK_KE_804", \
+		805 :  "JEK_805", \
+		806 :  "JOIK_806", \
+		807 :  "GEK_807", \
+		808 :  "GUhEK_808", \
+		809 :  "NAhE_BO_809", \
+		810 :  "NA_KU_810", \
+		811 :  "I_BO_811", \
+		812 :  "number_812", \
+		813 :  "GIhEK_BO_813", \
+		814 :  "GIhEK_KE_814", \
+		815 :  "tense_modal_815", \
+		816 :  "GIK_816", \
+		817 :  "lerfu_string_817", \
+		818 :  "GIhEK_818", \
+		819 :  "I_819", \
+		821 :  "JEK_BO_821", \
+		822 :  "JOIK_BO_822", \
+		823 :  "JOIK_KE_823", \
+		824 :  "PA_MOI_824", \
+		906 :  "utt_ordinal_root_906", \
+		911 :  "EK_root_911", \
+		926 :  "JEK_root_926", \
+		931 :  "JOIK_root_931", \
+		932 :  "interval_932", \
+		956 :  "I_root_956", \
+		957 :  "simple_JOIK_JEK_957", \
+		961 :  "number_root_961", \
+		971 :  "simple_tag_971", \
+		972 :  "simple_tense_modal_972", \
+		973 :  "simple_tense_modal_A_973:", \
+		974 :  "modal_974", \
+		975 :  "modal_A_975", \
+		977 :  "tense_A_977", \
+		978 :  "tense_B_978", \
+		979 :  "tense_C_979", \
+		981 :  "GIK_root_981", \
+		986 :  "lerfu_string_root_986", \
+		987 :  "lerfu_word_987", \
+		991 :  "GIhEK_root_991", \
+		1030 :  "time_1030", \
+		1031 :  "time_A_1031", \
+		1032 :  "time_B_1032", \
+		1033 :  "time_offset_1033", \
+		1034 :  "time_interval_1034", \
+		1035 :  "time_direction_1035", \
+		1040 :  "space_1040", \
+		1041 :  "space_motion_1041", \
+		1042 :  "space_A_1042", \
+		1043 :  "space_B_1043", \
+		1044 :  "space_C_1044", \
+		1045 :  "space_offset_1045", \
+		1046 :  "space_intval_1046", \
+		1047 :  "space_intval_A_1047", \
+		1048 :  "space_direction_1048", \
+		1050 :  "interval_modifier_1050", \
+		1051 :  "interval_property_1051", \
+		1052 :  "event_mod_1052", \
+		1053 :  "event_mod_A_1053", \
+		# 0 :  "YYSTYPE", \
+		501 :  "A", \
+		502 :  "BAI", \
+		503 :  "BA'E", \
+		504 :  "BE", \
+		505 :  "BEI", \
+		506 :  "BE'O", \
+		507 :  "BI'I", \
+		508 :  "BO", \
+		509 :  "BRIVLA", \
+		511 :  "BU", \
+		513 :  "BY", \
+		514 :  "CA'A", \
+		515 :  "CAI", \
+		516 :  "CEI", \
+		517 :  "CMENE", \
+		518 :  "CO", \
+		519 :  "COI", \
+		520 :  "CU", \
+		521 :  "CU'E", \
+		524 :  "DA'O", \
+		525 :  "DOI", \
+		526 :  "DO'U", \
+		527 :  "FA", \
+		528 :  "FA'A", \
+		529 :  "FA'O", \
+		530 :  "FE'E", \
+		531 :  "FE'U", \
+		532 :  "FI'O", \
+		533 :  "FOI", \
+		535 :  "FU'E", \
+		536 :  "FU'O", \
+		537 :  "GA", \
+		538 :  "GE'U", \
+		539 :  "GI", \
+		541 :  "GI'A", \
+		542 :  "GOI", \
+		543 :  "GO'A", \
+		544 :  "GU'A", \
+		545 :  "I", \
+		546 :  "JA", \
+		547 :  "JAI", \
+		548 :  "JOI", \
+		550 :  "KE'E", \
+		551 :  "KE", \
+		552 :  "KEI", \
+		554 :  "KI", \
+		555 :  "KO'A", \
+		556 :  "KU", \
+		557 :  "KU'O", \
+		558 :  "LA", \
+		559 :  "LAU", \
+		561 :  "LA'E", \
+		562 :  "LE", \
+		565 :  "LE'U", \
+		566 :  "LI", \
+		567 :  "LI'U", \
+		568 :  "LO'O", \
+		569 :  "LO'U", \
+		571 :  "LU", \
+		573 :  "LU'U", \
+		574 :  "ME", \
+		575 :  "ME'U", \
+		577 :  "MO'I", \
+		578 :  "NA", \
+		581 :  "NAI", \
+		583 :  "NA'E", \
+		584 :  "NI'O", \
+		585 :  "NOI", \
+		586 :  "NU", \
+		587 :  "NU'I", \
+		588 :  "NU'U", \
+		592 :  "PU", \
+		593 :  "RA'O", \
+		594 :  "ROI", \
+		595 :  "SA", \
+		596 :  "SE", \
+		597 :  "SEI", \
+		598 :  "SE'U", \
+		601 :  "SI", \
+		602 :  "SOI", \
+		603 :  "SU", \
+		604 :  "TA'E", \
+		605 :  "TEI", \
+		606 :  "TO", \
+		607 :  "TOI", \
+		610 :  "TU'E", \
+		611 :  "TU'U", \
+		612 :  "UI", \
+		613 :  "VA", \
+		614 :  "VAU", \
+		615 :  "VE'A", \
+		616 :  "VI'A", \
+		617 :  "XI", \
+		618 :  "Y", \
+		621 :  "ZA'O", \
+		622 :  "ZE'A", \
+		623 :  "ZEI", \
+		624 :  "ZI", \
+		625 :  "ZI'E", \
+		626 :  "ZO", \
+		627 :  "ZOI", \
+		628 :  "ZO'U", \
+		651 :  "BOI", \
+		655 :  "FU'A", \
+		656 :  "GA'O", \
+		657 :  "JO'I", \
+		658 :  "KU'E", \
+		661 :  "MAI", \
+		662 :  "MA'O", \
+		663 :  "MOI", \
+		664 :  "MO'E", \
+		665 :  "NA'U", \
+		666 :  "NI'E", \
+		667 :  "NU'A", \
+		672 :  "PA", \
+		673 :  "PE'O", \
+		675 :  "TE'U", \
+		677 :  "VEI", \
+		678 :  "VE'O", \
+		679 :  "VU'U", \
+		697 :  "any", \
+		698 :  "any", \
+		699 :  "anyt'ing", \
+		905 :  "lexer_A (utterance ordinal)", \
+		910 :  "lexer_B (ek)", \
+		915 :  "lexer_C (ek with BO)", \
+		916 :  "lexer_D (ek with KE)", \
+		925 :  "lexer_E (jek)", \
+		930 :  "lexer_F (joik)", \
+		935 :  "lexer_G (gek)", \
+		940 :  "lexer_H (guhek)", \
+		945 :  "lexer_I (NAhE BO)", \
+		950 :  "lexer_J (NA KU)", \
+		955 :  "lexer_K (i with BO)", \
+		960 :  "lexer_L (number)", \
+		965 :  "lexer_M (gihek with BO)", \
+		966 :  "lexer_N (gihek with KE)", \
+		970 :  "lexer_O (tense/modal)", \
+		980 :  "lexer_P (gik)", \
+		985 :  "lexer_Q (lerfu string)", \
+		990 :  "lexer_R (gihek)", \
+		995 :  "lexer_S (i or ijek)", \
+		1000 :  "lexer", \
+		1005 :  "lexer_U (jek with BO)", \
+		1010 :  "lexer_V (joik with BO)", \
+		1015 :  "lexer_W (joik with KE)", \
+		1020 :  "lexer", \
+		1025 :  "lexer_Y (numeric selbri)" \
+	})
+
+# Dense index of the names for IDs 0 to _RULENAME_MAX, so that a lookup
+# is a tuple subscript; IDs outside that range fall back to _RULENAMES.
+_RULENAME_MAX = 10000
+_RULENAME_TABLE = tuple(_RULENAMES.get(ruleid, "") \
+	for ruleid in range(_RULENAME_MAX + 1))
+
+# Reverse index (name to ID); for the few shared names the lowest ID wins.
+_RULEIDS = MappingProxyType({name : ruleid \
+	for ruleid, name in sorted(_RULENAMES.items(), reverse = True)})
+
+# Names in Prolog form, indexed like _RULENAME_TABLE.
+_PROLOGNAME_TABLE = tuple(Constants.prologize(name) for name in _RULENAME_TABLE)
+
 #######################################################################
 ## Token
 #######################################################################
 
+# first int32 of the bytes returned by Token.dumps; also tells the byte order
+_DUMPMAGIC = 0x4C4A5431
+
+# number of int32 in the header of the bytes returned by Token.dumps
+# and TokenStore.tobytes
+_DUMPHEADER = 4
+
+# first int32 of the bytes returned by TokenStore.tobytes
+_STOREMAGIC = 0x4C4A5332
+
 class Token:
 	"""
 	Class Token is the token struct (defined in token.h).
@@ -1295,29 +1581,30 @@ class Token:
 	The rest are the same.
 
 	Notes: 
-		Function settype(tok, type) defined in token.c is ommited since the setter 
-		function for ttype (type) property is performing the exact same fuctionality.
+		Function settype(tok, type) defined in token.c is ommited since assigning
+		the ttype attribute is performing the exact same fuctionality.
 
 		Function add(parent, child) is implemented as an object (instance) method and not as a 
 		class method (static).
 
-		In C code types ptoken and YYSTYPE are defined as pointers to token struct.
+		In C code types ptoken and YYSTYPE are defined as pointers to token struct;
+		here they are plain references to Token objects.
+		The fields are __slots__ and are not checked; see CheckedToken.
 
 	This class also implements all functions (except downcase) for printing a token 
 	defined in print.c.
 	Function downcase is not implemented since there is an Python intrinsic couterpart.
 	"""
+	__slots__ = ("ttype", "text", "up", "right", "downleft", "downright", "nextn")
+
 	def __init__(self, ttype = -1):
-		if not isinstance(ttype, int):
-			raise LojbanException(self, "ttype should be an int (is {:s})".format(ttype.__class__.__qualname__))
-		# end if not isinstance(ttype, int):
-		self._ttype = ttype
-		self._text = None
-		self._up = None
-		self._right = None
-		self._downright = None
-		self._downleft = None
-		self._nextn = None
+		self.ttype = ttype
+		self.text = None
+		self.up = None
+		self.right = None
+		self.downright = None
+		self.downleft = None
+		self.nextn = None
 	# end def __init__(self):
 
 	def __str__(self):
@@ -1329,171 +1616,25 @@ class Token:
 	# end def ___repr__(self):
 
 	def tostr(self, endline = False, singlemode = False, maxline = 75):
-		sysstdout = sys.stdout
 		buffer = StringIO()
-		sys.stdout = buffer
-		self.print(self, endline = False, singlemode = False, maxline = 75)
-		sys.stdout = sysstdout
+		Token.print(self, endline = endline, singlemode = singlemode, \
+			maxline = maxline, file = buffer)
 		return buffer.getvalue()
 	# end def tostr(self, endline = False, singlemode = False, maxline = 75):
 
-	@property
-	def ttype(self):
-		return self._ttype
-	# end def ttype(self):
-	
-	@ttype.setter
-	def ttype(self, v):
-		if v and not isinstance(v, int):
-			raise LojbanException(self, "ttype should be an int (is {:s})".format(v.__class__.__qualname__))
-		# end if v and not isinstance(v, int):
-		self._ttype = v
-	# end def ttype(self, v):
-
-	@property
-	def text(self):
-		return self._text
-	# end def text(self):
-	
-	@text.setter
-	def text(self, v):
-		if v and not isinstance(v, str):
-			raise LojbanException(self, "text should be a string (is {:s})".format(v.__class__.__qualname__))
-		# end if v and not isinstance(v, str):
-		self._text = v
-	# end def text(self, v):	
-
-	@property
-	def up(self):
-		return self._up
-	# end def up(self):
-	
-	@up.setter
-	def up(self, v):
-		if not v:
-			self._up = None
-		elif isinstance(v, Token):
-			self._up = weakref.ref(v)
-		elif (v.__class__.__qualname__ == "ReferenceType" or v.__class__.__qualname__ == "weakref") and isinstance(v(), Token):
-			self._up = v
-		else:
-			raise LojbanException(self, "Argument should be a Token" + \
-				" or a weak reference to Token or None"+\
-				" (is {:s} {:s})".format(v.__class__.__qualname__, \
-					"" if (v.__class__.__qualname__ != "ReferenceType" and v.__class__.__qualname__ != "weakref") else \
-					v().__class__.__qualname__))
-		# end if 
-	# end def up(self, v):
-
-	@property
-	def right(self):
-		return self._right
-	# end def right(self):
-	
-	@right.setter
-	def right(self, v):
-		if not v:
-			self._right = None
-		elif isinstance(v, Token):
-			self._right = weakref.ref(v)
-		elif (v.__class__.__qualname__ == "ReferenceType" or v.__class__.__qualname__ == "weakref") and isinstance(v(), Token):
-			self._right = v
-		else:
-			raise LojbanException(self, "Argument should be a Token" + \
-				" or a weak reference to Token or None"+\
-				" (is {:s} {:s})".format(v.__class__.__qualname__, \
-					"" if (v.__class__.__qualname__ != "ReferenceType" and v.__class__.__qualname__ != "weakref") else \
-					v().__class__.__qualname__))
-		# end if 
-	# end def right(self, v):
-
-	@property
-	def downright(self):
-		return self._downright
-	# end def downright(self):
-	
-	@downright.setter
-	def downright(self, v):
-		if not v:
-			self._downright = None
-		elif isinstance(v, Token):
-			self._downright = weakref.ref(v)
-		elif (v.__class__.__qualname__ == "ReferenceType" or v.__class__.__qualname__ == "weakref") and isinstance(v(), Token):
-			self._downright = v
-		else:
-			raise LojbanException(self, "Argument should be a Token" + \
-				" or a weak reference to Token or None"+\
-				" (is {:s} {:s})".format(v.__class__.__qualname__, \
-					"" if (v.__class__.__qualname__ != "ReferenceType" and v.__class__.__qualname__ != "weakref") else \
-					v().__class__.__qualname__))
-		# end if 
-	# end def downright(self, v):
-
-	@property
-	def downleft(self):
-		return self._downleft
-	# end def downleft(self):
-	
-	@downleft.setter
-	def downleft(self, v):
-		if not v:
-			self._downleft = None
-		elif isinstance(v, Token):
-			self._downleft = weakref.ref(v)
-		elif (v.__class__.__qualname__ == "ReferenceType" or v.__class__.__qualname__ == "weakref") and isinstance(v(), Token):
-			self._downleft = v
-		else:
-			raise LojbanException(self, "Argument should be a Token" + \
-				" or a weak reference to Token or None"+\
-				" (is {:s} {:s})".format(v.__class__.__qualname__, \
-					"" if (v.__class__.__qualname__ != "ReferenceType" and v.__class__.__qualname__ != "weakref") else \
-					v().__class__.__qualname__))
-		# end if 
-	# end def downleft(self, v):
-
-	@property
-	def nextn(self):
-		return self._nextn
-	# end def nextn(self):
-	
-	@nextn.setter
-	def nextn(self, v):
-		if not v:
-			self._nextn = None
-		elif isinstance(v, Token):
-			self._nextn = weakref.ref(v)
-		elif (v.__class__.__qualname__ == "ReferenceType" or v.__class__.__qualname__ == "weakref") and isinstance(v(), Token):
-			self._nextn = v
-		else:
-			raise LojbanException(self, "Argument should be a Token" + \
-				" or a weak reference to Token or None"+\
-				" (is {:s} {:s})".format(v.__class__.__qualname__, \
-					"" if (v.__class__.__qualname__ != "ReferenceType" and v.__class__.__qualname__ != "weakref") else \
-					v().__class__.__qualname__))
-		# end if 
-	# end def nextn(self, v):
-
 	def add(parent, child):
 		"""
 		Adds a child node to parent node.
 		"""
-		if child and ((child.__class__.__qualname__ != "ReferenceType" and child.__class__.__qualname__ != "weakref") or \
-			not isinstance(child(), Token)):
-			raise LojbanException(LojbanParser(), "Argument should be" + \
-				" a weak reference to childen or None"+\
-				" (is {:s} {:s})".format(child.__class__.__qualname__, \
-					"" if (child.__class__.__qualname__ != "ReferenceType" and child.__class__.__qualname__ != "weakref") else \
-					child().__class__.__qualname__))
-		# end if 
 		if child is None:
 			return
 		# end if child is None:
-		child().up = parent
-		if parent.downleft:
-			parent.downright().right = child
-		else: # if parent.downleft:
+		child.up = parent
+		if parent.downleft is None:
 			parent.downleft = child
-		# end if not parent.downleft is None:
+		else: # if parent.downleft is None:
+			parent.downright.right = child
+		# end if parent.downleft is None:
 		parent.downright = child
 	# end def add(parent, child):
 
@@ -1502,15 +1643,16 @@ class Token:
 	#
 
 	@staticmethod
-	def print(tok, endline = True, singlemode = False, maxline = 75): 
+	def print(tok, endline = True, singlemode = False, maxline = 75, file = None): 
 		"""
-		Prints a tree of tokens.
+		Prints a tree of tokens to file (default sys.stdout).
 		print is a intrinsic Python function thus renamed.
 		"""
 		def _print1(tok):
 			"""
 			Traverses and prints a tree of tokens.
 			"""
+			nonlocal column, level
 			if tok and not isinstance(tok, Token):
 				raise LojbanException(Token(), "Argument should be a Token (is {:s}).".format(tok.__class__.__qualname__))
 			# end if tok and not isinstance(tok, Token):
@@ -1521,60 +1663,60 @@ class Token:
 			while tail_recursion:
 				tail_recursion = False
 				if tok is None:
-					Token.print._column += 4
-					if Token.print._column >= Token.print._maxline:
-						print()
-						Token.print._column = 4
-					# end if Token.print._column >= Token.print._maxline:
-					print("NULL", end = "")
+					column += 4
+					if column >= maxline:
+						print(file = file)
+						column = 4
+					# end if column >= maxline:
+					print("NULL", end = "", file = file)
 				elif tok.ttype == 0:
-					Token.print._column += 3
-					if Token.print._column >= Token.print._maxline:
-						print()
-						Token.print._column = 3
-					# end if Token.print._column >= Token.print._maxline:
-					print("EOT", end = "")
+					column += 3
+					if column >= maxline:
+						print(file = file)
+						column = 3
+					# end if column >= maxline:
+					print("EOT", end = "", file = file)
 				elif tok.text:
-					Token.print._column += len(tok.text)
-					if Token.print._column >= Token.print._maxline:
-						print()
-						Token.print._column = len(tok.text)
-					# end if Token.print._column >= Token.print._maxline:
-					print("{:s}".format(tok.text), end = "") 
+					column += len(tok.text)
+					if column >= maxline:
+						print(file = file)
+						column = len(tok.text)
+					# end if column >= maxline:
+					print("{:s}".format(tok.text), end = "", file = file) 
 				elif not tok.downleft:
-					Token.print._column += 2
-					if Token.print._column >= Token.print._maxline:
-						print()
-						Token.print._column = 2
-					# end if Token.print._column >= Token.print._maxline:
-					print("()", end = "")
-				elif (not Token.print._singlemode and not tok.downleft().right):
-					tok = tok.downleft()
+					column += 2
+					if column >= maxline:
+						print(file = file)
+						column = 2
+					# end if column >= maxline:
+					print("()", end = "", file = file)
+				elif (not singlemode and not tok.downleft.right):
+					tok = tok.downleft
 					tail_recursion = True
 				else:
 					p = tok.downleft
 					while not p is None:
-						Token.print._column += 1
-						if Token.print._column >= Token.print._maxline:
-							print()
-							Token.print._column = 1
-						# end if Token.print._column >= Token.print._maxline:
+						column += 1
+						if column >= maxline:
+							print(file = file)
+							column = 1
+						# end if column >= maxline:
 						d = " "
-						if p() == tok.downleft():
-							d = _LDELIM[Token.print._level & 3]
-							Token.print._level += 1
-						# end if p() == tok.downleft():
-						print("{:s}".format(d), end = "")
-						_print1(p())
-						p = p().right
+						if p == tok.downleft:
+							d = _LDELIM[level & 3]
+							level += 1
+						# end if p == tok.downleft:
+						print("{:s}".format(d), end = "", file = file)
+						_print1(p)
+						p = p.right
 					# end while not p is None:
-					Token.print._column += 1
-					if Token.print._column >= Token.print._maxline:
-						print()
-						Token.print._column = 1
-					# end if Token.print._column >= Token.print._maxline:
-					Token.print._level -= 1
-					print("{:s}".format(_RDELIM[Token.print._level & 3]), end = "")
+					column += 1
+					if column >= maxline:
+						print(file = file)
+						column = 1
+					# end if column >= maxline:
+					level -= 1
+					print("{:s}".format(_RDELIM[level & 3]), end = "", file = file)
 				# end if 
 			# end while tail_recursion:
 		# end def print1(tok):
@@ -1583,61 +1725,28 @@ class Token:
 			raise LojbanException(Token(), "Argument should be a Token (is {:s}).".format(tok.__class__.__qualname__))
 		# end if tok and not isinstance(tok, Token):
 
-		if not getattr(Token.print, "_level", None):
-			Token.print._level = 0
-		# end if not getattr(Token.print, "_level", None):
-		if not getattr(Token.print, "_column", None):
-			Token.print._column = 0
-		# end if not getattr(Token.print, "_column", None):
-		if not getattr(Token.print, "_singlemode", None):
-			Token.print._singlemode = False
-		# end if not getattr(Token.print, "_singlemode", None):
-		if not getattr(Token.print, "_maxline", None):
-			Token.print._maxline = 75
-		# end if not getattr(Token.print, "_maxline", None):
-
-		Token.print._singlemode = singlemode
-		Token.print._maxline = maxline
-		if Token.print._maxline < 1:
-			Token.print._maxline = sys.maxsize
-		# end if Token.print._maxline < 1:
-		Token.print._level = 0
-		Token.print._column = 0
+
+		if maxline < 1:
+			maxline = sys.maxsize
+		# end if maxline < 1:
+		level = 0
+		column = 0
 		_print1(tok)
 		if endline:
-			print()
+			print(file = file)
 		# end if endline:
-	# end def print(self, tok):
+	# end def print(tok, endline = True, singlemode = False, maxline = 75, file = None):
 		
 	@staticmethod
-	def rprint(tok, endline = True, singlemode = False, maxline = 75):
+	def rprint(tok, endline = True, singlemode = False, maxline = 75, file = None):
 		"""
-		Reverse prints of a token tree.
+		Reverse prints of a token tree to file (default sys.stdout).
 		"""
-		def _prologize(p):
-			"""
-			Replaces single quotes and non alphanumeric characters with underscores.
-			"""
-			if p is None:
-				return None
-			# end if p is None:
-			r = ""
-			for c in p:
-				if c == "'":
-					r += "h"
-				elif not c.isalnum():
-					r += "_"
-				else:
-					r += c
-				# end if
-			# end for c in p:
-			return r
-		# end def _prologize(p):
-
 		def _rprint1(tok):
 			"""
 			Traverses in reverse order and prints of a token tree.
 			"""
+			nonlocal column
 			if tok and not isinstance(tok, Token):
 				raise LojbanException(Token(), "Argument should be a Token (is {:s}).".format(tok.__class__.__qualname__))
 			# end if tok and not isinstance(tok, Token):
@@ -1650,64 +1759,62 @@ class Token:
 				else:
 					rule = None
 				# end if
-				_prologize(rule)
 
 				if tok is None:
-					Token.rprint._column += 4
-					if Token.rprint._column >= Token.rprint._maxline:
-						print()
-						Token.rprint._column = 4
-					# end if Token.rprint._column >= Token.rprint._maxline:
-					print("NULL", end = "")
+					column += 4
+					if column >= maxline:
+						print(file = file)
+						column = 4
+					# end if column >= maxline:
+					print("NULL", end = "", file = file)
 				elif tok.ttype == 0:
-					Token.rprint._column += 3
-					if Token.rprint._column >= Token.rprint._maxline:
-						print()
-						Token.rprint._column = 3
-					# end if Token.rprint._column >= Token.rprint._maxline:
-					print("EOT", end = "")
+					column += 3
+					if column >= maxline:
+						print(file = file)
+						column = 3
+					# end if column >= maxline:
+					print("EOT", end = "", file = file)
 				elif not tok.text is None:
-					Token.rprint._column += len(rule) + len(tok.text) + 2
-					if Token.rprint._column >= Token.rprint._maxline:
-						print()
-						Token.rprint._column = len(rule) + len(tok.text) + 2
-					# end if Token.rprint._column >= Token.rprint._maxline:
-					_prologize(tok.text)
-					print("{:s}({:s})".format(rule, tok.text.lower()), end = "")
+					column += len(rule) + len(tok.text) + 2
+					if column >= maxline:
+						print(file = file)
+						column = len(rule) + len(tok.text) + 2
+					# end if column >= maxline:
+					print("{:s}({:s})".format(rule, tok.text.lower()), end = "", file = file)
 				elif tok.downleft is None:
-					Token.rprint._column += len(rule) + 2
-					if Token.rprint._column >= Token.rprint._maxline:
-						print()
-						Token.rprint._column = len(rule) + 2
-					# end if Token.rprint._column >= Token.rprint._maxline:
-					print("{:s}()".format(rule), end = "")
-				elif not Token.rprint._singlemode and tok.downleft().right is None:
-					tok = tok.downleft()
+					column += len(rule) + 2
+					if column >= maxline:
+						print(file = file)
+						column = len(rule) + 2
+					# end if column >= maxline:
+					print("{:s}()".format(rule), end = "", file = file)
+				elif not singlemode and tok.downleft.right is None:
+					tok = tok.downleft
 					tail_recursion = True
 				else:
-					Token.rprint._column += len(rule)
-					if Token.rprint._column >= Token.rprint._maxline:
-						print()
-						Token.rprint._column = len(rule)
-					# end if Token.rprint._column >= Token.rprint._maxline:
-					print("{:s}".format(rule), end = "")
+					column += len(rule)
+					if column >= maxline:
+						print(file = file)
+						column = len(rule)
+					# end if column >= maxline:
+					print("{:s}".format(rule), end = "", file = file)
 					p = tok.downleft
 					while not p is None:
-						Token.rprint._column += 1
-						if Token.rprint._column >= Token.rprint._maxline:
-							print()
-							Token.rprint._column = 1
-						# end if Token.rprint._column >= Token.rprint._maxline:
-						print("{:s}".format('(' if p == tok.downleft else ','), end = "")
-						_rprint1(p())
-						p = p().right
+						column += 1
+						if column >= maxline:
+							print(file = file)
+							column = 1
+						# end if column >= maxline:
+						print("{:s}".format('(' if p == tok.downleft else ','), end = "", file = file)
+						_rprint1(p)
+						p = p.right
 					# end while not p is None:
-					Token.rprint._column += 1
-					if Token.rprint._column >= Token.rprint._maxline:
-						print()
-						Token.rprint._column = 1
-					# end if Token.rprint._column >= Token.rprint._maxline:
-					print(")", end = "")
+					column += 1
+					if column >= maxline:
+						print(file = file)
+						column = 1
+					# end if column >= maxline:
+					print(")", end = "", file = file)
 				# end if
 			# end while tail_recursion:
 		# end def _rprint1(self, tok):
@@ -1716,43 +1823,35 @@ class Token:
 			raise LojbanException(Token(), "Argument should be a Token (is {:s}).".format(tok.__class__.__qualname__))
 		# end if tok and not isinstance(tok, Token):
 
-		if not getattr(Token.rprint, "_column", None):
-			Token.rprint._column = 0
-		# end if not getattr(Token.rprint, "_column", None):
-		if not getattr(Token.rprint, "_singlemode", None):
-			Token.rprint._singlemode = False
-		# end if not getattr(Token.rprint, "_singlemode", None):
-		if not getattr(Token.rprint, "_maxline", None):
-			Token.rprint._maxline = 75
-		# end if not getattr(Token.rprint, "_maxline", None):
-		Token.rprint._singlemode = singlemode
-		Token.rprint._maxline = maxline
-
-		Token.rprint._column = 0
+		column = 0
 		_rprint1(tok)
 		if endline:
-			print(".")
+			print(".", file = file)
 		else: # if endline:
-			print(".", end = "")
+			print(".", end = "", file = file)
 		# end if endline:
-	# end def rprint(self, tok):
+	# end def rprint(tok, endline = True, singlemode = False, maxline = 75, file = None):
 
 	@staticmethod
-	def tprint(tok):
+	def tprint(tok, file = None):
 		"""
-		Prints a tree of tokens
+		Prints a tree of tokens to file (default sys.stdout).
+		The nodes are numbered in numbers, not in their ttype, so that the tree
+		is left as it was (it may be read-only, as a TokenStore in shared
+		memory is).
 		"""
 		def _tree1(tok):
 			"""
 			Recursively prints a tree of tokens.
 			"""
+			nonlocal magic
 			if not isinstance(tok, Token):
 				raise LojbanException(Token(), "Argument should be a Token (is {:s}).".format(tok.__class__.__qualname__))
 			# end if isinstance(tok, Token):
 			child = tok.downleft
 			while not child is None:
-				_tree1(child())
-				child = child().right
+				_tree1(child)
+				child = child.right
 			# end while not child is None:
 			name = Constants.rulename(tok.ttype) if not tok.ttype is None else None
 			atype = tok.ttype
@@ -1765,680 +1864,2963 @@ class Token:
 			# # end if not tok.downleft is None and tok.downleft.right is None:
 			# # endif
 			# # Not executed code end
-			Token.tprint._magic += 1
-			tok.ttype = Token.tprint._magic
-			print("{:s}\t{:s}".format(str(tok.ttype), str(name)), end = "")
+			magic += 1
+			numbers[tok] = magic
+			print("{:s}\t{:s}".format(str(magic), str(name)), end = "", file = file)
 			if tok.text:
-				print("\t{:s}".format(tok.text), end = "")
+				print("\t{:s}".format(tok.text), end = "", file = file)
 			else:
 				child = tok.downleft
 				while not child is None:
-					print("\t{:s}".format(str(child().ttype)), end = "")
-					child = child().right
+					print("\t{:s}".format(str(numbers[child])), end = "", file = file)
+					child = child.right
 				# end while not child is None:
 			# end if
-			print()
+			print(file = file)
 		# end def _tree1(self, tok):
 
 		if tok is None:
-			print("NULL")
+			print("NULL", file = file)
 			return
 		# end if tok is None:
 		if not isinstance(tok, Token):
 			raise LojbanException(Token(), "Argument should be a Token (is {:s}).".format(tok.__class__.__qualname__))
 		# end if isinstance(tok, Token):
-		if not getattr(Token.tprint, "_magic", None):
-			Token.tprint._magic = 0
-		# end if not getattr(Token._print1, "_level", None):
-		Token.tprint._magic = 0
+		magic = 0
+		numbers = {}
 		_tree1(tok)
-	# end def tprint(self, tok):
+	# end def tprint(tok, file = None):
+
+	#
+	# methods for serializing a Token
+	#
+
+	@staticmethod
+	def dumps(tree):
+		"""
+		Returns a tree of tokens (or a list of trees) as bytes, in a compact
+		binary form meant to be sent to another process and read by loads.
+		The bytes hold a header of _DUMPHEADER int32 (_DUMPMAGIC, number of
+		trees or -1 for a single tree, number of tokens, number of texts),
+		then two int32 columns with the type and the shape of each token in
+		preorder, the character offsets of the texts (number of texts + 1
+		int32) and the texts, concatenated and encoded in UTF-8.
+		The shape of a token without text is its number of children; that of
+		a token with a text, which has no children, is -1 - the index of the
+		text in the texts table.  Each distinct text is stored once.
+		Integers are in the byte order of the machine.
+		"""
+		roots = tree if isinstance(tree, list) else [tree]
+		ttypes = array('i')
+		shapes = array('i')
+		offsets = array('i', [0])
+		texts = []
+		ids = {}
+		for root in roots:
+			if not isinstance(root, Token):
+				raise LojbanException(Token(), "Argument should be a Token (is {:s}).".format(root.__class__.__qualname__))
+			# end if not isinstance(root, Token):
+			stack = [root]
+			while stack:
+				tok = stack.pop()
+				ttypes.append(tok.ttype)
+				text = tok.text
+				child = tok.downleft
+				if text is None:
+					children = []
+					while not child is None:
+						children.append(child)
+						child = child.right
+					# end while not child is None:
+					shapes.append(len(children))
+					children.reverse()
+					stack.extend(children)
+				elif child is None:
+					textid = ids.get(text)
+					if textid is None:
+						textid = ids[text] = len(texts)
+						texts.append(text)
+						offsets.append(offsets[-1] + len(text))
+					# end if textid is None:
+					shapes.append(-1 - textid)
+				else: # if text is None:
+					raise LojbanException(Token(), "Token with both a text and children cannot be dumped.")
+				# end if text is None:
+			# end while stack:
+		# end for root in roots:
+		header = array('i', (_DUMPMAGIC, len(roots) if isinstance(tree, list) else -1, \
+			len(ttypes), len(texts)))
+		return b"".join((header.tobytes(), ttypes.tobytes(), shapes.tobytes(), \
+			offsets.tobytes(), "".join(texts).encode("utf-8")))
+	# end def dumps(tree):
+
+	@staticmethod
+	def loads(data, tokenclass = None):
+		"""
+		Returns the tree (or list of trees) of tokens of class tokenclass
+		(default Token) stored in data (bytes or any buffer) by dumps.
+		The integer columns are read in place through a memoryview; only the
+		texts are decoded, all at once.
+		"""
+		tokenclass = Token if tokenclass is None else tokenclass
+		view = memoryview(data)
+		itemsize = array('i').itemsize
+		header = view[:_DUMPHEADER * itemsize].cast('i')
+		if len(header) < _DUMPHEADER or header[0] != _DUMPMAGIC:
+			raise LojbanException(Token(), "Data is not a dump of tokens.")
+		# end if len(header) < _DUMPHEADER or header[0] != _DUMPMAGIC:
+		(nroots, ntokens, ntexts) = (header[1], header[2], header[3])
+		start = _DUMPHEADER * itemsize
+		end = start + ntokens * itemsize
+		ttypes = view[start:end].cast('i')
+		(start, end) = (end, end + ntokens * itemsize)
+		shapes = view[start:end].cast('i')
+		(start, end) = (end, end + (ntexts + 1) * itemsize)
+		offsets = view[start:end].cast('i')
+		alltexts = str(view[end:], "utf-8")
+		texts = [alltexts[offsets[i]:offsets[i + 1]] for i in range(ntexts)]
+		roots = []
+		# parents whose children are being read, and how many are left
+		parents = []
+		counts = []
+		parent = None
+		for (ttype, shape) in zip(ttypes, shapes):
+			tok = tokenclass(ttype)
+			if shape < 0:
+				tok.text = texts[-1 - shape]
+			# end if shape < 0:
+			if parent is None:
+				roots.append(tok)
+			else: # if parent is None:
+				tok.up = parent
+				if parent.downleft is None:
+					parent.downleft = tok
+				else: # if parent.downleft is None:
+					parent.downright.right = tok
+				# end if parent.downleft is None:
+				parent.downright = tok
+				counts[-1] -= 1
+				if counts[-1] == 0:
+					parents.pop()
+					counts.pop()
+					parent = parents[-1] if parents else None
+				# end if counts[-1] == 0:
+			# end if parent is None:
+			if shape > 0:
+				parents.append(tok)
+				counts.append(shape)
+				parent = tok
+			# end if shape > 0:
+		# end for (ttype, shape) in zip(ttypes, shapes):
+		return roots if nroots >= 0 else (roots[0] if roots else None)
+	# end def loads(data, tokenclass = None):
 # end class Token:
 
 #######################################################################
-## LojbanParser
+## CheckedToken
 #######################################################################
 
-class LojbanParser:
+class CheckedToken(Token):
 	"""
-	This class implements all the logic of the parser.
+	Class CheckedToken is a Token whose setters and add() check the types of
+	their arguments, raising a LojbanException on a bad value.
+	The parser allocates CheckedTokens instead of Tokens in debug mode
+	(--checktokens); Token itself does no checking.
 	"""
-	def __init__(self, parameters = Parameters()):
-		self._parameters = parameters
-		self.reset()
-	# end def __init__(self, ...):
+	__slots__ = ()
 
-	def __str__(self):
-		return "LojbanParser with " + self._parameters
-	# end def __str__(self):
+	def __init__(self, ttype = -1):
+		if not isinstance(ttype, int):
+			raise LojbanException(self, "ttype should be an int (is {:s})".format(ttype.__class__.__qualname__))
+		# end if not isinstance(ttype, int):
+		Token.__init__(self, ttype)
+	# end def __init__(self, ttype = -1):
 
-	def __repr__(self):
-		return self.__str__()
-	# end def __repr__(self):
+	def _checklink(self, v):
+		"""
+		Checks a value for a link to another token.
+		"""
+		if not v is None and not isinstance(v, Token):
+			raise LojbanException(self, "Argument should be a Token" + \
+				" or None (is {:s})".format(v.__class__.__qualname__))
+		# end if not v is None and not isinstance(v, Token):
+		return v
+	# end def _checklink(self, v):
 
 	@property
-	def rulemode(self):
-		return self._parameters.rulemode
-	# end def rulemode(self):
+	def ttype(self):
+		return Token.ttype.__get__(self)
+	# end def ttype(self):
+	
+	@ttype.setter
+	def ttype(self, v):
+		if v and not isinstance(v, int):
+			raise LojbanException(self, "ttype should be an int (is {:s})".format(v.__class__.__qualname__))
+		# end if v and not isinstance(v, int):
+		Token.ttype.__set__(self, v)
+	# end def ttype(self, v):
 
 	@property
-	def stringspace(self):
-		return self._stringspace
-	# end def stringspace(self):
+	def text(self):
+		return Token.text.__get__(self)
+	# end def text(self):
+	
+	@text.setter
+	def text(self, v):
+		if v and not isinstance(v, str):
+			raise LojbanException(self, "text should be a string (is {:s})".format(v.__class__.__qualname__))
+		# end if v and not isinstance(v, str):
+		Token.text.__set__(self, v)
+	# end def text(self, v):	
 
 	@property
-	def tokspace(self):
-		return self._tokspace
-	# end def tokspace(self):
+	def up(self):
+		return Token.up.__get__(self)
+	# end def up(self):
 	
+	@up.setter
+	def up(self, v):
+		Token.up.__set__(self, self._checklink(v))
+	# end def up(self, v):
+
 	@property
-	def treemode(self):
-		return self._parameters.treemode
-	# end def treemode(self):
+	def right(self):
+		return Token.right.__get__(self)
+	# end def right(self):
+	
+	@right.setter
+	def right(self, v):
+		Token.right.__set__(self, self._checklink(v))
+	# end def right(self, v):
 
-	_VERSION = "233"
+	@property
+	def downright(self):
+		return Token.downright.__get__(self)
+	# end def downright(self):
+	
+	@downright.setter
+	def downright(self, v):
+		Token.downright.__set__(self, self._checklink(v))
+	# end def downright(self, v):
 
-	@staticmethod
-	def _mkcmavo():
-		"""
-		Utility method for showing cmavo.
-		It is not called during parsing, it is called only from main,
-		on user request.
-		"""
-		cc = (".", "b", "c", "d", "f", "g", "j", "k", "l", "m", "n", \
-					"p", "r", "s", "t", "v", "x", "z")
-
-		vc = ( \
-			"a", "a'a", "a'e", "a'i", "a'o", "a'u", "ai", "au", "e", "e'a", \
-			"e'e", "e'i", "e'o", "e'u", "ei", "i", "i'a", "i'e", "i'i", "i'o", \
-			"i'u", "o", "o'a", "o'e", "o'i", "o'o", "o'u", "oi", "u", "u'a", \
-			"u'e", "u'i", "u'o", "u'u", "y", "ia", "ie", "ii", "io", "iu", \
-			"ua", "ue", "ui", "uo", "uu", "y'y" \
-		)
+	@property
+	def downleft(self):
+		return Token.downleft.__get__(self)
+	# end def downleft(self):
+	
+	@downleft.setter
+	def downleft(self, v):
+		Token.downleft.__set__(self, self._checklink(v))
+	# end def downleft(self, v):
 
-		idx = 0
-		for i in range(len(cc)):
-			jmax = 35 if i != 0 else len(vc)
-			for j in range(jmax):
-				t = Constants.cmavo[i][j]
-				if t >= 0:
-					rule = Constants.rulename(t)
-					try:
-						apos = rule.index("'")
-						rule = rule[:apos] + 'h' + rule[apos+1:]
-					except Exception as e:
-						pass
-					# end try except Exception as e:
-					idx += 1
-					print("{:0>3d}:({:0>2d}-{:0>2d}): {:1s}{:<8} {:<8}".format(idx, i, j, cc[i], vc[j], rule))
-				# end if t >= 0:
-			# end for j in range(jmax):
-		# end for i in range(len(cc)):
-	# end def _mkcmavo():
+	@property
+	def nextn(self):
+		return Token.nextn.__get__(self)
+	# end def nextn(self):
 	
-	def _absorb(self):
+	@nextn.setter
+	def nextn(self, v):
+		Token.nextn.__set__(self, self._checklink(v))
+	# end def nextn(self, v):
+
+	def add(parent, child):
 		"""
-		This method does indicator processing.  It invokes lerfu() and does
-		1-token lookahead to watch for following indicators.  If found, they
-		are absorbed into the previous token.  Indicators belong to selmao
-		UI, CAI, Y, DAhO, FUhE, or FUhO.  UI and CAI can also have a
-		following NAI, which is checked for and absorbed as well.
+		Adds a child node to parent node.
 		"""
-		if not getattr(LojbanParser._absorb, "_cache", None):
-			LojbanParser._absorb._cache = None
-		# end if not getattr(LojbanParser._absorb, "_cache", None):
+		if not child is None and not isinstance(child, Token):
+			raise LojbanException(parent, "Argument should be" + \
+				" a Token or None (is {:s})".format(child.__class__.__qualname__))
+		# end if not child is None and not isinstance(child, Token):
+		Token.add(parent, child)
+	# end def add(parent, child):
+# end class CheckedToken:
 
-		tok = LojbanParser._absorb._cache if LojbanParser._absorb._cache else self._lerfu()
+#######################################################################
+## TokenStore
+#######################################################################
 
-		if tok().ttype == 0:
-			return tok
-		# end if tok().ttype == 0:
-		result = None
-		LojbanParser._absorb._cache = self._lerfu()
-		while Constants.isindicator(LojbanParser._absorb._cache):
-			if LojbanParser._absorb._cache().ttype == Constants.NAI_581:
-				if result is None:
-					break
-				# end if result:
-				lasttype = result().downright().ttype
-				if lasttype != Constants.UI_612 and lasttype != Constants.CAI_515:
-					break
-				# end if lasttype != Constants.UI_612 and lasttype != Constants.CAI_515:
-			# end if LojbanParser._absorb._cache().ttype == Constants.NAI_581:
-			if result is None:
-				result = self._newtoken()
-				result().ttype = tok().ttype
-				result().add(tok)
-			# end if result is None:
-			result().add(LojbanParser._absorb._cache)
-			LojbanParser._absorb._cache = self._lerfu()
-		# end while Constants.isindicator(LojbanParser._absorb._cache):
-		if result:
-			return result
-		# end if result:
-		return tok
-	# end def _absorb(self):
+class TokenStore:
+	"""
+	Class TokenStore holds a whole tree of tokens in parallel array('i')
+	columns, one entry per token: ttype, text (index in the texts table),
+	up, right, downleft, downright and nextn (indexes of other tokens, -1
+	for None).  The texts are interned in a StringPool (that of the parser
+	or a new one), texts being its table: each distinct string is stored
+	once.
+	Tokens in a TokenStore are accessed through TokenView objects, which
+	are created on demand; the parser uses a TokenStore instead of Token
+	objects when the tokenstore parameter (--tokenstore) is set.
+	A copy of a tree (fromtree) can be turned into bytes (tobytes) and read
+	back from any buffer (frombuffer), for instance shared memory (fromshared),
+	the columns then being read-only views of the buffer.
+	"""
+	_COLUMNS = ("ttype", "text", "up", "right", "downleft", "downright", "nextn")
+
+	def __init__(self, strings = None):
+		self.ttype = array('i')
+		self.text = array('i')
+		self.up = array('i')
+		self.right = array('i')
+		self.downleft = array('i')
+		self.downright = array('i')
+		self.nextn = array('i')
+		self._strings = StringPool() if strings is None else strings
+		self.texts = self._strings.strings
+		# indexes of the roots of the trees copied by fromtree, and whether
+		# a single tree (not a list) was copied
+		self.roots = array('i')
+		self._single = True
+		# memoryviews of the buffer read by frombuffer, and the SharedMemory
+		# of fromshared
+		self._views = []
+		self._sharedmemory = None
+	# end def __init__(self):
 
-	def _BIhI_root_932(self):
-		ttype = 932
-		tok = self._BIhI_root_932_2()
-		if tok:
-			return self._cpd_reduce(tok, ttype)
-		# end if tok:
-		tok = self._BIhI_root_932_1()
-		if tok:
-			return self._cpd_reduce(tok, ttype)
-		# end if tok:
-		tok = self._BIhI_root_932_4()
-		if tok:
-			return self._cpd_reduce(tok, ttype)
-		# end if tok:
-		tok = self._BIhI_root_932_3()
-		if tok:
-			return self._cpd_reduce(tok, ttype)
-		# end if tok:
-		return None
-	#end def _BIhI_root_932(self):
+	def __len__(self):
+		return len(self.ttype)
+	# end def __len__(self):
 
-	def _BIhI_root_932_1(self):
-		result = self._newtoken()
-		tok = self._isnext(Constants.BIhI_507, result)
-		if not tok:
-			return self._fail(result)
-		# end if not tok:
-		return result
-	#end def _BIhI_root_932_1(self):
+	@property
+	def nodesize(self):
+		"""
+		Bytes used by one token in the columns.
+		"""
+		return len(TokenStore._COLUMNS) * self.ttype.itemsize
+	# end def nodesize(self):
 
-	def _BIhI_root_932_2(self):
-		result = self._newtoken()
-		tok = self._isnext(Constants.BIhI_507, result)
-		if not tok:
-			return self._fail(result)
-		# end if not tok:
-		tok = self._isnext(Constants.NAI_581, result)
-		if not tok:
-			return self._fail(result)
-		# end if not tok:
-		return result
-	#end def _BIhI_root_932_2(self):
+	def intern(self, s):
+		"""
+		Returns the index of string s in the texts table, adding it if needed.
+		"""
+		return self._strings.stringid(s)
+	# end def intern(self, s):
 
-	def _BIhI_root_932_3(self):
-		result = self._newtoken()
-		tok = self._isnext(Constants.SE_596, result)
-		if not tok:
-			return self._fail(result)
-		# end if not tok:
-		tok = self._isnext(Constants.BIhI_507, result)
-		if not tok:
-			return self._fail(result)
-		# end if not tok:
-		return result
-	#end def _BIhI_root_932_3(self):
+	def new(self):
+		"""
+		Appends a new token (type -1, no text, no links) and returns its index.
+		"""
+		index = len(self.ttype)
+		self.ttype.append(-1)
+		self.text.append(-1)
+		self.up.append(-1)
+		self.right.append(-1)
+		self.downleft.append(-1)
+		self.downright.append(-1)
+		self.nextn.append(-1)
+		return index
+	# end def new(self):
+
+	def view(self, index):
+		"""
+		Returns a TokenView of the token at index, or None for -1.
+		"""
+		return None if index < 0 else TokenView(self, index)
+	# end def view(self, index):
 
-	def _BIhI_root_932_4(self):
-		result = self._newtoken()
-		tok = self._isnext(Constants.SE_596, result)
-		if not tok:
-			return self._fail(result)
-		# end if not tok:
-		tok = self._isnext(Constants.BIhI_507, result)
-		if not tok:
-			return self._fail(result)
-		# end if not tok:
-		tok = self._isnext(Constants.NAI_581, result)
-		if not tok:
-			return self._fail(result)
-		# end if not tok:
-		return result
-	#end def _BIhI_root_932_4(self):
+	@property
+	def tree(self):
+		"""
+		The tree (or list of trees) copied by fromtree, as TokenViews.
+		"""
+		trees = [TokenView(self, index) for index in self.roots]
+		return trees if not self._single else (trees[0] if trees else None)
+	# end def tree(self):
 
-	def _cmenecheck(self, p, bad):
+	@staticmethod
+	def fromtree(tree):
 		"""
-		Reports invalidity of cmene.
+		Returns a new TokenStore holding a copy of a tree of tokens (or of a
+		list of trees), numbered in preorder.
 		"""
-		badlen = len(bad);
-		plen = len(p);
+		store = TokenStore()
+		store._single = not isinstance(tree, list)
+		for root in (tree if isinstance(tree, list) else [tree]):
+			# stack of (token, index of its parent in store)
+			stack = [(root, -1)]
+			while stack:
+				(tok, up) = stack.pop()
+				index = store.new()
+				store.ttype[index] = tok.ttype
+				if not tok.text is None:
+					store.text[index] = store.intern(tok.text)
+				# end if not tok.text is None:
+				if up < 0:
+					store.roots.append(index)
+				else: # if up < 0:
+					store.up[index] = up
+					if store.downleft[up] < 0:
+						store.downleft[up] = index
+					else: # if store.downleft[up] < 0:
+						store.right[store.downright[up]] = index
+					# end if store.downleft[up] < 0:
+					store.downright[up] = index
+				# end if up < 0:
+				children = []
+				child = tok.downleft
+				while not child is None:
+					children.append((child, index))
+					child = child.right
+				# end while not child is None:
+				children.reverse()
+				stack.extend(children)
+			# end while stack:
+		# end for root in (tree if isinstance(tree, list) else [tree]):
+		return store
+	# end def fromtree(tree):
+
+	def tobytes(self):
+		"""
+		Returns the store as bytes: a header of _DUMPHEADER int32
+		(_STOREMAGIC, number of roots or -1 for a single tree, number of
+		tokens, number of texts), the indexes of the roots, the columns, the
+		character offsets of the texts (number of texts + 1 int32) and the
+		texts, concatenated and encoded in UTF-8.
+		Integers are in the byte order of the machine.
+		"""
+		header = array('i', (_STOREMAGIC, -1 if self._single else len(self.roots), \
+			len(self), len(self.texts)))
+		offsets = array('i', [0])
+		for text in self.texts:
+			offsets.append(offsets[-1] + len(text))
+		# end for text in self.texts:
+		return b"".join([header.tobytes(), self.roots.tobytes()] + \
+			[getattr(self, column).tobytes() for column in TokenStore._COLUMNS] + \
+			[offsets.tobytes(), "".join(self.texts).encode("utf-8")])
+	# end def tobytes(self):
 
-		ipos = 0;
-		while (ipos < plen):
-			ifpos = LojbanParser._strchr(p[ipos:], bad[0]);
-			if ifpos is None:
-				return;
-			# end if ifpos is None:
-			if p[(ipos + ifpos + 1) : (ipos + ifpos + badlen)] == bad[1:]:
-				break;
-			# end if p[(ipos + ifpos + 1) : (ipos + ifpos + badlen)] == bad[1:]:
-			ipos += 1
-		# end while (ipos < plen):
-		if ifpos is None or ipos == plen:
-			return;
-		# end if ifpos is None or ipos == plen:
-		if ifpos == 0 or Constants.isV(p[ipos + ifpos - 1]):
-			print("Illegal cmene {:s} at line {:d}, column {:d}: contains {:s}".format(p, self._line, self._column, bad))
-		# end if ifpos == 0 or isV(p[ipos + ifpos - 1]):
-	# end def _cmenecheck(p, bad):
+	@staticmethod
+	def frombuffer(buffer, size = None):
+		"""
+		Returns a TokenStore reading the first size bytes (default all) of
+		buffer, written by tobytes.  The columns are read-only memoryviews of
+		buffer, which is not copied; only the texts are decoded.
+		close releases the views.
+		"""
+		store = TokenStore()
+		view = memoryview(buffer).toreadonly()
+		store._views.append(view)
+		if not size is None:
+			view = view[:size]
+			store._views.append(view)
+		# end if not size is None:
+		itemsize = array('i').itemsize
+		def _column(start, length):
+			column = view[start:start + length * itemsize]
+			store._views.append(column)
+			column = column.cast('i')
+			store._views.append(column)
+			return (column, start + length * itemsize)
+		# end def _column(start, length):
+		(header, start) = _column(0, _DUMPHEADER)
+		if len(header) < _DUMPHEADER or header[0] != _STOREMAGIC:
+			store.close()
+			raise LojbanException(store, "Data is not a TokenStore.")
+		# end if len(header) < _DUMPHEADER or header[0] != _STOREMAGIC:
+		(nroots, ntokens, ntexts) = (header[1], header[2], header[3])
+		store._single = nroots < 0
+		(store.roots, start) = _column(start, 1 if nroots < 0 else nroots)
+		for column in TokenStore._COLUMNS:
+			(values, start) = _column(start, ntokens)
+			setattr(store, column, values)
+		# end for column in TokenStore._COLUMNS:
+		(offsets, start) = _column(start, ntexts + 1)
+		alltexts = str(view[start:], "utf-8")
+		store.texts = [alltexts[offsets[i]:offsets[i + 1]] for i in range(ntexts)]
+		store._strings = None
+		return store
+	# end def frombuffer(buffer, size = None):
 
-	def _compound(self):
+	@staticmethod
+	def fromshared(name, size):
 		"""
-		Invokes the lexer rule drivers to try to make compounds.
-		If all of them fail, it calls gettoken() and returns it.
-		The ordering constraints needed for
-		recursive-descent compounding is the longest first.
-		Note: Definition of TEST replaced with resulting code.
+		Returns a TokenStore reading (frombuffer) the first size bytes of the
+		shared memory block name.  close releases and unlinks the block.
 		"""
-		tok = self._gettoken()
-		toktype = tok().ttype
-		self._fail(tok)
-		if toktype == Constants.A_501:
-			tok = self._lexer_C_915_driver()
-			if tok:
-				return tok
-			# end if tok:
-			tok = self._lexer_D_916_driver()
-			if tok:
-				return tok
-			# end if tok:
-			tok = self._lexer_B_910_driver()
-			if tok:
-				return tok
-			# end if tok:
-		elif toktype == Constants.BAI_502:
-			tok = self._lexer_G_935_driver()
-			if tok:
-				return tok
-			# end if tok:
-			tok = self._lexer_O_970_driver()
-			if tok:
-				return tok
-			# end if tok:
-		elif toktype == Constants.BIhI_507:
-			tok = self._lexer_G_935_driver()
-			if tok:
-				return tok
-			# end if tok:
-			tok = self._lexer_V_1010_driver()
-			if tok:
-				return tok
-			# end if tok:
-			tok = self._lexer_W_1015_driver()
-			if tok:
-				return tok
-			# end if tok:
-			tok = self._lexer_F_930_driver()
-			if tok:
-				return tok
-			# end if tok:
-		elif toktype == Constants.BY_513:
-			tok = self._lexer_A_905_driver()
-			if tok:
-				return tok
-			# end if tok:
-			tok = self._lexer_Y_1025_driver()
-			if tok:
-				return tok
-			# end if tok:
-			tok = self._lexer_Q_985_driver()
-			if tok:
-				return tok
-			# end if tok:
-		elif toktype == Constants.CAhA_514:
-			tok = self._lexer_G_935_driver()
-			if tok:
-				return tok
-			# end if tok:
-			tok = self._lexer_O_970_driver()
-			if tok:
-				return tok
-			# end if tok:
-		elif toktype == Constants.CUhE_521:
-			tok = self._lexer_G_935_driver()
-			if tok:
-				return tok
-			# end if tok:
-			tok = self._lexer_O_970_driver()
-			if tok:
-				return tok
-			# end if tok:
-		elif toktype == Constants.FAhA_528:
-			tok = self._lexer_G_935_driver()
-			if tok:
-				return tok
-			# end if tok:
-			tok = self._lexer_O_970_driver()
-			if tok:
-				return tok
-			# end if tok:
-		elif toktype == Constants.FEhE_530:
-			tok = self._lexer_G_935_driver()
-			if tok:
-				return tok
-			# end if tok:
-			tok = self._lexer_O_970_driver()
-			if tok:
-				return tok
-			# end if tok:
-		elif toktype == Constants.GA_537:
-			tok = self._lexer_G_935_driver()
-			if tok:
-				return tok
-			# end if tok:
-		elif toktype == Constants.GI_539:
-			tok = self._lexer_P_980_driver()
-			if tok:
-				return tok
-			# end if tok:
-		elif toktype == Constants.GIhA_541:
-			tok = self._lexer_M_965_driver()
-			if tok:
-				return tok
-			# end if tok:
-			tok = self._lexer_N_966_driver()
-			if tok:
-				return tok
-			# end if tok:
-			tok = self._lexer_R_990_driver()
-			if tok:
-				return tok
-			# end if tok:
-		elif toktype == Constants.GUhA_544:
-			tok = self._lexer_H_940_driver()
-			if tok:
-				return tok
-			# end if tok:
-		elif toktype == Constants.I_545:
-			tok = self._lexer_K_955_driver()
-			if tok:
-				return tok
-			# end if tok:
-			tok = self._lexer_S_995_driver()
-			if tok:
-				return tok
-			# end if tok:
-		elif toktype == Constants.JA_546:
-			tok = self._lexer_U_1005_driver()
-			if tok:
-				return tok
-			# end if tok:
-			tok = self._lexer_E_925_driver()
-			if tok:
-				return tok
-			# end if tok:
-		elif toktype == Constants.JOI_548:
-			tok = self._lexer_G_935_driver()
-			if tok:
-				return tok
-			# end if tok:
-			tok = self._lexer_V_1010_driver()
-			if tok:
-				return tok
-			# end if tok:
-			tok = self._lexer_W_1015_driver()
-			if tok:
-				return tok
-			# end if tok:
-			tok = self._lexer_F_930_driver()
-			if tok:
-				return tok
-			# end if tok:
-		elif toktype == Constants.KI_554:
-			tok = self._lexer_G_935_driver()
-			if tok:
-				return tok
-			# end if tok:
-			tok = self._lexer_O_970_driver()
-			if tok:
-				return tok
-			# end if tok:
-		elif toktype == Constants.LAU_559:
-			tok = self._lexer_A_905_driver()
-			if tok:
-				return tok
-			# end if tok:
-			tok = self._lexer_Y_1025_driver()
-			if tok:
-				return tok
-			# end if tok:
-			tok = self._lexer_Q_985_driver()
-			if tok:
-				return tok
-			# end if tok:
-		elif toktype == Constants.MOhI_577:
-			tok = self._lexer_G_935_driver()
-			if tok:
-				return tok
-			# end if tok:
-			tok = self._lexer_O_970_driver()
-			if tok:
-				return tok
-			# end if tok:
-		elif toktype == Constants.NA_578:
-			tok = self._lexer_C_915_driver()
-			if tok:
-				return tok
-			# end if tok:
-			tok = self._lexer_D_916_driver()
-			if tok:
-				return tok
-			# end if tok:
-			tok = self._lexer_B_910_driver()
-			if tok:
-				return tok
-			# end if tok:
-			tok = self._lexer_U_1005_driver()
-			if tok:
-				return tok
-			# end if tok:
-			tok = self._lexer_E_925_driver()
-			if tok:
-				return tok
-			# end if tok:
-			tok = self._lexer_J_950_driver()
-			if tok:
-				return tok
-			# end if tok:
-			tok = self._lexer_M_965_driver()
-			if tok:
-				return tok
-			# end if tok:
-			tok = self._lexer_N_966_driver()
-			if tok:
-				return tok
-			# end if tok:
-			tok = self._lexer_R_990_driver()
-			if tok:
-				return tok
-			# end if tok:
-		elif toktype == Constants.NAhE_583:
-			tok = self._lexer_I_945_driver()
-			if tok:
-				return tok
-			# end if tok:
-			tok = self._lexer_G_935_driver()
-			if tok:
-				return tok
-			# end if tok:
-			tok = self._lexer_O_970_driver()
-			if tok:
-				return tok
-			# end if tok:
-		elif toktype == Constants.PU_592:
-			tok = self._lexer_G_935_driver()
-			if tok:
-				return tok
-			# end if tok:
-			tok = self._lexer_O_970_driver()
-			if tok:
-				return tok
-			# end if tok:
-		elif toktype == Constants.SE_596:
-			tok = self._lexer_C_915_driver()
-			if tok:
-				return tok
-			# end if tok:
-			tok = self._lexer_D_916_driver()
-			if tok:
-				return tok
-			# end if tok:
-			tok = self._lexer_B_910_driver()
-			if tok:
-				return tok
-			# end if tok:
-			tok = self._lexer_U_1005_driver()
-			if tok:
-				return tok
-			# end if tok:
-			tok = self._lexer_E_925_driver()
-			if tok:
-				return tok
-			# end if tok:
-			tok = self._lexer_H_940_driver()
-			if tok:
-				return tok
-			# end if tok:
-			tok = self._lexer_M_965_driver()
-			if tok:
-				return tok
-			# end if tok:
-			tok = self._lexer_N_966_driver()
-			if tok:
-				return tok
-			# end if tok:
-			tok = self._lexer_G_935_driver()
-			if tok:
-				return tok
-			# end if tok:
-			tok = self._lexer_O_970_driver()
-			if tok:
-				return tok
-			# end if tok:
-			tok = self._lexer_V_1010_driver()
-			if tok:
-				return tok
-			# end if tok:
-			tok = self._lexer_W_1015_driver()
-			if tok:
-				return tok
-			# end if tok:
-			tok = self._lexer_F_930_driver()
-			if tok:
-				return tok
-			# end if tok:
-			tok = self._lexer_R_990_driver()
-			if tok:
-				return tok
-			# end if tok:
-		elif toktype == Constants.TAhE_604:
-			tok = self._lexer_G_935_driver()
-			if tok:
-				return tok
-			# end if tok:
-			tok = self._lexer_O_970_driver()
-			if tok:
-				return tok
-			# end if tok:
-		elif toktype == Constants.TEI_605:
-			tok = self._lexer_A_905_driver()
-			if tok:
-				return tok
-			# end if tok:
-			tok = self._lexer_Y_1025_driver()
-			if tok:
-				return tok
-			# end if tok:
-			tok = self._lexer_Q_985_driver()
-			if tok:
-				return tok
-			# end if tok:
-		elif toktype == Constants.VA_613:
-			tok = self._lexer_G_935_driver()
-			if tok:
-				return tok
-			# end if tok:
-			tok = self._lexer_O_970_driver()
-			if tok:
-				return tok
-			# end if tok:
-		elif toktype == Constants.VEhA_615:
-			tok = self._lexer_G_935_driver()
-			if tok:
-				return tok
-			# end if tok:
-			tok = self._lexer_O_970_driver()
-			if tok:
-				return tok
-			# end if tok:
-		elif toktype == Constants.VIhA_616:
-			tok = self._lexer_G_935_driver()
-			if tok:
-				return tok
-			# end if tok:
-			tok = self._lexer_O_970_driver()
-			if tok:
-				return tok
-			# end if tok:
-		elif toktype == Constants.ZAhO_621:
-			tok = self._lexer_G_935_driver()
-			if tok:
-				return tok
-			# end if tok:
-			tok = self._lexer_O_970_driver()
-			if tok:
-				return tok
-			# end if tok:
-		elif toktype == Constants.ZEhA_622:
-			tok = self._lexer_G_935_driver()
-			if tok:
-				return tok
-			# end if tok:
-			tok = self._lexer_O_970_driver()
-			if tok:
-				return tok
-			# end if tok:
-		elif toktype == Constants.ZI_624:
-			tok = self._lexer_G_935_driver()
-			if tok:
-				return tok
-			# end if tok:
-			tok = self._lexer_O_970_driver()
-			if tok:
-				return tok
-			# end if tok:
-		elif toktype == Constants.GAhO_656:
-			tok = self._lexer_G_935_driver()
-			if tok:
-				return tok
-			# end if tok:
-			tok = self._lexer_V_1010_driver()
-			if tok:
-				return tok
-			# end if tok:
-			tok = self._lexer_W_1015_driver()
-			if tok:
-				return tok
-			# end if tok:
-			tok = self._lexer_F_930_driver()
-			if tok:
-				return tok
-			# end if tok:
-		elif toktype == Constants.PA_672:
-			tok = self._lexer_A_905_driver()
-			if tok:
-				return tok
-			# end if tok:
-			tok = self._lexer_Y_1025_driver()
-			if tok:
-				return tok
-			# end if tok:
-			tok = self._lexer_O_970_driver()
-			if tok:
-				return tok
-			# end if tok:
-			tok = self._lexer_L_960_driver()
+		sharedmemory = shared_memory.SharedMemory(name)
+		store = TokenStore.frombuffer(sharedmemory.buf, size)
+		store._sharedmemory = sharedmemory
+		return store
+	# end def fromshared(name, size):
+
+	@staticmethod
+	def unlinkshared(name):
+		"""
+		Unlinks the shared memory block name written by toshared, without
+		reading it (for a store that will not be read).
+		"""
+		sharedmemory = shared_memory.SharedMemory(name)
+		sharedmemory.close()
+		sharedmemory.unlink()
+	# end def unlinkshared(name):
+
+	def toshared(self):
+		"""
+		Writes the store (tobytes) into a new shared memory block and returns
+		the name and size to give to fromshared, in this or another process;
+		the block is left to the reader to unlink.
+		"""
+		data = self.tobytes()
+		sharedmemory = shared_memory.SharedMemory(create = True, size = len(data))
+		sharedmemory.buf[:len(data)] = data
+		name = sharedmemory.name
+		sharedmemory.close()
+		return (name, len(data))
+	# end def toshared(self):
+
+	def close(self):
+		"""
+		Releases the views of the buffer read by frombuffer and the shared
+		memory block read by fromshared; the store may not be used after.
+		"""
+		while self._views:
+			self._views.pop().release()
+		# end while self._views:
+		if not self._sharedmemory is None:
+			self._sharedmemory.close()
+			self._sharedmemory.unlink()
+			self._sharedmemory = None
+		# end if not self._sharedmemory is None:
+	# end def close(self):
+# end class TokenStore:
+
+class TokenView(Token):
+	"""
+	Class TokenView is a Token whose fields live in a TokenStore.
+	It has the attributes and methods of Token, so the parser, the printers
+	and user code work on it unchanged; links are returned as new views, and
+	two views are equal when they refer to the same token.
+	"""
+	__slots__ = ("_store", "_index")
+
+	def __init__(self, store, index):
+		self._store = store
+		self._index = index
+	# end def __init__(self, store, index):
+
+	def __eq__(self, other):
+		return isinstance(other, TokenView) and self._index == other._index \
+			and self._store is other._store
+	# end def __eq__(self, other):
+
+	def __hash__(self):
+		return hash((id(self._store), self._index))
+	# end def __hash__(self):
+
+	@property
+	def ttype(self):
+		return self._store.ttype[self._index]
+	# end def ttype(self):
+
+	@ttype.setter
+	def ttype(self, v):
+		self._store.ttype[self._index] = v
+	# end def ttype(self, v):
+
+	@property
+	def text(self):
+		textid = self._store.text[self._index]
+		return None if textid < 0 else self._store.texts[textid]
+	# end def text(self):
+
+	@text.setter
+	def text(self, v):
+		self._store.text[self._index] = -1 if v is None else self._store.intern(v)
+	# end def text(self, v):
+
+	@property
+	def up(self):
+		index = self._store.up[self._index]
+		return None if index < 0 else TokenView(self._store, index)
+	# end def up(self):
+
+	@up.setter
+	def up(self, v):
+		self._store.up[self._index] = -1 if v is None else v._index
+	# end def up(self, v):
+
+	@property
+	def right(self):
+		index = self._store.right[self._index]
+		return None if index < 0 else TokenView(self._store, index)
+	# end def right(self):
+
+	@right.setter
+	def right(self, v):
+		self._store.right[self._index] = -1 if v is None else v._index
+	# end def right(self, v):
+
+	@property
+	def downleft(self):
+		index = self._store.downleft[self._index]
+		return None if index < 0 else TokenView(self._store, index)
+	# end def downleft(self):
+
+	@downleft.setter
+	def downleft(self, v):
+		self._store.downleft[self._index] = -1 if v is None else v._index
+	# end def downleft(self, v):
+
+	@property
+	def downright(self):
+		index = self._store.downright[self._index]
+		return None if index < 0 else TokenView(self._store, index)
+	# end def downright(self):
+
+	@downright.setter
+	def downright(self, v):
+		self._store.downright[self._index] = -1 if v is None else v._index
+	# end def downright(self, v):
+
+	@property
+	def nextn(self):
+		index = self._store.nextn[self._index]
+		return None if index < 0 else TokenView(self._store, index)
+	# end def nextn(self):
+
+	@nextn.setter
+	def nextn(self, v):
+		self._store.nextn[self._index] = -1 if v is None else v._index
+	# end def nextn(self, v):
+
+	def add(parent, child):
+		"""
+		Adds a child node to parent node, writing the columns directly.
+		"""
+		if child is None:
+			return
+		# end if child is None:
+		store = parent._store
+		index = parent._index
+		store.up[child._index] = index
+		if store.downleft[index] < 0:
+			store.downleft[index] = child._index
+		else: # if store.downleft[index] < 0:
+			store.right[store.downright[index]] = child._index
+		# end if store.downleft[index] < 0:
+		store.downright[index] = child._index
+	# end def add(parent, child):
+# end class TokenView:
+
+#######################################################################
+## TokenArena
+#######################################################################
+
+class TokenArena:
+	"""
+	Class TokenArena is a pool of Token objects kept from one parse to the
+	next, for parsers doing many small parses.  Tokens are handed out in
+	order by allocate(); rewind() makes all of them available again (so the
+	trees of earlier parses are overwritten).  The arena grows in blocks of
+	geometrically increasing size and keeps its capacity until trim() is
+	called.  The parser uses a TokenArena when the reusetokens parameter
+	(--reusetokens) is set.
+	"""
+	def __init__(self, tokenclass = Token, blocksize = 256):
+		self._tokenclass = tokenclass
+		self._blocksize = blocksize
+		self._tokens = []
+		self._used = 0
+		self._highwater = 0
+		self._tokensize = sys.getsizeof(tokenclass())
+	# end def __init__(self, tokenclass = Token, blocksize = 256):
+
+	def __len__(self):
+		return len(self._tokens)
+	# end def __len__(self):
+
+	@property
+	def tokenclass(self):
+		return self._tokenclass
+	# end def tokenclass(self):
+
+	@property
+	def tokensize(self):
+		"""
+		Bytes used by one token: the object and its slot in the arena.
+		"""
+		return self._tokensize + 8
+	# end def tokensize(self):
+
+	@property
+	def used(self):
+		"""
+		Number of tokens handed out since the last rewind().
+		"""
+		return self._used
+	# end def used(self):
+
+	@property
+	def highwater(self):
+		"""
+		Largest number of tokens handed out between two rewind() calls.
+		"""
+		return max(self._highwater, self._used)
+	# end def highwater(self):
+
+	@property
+	def highwaterspace(self):
+		"""
+		Bytes used by the largest number of tokens handed out.
+		"""
+		return self.highwater * self.tokensize
+	# end def highwaterspace(self):
+
+	@property
+	def space(self):
+		"""
+		Bytes held by the arena, at its current capacity.
+		"""
+		return len(self._tokens) * self.tokensize
+	# end def space(self):
+
+	def allocate(self):
+		"""
+		Returns the next unused token, growing the arena if it is full.
+		The fields of the token are left as they were.
+		"""
+		if self._used == len(self._tokens):
+			tokenclass = self._tokenclass
+			self._tokens.extend(tokenclass() \
+				for i in range(max(self._blocksize, len(self._tokens))))
+		# end if self._used == len(self._tokens):
+		tok = self._tokens[self._used]
+		self._used += 1
+		return tok
+	# end def allocate(self):
+
+	def rewind(self):
+		"""
+		Makes all the tokens available again, keeping the capacity.
+		"""
+		self._highwater = self.highwater
+		self._used = 0
+	# end def rewind(self):
+
+	def trim(self, capacity = 0):
+		"""
+		Releases the unused tokens beyond capacity (tokens in use are kept).
+		"""
+		del self._tokens[max(capacity, self._used):]
+	# end def trim(self, capacity = 0):
+# end class TokenArena:
+
+#######################################################################
+## StringPool
+#######################################################################
+
+class StringPool:
+	"""
+	Class StringPool keeps one copy of each distinct string (word) given to
+	it and numbers them: intern returns the pooled copy of a string, which
+	the tokens share, and stringid its index in strings, which compact forms
+	of trees (TokenStore) store in place of the string.
+	totalspace counts the characters of all the strings interned and
+	uniquespace those of the distinct ones, which is what is kept.
+	A StringPool may be shared by parsers in several threads (the
+	sharestrings parameter): strings are added and counted under a lock.
+	"""
+	def __init__(self):
+		self.strings = []
+		self._ids = {}
+		self._lock = threading.Lock()
+		self.totalspace = 0
+		self.uniquespace = 0
+	# end def __init__(self):
+
+	def __len__(self):
+		return len(self.strings)
+	# end def __len__(self):
+
+	def intern(self, s):
+		"""
+		Returns the pooled copy of string s, adding it if needed.
+		"""
+		with self._lock:
+			self.totalspace += len(s)
+			sid = self._ids.get(s)
+			if sid is None:
+				sid = self._add(s)
+			# end if sid is None:
+			return self.strings[sid]
+		# end with self._lock:
+	# end def intern(self, s):
+
+	def stringid(self, s):
+		"""
+		Returns the index of string s in strings, adding it if needed.
+		"""
+		sid = self._ids.get(s)
+		if sid is None:
+			with self._lock:
+				sid = self._ids.get(s)
+				if sid is None:
+					sid = self._add(s)
+				# end if sid is None:
+			# end with self._lock:
+		# end if sid is None:
+		return sid
+	# end def stringid(self, s):
+
+	def _add(self, s):
+		"""
+		Adds string s, which is not in the pool yet, and returns its index.
+		Called with the lock held.
+		"""
+		sid = len(self.strings)
+		self.strings.append(s)
+		self._ids[s] = sid
+		self.uniquespace += len(s)
+		return sid
+	# end def _add(self, s):
+# end class StringPool:
+
+# maximum number of strings of the shared StringPool: once it holds that
+# many, the next parser to reset starts a new one, and the old one goes
+# with the last tree or TokenStore using it
+_SHAREDSTRINGSMAX = 1 << 16
+
+# the StringPool of the parsers with the sharestrings parameter
+_SHAREDSTRINGS = StringPool()
+_SHAREDSTRINGSLOCK = threading.Lock()
+
+def _sharedstrings():
+	"""
+	Returns the StringPool shared by the parsers with the sharestrings
+	parameter, replaced by an empty one if it has grown to _SHAREDSTRINGSMAX
+	strings, so that a long running process does not keep every word it has
+	ever parsed.
+	"""
+	global _SHAREDSTRINGS
+	with _SHAREDSTRINGSLOCK:
+		if len(_SHAREDSTRINGS) >= _SHAREDSTRINGSMAX:
+			_SHAREDSTRINGS = StringPool()
+		# end if len(_SHAREDSTRINGS) >= _SHAREDSTRINGSMAX:
+		return _SHAREDSTRINGS
+	# end with _SHAREDSTRINGSLOCK:
+# end def _sharedstrings():
+
+#######################################################################
+## Word scanner tables
+#######################################################################
+
+# number of distinct words whose pieces LojbanParser._lexword keeps
+_LEXCACHESIZE = 1 << 13
+
+# number of characters read from the input stream at once
+_CHUNKSIZE = 1 << 16
+
+# size of the buffer of files opened by InputSource
+_FILEBUFSIZE = 1 << 20
+
+# digits are converted to the cmavo of the same value
+_DIGITS = ("no", "pa", "re", "ci", "vo", "mu", "xa", "ze", "bi", "so")
+
+# maps ASCII upper case letters to lower case; applied to whole input chunks
+_LOWERTABLE = str.maketrans("ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz")
+
+# maps digits to cmavo
+_DIGITTABLE = dict((ord(str(i)), d) for (i, d) in enumerate(_DIGITS))
+
+# kinds of runs recognized by _SCANRE (index of the matching group)
+_SCANWORD = 1 # letters, "'" and digits
+_SCANSEP = 2 # whitespace other than newline, and "."
+_SCANNEWLINE = 3 # "\n"
+_SCANCOMMENT = 4 # "/", start of a comment
+_SCANBACKSLASH = 5 # "\", possibly followed by a newline
+_SCANIGNORED = 6 # any other ASCII character
+_SCANOTHER = 7 # a single non ASCII character
+
+# the ASCII characters for which str.isspace() holds, except newline
+_SCANSPACE = "\\t\\x0b\\x0c\\r\\x1c-\\x1f "
+
+# leading separators, a whole word without digits and the separator ending it
+_WORDRE = re.compile("[" + _SCANSPACE + ".]*([a-z']+)([" + _SCANSPACE + ".\\n])")
+
+_SCANRE = re.compile("([A-Za-z0-9']+)|([" + _SCANSPACE + ".]+)|(\\n)|(/)|(\\\\)" \
+	"|([^A-Za-z0-9'" + _SCANSPACE + ".\\n/\\\\\\x80-\\U0010ffff]+)|(.)", re.DOTALL)
+
+#######################################################################
+## InputSource
+#######################################################################
+
+class InputSource:
+	"""
+	class InputSource wraps the text to be parsed, so that the parser never
+	has to redirect sys.stdin.  The text may be given as a string, as bytes,
+	as a file path (an os.PathLike, or a string with path = True), as a file
+	object (text or binary) or as an iterator of lines.
+	The parser reads the text with read(), in chunks (a string or bytes object
+	is returned whole), or with readline() in interactive mode; both return
+	the empty string at end of input.
+	"""
+	def __init__(self, source, encoding = "utf-8", path = False):
+		self._text = None # string or bytes object, decoded
+		self._pos = 0 # position in self._text
+		self._file = None # file object
+		self._lines = None # iterator of lines
+		self._closefile = False # whether self._file was opened here
+		self._decoder = codecs.getincrementaldecoder(encoding)()
+		if path or isinstance(source, os.PathLike):
+			self._file = open(source, "r", encoding = encoding, \
+				buffering = _FILEBUFSIZE)
+			self._closefile = True
+		elif isinstance(source, str):
+			self._text = source
+		elif isinstance(source, (bytes, bytearray, memoryview)):
+			self._text = str(source, encoding)
+		elif hasattr(source, "read"):
+			self._file = source
+		else: # if path or isinstance(source, os.PathLike):
+			self._lines = iter(source)
+		# end if path or isinstance(source, os.PathLike):
+	# end def __init__(self, source, encoding = "utf-8", path = False):
+
+	def _decode(self, data):
+		"""
+		Decodes data read from a binary file or line iterator; str is
+		returned as is.
+		"""
+		if isinstance(data, str):
+			return data
+		# end if isinstance(data, str):
+		return self._decoder.decode(data, final = not data)
+	# end def _decode(self, data):
+
+	def _nextline(self):
+		"""
+		Returns the next non empty item of the line iterator, ending with a
+		newline, or the empty string at the end of the iterator.
+		"""
+		for line in self._lines:
+			line = self._decode(line)
+			if line:
+				return line if line.endswith("\n") else line + "\n"
+			# end if line:
+		# end for line in self._lines:
+		return ""
+	# end def _nextline(self):
+
+	def close(self):
+		"""
+		Closes the file if it was opened by this InputSource.
+		"""
+		if self._closefile:
+			self._file.close()
+			self._closefile = False
+		# end if self._closefile:
+	# end def close(self):
+
+	def read(self):
+		"""
+		Returns the next chunk of text, or the empty string at end of input.
+		"""
+		if self._text is not None:
+			text = self._text[self._pos:] if self._pos else self._text
+			self._pos = len(self._text)
+			return text
+		elif self._file is not None:
+			return self._decode(self._file.read(_CHUNKSIZE))
+		# end if self._text is not None:
+		return self._nextline()
+	# end def read(self):
+
+	def readline(self):
+		"""
+		Returns the next line of text, or the empty string at end of input.
+		"""
+		if self._text is not None:
+			end = self._text.find("\n", self._pos) + 1 or len(self._text)
+			line = self._text[self._pos:end]
+			self._pos = end
+			return line
+		elif self._file is not None:
+			return self._decode(self._file.readline())
+		# end if self._text is not None:
+		return self._nextline()
+	# end def readline(self):
+# end class InputSource:
+
+#######################################################################
+## TokenStream
+#######################################################################
+
+# first int32 of the bytes returned by TokenStream.tobytes
+_STREAMMAGIC = 0x4C4A5333
+
+# version of the bytes returned by TokenStream.tobytes, changed with them
+_STREAMVERSION = 2
+
+# number of uint32 in the header of the bytes returned by TokenStream.tobytes
+_STREAMHEADER = 8
+
+# CRC-32 of the source of this module, once _sourcechecksum has read it
+_SOURCECHECKSUM = None
+
+def _sourcechecksum():
+	"""
+	Returns the CRC-32 of the source of this module, which goes into the
+	stamp of the TokenStreams (LojbanParser.streamstamp): tokens lexed by
+	another version of the lexer are not replayed.
+	"""
+	global _SOURCECHECKSUM
+	if _SOURCECHECKSUM is None:
+		with open(__file__, "rb") as file:
+			_SOURCECHECKSUM = zlib.crc32(file.read())
+		# end with open(__file__, "rb") as file:
+	# end if _SOURCECHECKSUM is None:
+	return _SOURCECHECKSUM
+# end def _sourcechecksum():
+
+class TokenStream:
+	"""
+	Class TokenStream holds the tokens that the lexer and the compounder
+	deliver to the YACC parser for a text (LojbanParser.tokenize makes it),
+	so that the text can be parsed again without them: parse accepts a
+	TokenStream in place of a text, whatever the output parameters.
+	Each token delivered (a selma'o-level token or a compound) has the line
+	and column the lexer had reached then, which syntax errors report.
+	The tokens of the compounds are in preorder in array('i') columns:
+	ttype, text (index in the texts table, -1 for None) and number of
+	children.  Each distinct text is stored once.
+	The stream is turned into bytes by tobytes (tofile) and read back by
+	frombuffer (fromfile).
+	stamp identifies the lexer that made the stream (LojbanParser.streamstamp),
+	and sourcesize and sourcecrc the text it was made from (its size and
+	CRC-32 in UTF-8, 0 if unknown), so that a cached stream can be checked
+	before it is replayed.
+	"""
+	def __init__(self):
+		self.stamp = 0
+		self.sourcesize = 0
+		self.sourcecrc = 0
+		self.lines = array('i')
+		self.columns = array('i')
+		self.ttype = array('i')
+		self.text = array('i')
+		self.children = array('i')
+		self.texts = []
+		self._ids = {}
+	# end def __init__(self):
+
+	def __len__(self):
+		return len(self.lines)
+	# end def __len__(self):
+
+	def append(self, tok, line, column):
+		"""
+		Appends a token delivered to the parser (with its subtree) and the
+		line and column of the lexer.
+		"""
+		self.lines.append(line)
+		self.columns.append(column)
+		stack = [tok]
+		while stack:
+			tok = stack.pop()
+			self.ttype.append(tok.ttype)
+			if tok.text is None:
+				self.text.append(-1)
+			else: # if tok.text is None:
+				textid = self._ids.get(tok.text)
+				if textid is None:
+					textid = self._ids[tok.text] = len(self.texts)
+					self.texts.append(tok.text)
+				# end if textid is None:
+				self.text.append(textid)
+			# end if tok.text is None:
+			children = []
+			child = tok.downleft
+			while not child is None:
+				children.append(child)
+				child = child.right
+			# end while not child is None:
+			self.children.append(len(children))
+			children.reverse()
+			stack.extend(children)
+		# end while stack:
+	# end def append(self, tok, line, column):
+
+	def tobytes(self):
+		"""
+		Returns the stream as bytes: a header of _STREAMHEADER uint32
+		(_STREAMMAGIC, _STREAMVERSION, stamp, sourcesize, sourcecrc, number
+		of tokens delivered, number of tokens in the columns, number of
+		texts), the lines and columns, the ttype, text and children columns,
+		the character offsets of the texts (number of texts + 1 int32) and
+		the texts, concatenated and encoded in UTF-8.
+		Integers are in the byte order of the machine.
+		"""
+		header = array('I', (_STREAMMAGIC, _STREAMVERSION, self.stamp, \
+			self.sourcesize & 0xFFFFFFFF, self.sourcecrc, len(self), \
+			len(self.ttype), len(self.texts)))
+		offsets = array('i', [0])
+		for text in self.texts:
+			offsets.append(offsets[-1] + len(text))
+		# end for text in self.texts:
+		return b"".join((header.tobytes(), self.lines.tobytes(), \
+			self.columns.tobytes(), self.ttype.tobytes(), self.text.tobytes(), \
+			self.children.tobytes(), offsets.tobytes(), \
+			"".join(self.texts).encode("utf-8")))
+	# end def tobytes(self):
+
+	@staticmethod
+	def frombuffer(buffer):
+		"""
+		Returns the TokenStream stored in buffer (bytes or any buffer) by
+		tobytes.  Raises a LojbanException if buffer does not hold a
+		TokenStream, or holds one of another version.
+		"""
+		stream = TokenStream()
+		view = memoryview(buffer)
+		itemsize = array('i').itemsize
+		def _column(start, length):
+			column = array('i')
+			column.frombytes(view[start:start + length * itemsize])
+			return (column, start + length * itemsize)
+		# end def _column(start, length):
+		header = array('I')
+		start = _STREAMHEADER * header.itemsize
+		if len(view) >= start:
+			header.frombytes(view[:start])
+		# end if len(view) >= start:
+		if len(header) < _STREAMHEADER or header[0] != _STREAMMAGIC:
+			raise LojbanException(stream, "Data is not a TokenStream.")
+		# end if len(header) < _STREAMHEADER or header[0] != _STREAMMAGIC:
+		if header[1] != _STREAMVERSION:
+			raise LojbanException(stream, "TokenStream of version {:d}, not {:d}.".format( \
+				header[1], _STREAMVERSION))
+		# end if header[1] != _STREAMVERSION:
+		(stream.stamp, stream.sourcesize, stream.sourcecrc) = header[2:5]
+		(ndelivered, ntokens, ntexts) = header[5:8]
+		(stream.lines, start) = _column(start, ndelivered)
+		(stream.columns, start) = _column(start, ndelivered)
+		(stream.ttype, start) = _column(start, ntokens)
+		(stream.text, start) = _column(start, ntokens)
+		(stream.children, start) = _column(start, ntokens)
+		(offsets, start) = _column(start, ntexts + 1)
+		alltexts = str(view[start:], "utf-8")
+		stream.texts = [alltexts[offsets[i]:offsets[i + 1]] for i in range(ntexts)]
+		stream._ids = {text : textid for (textid, text) in enumerate(stream.texts)}
+		return stream
+	# end def frombuffer(buffer):
+
+	def tofile(self, path):
+		"""
+		Writes the stream (tobytes) to the file path.
+		"""
+		with open(path, "wb") as file:
+			file.write(self.tobytes())
+		# end with open(path, "wb") as file:
+	# end def tofile(self, path):
+
+	@staticmethod
+	def fromfile(path):
+		"""
+		Returns the TokenStream written to the file path by tofile.
+		"""
+		with open(path, "rb") as file:
+			return TokenStream.frombuffer(file.read())
+		# end with open(path, "rb") as file:
+	# end def fromfile(path):
+# end class TokenStream:
+
+#######################################################################
+## Parser tables
+#######################################################################
+
+# Kinds of semantic action run when the YACC parser reduces a rule.
+# _YYELIDABLEOK inserts an elided terminator and also clears the error
+# recovery state (yyerrok), _YYELIDABLE only inserts it.
+_YYTOPLEVEL = 0
+_YYNODE = 1
+_YYELIDABLE = 2
+_YYELIDABLEOK = 3
+
+# Semantic actions indexed by rule number (from grammar.y).
+# Each entry is (kind, type, first, last): the action is called with
+# type and the values _yyv[yyvtidx - first] up to _yyv[yyvtidx - last].
+# Elidable actions take only the terminator type.
+_YYREDUCE = ( \
+	None, \
+	(_YYTOPLEVEL, 0, 1, 1), \
+	(_YYNODE, 10000, 0, 0), \
+	(_YYNODE, 10000, 1, 0), \
+	(_YYNODE, 10000, 1, 0), \
+	(_YYNODE, 10000, 1, 0), \
+	(_YYNODE, 10000, 2, 0), \
+	(_YYNODE, 10000, 1, 0), \
+	(_YYNODE, 1, 1, 0), \
+	(_YYNODE, 1, 0, 0), \
+	(_YYNODE, 2, 1, 0), \
+	(_YYNODE, 2, 1, 0), \
+	(_YYNODE, 2, 1, 0), \
+	(_YYNODE, 2, 0, 0), \
+	(_YYNODE, 3, 0, 0), \
+	(_YYELIDABLE, Constants.FAhO_529, 0, 0), \
+	(_YYNODE, 4, 0, 0), \
+	(_YYNODE, 4, 2, 0), \
+	(_YYNODE, 10, 0, 0), \
+	(_YYNODE, 10, 2, 0), \
+	(_YYNODE, 10, 1, 0), \
+	(_YYNODE, 11, 0, 0), \
+	(_YYNODE, 11, 2, 0), \
+	(_YYNODE, 11, 1, 0), \
+	(_YYNODE, 12, 0, 0), \
+	(_YYNODE, 12, 2, 0), \
+	(_YYNODE, 12, 3, 0), \
+	(_YYNODE, 12, 3, 0), \
+	(_YYNODE, 20, 0, 0), \
+	(_YYNODE, 20, 0, 0), \
+	(_YYNODE, 20, 0, 0), \
+	(_YYNODE, 20, 0, 0), \
+	(_YYNODE, 20, 1, 0), \
+	(_YYNODE, 20, 0, 0), \
+	(_YYNODE, 20, 0, 0), \
+	(_YYNODE, 20, 0, 0), \
+	(_YYNODE, 20, 0, 0), \
+	(_YYNODE, 20, 0, 0), \
+	(_YYNODE, 30, 1, 0), \
+	(_YYNODE, 30, 2, 0), \
+	(_YYNODE, 32, 0, 0), \
+	(_YYNODE, 32, 1, 0), \
+	(_YYNODE, 33, 0, 0), \
+	(_YYNODE, 33, 0, 0), \
+	(_YYNODE, 33, 0, 0), \
+	(_YYNODE, 33, 0, 0), \
+	(_YYNODE, 33, 0, 0), \
+	(_YYNODE, 34, 2, 0), \
+	(_YYNODE, 34, 2, 0), \
+	(_YYNODE, 34, 3, 0), \
+	(_YYNODE, 34, 4, 0), \
+	(_YYNODE, 34, 3, 0), \
+	(_YYNODE, 35, 2, 0), \
+	(_YYNODE, 35, 3, 0), \
+	(_YYNODE, 35, 3, 0), \
+	(_YYNODE, 35, 2, 0), \
+	(_YYNODE, 35, 3, 0), \
+	(_YYNODE, 35, 2, 0), \
+	(_YYNODE, 35, 1, 0), \
+	(_YYNODE, 36, 2, 0), \
+	(_YYNODE, 40, 0, 0), \
+	(_YYNODE, 40, 0, 0), \
+	(_YYNODE, 41, 3, 0), \
+	(_YYNODE, 41, 1, 0), \
+	(_YYNODE, 41, 0, 0), \
+	(_YYNODE, 42, 2, 0), \
+	(_YYNODE, 42, 1, 0), \
+	(_YYNODE, 50, 0, 0), \
+	(_YYNODE, 50, 4, 0), \
+	(_YYNODE, 51, 0, 0), \
+	(_YYNODE, 51, 3, 0), \
+	(_YYNODE, 52, 0, 0), \
+	(_YYNODE, 52, 3, 0), \
+	(_YYNODE, 53, 0, 0), \
+	(_YYNODE, 53, 1, 0), \
+	(_YYNODE, 54, 3, 0), \
+	(_YYNODE, 54, 3, 0), \
+	(_YYNODE, 54, 1, 0), \
+	(_YYNODE, 71, 1, 0), \
+	(_YYNODE, 71, 0, 0), \
+	(_YYNODE, 80, 0, 0), \
+	(_YYNODE, 80, 1, 0), \
+	(_YYNODE, 81, 0, 0), \
+	(_YYNODE, 81, 0, 0), \
+	(_YYNODE, 81, 0, 0), \
+	(_YYNODE, 81, 0, 0), \
+	(_YYNODE, 82, 1, 0), \
+	(_YYNODE, 82, 1, 0), \
+	(_YYNODE, 83, 6, 0), \
+	(_YYNODE, 83, 5, 0), \
+	(_YYNODE, 90, 0, 0), \
+	(_YYNODE, 90, 3, 0), \
+	(_YYNODE, 90, 3, 0), \
+	(_YYNODE, 91, 0, 0), \
+	(_YYNODE, 91, 2, 0), \
+	(_YYNODE, 92, 0, 0), \
+	(_YYNODE, 92, 2, 0), \
+	(_YYNODE, 92, 2, 0), \
+	(_YYNODE, 93, 0, 0), \
+	(_YYNODE, 93, 3, 0), \
+	(_YYNODE, 94, 0, 0), \
+	(_YYNODE, 94, 1, 0), \
+	(_YYNODE, 94, 2, 0), \
+	(_YYNODE, 94, 3, 0), \
+	(_YYNODE, 95, 0, 0), \
+	(_YYNODE, 95, 1, 0), \
+	(_YYNODE, 96, 2, 0), \
+	(_YYNODE, 96, 3, 0), \
+	(_YYNODE, 96, 0, 0), \
+	(_YYNODE, 96, 1, 0), \
+	(_YYNODE, 96, 2, 0), \
+	(_YYNODE, 96, 0, 0), \
+	(_YYNODE, 96, 0, 0), \
+	(_YYNODE, 110, 2, 0), \
+	(_YYNODE, 110, 2, 0), \
+	(_YYNODE, 111, 0, 0), \
+	(_YYNODE, 111, 1, 0), \
+	(_YYNODE, 111, 1, 0), \
+	(_YYNODE, 111, 2, 0), \
+	(_YYNODE, 112, 0, 0), \
+	(_YYNODE, 112, 1, 0), \
+	(_YYNODE, 112, 1, 0), \
+	(_YYNODE, 112, 2, 0), \
+	(_YYNODE, 112, 1, 0), \
+	(_YYNODE, 121, 0, 0), \
+	(_YYNODE, 121, 2, 0), \
+	(_YYNODE, 122, 2, 0), \
+	(_YYNODE, 122, 2, 0), \
+	(_YYNODE, 130, 1, 0), \
+	(_YYNODE, 130, 0, 0), \
+	(_YYNODE, 131, 0, 0), \
+	(_YYNODE, 131, 1, 0), \
+	(_YYNODE, 132, 0, 0), \
+	(_YYNODE, 132, 2, 0), \
+	(_YYNODE, 133, 0, 0), \
+	(_YYNODE, 133, 1, 0), \
+	(_YYNODE, 134, 0, 0), \
+	(_YYNODE, 134, 2, 0), \
+	(_YYNODE, 134, 3, 0), \
+	(_YYNODE, 135, 0, 0), \
+	(_YYNODE, 135, 2, 0), \
+	(_YYNODE, 135, 2, 0), \
+	(_YYNODE, 136, 0, 0), \
+	(_YYNODE, 136, 2, 0), \
+	(_YYNODE, 136, 0, 0), \
+	(_YYNODE, 136, 1, 0), \
+	(_YYNODE, 137, 3, 0), \
+	(_YYNODE, 150, 0, 0), \
+	(_YYNODE, 150, 2, 0), \
+	(_YYNODE, 151, 0, 0), \
+	(_YYNODE, 151, 1, 0), \
+	(_YYNODE, 152, 0, 0), \
+	(_YYNODE, 152, 2, 0), \
+	(_YYNODE, 152, 1, 0), \
+	(_YYNODE, 152, 2, 0), \
+	(_YYNODE, 152, 1, 0), \
+	(_YYNODE, 152, 2, 0), \
+	(_YYNODE, 152, 3, 0), \
+	(_YYNODE, 152, 1, 0), \
+	(_YYNODE, 152, 1, 0), \
+	(_YYNODE, 152, 2, 0), \
+	(_YYNODE, 160, 2, 0), \
+	(_YYNODE, 160, 3, 0), \
+	(_YYNODE, 161, 1, 0), \
+	(_YYNODE, 161, 2, 0), \
+	(_YYNODE, 300, 1, 0), \
+	(_YYNODE, 300, 2, 0), \
+	(_YYNODE, 310, 0, 0), \
+	(_YYNODE, 310, 2, 0), \
+	(_YYNODE, 310, 1, 0), \
+	(_YYNODE, 311, 0, 0), \
+	(_YYNODE, 311, 3, 0), \
+	(_YYNODE, 312, 0, 0), \
+	(_YYNODE, 312, 2, 0), \
+	(_YYNODE, 312, 3, 0), \
+	(_YYNODE, 313, 0, 0), \
+	(_YYNODE, 313, 1, 0), \
+	(_YYNODE, 330, 2, 0), \
+	(_YYNODE, 332, 0, 0), \
+	(_YYNODE, 332, 0, 0), \
+	(_YYNODE, 370, 0, 0), \
+	(_YYNODE, 370, 2, 0), \
+	(_YYNODE, 370, 3, 0), \
+	(_YYNODE, 371, 0, 0), \
+	(_YYNODE, 371, 3, 0), \
+	(_YYNODE, 372, 0, 0), \
+	(_YYNODE, 372, 2, 0), \
+	(_YYNODE, 374, 0, 0), \
+	(_YYNODE, 374, 1, 0), \
+	(_YYNODE, 374, 1, 0), \
+	(_YYNODE, 374, 1, 0), \
+	(_YYNODE, 374, 2, 0), \
+	(_YYNODE, 374, 2, 0), \
+	(_YYNODE, 381, 0, 0), \
+	(_YYNODE, 381, 3, 0), \
+	(_YYNODE, 381, 3, 0), \
+	(_YYNODE, 382, 0, 0), \
+	(_YYNODE, 382, 2, 0), \
+	(_YYNODE, 383, 0, 0), \
+	(_YYNODE, 383, 2, 0), \
+	(_YYNODE, 383, 2, 0), \
+	(_YYNODE, 385, 0, 0), \
+	(_YYNODE, 385, 1, 0), \
+	(_YYNODE, 385, 2, 0), \
+	(_YYNODE, 385, 2, 0), \
+	(_YYNODE, 385, 2, 0), \
+	(_YYNODE, 385, 3, 0), \
+	(_YYNODE, 385, 2, 0), \
+	(_YYNODE, 400, 0, 0), \
+	(_YYNODE, 400, 1, 0), \
+	(_YYNODE, 400, 1, 0), \
+	(_YYNODE, 404, 0, 0), \
+	(_YYNODE, 404, 1, 0), \
+	(_YYNODE, 405, 0, 0), \
+	(_YYNODE, 405, 1, 0), \
+	(_YYNODE, 407, 0, 0), \
+	(_YYNODE, 407, 1, 0), \
+	(_YYNODE, 408, 0, 0), \
+	(_YYNODE, 408, 0, 0), \
+	(_YYNODE, 408, 0, 0), \
+	(_YYNODE, 408, 1, 0), \
+	(_YYNODE, 410, 0, 0), \
+	(_YYNODE, 410, 1, 0), \
+	(_YYNODE, 410, 1, 0), \
+	(_YYNODE, 411, 0, 0), \
+	(_YYNODE, 411, 1, 0), \
+	(_YYNODE, 412, 0, 0), \
+	(_YYNODE, 412, 1, 0), \
+	(_YYNODE, 413, 0, 0), \
+	(_YYNODE, 413, 0, 0), \
+	(_YYNODE, 413, 1, 0), \
+	(_YYNODE, 413, 1, 0), \
+	(_YYNODE, 413, 0, 0), \
+	(_YYNODE, 413, 0, 0), \
+	(_YYNODE, 413, 0, 0), \
+	(_YYNODE, 415, 0, 0), \
+	(_YYNODE, 415, 0, 0), \
+	(_YYNODE, 415, 1, 0), \
+	(_YYNODE, 416, 0, 0), \
+	(_YYNODE, 416, 1, 0), \
+	(_YYNODE, 417, 0, 0), \
+	(_YYNODE, 417, 1, 0), \
+	(_YYNODE, 421, 0, 0), \
+	(_YYNODE, 421, 0, 0), \
+	(_YYNODE, 421, 1, 0), \
+	(_YYNODE, 422, 0, 0), \
+	(_YYNODE, 422, 1, 0), \
+	(_YYNODE, 422, 0, 0), \
+	(_YYNODE, 422, 1, 0), \
+	(_YYNODE, 425, 0, 0), \
+	(_YYNODE, 425, 2, 0), \
+	(_YYNODE, 426, 0, 0), \
+	(_YYNODE, 426, 1, 0), \
+	(_YYNODE, 426, 1, 0), \
+	(_YYNODE, 426, 2, 0), \
+	(_YYNODE, 432, 0, 0), \
+	(_YYNODE, 432, 1, 0), \
+	(_YYNODE, 433, 0, 0), \
+	(_YYNODE, 433, 0, 0), \
+	(_YYNODE, 433, 0, 0), \
+	(_YYNODE, 433, 2, 0), \
+	(_YYNODE, 434, 3, 0), \
+	(_YYNODE, 435, 1, 0), \
+	(_YYNODE, 436, 2, 0), \
+	(_YYNODE, 440, 0, 0), \
+	(_YYNODE, 440, 1, 0), \
+	(_YYNODE, 443, 0, 0), \
+	(_YYNODE, 443, 1, 0), \
+	(_YYNODE, 444, 0, 0), \
+	(_YYNODE, 444, 1, 0), \
+	(_YYNODE, 445, 0, 0), \
+	(_YYNODE, 445, 1, 0), \
+	(_YYNODE, 447, 0, 0), \
+	(_YYNODE, 447, 1, 0), \
+	(_YYNODE, 448, 0, 0), \
+	(_YYELIDABLEOK, Constants.LIhU_567, 0, 0), \
+	(_YYNODE, 450, 0, 0), \
+	(_YYNODE, 450, 1, 0), \
+	(_YYELIDABLEOK, Constants.KU_556, 0, 0), \
+	(_YYNODE, 451, 0, 0), \
+	(_YYNODE, 451, 1, 0), \
+	(_YYNODE, 452, 0, 0), \
+	(_YYNODE, 452, 1, 0), \
+	(_YYELIDABLEOK, Constants.KUhE_658, 0, 0), \
+	(_YYNODE, 453, 0, 0), \
+	(_YYNODE, 453, 1, 0), \
+	(_YYELIDABLEOK, Constants.KEI_552, 0, 0), \
+	(_YYNODE, 454, 0, 0), \
+	(_YYNODE, 454, 1, 0), \
+	(_YYELIDABLEOK, Constants.TUhU_611, 0, 0), \
+	(_YYNODE, 456, 0, 0), \
+	(_YYNODE, 456, 1, 0), \
+	(_YYELIDABLEOK, Constants.VAU_614, 0, 0), \
+	(_YYNODE, 457, 0, 0), \
+	(_YYELIDABLEOK, Constants.DOhU_526, 0, 0), \
+	(_YYNODE, 458, 0, 0), \
+	(_YYNODE, 458, 1, 0), \
+	(_YYELIDABLEOK, Constants.FEhU_531, 0, 0), \
+	(_YYNODE, 459, 0, 0), \
+	(_YYELIDABLEOK, Constants.SEhU_598, 0, 0), \
+	(_YYNODE, 460, 0, 0), \
+	(_YYNODE, 460, 1, 0), \
+	(_YYELIDABLEOK, Constants.NUhU_588, 0, 0), \
+	(_YYNODE, 461, 0, 0), \
+	(_YYNODE, 461, 1, 0), \
+	(_YYELIDABLEOK, Constants.BOI_651, 0, 0), \
+	(_YYNODE, 462, 0, 0), \
+	(_YYELIDABLEOK, Constants.BOI_651, 0, 0), \
+	(_YYNODE, 463, 0, 0), \
+	(_YYNODE, 463, 1, 0), \
+	(_YYELIDABLEOK, Constants.LUhU_573, 0, 0), \
+	(_YYNODE, 464, 0, 0), \
+	(_YYNODE, 464, 1, 0), \
+	(_YYELIDABLEOK, Constants.GEhU_538, 0, 0), \
+	(_YYNODE, 465, 0, 0), \
+	(_YYNODE, 465, 1, 0), \
+	(_YYELIDABLEOK, Constants.MEhU_575, 0, 0), \
+	(_YYNODE, 466, 0, 0), \
+	(_YYNODE, 466, 1, 0), \
+	(_YYELIDABLEOK, Constants.KEhE_550, 0, 0), \
+	(_YYNODE, 467, 0, 0), \
+	(_YYNODE, 467, 1, 0), \
+	(_YYELIDABLEOK, Constants.BEhO_506, 0, 0), \
+	(_YYNODE, 468, 0, 0), \
+	(_YYELIDABLEOK, Constants.TOI_607, 0, 0), \
+	(_YYNODE, 469, 0, 0), \
+	(_YYNODE, 469, 1, 0), \
+	(_YYELIDABLEOK, Constants.KUhO_557, 0, 0), \
+	(_YYNODE, 470, 0, 0), \
+	(_YYNODE, 471, 0, 0), \
+	(_YYNODE, 471, 1, 0), \
+	(_YYELIDABLEOK, Constants.VEhO_678, 0, 0), \
+	(_YYNODE, 472, 0, 0), \
+	(_YYNODE, 472, 1, 0), \
+	(_YYELIDABLEOK, Constants.LOhO_568, 0, 0), \
+	(_YYNODE, 473, 0, 0), \
+	(_YYNODE, 473, 1, 0), \
+	(_YYELIDABLEOK, Constants.TEhU_675, 0, 0), \
+	(_YYNODE, 474, 0, 0), \
+	(_YYELIDABLEOK, Constants.VEhO_678, 0, 0), \
+	(_YYNODE, 480, 0, 0), \
+	(_YYNODE, 480, 1, 0), \
+	(_YYNODE, 481, 0, 0), \
+	(_YYNODE, 481, 1, 0), \
+	(_YYNODE, 482, 0, 0), \
+	(_YYNODE, 482, 1, 0), \
+	(_YYNODE, 483, 0, 0), \
+	(_YYNODE, 483, 1, 0), \
+	(_YYNODE, 483, 0, 0), \
+	(_YYNODE, 486, 2, 0), \
+	(_YYNODE, 486, 3, 0), \
+	(_YYNODE, 486, 2, 0), \
+	(_YYNODE, 490, 0, 0), \
+	(_YYNODE, 490, 0, 0), \
+	(_YYNODE, 491, 0, 0), \
+	(_YYNODE, 491, 2, 0), \
+	(_YYNODE, 801, 0, 0), \
+	(_YYNODE, 802, 0, 0), \
+	(_YYNODE, 802, 1, 0), \
+	(_YYNODE, 803, 0, 0), \
+	(_YYNODE, 803, 1, 0), \
+	(_YYNODE, 804, 0, 0), \
+	(_YYNODE, 804, 1, 0), \
+	(_YYNODE, 805, 0, 0), \
+	(_YYNODE, 806, 0, 0), \
+	(_YYNODE, 807, 0, 0), \
+	(_YYNODE, 807, 1, 0), \
+	(_YYNODE, 808, 0, 0), \
+	(_YYNODE, 808, 1, 0), \
+	(_YYNODE, 809, 0, 0), \
+	(_YYNODE, 809, 1, 0), \
+	(_YYNODE, 810, 0, 0), \
+	(_YYNODE, 810, 1, 0), \
+	(_YYNODE, 811, 0, 0), \
+	(_YYNODE, 811, 1, 0), \
+	(_YYNODE, 812, 0, 0), \
+	(_YYNODE, 813, 0, 0), \
+	(_YYNODE, 813, 1, 0), \
+	(_YYNODE, 814, 0, 0), \
+	(_YYNODE, 814, 1, 0), \
+	(_YYNODE, 815, 0, 0), \
+	(_YYNODE, 815, 1, 0), \
+	(_YYNODE, 815, 2, 0), \
+	(_YYNODE, 816, 0, 0), \
+	(_YYNODE, 816, 1, 0), \
+	(_YYNODE, 817, 0, 0), \
+	(_YYNODE, 818, 0, 0), \
+	(_YYNODE, 818, 1, 0), \
+	(_YYNODE, 819, 0, 0), \
+	(_YYNODE, 819, 1, 0), \
+	(_YYNODE, 821, 0, 0), \
+	(_YYNODE, 821, 1, 0), \
+	(_YYNODE, 822, 0, 0), \
+	(_YYNODE, 822, 1, 0), \
+	(_YYNODE, 823, 0, 0), \
+	(_YYNODE, 823, 1, 0), \
+	(_YYNODE, 824, 0, 0), \
+)
+
+
+# The tables of the YACC parser (defined in grammar.c), used by _yyparse:
+# actions (_YYACT) and the state or rule they are for (_YYCHK), offsets in
+# _YYACT of the actions of each state (_YYPACT) and of the gotos of each
+# nonterminal (_YYPGO), default reductions (_YYDEF), exceptions to them
+# (_YYEXCA), and the nonterminal (_YYR1) and length (_YYR2) of each rule.
+# They are tuples rather than arrays ('h' would do): indexing an array makes
+# a new int object each time, which slows the parser loop by a sixth.
+_YYEXCA = ( \
+	-1, 1, \
+	0, -1, \
+	-2, 0, \
+	-1, 403, \
+	561, 179, \
+	657, 179, \
+	664, 179, \
+	666, 179, \
+	677, 179, \
+	935, 179, \
+	945, 179, \
+	960, 179, \
+	985, 179, \
+	-2, 169, \
+	0, \
+)
+
+_YYACT = ( \
+	75,	  74,	  67,	 276,	  28,	 152,	 299,	 330, \
+	283,	  27,	 448,	  34,	 300,	  26,	  81,	  51, \
+	79,	 502,	 296,	  30,	  36,	  45,	  27,	 101, \
+	31,	  67,	 525,	  69,	  79,	  28,	  79,	  11, \
+	37,	 494,	  27,	 581,	 578,	 332,	  86,	 154, \
+	331,	 333,	 548,	 145,	 232,	  27,	  51,	 143, \
+	354,	 239,	 370,	 119,	  45,	 377,	 112,	 155, \
+	506,	 117,	 121,	 187,	 385,	 152,	 113,	 205, \
+	179,	 133,	 178,	 129,	 367,	 473,	 146,	 495, \
+	86,	 290,	  68,	 509,	  68,	   7,	 252,	 139, \
+	31,	  87,	 155,	  93,	  79,	 490,	 502,	 241, \
+	532,	 250,	 243,	 302,	 150,	  47,	 284,	 154, \
+	443,	 139,	  41,	 145,	 459,	 300,	  39,	 143, \
+	75,	  74,	  65,	 284,	  33,	 152,	 150,	  31, \
+	229,	  42,	  35,	  87,	 157,	 406,	  75,	  51, \
+	437,	  74,	 132,	 131,	  47,	  45,	 146,	 101, \
+	34,	  41,	  68,	 434,	  79,	  39,	 440,	 139, \
+	375,	  36,	 155,	  51,	 471,	 137,	  86,	 154, \
+	42,	 201,	 334,	 145,	 150,	  37,	 187,	 143, \
+	546,	 100,	 336,	 119,	 151,	  99,	 112,	 297, \
+	282,	 117,	 121,	 147,	 431,	 225,	 113,	 187, \
+	66,	 133,	  62,	 129,	 107,	  81,	 146,	  63, \
+	265,	 520,	  68,	 266,	 135,	 304,	 312,	 139, \
+	31,	  87,	 155,	  93,	  77,	  17,	  75,	  74, \
+	20,	 262,	  58,	 152,	 150,	  47,	  49,	  14, \
+	71,	 130,	  41,	 164,	 117,	 248,	  39,	 118, \
+	70,	 298,	  65,	 280,	  10,	 101,	   6,	 434, \
+	152,	  42,	  79,	 147,	  16,	 383,	  98,	 518, \
+	165,	  33,	 132,	 131,	  86,	 154,	 529,	  35, \
+	56,	 145,	  18,	 435,	 488,	 143,	  95,	  79, \
+	204,	 119,	 223,	 197,	 112,	 202,	 128,	 117, \
+	121,	 407,	 154,	 196,	 113,	 182,	 145,	 133, \
+	530,	 129,	 143,	 127,	 146,	  19,	 126,	 122, \
+	68,	 200,	 177,	 147,	  73,	 139,	  31,	  87, \
+	155,	  93,	  15,	  46,	 254,	  81,	 277,	 199, \
+	173,	 146,	 150,	 275,	 153,	  68,	 117,	  75, \
+	74,	 149,	 139,	 286,	 152,	 155,	  13,	 247, \
+	65,	  80,	 399,	 368,	 259,	 244,	 507,	 150, \
+	324,	 148,	 504,	 258,	 139,	 257,	 101,	 501, \
+	132,	 131,	 142,	  79,	 342,	 337,	 335,	 134, \
+	81,	 150,	 125,	 328,	 285,	  86,	 154,	 311, \
+	123,	 186,	 145,	 306,	 232,	 441,	 143,	 379, \
+	410,	 438,	 119,	 115,	 329,	 112,	 114,	 482, \
+	117,	 121,	 111,	 106,	 502,	 113,	 410,	 104, \
+	133,	 147,	 129,	 237,	  91,	 146,	 164,	 371, \
+	92,	  68,	  85,	  81,	  84,	 152,	 139,	  31, \
+	87,	 155,	  93,	 508,	  83,	 289,	 147,	 505, \
+	230,	 295,	 274,	 150,	 501,	 433,	 259,	 101, \
+	81,	 391,	 472,	 265,	  79,	 258,	 266,	 257, \
+	369,	  65,	  88,	 436,	 489,	 442,	 246,	 154, \
+	28,	  43,	  81,	 145,	 262,	  27,	  67,	 143, \
+	414,	 132,	 131,	 119,	 416,	 254,	 112,	 384, \
+	439,	 117,	 121,	 366,	 186,	  28,	 113,	 117, \
+	90,	 133,	  27,	 129,	 232,	 152,	 146,	  96, \
+	43,	  96,	  68,	  29,	 141,	 186,	 430,	 139, \
+	432,	 124,	 155,	  93,	 238,	 139,	  94,	 286, \
+	376,	 365,	 147,	  30,	 150,	  86,	  78,	 152, \
+	80,	 415,	 150,	 412,	  81,	 547,	 417,	 154, \
+	74,	 433,	  78,	 145,	  78,	  51,	 228,	 143, \
+	254,	 404,	 249,	  45,	 323,	 497,	  79,	 469, \
+	285,	 125,	 132,	 131,	 224,	 468,	  69,	  96, \
+	527,	 154,	  38,	  29,	 141,	 145,	 146,	 373, \
+	87,	 143,	 533,	 403,	 484,	 397,	 410,	 139, \
+	139,	  43,	 155,	  40,	 510,	 422,	  67,	  97, \
+	25,	 533,	 445,	 152,	 150,	 150,	  24,	 259, \
+	146,	 156,	  78,	 147,	 265,	  28,	 258,	 266, \
+	257,	 139,	  27,	 355,	 155,	  81,	 462,	  96, \
+	496,	 561,	  79,	  81,	 141,	 262,	 150,	  48, \
+	405,	 124,	  23,	  47,	  86,	 154,	  94,	 109, \
+	41,	 145,	 571,	  30,	  39,	 143,	  22,	 568, \
+	80,	  21,	 423,	 424,	 168,	 552,	  51,	  42, \
+	12,	 116,	  78,	  53,	  45,	 548,	 549,	 550, \
+	52,	 156,	  96,	  50,	 146,	 553,	 554,	 265, \
+	68,	 125,	 266,	 147,	 124,	 139,	  69,	  87, \
+	155,	  44,	   4,	  29,	  67,	 555,	   1,	 519, \
+	262,	 152,	 150,	  80,	 565,	   0,	 254,	 564, \
+	522,	 523,	   0,	  28,	 419,	 147,	 536,	 573, \
+	27,	   0,	   0,	 586,	 569,	  96,	   0,	   0, \
+	102,	 156,	 141,	 589,	 125,	 533,	 594,	 124, \
+	592,	   0,	  54,	 154,	  94,	 240,	 139,	 145, \
+	0,	  30,	 501,	 143,	  47,	   0,	  80,	 141, \
+	485,	  41,	  28,	 150,	 595,	  39,	  64,	  27, \
+	78,	 491,	 492,	 286,	  96,	 538,	 152,	   0, \
+	42,	 141,	 146,	  80,	 187,	   0,	 124,	 125, \
+	516,	 147,	 517,	 139,	  69,	  78,	 155,	 307, \
+	0,	  29,	 217,	  81,	  51,	  80,	  28,	   0, \
+	150,	 209,	  45,	  27,	 285,	  67,	   0,	 344, \
+	154,	   0,	 599,	 600,	 145,	 579,	   0,	   0, \
+	214,	   0,	 405,	  75,	  74,	 208,	 125,	 156, \
+	152,	   0,	 539,	 540,	   0,	 265,	  96,	   0, \
+	266,	   0,	 209,	 141,	 209,	  32,	   0,	 146, \
+	124,	   0,	 101,	  68,	 156,	  94,	 262,	  79, \
+	139,	   0,	  30,	 155,	 284,	   0,	 273,	  80, \
+	381,	  86,	 154,	   0,	 382,	 150,	 145,	 318, \
+	0,	  78,	 143,	   0,	   0,	   0,	 119,	 147, \
+	0,	 112,	  47,	 213,	 117,	 121,	 344,	  41, \
+	125,	 113,	   0,	  39,	 133,	  69,	 129,	   0, \
+	284,	 146,	  29,	   0,	   0,	  68,	  42,	 209, \
+	0,	   0,	 139,	 287,	  87,	 155,	  93,	  96, \
+	0,	 450,	 453,	 254,	 141,	  96,	   0,	 150, \
+	152,	 124,	 141,	 350,	   0,	   0,	  94,	 124, \
+	156,	 464,	 465,	 230,	 483,	  65,	   0,	 584, \
+	80,	   0,	 101,	 184,	 147,	 253,	  80,	  79, \
+	0,	   0,	  78,	 139,	   0,	 132,	 131,	 405, \
+	0,	 152,	 154,	 378,	 313,	 217,	 145,	 388, \
+	150,	 125,	 143,	   0,	 209,	  28,	 119,	 125, \
+	0,	 112,	  27,	 101,	 117,	 121,	   0,	  43, \
+	79,	 113,	   0,	   0,	 133,	 141,	 129,	   0, \
+	208,	 146,	   0,	 154,	 254,	  68,	 147,	 145, \
+	486,	  72,	 139,	 143,	   0,	 155,	  93,	 119, \
+	81,	 156,	 112,	 140,	   0,	 117,	 121,	 150, \
+	152,	 541,	 113,	 543,	 544,	 133,	   0,	 129, \
+	0,	 308,	 146,	   0,	 139,	   0,	  68,	 428, \
+	0,	   0,	 265,	 139,	   0,	 266,	 155,	  93, \
+	0,	 150,	 307,	   0,	  78,	 132,	 131,	 224, \
+	150,	 152,	 154,	 262,	   0,	 380,	 145,	 409, \
+	0,	  26,	 143,	   0,	   0,	 386,	 227,	   3, \
+	0,	   0,	 186,	 387,	 158,	 160,	 161,	   0, \
+	79,	 156,	 141,	   0,	 267,	 269,	 132,	 131, \
+	43,	 146,	  86,	 154,	   0,	   0,	 147,	 145, \
+	272,	   0,	 139,	 143,	   0,	 155,	  80,	 119, \
+	81,	 349,	 112,	 156,	   0,	 117,	 121,	 150, \
+	78,	   2,	 113,	 265,	 254,	 133,	 266,	 129, \
+	0,	 162,	 146,	   0,	 152,	   0,	  68,	 147, \
+	547,	   0,	   0,	 139,	 262,	  87,	 155,	 230, \
+	358,	  81,	 361,	 363,	 105,	 245,	 101,	   0, \
+	150,	 392,	   0,	  79,	 139,	   0,	   0,	 217, \
+	0,	 191,	 360,	 281,	 338,	   0,	 154,	   0, \
+	0,	 150,	 145,	   0,	 345,	 347,	 143,	 156, \
+	141,	   0,	 119,	   0,	   0,	 112,	 132,	 131, \
+	117,	 121,	   0,	   0,	 320,	 113,	 147,	   0, \
+	133,	   0,	 129,	   0,	   0,	 146,	 152,	   0, \
+	307,	  68,	   0,	   0,	 215,	   0,	 139,	   0, \
+	0,	 155,	  93,	 227,	   0,	  76,	  43,	 447, \
+	449,	   0,	   0,	 150,	   0,	  79,	  28,	 147, \
+	152,	   0,	 209,	  27,	 227,	 426,	 427,	   0, \
+	154,	  81,	   0,	 265,	 145,	 141,	 266,	 357, \
+	143,	   0,	 101,	   0,	 475,	   0,	 562,	  79, \
+	402,	 132,	 131,	 327,	 262,	   0,	   0,	   0, \
+	487,	  67,	 154,	   0,	   0,	 156,	 145,	 146, \
+	0,	   0,	 143,	  68,	   0,	   0,	 119,	 152, \
+	139,	 112,	 226,	 155,	 117,	 121,	 499,	   0, \
+	0,	 113,	  96,	   0,	 133,	 150,	 129,	 141, \
+	0,	 146,	 147,	   0,	 124,	  68,	 388,	 476, \
+	477,	  94,	 139,	   0,	  81,	 155,	  93,	 278, \
+	0,	 154,	 500,	  80,	   0,	 145,	 227,	 150, \
+	152,	 214,	   0,	   0,	   0,	  78,	 108,	 413, \
+	0,	 227,	 156,	 512,	 513,	 207,	 514,	   0, \
+	141,	   0,	   0,	   0,	 125,	   0,	 215,	   0, \
+	146,	  69,	   0,	   0,	  68,	 132,	 131,	 215, \
+	0,	 139,	 154,	   0,	 155,	 152,	 145,	   0, \
+	0,	 542,	 143,	   0,	 147,	   0,	 150,	   0, \
+	215,	 551,	   0,	   0,	   0,	   0,	   0,	 338, \
+	0,	 215,	  96,	   0,	 156,	   0,	 503,	 141, \
+	0,	 146,	 222,	 320,	 124,	  68,	 147,	 154, \
+	0,	  94,	 139,	 145,	   0,	 155,	 400,	 143, \
+	81,	  28,	   0,	  80,	 411,	   0,	  27,	 150, \
+	0,	 141,	   0,	  96,	 418,	  78,	   0,	   0, \
+	141,	   0,	   0,	   0,	 152,	 124,	 146,	   0, \
+	0,	   0,	  94,	   0,	 125,	   0,	   0,	 139, \
+	226,	   0,	 155,	   0,	  80,	 147,	 101,	 315, \
+	0,	 278,	   0,	  79,	 150,	 152,	  78,	 394, \
+	315,	   0,	   0,	   0,	   0,	 278,	 154,	   0, \
+	0,	   0,	 145,	   0,	   0,	 125,	 143,	   0, \
+	0,	   0,	 119,	 574,	 156,	 112,	   0,	 141, \
+	117,	 121,	   0,	   0,	 400,	 113,	 147,	 154, \
+	133,	   0,	 129,	 145,	 227,	 146,	   0,	 143, \
+	0,	  68,	   0,	   0,	   0,	   0,	 139,	   0, \
+	444,	 155,	  93,	  96,	   0,	 156,	   0,	   0, \
+	141,	   0,	   0,	 150,	 152,	 124,	 146,	   0, \
+	0,	   0,	 596,	 147,	  26,	 222,	   0,	 139, \
+	0,	 141,	 155,	   0,	  80,	   0,	   9,	   0, \
+	461,	   0,	   0,	  79,	 150,	   0,	  78,	 163, \
+	400,	 132,	 131,	   0,	   0,	  86,	 154,	 171, \
+	172,	   0,	 145,	   0,	   0,	 125,	 143,	 254, \
+	0,	   0,	 119,	   0,	 156,	 112,	   0,	   0, \
+	117,	 121,	   0,	   0,	 531,	 113,	  96,	 537, \
+	133,	   0,	 129,	 141,	   0,	 146,	   0,	   0, \
+	124,	  68,	 147,	   0,	 206,	  94,	 139,	 139, \
+	87,	 155,	 400,	   0,	  81,	 156,	   0,	  80, \
+	0,	   0,	   0,	 150,	 150,	   0,	   0,	   0, \
+	0,	  78,	   0,	 147,	   0,	   0,	 535,	   0, \
+	0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
+	125,	   0,	   0,	 229,	   0,	   0,	   0,	 227, \
+	227,	 132,	 131,	   0,	   0,	   0,	   0,	   0, \
+	0,	 548,	   0,	   0,	   0,	 141,	   0,	   0, \
+	0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
+	0,	   0,	   0,	   0,	 152,	   0,	   0,	   0, \
+	156,	   0,	  96,	   0,	   0,	   0,	 265,	 141, \
+	0,	 266,	 147,	  78,	 124,	   0,	   0,	   0, \
+	0,	  94,	   0,	  79,	  81,	   0,	 401,	 262, \
+	0,	   0,	   0,	  80,	   0,	  86,	 154,	 585, \
+	0,	 370,	 145,	   0,	   0,	  78,	 143,	  28, \
+	0,	   0,	 119,	   0,	  27,	 112,	   0,	 524, \
+	117,	 121,	   0,	   0,	 125,	 113,	 141,	 152, \
+	133,	   0,	 129,	   0,	   0,	 146,	   0,	   0, \
+	0,	  68,	 156,	   0,	   0,	   0,	 139,	   0, \
+	87,	 155,	   0,	   0,	   0,	 545,	  79,	   0, \
+	28,	   0,	   0,	 150,	   0,	  27,	   0,	   0, \
+	0,	 154,	   0,	   0,	 156,	 145,	   0,	 141, \
+	0,	 143,	   0,	   0,	   0,	 119,	   0,	 560, \
+	112,	   0,	   0,	 117,	 121,	   0,	 566,	 567, \
+	113,	 132,	 131,	 133,	   0,	 129,	   0,	   0, \
+	146,	   0,	   0,	   0,	  68,	   0,	   0,	   0, \
+	0,	 139,	 119,	   0,	 155,	 112,	   0,	   0, \
+	117,	 121,	   0,	 156,	   0,	 113,	 150,	 101, \
+	133,	 577,	 129,	   0,	  79,	   0,	   0,	   0, \
+	0,	   0,	 147,	   0,	 290,	   0,	   0,	   0, \
+	0,	   0,	   0,	   0,	  81,	   0,	   0,	   0, \
+	0,	   0,	   0,	 119,	 132,	 131,	 112,	   0, \
+	0,	 117,	 121,	   0,	 156,	   0,	 113,	   0, \
+	152,	 133,	   0,	 129,	   0,	   0,	  96,	   0, \
+	0,	   0,	   0,	 141,	 588,	   0,	 590,	 591, \
+	124,	 132,	 131,	  93,	 460,	  94,	   0,	  79, \
+	0,	   0,	   0,	   0,	   0,	 147,	   0,	  80, \
+	0,	 156,	 154,	   0,	 141,	   0,	 145,	  81, \
+	0,	  78,	 143,	   0,	   0,	   0,	 119,	   0, \
+	0,	 112,	 101,	   0,	 117,	 121,	   0,	  79, \
+	125,	 113,	 132,	 131,	 133,	 254,	 129,	   0, \
+	0,	 146,	   0,	   0,	  81,	  68,	   0,	 117, \
+	0,	   0,	 139,	   0,	   0,	 155,	 119,	   0, \
+	0,	 112,	   0,	   0,	 117,	 121,	   0,	 150, \
+	254,	 113,	   0,	   0,	 133,	 139,	 129,	   0, \
+	156,	 101,	 117,	 141,	 141,	   0,	  79,	   0, \
+	124,	   0,	 150,	   0,	   0,	  81,	  93,	   0, \
+	0,	   0,	   0,	   0,	   0,	 132,	 131,	  80, \
+	139,	 156,	   0,	   0,	   0,	 119,	   0,	   0, \
+	112,	  78,	   0,	 117,	 121,	 150,	   0,	   0, \
+	113,	 228,	   0,	 133,	   0,	 129,	   0,	   0, \
+	125,	   0,	   0,	   0,	 119,	 132,	 131,	 112, \
+	0,	 254,	 117,	 121,	   0,	  93,	 147,	 113, \
+	0,	   0,	 133,	 117,	 129,	   0,	   0,	 259, \
+	534,	   0,	   0,	   0,	 265,	   0,	 258,	 266, \
+	257,	   0,	   0,	   0,	   0,	   0,	   0,	 246, \
+	156,	 139,	   0,	  81,	   0,	 262,	   0,	 369, \
+	0,	   0,	 259,	 254,	 132,	 131,	 150,	 265, \
+	81,	 258,	 266,	 257,	   0,	 117,	   0,	   0, \
+	0,	  86,	 246,	   0,	 547,	   0,	  81,	   0, \
+	262,	   0,	   0,	 132,	 131,	   0,	 119,	   0, \
+	0,	 112,	   0,	 139,	 117,	 121,	   0,	   0, \
+	0,	 113,	   0,	   0,	 133,	   0,	 129,	   0, \
+	150,	   0,	   0,	 141,	   0,	   0,	   0,	  81, \
+	124,	   0,	   0,	   0,	  87,	   0,	   0,	   0, \
+	0,	 242,	   0,	 259,	   0,	   0,	   0,	  80, \
+	265,	   0,	 258,	 266,	 257,	   0,	  81,	 119, \
+	289,	  78,	 112,	 246,	   0,	 117,	 121,	  81, \
+	0,	 262,	 113,	   0,	  60,	 133,	   0,	 129, \
+	125,	 119,	   0,	   0,	 112,	 132,	 131,	 117, \
+	121,	  96,	   0,	   0,	 113,	 259,	 141,	 133, \
+	0,	 129,	 265,	 124,	 258,	 266,	 257,	   0, \
+	0,	  82,	   0,	   0,	   0,	 246,	   0,	   0, \
+	0,	  81,	  80,	 262,	   0,	 193,	  96,	   0, \
+	156,	   0,	   0,	   0,	  78,	   0,	   0,	   0, \
+	124,	   0,	   0,	 210,	  61,	   0,	 132,	 131, \
+	81,	   0,	   0,	 125,	   0,	   0,	   0,	  80, \
+	183,	   0,	   0,	 195,	   0,	   0,	   0,	 232, \
+	132,	 131,	   0,	   0,	   0,	   0,	   0,	  96, \
+	0,	   0,	   0,	   0,	 210,	   0,	 210,	   0, \
+	125,	 124,	 292,	 181,	   0,	   0,	  94,	   0, \
+	0,	   0,	   0,	 156,	 303,	   0,	   0,	   0, \
+	80,	  81,	   0,	   0,	   0,	   0,	   0,	   0, \
+	0,	   0,	  78,	 279,	   0,	   0,	 288,	   0, \
+	0,	   0,	   0,	  81,	   0,	   0,	   0,	   0, \
+	0,	 125,	   0,	   0,	   0,	   0,	   0,	   0, \
+	309,	   0,	   0,	   0,	   0,	   0,	   0,	 141, \
+	0,	 210,	   0,	   0,	 124,	   0,	   0,	   0, \
+	0,	   0,	   0,	   0,	   0,	  96,	   0,	 305, \
+	0,	   0,	 141,	 310,	   0,	 314,	   0,	 124, \
+	0,	   0,	  96,	   0,	 348,	  78,	 314,	   0, \
+	0,	   0,	   0,	   0,	 124,	   0,	  80,	   0, \
+	96,	  94,	   0,	   0,	 125,	 141,	   0,	   0, \
+	0,	   0,	 124,	  80,	   0,	   0,	   0,	   0, \
+	0,	   0,	   0,	   0,	   0,	  78,	 210,	 125, \
+	0,	  80,	   0,	   0,	   0,	   0,	   0,	 364, \
+	0,	  96,	   0,	   0,	 125,	 374,	   0,	   0, \
+	0,	   0,	   0,	 124,	 156,	   0,	   0,	   0, \
+	94,	 359,	 125,	 362,	   0,	   0,	   0,	   0, \
+	96,	   0,	  80,	   0,	   0,	   0,	   0,	   0, \
+	0,	  96,	 124,	   0,	  78,	   0,	 141,	   0, \
+	0,	 364,	   0,	 124,	   0,	   0,	   0,	   0, \
+	0,	  80,	   8,	 125,	   0,	   0,	   0,	  55, \
+	0,	   0,	  80,	   0,	   0,	   0,	   0,	   0, \
+	0,	   0,	   0,	   0,	 421,	   0,	   0,	   0, \
+	458,	   0,	 125,	  96,	   0,	   0,	   0,	   0, \
+	141,	   0,	   0,	 125,	   0,	 124,	   0,	   0, \
+	0,	   0,	 451,	 452,	   0,	   0,	 185,	   0, \
+	194,	   0,	  96,	   0,	  80,	 279,	   0,	   0, \
+	0,	   0,	 216,	   0,	 124,	   0,	 211,	   0, \
+	0,	 220,	   0,	 185,	 211,	   0,	   0,	   0, \
+	474,	   0,	   0,	  80,	   0,	 125,	   0,	 481, \
+	0,	   0,	 268,	 268,	   0,	   0,	   0,	 185, \
+	0,	   0,	   0,	   0,	   0,	   0,	 268,	 211, \
+	0,	 211,	   0,	  96,	 125,	 268,	   0,	   0, \
+	478,	 479,	   0,	   0,	   0,	 124,	   0,	 268, \
+	0,	   0,	   0,	   0,	   0,	  96,	   0,	 319, \
+	185,	   0,	   0,	   0,	  80,	   0,	   0,	 124, \
+	0,	 185,	   0,	   0,	   0,	   0,	   0,	   0, \
+	0,	   0,	   0,	   0,	   0,	   0,	  80,	   0, \
+	0,	   0,	 185,	   0,	   0,	 125,	   0,	 351, \
+	0,	 346,	   0,	   0,	 211,	   0,	   0,	   0, \
+	0,	   0,	   0,	   0,	   0,	   0,	   0,	 125, \
+	0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
+	0,	   0,	 303,	   0,	 210,	 526,	   0,	   0, \
+	0,	   0,	   0,	   0,	 216,	 185,	   0,	   0, \
+	0,	   0,	   0,	 303,	 185,	 216,	 185,	   0, \
+	0,	 194,	   0,	   0,	   0,	   0,	   0,	   0, \
+	0,	   0,	   0,	   0,	   0,	   0,	 216,	   0, \
+	0,	 211,	 211,	   0,	 220,	   0,	 389,	 216, \
+	0,	   0,	   0,	 220,	   0,	   0,	   0,	   0, \
+	0,	 220,	   0,	   0,	 189,	  89,	   0,	 220, \
+	0,	  89,	  89,	  89,	  89,	  89,	   0,	   0, \
+	408,	   0,	   0,	   0,	   0,	  89,	  89,	  89, \
+	0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
+	0,	 185,	   0,	   0,	   0,	 575,	   0,	 216, \
+	0,	   0,	 185,	   0,	  89,	   0,	   0,	   0, \
+	0,	   0,	 220,	 220,	   0,	   0,	   0,	   0, \
+	0,	   0,	  89,	  89,	   0,	 303,	 219,	   0, \
+	0,	 231,	   0,	 268,	 268,	 120,	 597,	 220, \
+	0,	   0,	   0,	   0,	 260,	   0,	 319,	 268, \
+	0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
+	0,	   0,	 185,	 185,	  89,	 185,	  89,	   0, \
+	0,	 598,	 291,	   0,	   0,	   0,	   0,	   0, \
+	0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
+	198,	   0,	   0,	   0,	   0,	 216,	 260,	   0, \
+	0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
+	0,	   0,	   0,	   0,	   0,	   0,	  89,	   0, \
+	0,	   0,	   0,	   0,	   0,	 256,	   0,	   0, \
+	0,	   0,	   0,	 185,	   0,	   0,	   0,	   0, \
+	0,	  89,	   0,	   0,	   0,	   0,	   0,	   0, \
+	216,	   0,	   0,	   0,	  89,	   0,	 389,	   0, \
+	0,	   0,	   0,	 408,	   0,	   0,	   0,	   0, \
+	0,	   0,	   0,	   0,	   0,	   0,	 408,	 256, \
+	0,	   0,	   0,	   0,	   0,	 408,	   0,	   0, \
+	0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
+	0,	   0,	 260,	   0,	  89,	  89,	   0,	   0, \
+	0,	  89,	   0,	   0,	  89,	   0,	  89,	 231, \
+	0,	 219,	  89,	 219,	   0,	 268,	   0,	 211, \
+	219,	 220,	   5,	   0,	   0,	   0,	 219,	 159, \
+	0,	   0,	 268,	   0,	 231,	   0,	 268,	 166, \
+	167,	 169,	 170,	   0,	   0,	   0,	   0,	 260, \
+	0,	   0,	 260,	   0,	   0,	   0,	 185,	   0, \
+	174,	 175,	 176,	   0,	   0,	   0,	   0,	   0, \
+	260,	 260,	 260,	 256,	   0,	   0,	 260,	   0, \
+	0,	   0,	 203,	   0,	   0,	   0,	   0,	 219, \
+	219,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
+	0,	   0,	   0,	   0,	 233,	   0,	 234,	 235, \
+	236,	   0,	   0,	   0,	 219,	 389,	 408,	   0, \
+	0,	 270,	   0,	   0,	 408,	   0,	   0,	   0, \
+	256,	   0,	 138,	 256,	   0,	   0,	   0,	   0, \
+	0,	 293,	   0,	 294,	   0,	   0,	   0,	   0, \
+	301,	 256,	 256,	 256,	   0,	   0,	   0,	 256, \
+	268,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
+	321,	 268,	 322,	   0,	   0,	 325,	   0,	 326, \
+	0,	   0,	   0,	   0,	 408,	   0,	   0,	   0, \
+	0,	   0,	   0,	   0,	   0,	   0,	 341,	   0, \
+	343,	   0,	   0,	   0,	 268,	 268,	 268,	   0, \
+	352,	 353,	   0,	   0,	   0,	   0,	 356,	   0, \
+	0,	   0,	 251,	   0,	 110,	   0,	   0,	   0, \
+	0,	   0,	   0,	 219,	   0,	   0,	   0,	   0, \
+	0,	   0,	   0,	   0,	   0,	 260,	   0,	   0, \
+	0,	 260,	   0,	   0,	 260,	   0,	   0,	   0, \
+	260,	 260,	 260,	 260,	   0,	 260,	 260,	   0, \
+	190,	  59,	   0,	 260,	 251,	  59,	  59,	  59, \
+	59,	  59,	   0,	   0,	   0,	   0,	   0,	   0, \
+	0,	  59,	  59,	  59,	   0,	   0,	   0,	   0, \
+	136,	   0,	   0,	 393,	  89,	   0,	 219,	 395, \
+	0,	 396,	   0,	   0,	 261,	   0,	   0,	   0, \
+	59,	 398,	   0,	   0,	   0,	   0,	 256,	   0, \
+	0,	   0,	 256,	   0,	   0,	 256,	  59,	   0, \
+	0,	 256,	 256,	 256,	 256,	   0,	 256,	 256, \
+	0,	 425,	   0,	   0,	 256,	   0,	   0,	   0, \
+	255,	   0,	   0,	   0,	   0,	   0,	 261,	 446, \
+	0,	   0,	   0,	   0,	   0,	   0,	 454,	 455, \
+	251,	 456,	   0,	   0,	 457,	   0,	   0,	   0, \
+	264,	   0,	   0,	 463,	   0,	   0,	 466,	 467, \
+	0,	   0,	 219,	   0,	   0,	   0,	 260,	 470, \
+	260,	 317,	 255,	   0,	   0,	   0,	   0,	 260, \
+	0,	   0,	 317,	   0,	   0,	   0,	   0,	   0, \
+	0,	   0,	  59,	 251,	 260,	 493,	   0,	   0, \
+	251,	 251,	 264,	 498,	   0,	   0,	 251,	   0, \
+	0,	 251,	   0,	   0,	   0,	   0,	 251,	   0, \
+	0,	   0,	   0,	   0,	 251,	   0,	 511,	   0, \
+	59,	 339,	 261,	   0,	   0,	   0,	   0,	   0, \
+	0,	 339,	 339,	   0,	 264,	   0,	   0,	 256, \
+	0,	 256,	   0,	   0,	   0,	   0,	 317,	   0, \
+	256,	   0,	   0,	 521,	   0,	   0,	   0,	   0, \
+	0,	   0,	   0,	   0,	 144,	 256,	 255,	   0, \
+	59,	  59,	   0,	   0,	 528,	  59,	   0,	 261, \
+	59,	 251,	 261,	   0,	   0,	   0,	  59,	   0, \
+	0,	   0,	   0,	   0,	   0,	   0,	 264,	   0, \
+	261,	 261,	 261,	   0,	   0,	   0,	 261,	   0, \
+	0,	   0,	   0,	   0,	 556,	   0,	   0,	 557, \
+	0,	   0,	 558,	 255,	   0,	 559,	 255,	   0, \
+	0,	   0,	   0,	 563,	   0,	   0,	   0,	   0, \
+	0,	   0,	   0,	   0,	 255,	 255,	 255,	 570, \
+	0,	 264,	 255,	   0,	 263,	 251,	 264,	 264, \
+	0,	   0,	   0,	 572,	 264,	   0,	   0,	 264, \
+	0,	   0,	   0,	   0,	 264,	   0,	 576,	   0, \
+	264,	 264,	 264,	 251,	   0,	   0,	   0,	   0, \
+	0,	 251,	 251,	 251,	 251,	   0,	 251,	   0, \
+	580,	   0,	   0,	   0,	 582,	   0,	 263,	 583, \
+	0,	 251,	   0,	 317,	 317,	   0,	   0,	 251, \
+	0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
+	0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
+	0,	 587,	   0,	   0,	   0,	   0,	   0,	 264, \
+	263,	   0,	   0,	   0,	   0,	   0,	 593,	   0, \
+	0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
+	339,	   0,	   0,	   0,	 339,	 261,	   0,	   0, \
+	0,	 261,	   0,	 339,	 261,	   0,	   0,	   0, \
+	261,	 261,	 261,	 261,	   0,	 261,	 261,	   0, \
+	0,	   0,	   0,	 261,	   0,	   0,	   0,	   0, \
+	0,	   0,	 263,	   0,	   0,	   0,	   0,	   0, \
+	0,	 255,	   0,	 264,	   0,	 255,	   0,	   0, \
+	255,	   0,	   0,	   0,	 255,	 255,	 255,	 255, \
+	0,	 255,	 255,	   0,	 251,	   0,	 251,	 255, \
+	0,	 264,	   0,	   0,	   0,	 251,	   0,	 264, \
+	264,	 264,	 264,	   0,	 264,	 263,	   0,	   0, \
+	0,	   0,	 263,	 263,	   0,	   0,	   0,	 264, \
+	263,	   0,	   0,	 263,	   0,	 264,	   0,	   0, \
+	263,	   0,	   0,	   0,	 263,	 263,	 263,	 103, \
+	0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
+	0,	   0,	   0,	   0,	   0,	   0,	   0,	 317, \
+	188,	  57,	   0,	   0,	   0,	  57,	  57,	  57, \
+	57,	  57,	   0,	   0,	   0,	   0,	 261,	   0, \
+	261,	  57,	  57,	  57,	   0,	   0,	 180,	 261, \
+	192,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
+	0,	   0,	   0,	 263,	 261,	   0,	   0,	   0, \
+	57,	 218,	   0,	 221,	   0,	   0,	   0,	   0, \
+	0,	   0,	 255,	   0,	 255,	   0,	  57,	 212, \
+	0,	   0,	 212,	 255,	   0,	 212,	   0,	 271, \
+	0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
+	255,	   0,	 264,	   0,	 264,	   0,	   0,	   0, \
+	0,	   0,	   0,	 264,	   0,	   0,	   0,	 264, \
+	212,	   0,	 212,	   0,	   0,	   0,	   0,	 263, \
+	316,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
+	0,	 316,	   0,	   0,	   0,	   0,	   0,	   0, \
+	0,	   0,	   0,	   0,	   0,	 263,	   0,	   0, \
+	0,	   0,	 340,	 263,	 263,	 263,	 263,	   0, \
+	263,	   0,	  57,	   0,	   0,	   0,	   0,	   0, \
+	0,	   0,	   0,	 263,	   0,	   0,	   0,	   0, \
+	0,	 263,	   0,	   0,	   0,	 212,	   0,	   0, \
+	0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
+	57,	   0,	   0,	   0,	   0,	 316,	   0,	   0, \
+	0,	   0,	   0,	   0,	 218,	   0,	 221,	   0, \
+	0,	 372,	   0,	   0,	   0,	   0,	   0,	   0, \
+	0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
+	0,	   0,	   0,	   0,	 218,	   0,	   0,	   0, \
+	57,	  57,	   0,	   0,	   0,	  57,	   0,	   0, \
+	57,	   0,	 212,	 212,	   0,	 212,	  57,	 390, \
+	0,	   0,	   0,	   0,	 212,	   0,	   0,	   0, \
+	0,	   0,	 212,	   0,	   0,	   0,	   0,	   0, \
+	212,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
+	0,	 420,	   0,	   0,	   0,	   0,	 263,	   0, \
+	263,	   0,	 429,	   0,	   0,	   0,	   0,	 263, \
+	0,	   0,	   0,	 263,	   0,	   0,	   0,	   0, \
+	0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
+	0,	   0,	   0,	 212,	 212,	   0,	   0,	   0, \
+	0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
+	0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
+	212,	   0,	 316,	 316,	   0,	 480,	   0,	   0, \
+	0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
+	0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
+	0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
+	0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
+	0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
+	0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
+	0,	   0,	   0,	 515,	   0,	   0,	   0,	   0, \
+	0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
+	0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
+	0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
+	0,	   0,	   0,	   0,	   0,	   0,	   0,	 390, \
+	0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
+	0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
+	0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
+	0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
+	0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
+	0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
+	0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
+	212,	   0,	 212,	   0,	   0,	   0,	   0,	   0, \
+	0,	   0,	   0,	   0,	   0,	   0,	 316,	   0, \
+	0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
+	0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
+	0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
+	0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
+	0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
+	0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
+	0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
+	0,	   0,	   0,	   0,	   0,	   0,	 390, \
+)
+
+_YYPACT = ( \
+	-504,   -1000,	-413,   -1000,	-400,	-314,	-314,	-504, \
+	-217,   -1000,	-387,	-387,	 165,	  47,	 165,	 165, \
+	-217,	-217,	 203,   -1000,   -1000,   -1000,   -1000,   -1000, \
+	-1000,   -1000,   -1000,   -1000,   -1000,	 165,	 165,	-473, \
+	-1000,	-515,	-517,   -1000,   -1000,   -1000,	 412,	-504, \
+	759,	1079,	-663,   -1000,	-560,   -1000,	-380,	 165, \
+	-1000,   -1000,	-936,	-518,   -1000,	-217,	 571,	 153, \
+	-1000,	-448,   -1000,	1179,	-144,	-581,   -1000,   -1000, \
+	-1000,	 165,   -1000,	 165,	 165,	 165,	-207,	1290, \
+	-1000,   -1000,	1258,	1258,   -1000,   -1000,	 165,	 545, \
+	-1000,   -1000,   -1000,   -1000,   -1000,   -1000,	1258,	 759, \
+	-963,	 759,   -1000,	-908,	1404,	1258,	 165,   -1000, \
+	165,   -1000,   -1000,	-947,	-909,	 165,   -1000,	1211, \
+	-1000,   -1000,	-470,   -1000,   -1000,	 379,	1355,   -1000, \
+	847,	1290,   -1000,   -1000,	-921,	 165,   -1000,	 165, \
+	-207,	 991,	 165,   -1000,	 165,   -1000,   -1000,   -1000, \
+	-1000,	-504,	-998,	-658,	-661,	-656,	-362,   -1000, \
+	784,   -1000,	 545,	 165,	-386,	 165,   -1000,	 784, \
+	696,	 -54,	1079,	-486,	 324,	 165,	 165,   -1000, \
+	-1000,   -1000,	-545,	 -50,   -1000,   -1000,   -1000,	-314, \
+	-1000,   -1000,   -1000,   -1000,   -1000,	-387,   -1000,   -1000, \
+	-1000,   -1000,   -1000,   -1000,   -1000,   -1000,   -1000,   -1000, \
+	-1000,   -1000,   -1000,   -1000,	 -89,	-293,	 -89,	-106, \
+	-1000,	 659,   -1000,   -1000,	 545,	1079,	1179,	-188, \
+	-206,	 479,	 659,	1281,	-203,	1290,	-203,	 203, \
+	203,   -1000,   -1000,   -1000,	 203,   -1000,	-196,	 203, \
+	-1000,	 759,	 291,	 618,	-448,	 203,	-448,   -1000, \
+	-516,   -1000,   -1000,	-448,	 618,	-183,   -1000,   -1000, \
+	165,	-448,   -1000,   -1000,	 165,   -1000,	 165,	1050, \
+	-470,   -1000,   -1000,   -1000,   -1000,   -1000,	 165,   -1000, \
+	848,   -1000,	-357,	-391,   -1000,	-275,	 429,	-908, \
+	-1000,   -1000,   -1000,	 429,	-909,   -1000,	 429,   -1000, \
+	-207,	 545,	1079,	1332,	-357,	-357,	 165,	-486, \
+	-486,	1290,	 545,	-384,	-896,	 -41,   -1000,	-136, \
+	-122,	-160,	-448,	-448,	 165,	-970,	-970,	-970, \
+	1079,	1079,	1079,	 165,	 165,   -1000,	 165,   -1000, \
+	-1000,	 165,   -1000,	1258,	1120,   -1000,   -1000,	-448, \
+	165,	1079,	1079,	 165,	 165,   -1000,   -1000,	1211, \
+	-1000,	-581,	 784,	-921,	 165,	-187,	1422,   -1000, \
+	-183,   -1000,	-293,	   6,	-470,	1050,	 244,	 784, \
+	784,   -1000,   -1000,   -1000,	-183,   -1000,   -1000,	-171, \
+	784,	 784,	 165,	-666,   -1000,	-494,	 784,	 696, \
+	165,   -1000,   -1000,	 696,	-970,   -1000,   -1000,   -1000, \
+	92,   -1000,	 -80,   -1000,	-200,   -1000,	-181,	-531, \
+	-1000,   -1000,   -1000,	 165,   -1000,   -1000,   -1000,	-197, \
+	-106,   -1000,	-197,   -1000,	-970,   -1000,   -1000,   -1000, \
+	-1000,   -1000,   -1000,	 545,	-206,   -1000,	-206,   -1000, \
+	-1000,   -1000,	 -79,   -1000,   -1000,   -1000,   -1000,   -1000, \
+	165,   -1000,	-196,	-196,	-170,	-525,	-502,   -1000, \
+	-470,   -1000,   -1000,   -1000,   -1000,   -1000,   -1000,   -1000, \
+	-275,	 165,   -1000,   -1000,	-357,   -1000,	 429,	1198, \
+	429,	 429,   -1000,	-275,	-357,	-357,	-357,	-970, \
+	-357,	-357,	-239,   -1000,	-214,	-214,	1225,	-970, \
+	-187,   -1000,   -1000,   -1000,	 317,	-214,   -1000,   -1000, \
+	-125,	 165,   -1000,   -1000,	 165,   -1000,   -1000,	 165, \
+	-1000,   -1000,	 165,   -1000,	-170,	1211,   -1000,	 759, \
+	165,	-448,	1079,	-170,	-170,   -1000,   -1000,   -1000, \
+	-1000,   -1000,	1120,	-885,	 165,   -1000,	1211,   -1000, \
+	-1000,   -1000,   -1000,   -1000,   -1000,   -1000,   -1000,   -1000, \
+	165,   -1000,	-187,   -1000,   -1000,   -1000,	-293,	-581, \
+	-470,   -1000,   -1000,	 165,   -1000,   -1000,	  92,   -1000, \
+	-1000,   -1000,   -1000,   -1000,   -1000,   -1000,	-662,   -1000, \
+	-1000,   -1000,   -1000,	 784,   -1000,	 165,   -1000,   -1000, \
+	-628,	 165,   -1000,   -1000,	 165,   -1000,   -1000,   -1000, \
+	-1000,   -1000,   -1000,	-206,   -1000,   -1000,   -1000,   -1000, \
+	-1000,   -1000,   -1000,   -1000,   -1000,	-502,	-581,   -1000, \
+	-1000,	-138,   -1000,	-275,   -1000,   -1000,	 165,   -1000, \
+	-1000,	-239,	1198,	-170,	-170,   -1000,	  55,   -1000, \
+	-1000,   -1000,   -1000,	 165,   -1000,   -1000,   -1000,	-357, \
+	-1000,   -1000,   -1000,   -1000,   -1000,   -1000,   -1000,   -1000, \
+	1211,   -1000,   -1000,   -1000,   -1000,   -1000,   -1000,   -1000, \
+	-970,	1258,   -1000,   -1000,   -1000,   -1000,   -1000,	-581, \
+	-1000,   -1000,   -1000,   -1000,   -1000,   -1000,   -1000,   -1000, \
+	-1000,	-921,   -1000,   -1000,   -1000,   -1000,   -1000,   -1000, \
+	-1000,   -1000,   -1000,   -1000,	1258,	1120,	1120,   -1000, \
+	-1000, \
+)
+
+_YYPGO = ( \
+	 0,	 598,	 977,	 935,	 594,	2698,	 214,	2242, \
+	1374,	 220,	 189,	 234,	 261,	 725,	 593,	 543, \
+	579,	 576,	 571,	 221,	 634,	2247,	 232,	3376, \
+	194,	2896,	1972,	 181,	2028,	 170,	 175,	 654, \
+	568,	 561,	 558,	 546,	 518,	 512,	 507,	3359, \
+	299,	2001,	 165,	 490,	 819,	 836,	 449,	1069, \
+	188,	2476,	 793,	 424,	 394,	 378,	1162,	  91, \
+	238,	 157,	 377,	 624,	 873,	 372,	 364,	 362, \
+	360,	 787,	 100,	 160,	 356,	 211,	 927,	 511, \
+	153,	 159,	 209,	 351,	 347,	1174,	2860,	 140, \
+	346,	 637,	 343,	 342,	 339,	 182,	 268,	 337, \
+	333,	1004,	 172,	 551,	 331,	 569,	 328,	 201, \
+	323,	 319,	 180,	2920,	2786,	 141,	 318,	 883, \
+	314,	3092,	 306,	 821,	 305,	 302,	 164,	 208, \
+	355,	 200,	 298,	  87,	1005,	 256,	  90,	 301, \
+	249,	  88,	 230,	 205,	  89,	 152,	 295,	 474, \
+	78,	2541,	 294,	 289,	 284,	 212,	 192,	 275, \
+	198,	 199,	 274,	 156,	 263,	 262,	 259,	 246, \
+	236,	 235,	 136,	 223,	 222,	 207,	 168, \
+)
+
+_YYR1 = ( \
+	 0,	   1,	   2,	   2,	   2,	   2,	   2,	   2, \
+	 3,	   3,	   8,	   8,	   8,	   8,	  12,	  12, \
+	13,	  13,	  14,	  14,	  14,	  15,	  15,	  15, \
+	16,	  16,	  16,	  16,	  17,	  17,	  17,	  17, \
+	17,	  17,	  17,	  17,	  17,	  17,	  20,	  20, \
+	 5,	   5,	  32,	  32,	  32,	  32,	  32,	  35, \
+	35,	  35,	  35,	  35,	  33,	  33,	  33,	  33, \
+	33,	  33,	  33,	  34,	  31,	  31,	  48,	  48, \
+	48,	  51,	  51,	  47,	  47,	  52,	  52,	  56, \
+	56,	  57,	  57,	  59,	  59,	  59,	  55,	  55, \
+	26,	  26,	  60,	  60,	  60,	  60,	  61,	  61, \
+	62,	  62,	  41,	  41,	  41,	  68,	  68,	  71, \
+	71,	  71,	  72,	  72,	  75,	  75,	  75,	  75, \
+	76,	  76,	  77,	  77,	  77,	  77,	  77,	  77, \
+	77,	  83,	  83,	  85,	  85,	  85,	  85,	  45, \
+	45,	  45,	  45,	  45,	  28,	  28,	  86,	  86, \
+	39,	  39,	  89,	  89,	  90,	  90,	  91,	  91, \
+	93,	  93,	  93,	  94,	  94,	  94,	  95,	  95, \
+	95,	  95,	  98,	  97,	  97,	 101,	 101,	 103, \
+	103,	 103,	 103,	 103,	 103,	 103,	 103,	 103, \
+	103,	  30,	  30,	  29,	  29,	  25,	  25,	  81, \
+	81,	  81,	 115,	 115,	 118,	 118,	 118,	 120, \
+	120,	 117,	 122,	 122,	 116,	 116,	 116,	 123, \
+	123,	 124,	 124,	 107,	 107,	 107,	 107,	 107, \
+	107,	 119,	 119,	 119,	 126,	 126,	 127,	 127, \
+	127,	 128,	 128,	 128,	 128,	 128,	 128,	 128, \
+	80,	  80,	  80,	   6,	   6,	 130,	 130,	 104, \
+	104,	 131,	 131,	 131,	 131,	  11,	  11,	  11, \
+	 4,	   4,	 133,	 133,	 134,	 134,	 134,	 134, \
+	134,	 134,	 134,	  43,	  43,	  43,	 135,	 135, \
+	136,	 136,	  67,	  67,	  67,	   7,	   7,	   7, \
+	 7,	 108,	 108,	 139,	 139,	 139,	 139,	  84, \
+	84,	 140,	 140,	 140,	 140,	 141,	 142,	 143, \
+	38,	  38,	  92,	  92,	 102,	 102,	  23,	  23, \
+	18,	  18,	 144,	 144,	  65,	  65,	  65,	  42, \
+	42,	 121,	 121,	 121,	 109,	 109,	 109,	  19, \
+	19,	  19,	  27,	  27,	  27,	  44,	  44,	 145, \
+	145,	 145,	  40,	  40,	  66,	  66,	  66,	 112, \
+	112,	 112,	 146,	 146,	  79,	  79,	  79,	  87, \
+	87,	  87,	 106,	 106,	 106,	  54,	  54,	  54, \
+	110,	 110,	 110,	  46,	  46,	  88,	  88,	  88, \
+	113,	 114,	 114,	 114,	  82,	  82,	  82,	 125, \
+	125,	 125,	 147,	 147,	 105,	 105,	 148,	 148, \
+	99,	  99,	  78,	  78,	  78,	  36,	  36,	  36, \
+	64,	  64,	  21,	  21,	  37,	  22,	  22,	  73, \
+	73,	  69,	  69,	 138,	 137,	  49,	  49,	 100, \
+	100,	 149,	 149,	  63,	  63,	  10,	  10,	 111, \
+	58,	  58,	  53,	  53,	 150,	 150,	 150,	  50, \
+	50,	 129,	  24,	  24,	   9,	   9,	  96,	  96, \
+	74,	  74,	  70,	  70,	 132, \
+)
+
+_YYR2 = ( \
+	0,	   2,	   1,	   2,	   2,	   2,	   3,	   2, \
+	2,	   1,	   2,	   2,	   2,	   1,	   1,	   0, \
+	1,	   3,	   1,	   3,	   2,	   1,	   3,	   2, \
+	1,	   3,	   4,	   4,	   1,	   1,	   1,	   1, \
+	2,	   1,	   1,	   1,	   1,	   1,	   2,	   3, \
+	1,	   2,	   1,	   1,	   1,	   1,	   1,	   3, \
+	3,	   4,	   5,	   4,	   3,	   4,	   4,	   3, \
+	4,	   3,	   2,	   3,	   1,	   1,	   4,	   2, \
+	1,	   3,	   2,	   1,	   5,	   1,	   4,	   1, \
+	4,	   1,	   2,	   4,	   4,	   2,	   2,	   1, \
+	1,	   2,	   1,	   1,	   1,	   1,	   2,	   2, \
+	7,	   6,	   1,	   4,	   4,	   1,	   3,	   1, \
+	3,	   3,	   1,	   4,	   1,	   2,	   3,	   4, \
+	1,	   2,	   3,	   4,	   1,	   2,	   3,	   1, \
+	1,	   3,	   3,	   1,	   2,	   2,	   3,	   1, \
+	2,	   2,	   3,	   2,	   1,	   3,	   3,	   3, \
+	2,	   1,	   1,	   2,	   1,	   3,	   1,	   2, \
+	1,	   3,	   4,	   1,	   3,	   3,	   1,	   3, \
+	1,	   2,	   4,	   1,	   3,	   1,	   2,	   1, \
+	3,	   2,	   3,	   2,	   3,	   4,	   2,	   2, \
+	3,	   3,	   4,	   2,	   3,	   2,	   3,	   1, \
+	3,	   2,	   1,	   4,	   1,	   3,	   4,	   1, \
+	2,	   3,	   1,	   1,	   1,	   3,	   4,	   1, \
+	4,	   1,	   3,	   1,	   2,	   2,	   2,	   3, \
+	3,	   1,	   4,	   4,	   1,	   3,	   1,	   3, \
+	3,	   1,	   2,	   3,	   3,	   3,	   4,	   3, \
+	1,	   2,	   2,	   1,	   2,	   1,	   2,	   1, \
+	2,	   1,	   1,	   1,	   2,	   1,	   2,	   2, \
+	1,	   2,	   1,	   2,	   1,	   1,	   2,	   2, \
+	1,	   1,	   1,	   1,	   1,	   2,	   1,	   2, \
+	1,	   2,	   1,	   1,	   2,	   1,	   2,	   1, \
+	2,	   1,	   3,	   1,	   2,	   2,	   3,	   1, \
+	2,	   1,	   1,	   1,	   3,	   4,	   2,	   3, \
+	1,	   2,	   1,	   2,	   1,	   2,	   1,	   2, \
+	1,	   2,	   1,	   1,	   1,	   2,	   1,	   1, \
+	2,	   1,	   2,	   1,	   1,	   2,	   1,	   1, \
+	2,	   1,	   1,	   2,	   1,	   1,	   1,	   1, \
+	2,	   1,	   1,	   1,	   1,	   2,	   1,	   1, \
+	2,	   1,	   1,	   1,	   1,	   2,	   1,	   1, \
+	2,	   1,	   1,	   2,	   1,	   1,	   2,	   1, \
+	1,	   2,	   1,	   1,	   1,	   1,	   2,	   1, \
+	1,	   1,	   2,	   1,	   1,	   2,	   1,	   1, \
+	2,	   1,	   1,	   1,	   1,	   2,	   1,	   2, \
+	1,	   2,	   1,	   2,	   1,	   3,	   4,	   3, \
+	1,	   1,	   1,	   3,	   1,	   1,	   2,	   1, \
+	2,	   1,	   2,	   1,	   1,	   1,	   2,	   1, \
+	2,	   1,	   2,	   1,	   2,	   1,	   2,	   1, \
+	1,	   2,	   1,	   2,	   1,	   2,	   3,	   1, \
+	2,	   1,	   1,	   2,	   1,	   2,	   1,	   2, \
+	1,	   2,	   1,	   2,	   1, \
+)
+
+_YYCHK = ( \
+	-1000,	  -1,	  -2,	  -3,	  -4,	  -5,	  -6,	 581, \
+	-7,	  -8,	-133,	 535,	 -32,	-130,	-137,	-138, \
+	-9,	 -10,	 -11,	 -12,	-134,	 -33,	 -34,	 -35, \
+	-36,	 -37,	 517,	 930,	 925,	 995,	 955,	 584, \
+	-13,	 612,	 515,	 618,	 524,	 536,	 -43,	 606, \
+	-38,	 602,	 617,	 905,	 -14,	 525,	-135,	 597, \
+	-15,	-136,	 -16,	 519,	 -17,	 -18,	 -20,	 -21, \
+	-22,	 -23,	 -24,	 -25,	 -26,	 -28,	 -29,	 -30, \
+	-31,	 610,	-150,	 910,	 578,	 990,	-111,	-113, \
+	-60,	 -86,	 505,	 504,	 -47,	 -48,	 970,	 532, \
+	960,	 677,	 -41,	 -61,	 -62,	 -63,	 542,	 585, \
+	-52,	 -49,	 -51,	 -68,	 -64,	 587,	 950,	 -56, \
+	935,	 -71,	-148,	 -57,	 -72,	 527,	 -59,	 -39, \
+	-75,	 -89,	 -76,	 -90,	 -77,	 -91,	 -78,	 -80, \
+	558,	 566,	 -83,	 -84,	 -93,	 561,	-149,	 555, \
+	-129,	 562,	-140,	 -94,	 945,	 985,	-141,	-142, \
+	-143,	 571,	 -95,	 627,	 626,	 569,	 -97,	 -98, \
+	-99,	-101,	-100,	 583,	-103,	 940,	-104,	 551, \
+	-105,	 547,	 574,	 667,	-108,	-131,	 596,	-139, \
+	509,	-132,	 543,	 586,	1025,	 529,	  -3,	  -5, \
+	-3,	  -3,	  -2,	  -8,	-134,	-133,	  -5,	  -5, \
+	517,	  -5,	  -5,	  -8,	  -8,	 -12,	  -5,	  -5, \
+	-5,	 -11,	 581,	 581,	 -39,	 -28,	  -6,	 -41, \
+	-44,	 -21,	 526,	 256,	 -23,	 -49,	 -25,	  -2, \
+	-39,	 -26,	 -21,	 -41,	-111,	-113,	-129,	 -11, \
+	-9,	 525,	-136,	  -5,	 -10,	 581,	  -8,	 610, \
+	-31,	 -20,	 -26,	 -21,	 -23,	 610,	 551,	 -89, \
+	-7,	 -59,	 -39,	 -49,	 -21,	 -39,	 -77,	 -27, \
+	628,	 -42,	 -47,	 -60,	 614,	 256,	 520,	 -49, \
+	625,	  -5,	  -5,	  -5,	  -5,	-112,	 651,	 256, \
+	-81,	-115,	 655,	-118,	-119,	-116,	 673,	-126, \
+	-123,	-127,	-124,	-100,	-128,	-107,	 551,	 -25, \
+	-129,	 666,	 664,	 657,	 -49,	 -78,	 679,	-105, \
+	-99,	 662,	 665,	 -60,	 -21,	 -60,	  -5,	 -39, \
+	-60,	 -31,	 -53,	 -24,	 966,	 -48,	 -47,	 -41, \
+	-69,	 -70,	 -67,	 916,	1015,	 -22,	-137,	 -65, \
+	-41,	 556,	 256,	 -49,	 -26,	  -5,	  -5,	 -58, \
+	965,	 -73,	 -74,	 915,	1010,	  -5,	 -55,	 -26, \
+	-27,	 -28,	 -92,	 -93,	 518,	 -41,	 -28,	  -6, \
+	-85,	 -45,	 -28,	 -77,	 -39,	 -25,	 -81,	  -7, \
+	-70,	  -5,	  -5,	-112,	 -85,	  -5,	  -5,	  -2, \
+	-96,	 -74,	1005,	 698,	 698,	 697,	 508,	-102, \
+	516,	 -98,	-103,	 -99,	 -39,	  -5,	 -30,	  -5, \
+	-91,	-103,	 -21,	-103,	 -41,	-107,	 -31,	  -7, \
+	-5,	  -5,	 593,	 581,	  -5,	  -3,	 -44,	 -28, \
+	-45,	 -44,	 -28,	 -44,	 -41,	 -46,	 607,	 256, \
+	-40,	 598,	 256,	 -42,	 -39,	 -40,	 -41,	-146, \
+	651,	 256,	 -81,	-146,	 -13,	 -15,	 -15,	 -19, \
+	611,	 256,	 -13,	 -13,	 -59,	 -21,	 -23,	-150, \
+	-65,	  -5,	 -47,	  -5,	  -5,	 -86,	  -5,	-114, \
+	-116,	 678,	 256,	-117,	-122,	-119,	 508,	-120, \
+	-7,	 -70,	-118,	-116,	 -69,	 -70,	 -67,	-123, \
+	-73,	 -74,	-116,	-112,	 -39,	 -41,	-120,	-119, \
+	-119,	  -5,	-107,	-107,	 -81,	 -39,	 -29,	-110, \
+	-29,	 506,	 256,	-145,	 531,	 256,	 -87,	 538, \
+	256,	 -88,	 557,	 256,	 -47,	 -56,	  -5,	 -50, \
+	980,	 -50,	 -50,	 -41,	 -41,	 -71,	  -5,	  -5, \
+	-5,	  -5,	 -26,	 -66,	 588,	 256,	 -56,	  -5, \
+	-71,	 -71,	  -5,	  -5,	 -27,	 -90,	  -5,	 -79, \
+	573,	 256,	 -41,	 -65,	 -45,	 -45,	 -28,	 -28, \
+	-39,	 -41,	 -82,	 568,	 256,	 -94,	 -91,	 -65, \
+	-144,	 567,	 256,	 -94,	 -94,	  -5,	 699,	 565, \
+	-95,	-101,	  -5,	 -50,	 -54,	 550,	 256,	-103, \
+	-106,	 575,	 256,	-109,	 552,	 256,	-139,	  -5, \
+	-44,	 -44,	 -44,	 -39,	 -40,	 -40,	-147,	 678, \
+	256,	  -5,	 -19,	 -19,	 -54,	 551,	 -28,	-115, \
+	-5,	-122,	-117,	-116,	-121,	-118,	 658,	 256, \
+	-123,	-116,	-120,	-119,	-119,	-127,	 -50,	-127, \
+	-127,	 -54,	-125,	 675,	 256,	-125,	-125,	 -50, \
+	-79,	-125,	-125,	-110,	  -5,	  -5,	  -5,	  -5, \
+	-54,	 -55,	 -31,	  -5,	 -57,	 -72,	 -54,	 -54, \
+	-66,	 -67,	  -5,	 -55,	  -5,	 -79,	 -45,	 -28, \
+	-5,	 -54,	 698,	 -95,	  -5,	 663,	  -5,	  -5, \
+	-40,	-116,	-115,	  -5,	 -54,	-121,	 -54,	 -54, \
+	-124,	  -5,	-128,	 -55,	 -50,	 -26,	 -26,	 -66, \
+	-66, \
+)
+
+_YYDEF = ( \
+	15,	  -2,	   0,	   2,	  15,	  15,	  15,	  15, \
+	15,	   9,	 224,	   0,	  40,	 211,	 245,	 247, \
+	15,	  15,	  15,	  13,	 226,	  42,	  43,	  44, \
+	45,	  46,	 213,	 364,	 363,	 388,	 373,	 221, \
+	14,	 228,	 229,	 232,	 233,	 234,	   0,	  15, \
+	 0,	   0,	   0,	 356,	  16,	 235,	 236,	 264, \
+	18,	 238,	  21,	 240,	  24,	  15,	  37,	 352, \
+	28,	  29,	  30,	  31,	   0,	  33,	  34,	  35, \
+	36,	 272,	 354,	 357,	 270,	 386,	   0,	   0, \
+	80,	 124,	   0,	   0,	  60,	  61,	 380,	   0, \
+	375,	 328,	  82,	  83,	  84,	  85,	   0,	   0, \
+	67,	   0,	  64,	  90,	   0,	   0,	 371,	  69, \
+	365,	  93,	 353,	  71,	  95,	 342,	  73,	   0, \
+	98,	 129,	 100,	 130,	 104,	 132,	   0,	 108, \
+	 0,	   0,	 111,	 112,	 134,	 346,	 348,	 208, \
+	 0,	   0,	 255,	 136,	 369,	 385,	 257,	 258, \
+	259,	  15,	 139,	   0,	   0,	   0,	 142,	 144, \
+	 0,	 147,	   0,	 344,	 149,	 367,	 151,	   0, \
+	 0,	   0,	   0,	   0,	   0,	 215,	 340,	 249, \
+	217,	 218,	 219,	 251,	 396,	   1,	   3,	  15, \
+	 4,	   5,	   7,	   8,	 227,	 225,	  41,	 212, \
+	214,	 246,	 248,	  10,	  11,	  12,	 389,	 374, \
+	222,	 223,	 230,	 231,	   0,	   0,	   0,	   0, \
+	58,	   0,	 293,	 294,	   0,	   0,	   0,	   0, \
+	 0,	   0,	 352,	   0,	   0,	   0,	   0,	   0, \
+	20,	 237,	 239,	 265,	  23,	 241,	   0,	   0, \
+	63,	   0,	   0,	 352,	   0,	   0,	   0,	 128, \
+	 0,	  77,	 131,	   0,	   0,	   0,	 105,	  32, \
+	38,	   0,	  66,	  81,	 290,	 292,	 279,	   0, \
+	 0,	 273,	 358,	 271,	 387,	 165,	 303,	 305, \
+	 0,	 167,	   0,	 170,	 172,	   0,	   0,	 193, \
+	180,	 196,	 183,	   0,	 198,	 185,	   0,	 201, \
+	 0,	   0,	   0,	   0,	   0,	   0,	 187,	   0, \
+	 0,	   0,	   0,	 163,	 352,	   0,	 381,	   0, \
+	 0,	   0,	   0,	   0,	 378,	   0,	   0,	  82, \
+	 0,	   0,	   0,	 361,	 394,	 242,	 243,	  86, \
+	87,	 276,	 278,	   0,	   0,	 372,	 366,	   0, \
+	376,	   0,	   0,	 359,	 392,	 343,	  74,	   0, \
+	79,	 101,	   0,	 135,	 266,	   0,	   0,	 109, \
+	 0,	 115,	   0,	   0,	 119,	   0,	   0,	   0, \
+	 0,	 347,	 209,	 210,	   0,	 256,	 370,	   0, \
+	 0,	   0,	 390,	   0,	 262,	   0,	   0,	   0, \
+	268,	 145,	 159,	   0,	   0,	 345,	 150,	 368, \
+	 0,	 153,	   0,	 155,	   0,	 158,	   0,	   0, \
+	216,	 341,	 220,	 252,	 253,	   6,	  52,	   0, \
+	 0,	  55,	   0,	  57,	   0,	  59,	 323,	 324, \
+	47,	 298,	 299,	   0,	   0,	  48,	   0,	 349, \
+	306,	 307,	   0,	 351,	  17,	  19,	  22,	  25, \
+	287,	 289,	   0,	   0,	   0,	   0,	   0,	 355, \
+	102,	  39,	  65,	 291,	 280,	 125,	 304,	 166, \
+	 0,	 329,	 331,	  -2,	   0,	 178,	   0,	   0, \
+	 0,	   0,	 175,	   0,	   0,	   0,	   0,	   0, \
+	 0,	   0,	   0,	 202,	   0,	   0,	   0,	   0, \
+	 0,	 188,	 189,	 190,	   0,	   0,	 164,	 161, \
+	 0,	 320,	 322,	 382,	 295,	 297,	 126,	 311, \
+	313,	 127,	 325,	 327,	   0,	   0,	 379,	   0, \
+	383,	   0,	   0,	   0,	   0,	  94,	 362,	 395, \
+	244,	 277,	   0,	   0,	 300,	 302,	   0,	 377, \
+	96,	  97,	 360,	 393,	  78,	 133,	 267,	 106, \
+	308,	 310,	   0,	 113,	 116,	 117,	   0,	 120, \
+	121,	 123,	 110,	 332,	 334,	 137,	   0,	 114, \
+	260,	 274,	 275,	 140,	 141,	 391,	   0,	 263, \
+	143,	 148,	 269,	   0,	 152,	 317,	 319,	 154, \
+	156,	 314,	 316,	 160,	 284,	 286,	 250,	 254, \
+	53,	  54,	  56,	   0,	  51,	  49,	 350,	 338, \
+	339,	 288,	  26,	  27,	  76,	   0,	 103,	 168, \
+	330,	   0,	 179,	   0,	 173,	 176,	 281,	 283, \
+	181,	   0,	   0,	   0,	   0,	 197,	   0,	 199, \
+	200,	 186,	 203,	 335,	 337,	 204,	 205,	   0, \
+	207,	 191,	 192,	 162,	 321,	 296,	 312,	 326, \
+	 0,	  70,	  62,	 384,	  75,	  99,	  91,	  92, \
+	 0,	   0,	 301,	  72,	 309,	 107,	 118,	 122, \
+	333,	 138,	 261,	 146,	 318,	 157,	 315,	 285, \
+	50,	 177,	 171,	 282,	 182,	 174,	 194,	 195, \
+	184,	 336,	 206,	  68,	   0,	   0,	   0,	  89, \
+	88, \
+)
+
+def _excamap(exca):
+	"""
+	Returns the exceptions of exca (groups of -1, state, then token, action
+	pairs ended by -2, action for any other token) as a dict keyed by
+	(state, token), the action for any other token being under (state, -1).
+	"""
+	excamap = {}
+	state = None
+	for i in range(0, len(exca) - 1, 2):
+		if exca[i] == -1:
+			state = exca[i + 1]
+		elif exca[i] == -2:
+			excamap[(state, -1)] = exca[i + 1]
+		else: # if exca[i] == -1:
+			excamap[(state, exca[i])] = exca[i + 1]
+		# end if exca[i] == -1:
+	# end for i in range(0, len(exca) - 1, 2):
+	return excamap
+# end def _excamap(exca):
+
+# _YYEXCA by (state, token): the action of a state whose default is -2 is
+# found with one lookup rather than by scanning _YYEXCA from the start.
+_YYEXCAMAP = MappingProxyType(_excamap(_YYEXCA))
+
+# initial size of the stacks of the YACC parser, which grow up to the
+# yymaxdepth parameter
+_YYINITDEPTH = 1 << 6
+
+# Codes that the state functions of lojbanParserStates (the parser made by
+# genLojbanParser.py from these tables) add to the next state they return:
+# a token was shifted, an empty rule was reduced (both grow the stacks),
+# the reduction cleared the error recovery state (yyerrok).  _YYERROR and
+# _YYACCEPT are returned alone, on a syntax error and at the end of a text.
+_YYSTATEMASK = (1 << 10) - 1
+_YYSHIFTED = 1 << 10
+_YYGREW = 1 << 11
+_YYERROK = 1 << 12
+_YYERROR = 1 << 13
+_YYACCEPT = 1 << 14
+
+def _tableschecksum():
+	"""
+	Returns a checksum of the parser tables and semantic actions, with which
+	genLojbanParser.py stamps lojbanParserStates.
+	"""
+	return zlib.crc32(repr((_YYREDUCE, _YYEXCA, _YYACT, _YYPACT, _YYPGO, \
+		_YYR1, _YYR2, _YYCHK, _YYDEF)).encode())
+# end def _tableschecksum():
+
+# lojbanParserStates, once _statesmodule has imported and checked it
+_STATESMODULE = None
+
+def _statesmodule():
+	"""
+	Returns the module lojbanParserStates, imported on first use.  Raises a
+	LojbanException if it is missing or was generated from other tables.
+	"""
+	global _STATESMODULE
+	if _STATESMODULE is None:
+		try:
+			import lojbanParserStates
+		except ImportError as e:
+			raise LojbanException(None, "lojbanParserStates.py is missing," + \
+				" run genLojbanParser.py ({:s})".format(str(e)))
+		# end try except ImportError as e:
+		if lojbanParserStates.CHECKSUM != _tableschecksum():
+			raise LojbanException(None, "lojbanParserStates.py was generated" + \
+				" from other parser tables, run genLojbanParser.py")
+		# end if lojbanParserStates.CHECKSUM != _tableschecksum():
+		_STATESMODULE = lojbanParserStates
+	# end if _STATESMODULE is None:
+	return _STATESMODULE
+# end def _statesmodule():
+
+
+#######################################################################
+## ParseContext
+#######################################################################
+
+class ParseContext:
+	"""
+	class ParseContext holds the state that the stages of the lexer pipeline
+	keep from one call to the next (static variables in the C code).
+	LojbanParser.reset() creates a new ParseContext for each parse, so that
+	nothing is carried over from one parse to the next or shared between
+	LojbanParser instances.
+	"""
+	def __init__(self):
+		# token read ahead by _absorb
+		self.absorb_cache = None
+		# current token, closing delimiter of zoi/la'o and mode of _filter
+		self.filter_tok = None
+		self.filter_delim = None
+		self.filter_mode = 0 # _NORMAL_MODE
+		# EOF seen by _getword
+		self.getword_eof = False
+		# token read ahead by _glue
+		self.glue_cache = None
+		# token read ahead by _lerfu
+		self.lerfu_cache = None
+		# pieces of the current word of _lex and index of the next one
+		self.lex_pieces = ()
+		self.lex_piece = 0
+		# type of the last token returned by _termin
+		self.termin_lasttype = -1
+		# cutting of the text by iterparse (see _segmentlex): selma'o before
+		# which the text is cut (None for no cutting), nesting depth in
+		# LU, TO and TUhE, token held back for the next part, number of tokens
+		# in the current part, whether the current part is being ended, the
+		# tokens made to end it, and EOT seen
+		self.segment_boundaries = None
+		self.segment_depth = 0
+		self.segment_pending = None
+		self.segment_ntokens = 0
+		self.segment_closing = False
+		self.segment_extra = []
+		self.segment_eof = False
+		# calls of fail() by the compounder (backtracks), matches that its
+		# FIRST sets ruled out at the next tokens (see _attempt), and whether
+		# they are looked up (set by reset(): not with D_cpd_reduce)
+		self.compound_backtracks = 0
+		self.compound_pruned = 0
+		self.compound_prune = True
+		# compound tokens made by the compounder for the token that _compound
+		# is making, None outside of it (see _reclaim)
+		self.compound_nodes = None
+		# packrat memo of the compounder: (production, position) -> token of
+		# the match, its type and the position after it, or None for no match;
+		# the tokens that it holds -> their children, how to link them (see
+		# _memodeliver) and the position of their match; the positions counting
+		# from that of the first token of the lookahead buffer, compound_base
+		# tokens from the text start; and the size of the memo at which
+		# _compound next drops the matches behind it
+		self.compound_memo = {}
+		self.compound_live = {}
+		self.compound_base = 0
+		self.compound_memolimit = 0
+		# TokenStream parsed in place of a text (see _streamtoken), index of
+		# its next token delivered and of the first node of that token
+		self.stream = None
+		self.stream_index = 0
+		self.stream_node = 0
+	# end def __init__(self):
+# end class ParseContext:
+
+#######################################################################
+## LojbanParser
+#######################################################################
+
+class LojbanParser:
+	"""
+	This class implements all the logic of the parser.
+	"""
+	def __init__(self, parameters = None):
+		self._parameters = Parameters() if parameters is None else parameters
+		self._tokenarena = None
+		self.reset()
+	# end def __init__(self, ...):
+
+	def __str__(self):
+		return "LojbanParser with " + self._parameters
+	# end def __str__(self):
+
+	def __repr__(self):
+		return self.__str__()
+	# end def __repr__(self):
+
+	@property
+	def backtracks(self):
+		"""
+		Backtracks (calls of fail()) of the compounder in the last parse.
+		"""
+		return self._context.compound_backtracks
+	# end def backtracks(self):
+
+	@property
+	def errors(self):
+		return self._errors
+	# end def errors(self):
+
+	@property
+	def lexcacheinfo(self):
+		"""
+		Hits, misses and size of the cache of the pieces of words of _lex
+		(shared by all parsers), as functools.lru_cache reports them.
+		"""
+		return LojbanParser._lexword.cache_info()
+	# end def lexcacheinfo(self):
+
+	@property
+	def prunedbacktracks(self):
+		"""
+		Matches of the compounder that the FIRST sets ruled out in the last
+		parse, each of them a backtrack avoided.
+		"""
+		return self._context.compound_pruned
+	# end def prunedbacktracks(self):
+
+	@property
+	def rulemode(self):
+		return self._parameters.rulemode
+	# end def rulemode(self):
+
+	@property
+	def streamstamp(self):
+		"""
+		Stamp of the TokenStreams made by tokenize: the CRC-32 of the source
+		of the lexer, and of the parameters that change the way it
+		delivers tokens (packrat).
+		"""
+		return zlib.crc32(repr((self._parameters.packrat,)).encode(), \
+			_sourcechecksum())
+	# end def streamstamp(self):
+
+	@property
+	def strings(self):
+		return self._strings
+	# end def strings(self):
+
+	@property
+	def stringspace(self):
+		"""
+		Characters of the distinct words kept in the StringPool of the parser
+		(of all the parsers sharing it, with the sharestrings parameter).
+		"""
+		return self._strings.uniquespace
+	# end def stringspace(self):
+
+	@property
+	def stringtotalspace(self):
+		"""
+		Characters of all the words of the last parse, as they would take
+		without interning.
+		"""
+		return self._stringspace
+	# end def stringtotalspace(self):
+
+	@property
+	def tokenarena(self):
+		return self._tokenarena
+	# end def tokenarena(self):
+
+	@property
+	def tokspace(self):
+		return self._tokspace
+	# end def tokspace(self):
+	
+	@property
+	def treemode(self):
+		return self._parameters.treemode
+	# end def treemode(self):
+
+	_VERSION = "233"
+
+	# whether reset() has put the packrat memo on the instance (a class
+	# attribute until then, to keep the instance attributes few)
+	_packrat = False
+
+	# types of the tokens before which iterparse cuts the text, for each unit
+	_SEGMENTBOUNDARIES = { \
+		"sentence" : (Constants.lexer_S_995, Constants.I_545, Constants.NIhO_584), \
+		"paragraph" : (Constants.NIhO_584,), \
+		}
+
+	# number of matches of the packrat memo of the compounder at which
+	# _compound drops those behind it (see _memoprune)
+	_MEMOSIZE = 1 << 15
+
+	# number of compounded tokens that the lookahead buffer keeps before
+	# dropping them
+	_LOOKAHEADSIZE = 1 << 10
+
+	@staticmethod
+	def _mkcmavo():
+		"""
+		Utility method for showing cmavo.
+		It is not called during parsing, it is called only from main,
+		on user request.
+		"""
+		cc = (".", "b", "c", "d", "f", "g", "j", "k", "l", "m", "n", \
+					"p", "r", "s", "t", "v", "x", "z")
+
+		vc = ( \
+			"a", "a'a", "a'e", "a'i", "a'o", "a'u", "ai", "au", "e", "e'a", \
+			"e'e", "e'i", "e'o", "e'u", "ei", "i", "i'a", "i'e", "i'i", "i'o", \
+			"i'u", "o", "o'a", "o'e", "o'i", "o'o", "o'u", "oi", "u", "u'a", \
+			"u'e", "u'i", "u'o", "u'u", "y", "ia", "ie", "ii", "io", "iu", \
+			"ua", "ue", "ui", "uo", "uu", "y'y" \
+		)
+
+		idx = 0
+		for i in range(len(cc)):
+			jmax = 35 if i != 0 else len(vc)
+			for j in range(jmax):
+				t = Constants.cmavo[i][j]
+				if t >= 0:
+					rule = Constants.rulename(t)
+					try:
+						apos = rule.index("'")
+						rule = rule[:apos] + 'h' + rule[apos+1:]
+					except Exception as e:
+						pass
+					# end try except Exception as e:
+					idx += 1
+					print("{:0>3d}:({:0>2d}-{:0>2d}): {:1s}{:<8} {:<8}".format(idx, i, j, cc[i], vc[j], rule))
+				# end if t >= 0:
+			# end for j in range(jmax):
+		# end for i in range(len(cc)):
+	# end def _mkcmavo():
+	
+	def _absorb(self):
+		"""
+		This method does indicator processing.  It invokes lerfu() and does
+		1-token lookahead to watch for following indicators.  If found, they
+		are absorbed into the previous token.  Indicators belong to selmao
+		UI, CAI, Y, DAhO, FUhE, or FUhO.  UI and CAI can also have a
+		following NAI, which is checked for and absorbed as well.
+		"""
+
+		tok = self._context.absorb_cache if self._context.absorb_cache else self._lerfu()
+
+		if tok.ttype == 0:
+			return tok
+		# end if tok.ttype == 0:
+		result = None
+		self._context.absorb_cache = self._lerfu()
+		while Constants.isindicator(self._context.absorb_cache):
+			if self._context.absorb_cache.ttype == Constants.NAI_581:
+				if result is None:
+					break
+				# end if result:
+				lasttype = result.downright.ttype
+				if lasttype != Constants.UI_612 and lasttype != Constants.CAI_515:
+					break
+				# end if lasttype != Constants.UI_612 and lasttype != Constants.CAI_515:
+			# end if self._context.absorb_cache.ttype == Constants.NAI_581:
+			if result is None:
+				result = self._newtoken()
+				result.ttype = tok.ttype
+				result.add(tok)
+			# end if result is None:
+			result.add(self._context.absorb_cache)
+			self._context.absorb_cache = self._lerfu()
+		# end while Constants.isindicator(self._context.absorb_cache):
+		if result:
+			return result
+		# end if result:
+		return tok
+	# end def _absorb(self):
+
+	def _BIhI_root_932(self):
+		ttype = 932
+		tok = self._BIhI_root_932_2()
+		if tok:
+			return self._cpd_reduce(tok, ttype)
+		# end if tok:
+		tok = self._BIhI_root_932_1()
+		if tok:
+			return self._cpd_reduce(tok, ttype)
+		# end if tok:
+		tok = self._BIhI_root_932_4()
+		if tok:
+			return self._cpd_reduce(tok, ttype)
+		# end if tok:
+		tok = self._BIhI_root_932_3()
+		if tok:
+			return self._cpd_reduce(tok, ttype)
+		# end if tok:
+		return None
+	#end def _BIhI_root_932(self):
+
+	def _BIhI_root_932_1(self):
+		result = self._newtoken()
+		tok = self._isnext(Constants.BIhI_507, result)
+		if not tok:
+			return self._fail(result)
+		# end if not tok:
+		return result
+	#end def _BIhI_root_932_1(self):
+
+	def _BIhI_root_932_2(self):
+		result = self._newtoken()
+		tok = self._isnext(Constants.BIhI_507, result)
+		if not tok:
+			return self._fail(result)
+		# end if not tok:
+		tok = self._isnext(Constants.NAI_581, result)
+		if not tok:
+			return self._fail(result)
+		# end if not tok:
+		return result
+	#end def _BIhI_root_932_2(self):
+
+	def _BIhI_root_932_3(self):
+		result = self._newtoken()
+		tok = self._isnext(Constants.SE_596, result)
+		if not tok:
+			return self._fail(result)
+		# end if not tok:
+		tok = self._isnext(Constants.BIhI_507, result)
+		if not tok:
+			return self._fail(result)
+		# end if not tok:
+		return result
+	#end def _BIhI_root_932_3(self):
+
+	def _BIhI_root_932_4(self):
+		result = self._newtoken()
+		tok = self._isnext(Constants.SE_596, result)
+		if not tok:
+			return self._fail(result)
+		# end if not tok:
+		tok = self._isnext(Constants.BIhI_507, result)
+		if not tok:
+			return self._fail(result)
+		# end if not tok:
+		tok = self._isnext(Constants.NAI_581, result)
+		if not tok:
+			return self._fail(result)
+		# end if not tok:
+		return result
+	#end def _BIhI_root_932_4(self):
+
+	@staticmethod
+	def _cmenecheck(p, bad):
+		"""
+		Checks the validity of cmene p: returns True if it contains bad where
+		it should not.
+		"""
+		badlen = len(bad);
+		plen = len(p);
+
+		ipos = 0;
+		while (ipos < plen):
+			ifpos = LojbanParser._strchr(p[ipos:], bad[0]);
+			if ifpos is None:
+				return False
+			# end if ifpos is None:
+			if p[(ipos + ifpos + 1) : (ipos + ifpos + badlen)] == bad[1:]:
+				break;
+			# end if p[(ipos + ifpos + 1) : (ipos + ifpos + badlen)] == bad[1:]:
+			ipos += 1
+		# end while (ipos < plen):
+		if ifpos is None or ipos == plen:
+			return False
+		# end if ifpos is None or ipos == plen:
+		return ifpos == 0 or Constants.isV(p[ipos + ifpos - 1])
+	# end def _cmenecheck(p, bad):
+
+	def _compound(self):
+		"""
+		Invokes the lexer rule drivers to try to make compounds.
+		If all of them fail, it calls gettoken() and returns it.
+		The drivers to try for the type of the first token, in order, are
+		given by _COMPOUNDDRIVERS; the ordering constraints needed for
+		recursive-descent compounding is the longest first.
+		The lookahead buffer is emptied of the tokens already compounded
+		when it holds _LOOKAHEADSIZE of them, and the packrat memo of the
+		matches behind the compounder when it holds _MEMOSIZE matches, or
+		twice as many as were left the last time.
+		The compound tokens of the matches that failed go to the freelist
+		once the result is known (see reclaim()).
+		When a TokenStream is parsed, its tokens are returned instead.
+		"""
+		if self._context.stream is not None:
+			return self._streamtoken()
+		# end if self._context.stream is not None:
+		if self._cursor >= LojbanParser._LOOKAHEADSIZE:
+			# the tokens before the cursor are never read again
+			del self._lookahead[:self._cursor]
+			self._context.compound_base += self._cursor
+			self._cursor = 0
+		# end if self._cursor >= LojbanParser._LOOKAHEADSIZE:
+		if len(self._context.compound_memo) >= LojbanParser._MEMOSIZE and \
+			len(self._context.compound_memo) >= self._context.compound_memolimit:
+			self._memoprune()
+		# end if len(self._context.compound_memo) >= LojbanParser._MEMOSIZE and \
+		drivers = LojbanParser._COMPOUNDDRIVERS.get(self._peek(0).ttype)
+		if drivers is None:
+			return self._gettoken()
+		# end if drivers is None:
+		context = self._context
+		backtracks = context.compound_backtracks
+		context.compound_nodes = nodes = []
+		for driver in drivers:
+			tok = driver(self)
 			if tok:
-				return tok
+				break
 			# end if tok:
-		# end if
-
+		# end for driver in drivers:
+		context.compound_nodes = None
+		if tok and context.compound_live:
+			self._memodeliver(tok)
+		# end if tok and context.compound_live:
+		if context.compound_backtracks != backtracks:
+			self._reclaim(nodes, tok)
+		# end if context.compound_backtracks != backtracks:
+		if tok:
+			return tok
+		# end if tok:
 		rettok = self._gettoken()
 		return rettok
 	# end def _compound(self):
@@ -2455,7 +4837,7 @@ class LojbanParser:
 		cpd_reduce(result, type) does a settype() and outputs debugging info.
 		"""
 		if tok:
-			tok().ttype = ttype
+			tok.ttype = ttype
 			if self._parameters.D_cpd_reduce:
 				print("compounder reduced {:s}".format(Constants.rulename(ttype)))
 			# end if self._parameters.D_cpd_reduce:
@@ -2468,7 +4850,7 @@ class LojbanParser:
 		Destroys (removes) a token from the list.
 		Releases a token to the freelist.
 		"""
-		tok().nextn = self._freelist
+		tok.nextn = self._freelist
 		self._freelist = tok
 	# end _def destroy(self, tok):
 
@@ -2639,10 +5021,10 @@ class LojbanParser:
 			return None
 		# end if self._parameters.elidemode:
 		result = self._newtoken()
-		result().ttype = t
-		result().text = Constants.rulename(t)
+		result.ttype = t
+		result.text = Constants.rulename(t)
 		if self._parameters.D_elidable:
-			print("inserting elided {:s} ({:d})".format(result().text, result().ttype))
+			print("inserting elided {:s} ({:d})".format(result.text, result.ttype))
 		# end if self._parameters.D_elidable:
 		return result
 	# end def _elidable(self, t):
@@ -2666,7 +5048,7 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		return result
 	#end def _event_mod_1052_1(self):
 
@@ -2676,12 +5058,12 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		tok = self._event_mod_1052()
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		return result
 	#end def _event_mod_1052_2(self):
 
@@ -2738,7 +5120,7 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		return result
 	#end def _event_mod_A_1053_3(self):
 
@@ -2756,7 +5138,7 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		return result
 	#end def _event_mod_A_1053_4(self):
 
@@ -2769,33 +5151,36 @@ class LojbanParser:
 		type of the compound.
 		"""
 		tok = self._glue()
-		if tok().ttype == Constants.BAhE_503:
+		if tok.ttype == Constants.BAhE_503:
 			absorber = self._fabsorb()
-			if absorber().ttype == 0:
+			if absorber.ttype == 0:
 				return tok
 			# end if absorber.ttype == 0:
 			result = self._newtoken()
-			result().add(tok)
-			result().add(absorber)
-			result().ttype = absorber().ttype
+			result.add(tok)
+			result.add(absorber)
+			result.ttype = absorber.ttype
 			return result
-		# end if tok().ttype == Constants.BAhE_503:
+		# end if tok.ttype == Constants.BAhE_503:
 		return tok
 	# end def _fabsorb(self):
 
 	def _fail(self, tok):
 		"""
 		fail(tok) is used to cause backtracking failure.  
-		The argument, tok, is scanned recursively, and all selmao-level tokens are 
-		pushed onto the front of the self._pushback queue (preserving their order).  
+		The selma'o-level tokens of tok go back to the lookahead buffer: a
+		selma'o-level tok, the last token read by gettoken(), by moving the
+		cursor back over it; those of a compound tok when the production that
+		made it returns None, which puts the cursor back where it started
+		(see _attempt).  Its compound tokens go to the freelist once
+		_compound has its result (see reclaim()).
 		Fail() returns None.
 		"""
-		self._head = self._tail = None
-		self._release(tok)
-		if self._head:
-			self._tail().nextn = self._pushback
-			self._pushback = self._head
-		# end if not self._head is None:
+		self._context.compound_backtracks += 1
+		t = tok.ttype
+		if (t == 0 or (t >= 500 and t <= 699)):
+			self._cursor -= 1
+		# end if (t == 0 or (t >= 500 and t <= 699)):
 		return None
 	# end def _fail(self, tok):
 
@@ -2812,83 +5197,74 @@ class LojbanParser:
 		_ZOI_END_MODE = 4
 		_LOhU_MODE = 5
 		_LEhU_MODE = 6
-		if not getattr(LojbanParser._filter, "_tok", None):
-			LojbanParser._filter._tok = None
-		# end if not getattr(LojbanParser._filter, "_tok", None):
-		if not getattr(LojbanParser._filter, "_delim", None):
-			LojbanParser._filter._delim = None
-		# end if not getattr(LojbanParser._filter, "_delim", None):
-		if not getattr(LojbanParser._filter, "_mode", None):
-			LojbanParser._filter._mode = _NORMAL_MODE
-		# end if not getattr(LojbanParser._filter, "_mode", None):
-
-		if LojbanParser._filter._mode == _NORMAL_MODE:
-			LojbanParser._filter._tok = self._lex()
-			if LojbanParser._filter._tok().ttype == 0:
-				return LojbanParser._filter._tok
-			if (LojbanParser._filter._tok().text == "zo"):
-				LojbanParser._filter._mode = _ZO_MODE
-			elif (LojbanParser._filter._tok().text == "zoi"):
-				LojbanParser._filter._mode = _ZOI_START_MODE
-			elif (LojbanParser._filter._tok().text == "la'o"):
-				LojbanParser._filter._mode = _ZOI_START_MODE
-			elif (LojbanParser._filter._tok().text == "lo'u"):
-				LojbanParser._filter._mode = _LOhU_MODE
-			return LojbanParser._filter._tok
-		elif LojbanParser._filter._mode == _ZO_MODE:
-			LojbanParser._filter._tok = self._lex()
-			if LojbanParser._filter._tok().ttype == 0:
-				return LojbanParser._filter._tok
-			LojbanParser._filter._tok().ttype = Constants.any_word_698
-			LojbanParser._filter._mode = _NORMAL_MODE
-			return LojbanParser._filter._tok
-		elif LojbanParser._filter._mode == _ZOI_START_MODE:
-			LojbanParser._filter._tok = self._lex()
-			if LojbanParser._filter._tok().ttype == 0:
-				return LojbanParser._filter._tok
-			LojbanParser._filter._tok().ttype = Constants.any_word_698
-			LojbanParser._filter._mode = _ZOI_STRING_MODE
-			LojbanParser._filter._delim = LojbanParser._filter._tok
-			return LojbanParser._filter._tok
-		elif LojbanParser._filter._mode == _ZOI_STRING_MODE:
+
+		if self._context.filter_mode == _NORMAL_MODE:
+			self._context.filter_tok = self._lex()
+			if self._context.filter_tok.ttype == 0:
+				return self._context.filter_tok
+			if (self._context.filter_tok.text == "zo"):
+				self._context.filter_mode = _ZO_MODE
+			elif (self._context.filter_tok.text == "zoi"):
+				self._context.filter_mode = _ZOI_START_MODE
+			elif (self._context.filter_tok.text == "la'o"):
+				self._context.filter_mode = _ZOI_START_MODE
+			elif (self._context.filter_tok.text == "lo'u"):
+				self._context.filter_mode = _LOhU_MODE
+			return self._context.filter_tok
+		elif self._context.filter_mode == _ZO_MODE:
+			self._context.filter_tok = self._lex()
+			if self._context.filter_tok.ttype == 0:
+				return self._context.filter_tok
+			self._context.filter_tok.ttype = Constants.any_word_698
+			self._context.filter_mode = _NORMAL_MODE
+			return self._context.filter_tok
+		elif self._context.filter_mode == _ZOI_START_MODE:
+			self._context.filter_tok = self._lex()
+			if self._context.filter_tok.ttype == 0:
+				return self._context.filter_tok
+			self._context.filter_tok.ttype = Constants.any_word_698
+			self._context.filter_mode = _ZOI_STRING_MODE
+			self._context.filter_delim = self._context.filter_tok
+			return self._context.filter_tok
+		elif self._context.filter_mode == _ZOI_STRING_MODE:
 			result = self._newtoken()
-			result().ttype = Constants.anything_699
+			result.ttype = Constants.anything_699
 			while True:
-				LojbanParser._filter._tok = self._lex()
-				if LojbanParser._filter._tok().ttype == 0:
-					return LojbanParser._filter._tok
-				if LojbanParser._filter._tok().text == LojbanParser._filter._delim().text:
+				self._context.filter_tok = self._lex()
+				if self._context.filter_tok.ttype == 0:
+					return self._context.filter_tok
+				if self._context.filter_tok.text == self._context.filter_delim.text:
 					break
-				LojbanParser._filter._tok().ttype = -1
-				result().add(LojbanParser._filter._tok)
+				self._context.filter_tok.ttype = -1
+				result.add(self._context.filter_tok)
 			# end while True:
-			LojbanParser._filter._mode = _ZOI_END_MODE
+			self._context.filter_mode = _ZOI_END_MODE
 			return result
-		elif LojbanParser._filter._mode == _ZOI_END_MODE:
-			# note: LojbanParser._filter._token has already been read 
-			LojbanParser._filter._tok().ttype = Constants.any_word_698
-			LojbanParser._filter._mode = _NORMAL_MODE
-			return LojbanParser._filter._tok
-		elif LojbanParser._filter._mode == _LOhU_MODE:
+		elif self._context.filter_mode == _ZOI_END_MODE:
+			# note: self._context.filter_tok has already been read 
+			self._context.filter_tok.ttype = Constants.any_word_698
+			self._context.filter_mode = _NORMAL_MODE
+			return self._context.filter_tok
+		elif self._context.filter_mode == _LOhU_MODE:
 			result = self._newtoken()
-			result().ttype = Constants.any_words_697
+			result.ttype = Constants.any_words_697
 			zo = False
 			while True:
-				LojbanParser._filter._tok = self._lex()
-				if LojbanParser._filter._tok().ttype == 0:
-					return LojbanParser._filter._tok
-				if (not zo and LojbanParser._filter._tok().text == "le'u"):
+				self._context.filter_tok = self._lex()
+				if self._context.filter_tok.ttype == 0:
+					return self._context.filter_tok
+				if (not zo and self._context.filter_tok.text == "le'u"):
 					break
-				zo = (LojbanParser._filter._tok().text == "zo")
-				LojbanParser._filter._tok().ttype = -1
-				result().add(LojbanParser._filter._tok)
+				zo = (self._context.filter_tok.text == "zo")
+				self._context.filter_tok.ttype = -1
+				result.add(self._context.filter_tok)
 			# end while True:
-			LojbanParser._filter._mode = _LEhU_MODE
+			self._context.filter_mode = _LEhU_MODE
 			return result
-		elif LojbanParser._filter._mode == _LEhU_MODE:
-			# note: LojbanParser._filter._token has already been read 
-			LojbanParser._filter._mode = _NORMAL_MODE
-			return LojbanParser._filter._tok
+		elif self._context.filter_mode == _LEhU_MODE:
+			# note: self._context.filter_tok has already been read 
+			self._context.filter_mode = _NORMAL_MODE
+			return self._context.filter_tok
 		# NOTREACHED
 		raise LojbanException(self,\
 			"FATAL ERROR: Reached invalid code")
@@ -2896,104 +5272,152 @@ class LojbanParser:
 
 	def _getword(self):
 		"""
-		This method picks words out of the standard input stream.  It treats
+		This method picks words out of the InputSource being parsed.  It treats
 		whitespace and "." as word separators, mashes upper case to lower case,
 		converts digits to appropriate cmavo, and blows away all else.   Text between
 		slashes is treated as comments (possibly English translations) and discarded.
 
-		Getword returns a pointer to a static buffer which will be overwritten by
-		successive calls, or else NULL (which means end of file).
+		The input is read in chunks into self._inbuf and scanned a word at a time
+		with _WORDRE, or else run by run with _SCANRE; only non ASCII characters
+		are examined one at a time.
+		Getword returns the next word, or else None (which means end of file).
 		Line and column numbers are tracked for error recovery.
 		Getword remembers EOF on input and does not re-examine the input stream.
 		"""
-		_digits = ("no", "pa", "re", "ci", "vo", "mu", "xa", "ze", "bi", "so")
-		if not getattr(LojbanParser._getword, "_eof", None):
-			LojbanParser._getword._eof = False
-		# end if not getattr(LojbanParser._getword, "_eof", None):
-		if LojbanParser._getword._eof:
-			return None
-		# end if LojbanParser._getword._eof
-		oldch = None
-		buffer = []
-		while True:
-			try:
-				if oldch is None:
-					ch = sys.stdin.read(1)
-				else: # if oldch is None:
-					ch = oldch
-					oldch = None
-				# end if oldch is None:
-				self._column += 1
-				if (ch == '\n'):
+		inbuf = self._inbuf
+		pos = self._inpos
+		if inbuf:
+			# fast path: the next word is followed by a separator in the buffer
+			match = _WORDRE.match(inbuf, pos)
+			if match:
+				self._inpos = match.end()
+				if match.group(2) == '\n':
 					self._column = 0
 					self._line += 1
 					if self._interactive:
-						LojbanParser._getword._eof = True
-						return " ".join((''.join(buffer)).strip().split()) if buffer else None
-						# return ''.join(buffer) if buffer else None  # TODO
+						self._inbuf = None
+						self._context.getword_eof = True
 					# end if self._interactive:
-				# end if (ch == '\n'):
-				if ch == '': # EOF
+				else: # if match.group(2) == '\n':
+					self._column += self._inpos - pos
+				# end if match.group(2) == '\n':
+				return match.group(1)
+			# end if match:
+		# end if inbuf:
+		if self._context.getword_eof:
+			return None
+		# end if self._context.getword_eof
+		buffer = []
+		while True:
+			if pos >= len(inbuf):
+				inbuf = self._readinput()
+				pos = 0
+				if not inbuf: # EOF
+					self._column += 1
 					if self._interactive:
 						raise LojbanException(self)
 					# end if self._interactive:
-					LojbanParser._getword._eof = True
-					return " ".join((''.join(buffer)).strip().split()) if buffer else None
-					# return ''.join(buffer) if buffer else None  # TODO
-				elif ch.isspace() or ch == '.':
-					if buffer: 
-						return " ".join((''.join(buffer)).strip().split())
-						# return ''.join(buffer) # TDOD
-					# end if buffer: 
+					self._context.getword_eof = True
+					return ''.join(buffer) if buffer else None
+				# end if not inbuf:
+			# end if pos >= len(inbuf):
+			match = _SCANRE.match(inbuf, pos)
+			kind = match.lastindex
+			if kind == _SCANWORD:
+				word = match.group(_SCANWORD)
+				self._column += len(word)
+				buffer.append(word.translate(_DIGITTABLE))
+				pos = match.end()
+			elif kind == _SCANSEP:
+				if buffer:
+					# only the separator ending the word is consumed
+					self._column += 1
+					self._inpos = pos + 1
+					return ''.join(buffer)
+				# end if buffer:
+				self._column += match.end() - pos
+				pos = match.end()
+			elif kind == _SCANNEWLINE:
+				self._column = 0
+				self._line += 1
+				pos += 1
+				if self._interactive:
+					self._inbuf = None
+					self._context.getword_eof = True
+					return ''.join(buffer) if buffer else None
+				# end if self._interactive:
+				if buffer:
+					self._inpos = pos
+					return ''.join(buffer)
+				# end if buffer:
+			elif kind == _SCANCOMMENT:
+				# only the opening slash is counted in the column
+				self._column += 1
+				pos = inbuf.find('/', pos + 1)
+				while pos < 0:
+					inbuf = self._readinput()
+					if not inbuf:
+						break
+					# end if not inbuf:
+					pos = inbuf.find('/')
+				# end while pos < 0:
+				pos += 1
+			elif kind == _SCANBACKSLASH:
+				self._column += 1
+				pos += 1
+				if pos >= len(inbuf):
+					inbuf = self._readinput()
+					pos = 0
+				# end if pos >= len(inbuf):
+				if inbuf.startswith('\n', pos):
+					self._column = 0
+					self._line += 1
+					pos += 1
+				# end if inbuf.startswith('\n', pos):
+			elif kind == _SCANIGNORED:
+				self._column += match.end() - pos
+				pos = match.end()
+			else: # if kind == _SCANOTHER:
+				ch = inbuf[pos]
+				self._column += 1
+				pos += 1
+				if ch.isspace():
+					if buffer:
+						self._inpos = pos
+						return ''.join(buffer)
+					# end if buffer:
 				elif ch.isupper():
 					buffer.append(ch.lower())
-				elif ch.islower() or ch == '\'':
+				elif ch.islower():
 					buffer.append(ch)
-				elif ch == '/':
-					ch = sys.stdin.read(1)
-					while ch != '/' and ch != '':
-						ch = sys.stdin.read(1)
-					# end while ch != '/' and ch != ''
-				elif ch == '\\':
-					ch = sys.stdin.read(1)
-					if ch != '\n':
-						oldch = ch
-					else: # if ch != '\n'
-						self._column = 0
-						self._line += 1
-					# end if ch != '\n'
-				elif ch.isdigit():
-					buffer.append(Getword._digits[ord(ch) - ord('0')])
-				# end if ch
-			except EOFError as e:
-				if self._interactive:
-					raise LojbanException(self)
-				# end if self._interactive:
-				LojbanParser._getword._eof = True
-				return " ".join((''.join(buffer)).strip().split()) if buffer else None
-				# return ''.join(buffer) if buffer else None  # TODO
-			# end try except EOFError as e:
+				elif ch.isdecimal():
+					buffer.append(_DIGITS[int(ch)])
+				# end if ch.isspace():
+			# end if kind == _SCANWORD:
 		# end while True:
 	# end def _getword(self):
 
 	def _gettoken(self):
 		"""
-		gettoken() invokes absorb() and returns 
-		tokens without modification.
-		However, if there are any tokens on the self._pushback list, 
-		they will be used first.
-		"""
-		if self._pushback:
-			result = self._pushback
-			self._pushback = self._pushback().nextn
-			result().nextn = None
-		else: # if self._pushback:
-			result = self._absorb()
+		gettoken() returns the next token of the lookahead buffer, reading it
+		from absorb() when the buffer has no token left.  The tokens of the
+		buffer are the selma'o-level tokens made by absorb(), in order;
+		backtracking moves the cursor back (see fail()), and the links left
+		from an abandoned match are cleared when the token is read again.
+		"""
+		lookahead = self._lookahead
+		if self._cursor < len(lookahead):
+			result = lookahead[self._cursor]
+			result.up = result.right = None
+		else: # if self._cursor < len(lookahead):
+			result = self._lexahead()
 			if self._parameters.D_cpd_lex:
 				print("compounder lexing: ", end = "")
-				self.print(result())
+				self.print(result)
 			# end if self._parameters.D_cpd_lex:
-		# end if not self._pushback is None:
+			lookahead.append(result)
+		# end if self._cursor < len(lookahead):
+		self._cursor += 1
 		return result
 	# end def _gettoken(self):
 
@@ -3221,7 +5645,7 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		return result
 	#end def _I_root_956_2(self):
 
@@ -3248,7 +5672,7 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		return result
 	#end def _interval_modifier_1050_1(self):
 
@@ -3258,12 +5682,12 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		tok = self._event_mod_1052()
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		return result
 	#end def _interval_modifier_1050_2(self):
 
@@ -3273,7 +5697,7 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		return result
 	#end def _interval_modifier_1050_3(self):
 
@@ -3304,7 +5728,7 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		tok = self._isnext(Constants.ROI_594, result)
 		if not tok:
 			return self._fail(result)
@@ -3318,7 +5742,7 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		tok = self._isnext(Constants.ROI_594, result)
 		if not tok:
 			return self._fail(result)
@@ -3352,7 +5776,8 @@ class LojbanParser:
 		return result
 	#end def _interval_property_1051_4(self):
 
-	def _isbrivla(self, s):
+	@staticmethod
+	def _isbrivla(s):
 		"""
 		Check if a word if a brivla
 		"""
@@ -3371,19 +5796,17 @@ class LojbanParser:
 		return False
 	# end def _isbrivla(s):
 
-	def _iscmene(self, p):
+	@staticmethod
+	def _iscmene(p):
 		"""
-		Checks if a word is a cmene
+		Checks if a word is a cmene: returns None if not, or the tuple of
+		the strings it should not contain that it does (empty if valid).
 		"""
 		if not Constants.isC(p[-1]):
-			return False
+			return None
 		# end if not isC(s[-1]):
-		self._cmenecheck(p, "la")
-		self._cmenecheck(p, "doi")
-		self._cmenecheck(p, "h")
-		self._cmenecheck(p, "w")
-		self._cmenecheck(p, "q")
-		return True
+		return tuple(bad for bad in ("la", "doi", "h", "w", "q") \
+			if LojbanParser._cmenecheck(p, bad))
 	# end def _iscmene(p):
 
 	def _isnext(self, t, result):
@@ -3393,8 +5816,8 @@ class LojbanParser:
 		Note: "is" is a reserved word in Python thus renamed to isnext.
 		"""
 		tok = self._gettoken()
-		result().add(tok)
-		return (tok if (tok().ttype == t) else None)
+		result.add(tok)
+		return (tok if (tok.ttype == t) else None)
 	# end def _isnext(self, t, result):
 
 	def _JEK_root_926(self):
@@ -3641,7 +6064,7 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		return result
 	#end def _JOIK_root_931_5(self):
 
@@ -3655,7 +6078,7 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		tok = self._isnext(Constants.GAhO_656, result)
 		if not tok:
 			return self._fail(result)
@@ -3669,47 +6092,96 @@ class LojbanParser:
 		1-token lookahead to watch for ZEI.  If found, the ZEI and the following
 		token are absorbed into the previous token.  The result is given type BRIVLA.
 		"""
-		if not getattr(LojbanParser._glue, "_cache", None):
-			LojbanParser._glue._cache = None
-		# end if not getattr(LojbanParser._glue, "_cache", None):
-		tok = LojbanParser._glue._cache if LojbanParser._glue._cache else self._termin()
-		if (tok().ttype == 0): 
+		tok = self._context.glue_cache if self._context.glue_cache else self._termin()
+		if (tok.ttype == 0): 
 			return tok
 		result = None
 		while True:
-			LojbanParser._glue._cache = self._termin()
-			if LojbanParser._glue._cache().ttype != Constants.ZEI_623:
+			self._context.glue_cache = self._termin()
+			if self._context.glue_cache.ttype != Constants.ZEI_623:
 				break
 			elif result is None:
 				result = self._newtoken()
-				result().ttype = Constants.BRIVLA_509
-				result().add(tok)
-			result().add(LojbanParser._glue._cache)
-			result().add(self._termin())
+				result.ttype = Constants.BRIVLA_509
+				result.add(tok)
+			result.add(self._context.glue_cache)
+			result.add(self._termin())
 		# end while True:
 		return result if result else tok
 	# end def _glue(self):
 
+	def _iterparse(self, source, boundaries, recycle):
+		"""
+		Parses the text of source cut before the tokens of types in boundaries
+		(see iterparse) and yields the tree of each piece; with recycle, the
+		tokens of a tree are released when the next one is requested.
+		With the recover parameter, a piece with a syntax error is skipped up
+		to the next cut (outside of any quote) and parsing goes on.
+		"""
+		self.reset()
+		self._opensource(source)
+		context = self._context
+		context.segment_boundaries = boundaries
+		try:
+			while not context.segment_eof:
+				context.segment_ntokens = 0
+				context.segment_closing = False
+				self._results = None
+				failed = self._yyparse(yymaxdepth = self._parameters.yymaxdepth, 
+					yyredmax = self._parameters.yyredmax, 
+					yydebug = self._parameters.yydebug, 
+					yytflag = self._parameters.yytflag, 
+					yytfilen = self._parameters.yytfilen)
+				if failed:
+					self._reporterror()
+					if not self._parameters.recover:
+						return
+					# end if not self._parameters.recover:
+					# skip the rest of the piece, leaving any unclosed quote
+					context.segment_depth = 0
+					while not context.segment_closing and not context.segment_eof:
+						tok = self._segmentlex()
+						if not context.segment_closing:
+							self._recycle(tok)
+						# end if not context.segment_closing:
+					# end while not context.segment_closing and not context.segment_eof:
+				# end if failed:
+				for tok in context.segment_extra:
+					self._destroy(tok)
+				# end for tok in context.segment_extra:
+				context.segment_extra = []
+				tree = None if failed else self._results
+				self._results = None
+				if not tree is None:
+					yield tree
+					if recycle:
+						self._recycle(tree)
+					# end if recycle:
+				# end if not tree is None:
+			# end while not context.segment_eof:
+		finally:
+			self._source.close()
+			self._source = None
+		# end try finally:
+	# end def _iterparse(self, source, boundaries, recycle):
+
 	def _lerfu(self):
 		"""
 		This method does BU processing.  It invokes fabsorb() and does
 		1-token lookahead to detect a following BU.  The BU is absorbed into
 		the previous token, changing its selmao to BY.
 		"""
-		if not getattr(LojbanParser._lerfu, "_cache", None):
-			LojbanParser._lerfu._cache = None
-		# end if not getattr(LojbanParser._lerfu, "_cache", None):
-		tok = LojbanParser._lerfu._cache if LojbanParser._lerfu._cache else self._fabsorb()
-		LojbanParser._lerfu._cache = self._fabsorb()
+		tok = self._context.lerfu_cache if self._context.lerfu_cache else self._fabsorb()
+		self._context.lerfu_cache = self._fabsorb()
 
-		if (LojbanParser._lerfu._cache().ttype == Constants.BU_511):
+		if (self._context.lerfu_cache.ttype == Constants.BU_511):
 			result = self._newtoken()
-			result().ttype = Constants.BY_513
-			result().add(tok)
-			result().add(LojbanParser._lerfu._cache)
-			LojbanParser._lerfu._cache = None
+			result.ttype = Constants.BY_513
+			result.add(tok)
+			result.add(self._context.lerfu_cache)
+			self._context.lerfu_cache = None
 			return result
-		# end if (LojbanParser._lerfu._cache().ttype == Constants.BU_511):
+		# end if (self._context.lerfu_cache.ttype == Constants.BU_511):
 		return tok
 	# end def _lerfu(self):
 
@@ -3719,19 +6191,19 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		while True:
 			tok = self._gettoken()
-			if tok().ttype == Constants.PA_672:
-				result().add(tok)
-			elif tok().ttype in [Constants.BY_513, Constants.LAU_559, Constants.TEI_605]:
+			if tok.ttype == Constants.PA_672:
+				result.add(tok)
+			elif tok.ttype in [Constants.BY_513, Constants.LAU_559, Constants.TEI_605]:
 				self._fail(tok)
 				tok = self._lerfu_word_987()
-				result().add(tok)
+				result.add(tok)
 			else:
 				self._fail(tok)
 				return self._cpd_reduce(result, 986)
-			# end if tok().ttype
+			# end if tok.ttype
 		# end while True:
 	#end def _lerfu_string_root_986(self):
 
@@ -3771,7 +6243,7 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		return result
 	#end def _lerfu_word_987_2(self):
 
@@ -3785,7 +6257,7 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		tok = self._isnext(Constants.FOI_533, result)
 		if not tok:
 			return self._fail(result)
@@ -3803,49 +6275,54 @@ class LojbanParser:
 		of Lojban speech.  It returns a pointer to a token object, which is
 		created from the free store.  See lojban.h for an explanation of this
 		object.
+		The pieces of each word are computed once by _lexword, which caches
+		them, and handed out one per call.
 		"""
-		if not getattr(LojbanParser._lex, "_word", None):
-			LojbanParser._lex._word = None
-		# end if not getattr(LojbanParser._lex, "_word", None):
+		context = self._context
 		result = self._newtoken()
-		if not LojbanParser._lex._word:
-			LojbanParser._lex._word = self._getword()
-			if not LojbanParser._lex._word:
-				result().ttype = 0
+		if context.lex_piece >= len(context.lex_pieces):
+			word = self._getword()
+			if not word:
+				result.ttype = 0
 				if self._parameters.D_valsi:
 					print("valsi: end of text")
 				# end if self._parameters.D_valsi:
 				return result
-			# end if not LojbanParser._lex._word:
-		# end if not LojbanParser._lex._word:
-		if self._iscmene(LojbanParser._lex._word):
-			result().ttype = Constants.CMENE_517
-			result().text = self._newstring(LojbanParser._lex._word)
-			LojbanParser._lex._word = None
-		elif self._isbrivla(LojbanParser._lex._word):
-			result().ttype = Constants.BRIVLA_509
-			result().text = self._newstring(LojbanParser._lex._word)
-			LojbanParser._lex._word = None
-		else:
-			tmpword = [c for c in LojbanParser._lex._word]
-			tmpword.append('')
-			idx = 1
-			for idx in range(1, len(tmpword)):
-				if Constants.isC(tmpword[idx]):
-					break
-				# end if Constants.isC(LojbanParser._lex._word[idx]):
-			# end for idx in range(1, len(LojbanParser._lex._word)):
-			result().text = self._newstring(LojbanParser._lex._word[:idx])
-			# LojbanParser._lex._word = p
-			LojbanParser._lex._word = LojbanParser._lex._word[len(result().text):]
-		# end if
+			# end if not word:
+			context.lex_pieces = LojbanParser._lexword(word)
+			context.lex_piece = 0
+		# end if context.lex_piece >= len(context.lex_pieces):
+		(ttype, text, illegal) = context.lex_pieces[context.lex_piece]
+		context.lex_piece += 1
+		for bad in illegal:
+			print("Illegal cmene {:s} at line {:d}, column {:d}: contains {:s}".format(\
+				text, self._line, self._column, bad))
+		# end for bad in illegal:
+		if not ttype is None:
+			result.ttype = ttype
+		# end if not ttype is None:
+		result.text = self._newstring(text)
 		if self._parameters.D_valsi:
 			print("valsi: ", end = "")
-			self.print(result())
+			self.print(result)
 		# end if self._parameters.D_valsi:
 		return result
 	# end def _lex():
 
+	def _lexahead(self):
+		"""
+		Returns the next selma'o-level token from absorb() for the lookahead
+		buffer.  The tokens that the lexer makes for it are not among those of
+		the compounder matches (see reclaim()).
+		"""
+		context = self._context
+		nodes = context.compound_nodes
+		context.compound_nodes = None
+		tok = self._absorb()
+		context.compound_nodes = nodes
+		return tok
+	# end def _lexahead(self):
+
 	def _lexer_A_905_driver(self):
 		return self._cpd_reduce(self._utt_ordinal_root_906(), 905)
 	#end def _lexer_A_905_driver(self):
@@ -3873,7 +6350,7 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		tok = self._isnext(Constants.BO_508, result)
 		if not tok:
 			return self._fail(result)
@@ -3887,12 +6364,12 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		tok = self._simple_tag_971()
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		tok = self._isnext(Constants.BO_508, result)
 		if not tok:
 			return self._fail(result)
@@ -3919,7 +6396,7 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		tok = self._isnext(Constants.KE_551, result)
 		if not tok:
 			return self._fail(result)
@@ -3933,12 +6410,12 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		tok = self._simple_tag_971()
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		tok = self._isnext(Constants.KE_551, result)
 		if not tok:
 			return self._fail(result)
@@ -4041,12 +6518,12 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		tok = self._GIK_root_981()
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		return result
 	#end def _lexer_G_935_5(self):
 
@@ -4056,7 +6533,7 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		tok = self._isnext(Constants.GI_539, result)
 		if not tok:
 			return self._fail(result)
@@ -4200,7 +6677,7 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		tok = self._isnext(Constants.BO_508, result)
 		if not tok:
 			return self._fail(result)
@@ -4214,12 +6691,12 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		tok = self._simple_tag_971()
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		tok = self._isnext(Constants.BO_508, result)
 		if not tok:
 			return self._fail(result)
@@ -4250,7 +6727,7 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		tok = self._isnext(Constants.BO_508, result)
 		if not tok:
 			return self._fail(result)
@@ -4264,12 +6741,12 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		tok = self._simple_tag_971()
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		tok = self._isnext(Constants.BO_508, result)
 		if not tok:
 			return self._fail(result)
@@ -4296,7 +6773,7 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		tok = self._isnext(Constants.KE_551, result)
 		if not tok:
 			return self._fail(result)
@@ -4310,12 +6787,12 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		tok = self._simple_tag_971()
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		tok = self._isnext(Constants.KE_551, result)
 		if not tok:
 			return self._fail(result)
@@ -4362,7 +6839,7 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		tok = self._isnext(Constants.BO_508, result)
 		if not tok:
 			return self._fail(result)
@@ -4376,12 +6853,12 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		tok = self._simple_tag_971()
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		tok = self._isnext(Constants.BO_508, result)
 		if not tok:
 			return self._fail(result)
@@ -4408,7 +6885,7 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		tok = self._isnext(Constants.BO_508, result)
 		if not tok:
 			return self._fail(result)
@@ -4422,12 +6899,12 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		tok = self._simple_tag_971()
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		tok = self._isnext(Constants.BO_508, result)
 		if not tok:
 			return self._fail(result)
@@ -4454,7 +6931,7 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		tok = self._isnext(Constants.KE_551, result)
 		if not tok:
 			return self._fail(result)
@@ -4468,12 +6945,12 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		tok = self._simple_tag_971()
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		tok = self._isnext(Constants.KE_551, result)
 		if not tok:
 			return self._fail(result)
@@ -4500,7 +6977,7 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		tok = self._isnext(Constants.MOI_663, result)
 		if not tok:
 			return self._fail(result)
@@ -4514,7 +6991,7 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		tok = self._isnext(Constants.MOI_663, result)
 		if not tok:
 			return self._fail(result)
@@ -4522,14 +6999,56 @@ class LojbanParser:
 		return result
 	#end def _lexer_Y_1025_2(self):
 
+	@staticmethod
+	@functools.lru_cache(maxsize = _LEXCACHESIZE)
+	def _lexword(word):
+		"""
+		Returns the pieces that _lex makes of word, as a tuple of (type or
+		None, text, illegal) where illegal is the tuple of the strings that
+		a cmene should not contain found in it (see _iscmene).
+		A word is a cmene, a brivla, or split into cmavo, each ending before
+		the next consonant; the remaining part is checked again each time.
+		Results are cached (LojbanParser.lexcacheinfo gives hits and misses).
+		"""
+		pieces = []
+		while word:
+			illegal = LojbanParser._iscmene(word)
+			if not illegal is None:
+				pieces.append((Constants.CMENE_517, word, illegal))
+				break
+			elif LojbanParser._isbrivla(word):
+				pieces.append((Constants.BRIVLA_509, word, ()))
+				break
+			# end if not illegal is None:
+			idx = 1
+			while idx < len(word) and not Constants.isC(word[idx]):
+				idx += 1
+			# end while idx < len(word) and not Constants.isC(word[idx]):
+			pieces.append((None, word[:idx], ()))
+			word = word[idx:]
+		# end while word:
+		return tuple(pieces)
+	# end def _lexword(word):
+
 	def _makefree(self):
 		"""
 		manufactures new tokens for the freelist.
 		"""
-		self._tokenslist.append(Token())
-		self._tokspace += sys.getsizeof(Token())
-		self._tokenslist[-1].nextn = None
-		self._freelist = weakref.ref(self._tokenslist[-1])
+		if self._tokenstore is not None:
+			self._freelist = self._tokenstore.view(self._tokenstore.new())
+			self._tokspace += self._tokenstore.nodesize
+			return
+		# end if self._tokenstore is not None:
+		if not self._tokenarena is None:
+			self._freelist = self._tokenarena.allocate()
+			self._freelist.nextn = None
+			self._tokspace += self._tokenarena.tokensize
+			return
+		# end if not self._tokenarena is None:
+		tok = CheckedToken() if self._parameters.checktokens else Token()
+		self._tokenslist.append(tok)
+		self._tokspace += sys.getsizeof(tok)
+		self._freelist = tok
 	# end def _makefree(self):
 
 	def _modal_974(self):
@@ -4551,7 +7070,7 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		return result
 	#end def _modal_974_1(self):
 
@@ -4561,7 +7080,7 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		tok = self._isnext(Constants.NAI_581, result)
 		if not tok:
 			return self._fail(result)
@@ -4604,6 +7123,210 @@ class LojbanParser:
 		return result
 	#end def _modal_A_975_2(self):
 
+	def _memodeliver(self, tok):
+		"""
+		Makes whole the tree tok returned by the compounder with the packrat
+		parameter.  The tokens that the packrat memo holds (see _memoized) may
+		have had their links changed by the matches tried since they were
+		made, or have no children yet (see _memoloop): their children are put
+		back from the memo, which then lets them go.
+		"""
+		live = self._context.compound_live
+		stack = [tok]
+		while stack:
+			tok = stack.pop()
+			kept = live.pop(tok, None)
+			if not kept is None:
+				(cells, wrap, start) = kept
+				items = []
+				while cells:
+					items.extend(cells[0])
+					cells = cells[1]
+				# end while cells:
+				for (child, ttype) in items:
+					child.ttype = ttype
+					child.right = None
+				# end for (child, ttype) in items:
+				tok.downleft = tok.downright = None
+				if wrap is None or len(items) == 1:
+					for (child, ttype) in items:
+						tok.add(child)
+					# end for (child, ttype) in items:
+				else: # if wrap is None or len(items) == 1:
+					# the left-nested tokens of the loop, as it makes them
+					size = len(kept[0][0])
+					result = self._newtoken()
+					result.add(items[0][0])
+					for i in range(1, len(items), size):
+						for (child, ttype) in items[i:i + size]:
+							result.add(child)
+						# end for (child, ttype) in items[i:i + size]:
+						result.ttype = wrap
+						if i + size < len(items):
+							child = self._newtoken()
+							child.add(result)
+							result = child
+						# end if i + size < len(items):
+					# end for i in range(1, len(items), size):
+					tok.add(result)
+				# end if wrap is None or len(items) == 1:
+			# end if not kept is None:
+			child = tok.downleft
+			while child:
+				t = child.ttype
+				if not (t == 0 or (t >= 500 and t <= 699)):
+					stack.append(child)
+				# end if not (t == 0 or (t >= 500 and t <= 699)):
+				child = child.right
+			# end while child:
+		# end while stack:
+	# end def _memodeliver(self, tok):
+
+	def _memoized(self, production, method):
+		"""
+		Calls the method of the compounder production production, with the
+		packrat parameter.  The match (or no match) is remembered for the
+		position of the compounder in the token stream, with the position after
+		it: another call at the same position gives back the same token and
+		moves the compounder past it, without trying the alternatives again.
+		Fail() leaves the tokens of the memo alone, and their links are made
+		good again when the compounder returns them (see _memodeliver).
+		"""
+		memo = self._context.compound_memo
+		base = self._context.compound_base
+		key = (production, base + self._cursor)
+		if key in memo:
+			match = memo[key]
+			if match is None:
+				return None
+			# end if match is None:
+			(tok, ttype, end) = match
+			tok.ttype = ttype
+			tok.up = tok.right = None
+			self._cursor = end - base
+			return tok
+		# end if key in memo:
+		result = method(self)
+		if result:
+			if not result in self._context.compound_live:
+				self._memosnapshot(result, key[1])
+			# end if not result in self._context.compound_live:
+			memo[key] = (result, result.ttype, base + self._cursor)
+		else: # if result:
+			memo[key] = None
+		# end if result:
+		return result
+	# end def _memoized(self, production, method):
+
+	def _memoloop(self, production):
+		"""
+		Packrat form of the loop of the compounder production production (see
+		_MEMOLOOPS): a match of first, then of between and first again as many
+		times as they match.  The match is remembered at each start of first
+		along the loop, sharing the rest of the loop with the matches at the
+		later starts, so a chain is read once however many of its tokens the
+		compounder tries it at.  Its token gets its children when the
+		compounder returns it (see _memodeliver).
+		"""
+		(first, between, wrap) = LojbanParser._MEMOLOOPS[production]
+		memo = self._context.compound_memo
+		live = self._context.compound_live
+		base = self._context.compound_base
+		starts = []
+		items = []
+		pending = []
+		cells = None
+		while True:
+			key = (production, base + self._cursor)
+			if starts and key in memo:
+				match = memo[key]
+				if not match is None:
+					(tok, ttype, end) = match
+					cells = live[tok][0]
+					self._cursor = end - base
+					items[-1].extend(pending)
+					pending = []
+				# end if not match is None:
+				break
+			# end if starts and key in memo:
+			start = base + self._cursor
+			tok = getattr(self, first)()
+			if not tok:
+				break
+			# end if not tok:
+			if starts:
+				items[-1].extend(pending)
+			# end if starts:
+			starts.append(start)
+			items.append([(tok, tok.ttype)])
+			pending = []
+			cursor = self._cursor
+			for name in between:
+				tok = getattr(self, name)()
+				if not tok:
+					break
+				# end if not tok:
+				pending.append((tok, tok.ttype))
+			# end for name in between:
+			if len(pending) < len(between):
+				break
+			# end if len(pending) < len(between):
+		# end while True:
+		if not starts:
+			return None
+		# end if not starts:
+		# the matches of between not followed by first
+		for (tok, ttype) in pending:
+			self._fail(tok)
+		# end for (tok, ttype) in pending:
+		if pending:
+			self._cursor = cursor
+		# end if pending:
+		end = base + self._cursor
+		for i in range(len(starts) - 1, -1, -1):
+			cells = (tuple(items[i]), cells)
+			tok = self._newtoken()
+			live[tok] = (cells, wrap, starts[i])
+			if i > 0:
+				memo[(production, starts[i])] = (tok, tok.ttype, end)
+			# end if i > 0:
+		# end for i in range(len(starts) - 1, -1, -1):
+		return tok
+	# end def _memoloop(self, production):
+
+	def _memoprune(self):
+		"""
+		Drops the matches of the packrat memo behind the compounder, which it
+		does not try again, and the tokens that they hold.
+		"""
+		context = self._context
+		position = context.compound_base + self._cursor
+		context.compound_memo = {key: match for (key, match) in \
+			context.compound_memo.items() if key[1] >= position}
+		context.compound_live = {tok: kept for (tok, kept) in \
+			context.compound_live.items() if kept[2] >= position}
+		context.compound_memolimit = 2 * len(context.compound_memo)
+	# end def _memoprune(self):
+
+	def _memosnapshot(self, tok, start):
+		"""
+		Keeps the children of the new match tok of the packrat memo at start,
+		and those of its compound tokens not already kept.
+		"""
+		live = self._context.compound_live
+		children = []
+		child = tok.downleft
+		while child:
+			t = child.ttype
+			children.append((child, t))
+			if not (t == 0 or (t >= 500 and t <= 699) or child in live):
+				self._memosnapshot(child, start)
+			# end if not (t == 0 or (t >= 500 and t <= 699) or child in live):
+			child = child.right
+		# end while child:
+		live[tok] = ((tuple(children), None), None, start)
+	# end def _memosnapshot(self, tok, start):
+
 	def _newnode(self, t, n1):
 		"""
 		Creates a new node.
@@ -4618,8 +7341,8 @@ class LojbanParser:
 		# Removed code end.
 		# Note that the else clause is the only part executed
 		result = self._newtoken()
-		result().add(n1)
-		result().ttype = self._lastreduce = t
+		result.add(n1)
+		result.ttype = self._lastreduce = t
 		if self._parameters.D_reduce:
 			print("reducing to {:s}".format(Constants.rulename(t)))
 		# end if self._parameters.D_reduce:
@@ -4628,11 +7351,11 @@ class LojbanParser:
 
 	def _newstring(self, word):
 		"""
-		Counts memory used for the words.
+		Returns the copy of word in the StringPool of the parser, and counts
+		memory used for the words.
 		"""
 		self._stringspace += len(word)
-		result = word
-		return result
+		return self._strings.intern(word)
 	# end def _newstring(self, n):
 
 	def _newtoken(self):
@@ -4644,14 +7367,17 @@ class LojbanParser:
 		if self._freelist is None:
 			self._makefree()
 		# end if self._freelist is None:
-		self._newtoken_result = self._freelist
-		self._freelist = self._freelist().nextn
-		self._newtoken_result().ttype = -1
-		self._newtoken_result().text = None
-		self._newtoken_result().up = self._newtoken_result().right = \
-			self._newtoken_result().nextn = self._newtoken_result().downleft = \
-			self._newtoken_result().downright = None
-		return self._newtoken_result
+		self._newtoken_result = result = self._freelist
+		self._freelist = result.nextn
+		result.ttype = -1
+		result.text = None
+		result.up = result.right = result.nextn = result.downleft = \
+			result.downright = None
+		nodes = self._context.compound_nodes
+		if nodes is not None:
+			nodes.append(result)
+		# end if nodes is not None:
+		return result
 	# end def _newtoken(self):
 
 	def _node(self, t, n1, *n):
@@ -4667,7 +7393,7 @@ class LojbanParser:
 				return result
 			else: # if self._parameters.singlemode:
 				if n1:
-					n1().ttype = t
+					n1.ttype = t
 				return n1
 			# end if self._parameters.singlemode:
 			return None
@@ -4678,7 +7404,7 @@ class LojbanParser:
 
 		result = self._newnode(t, n1)
 		for ni in n:
-			result().add(ni)
+			result.add(ni)
 		# end for ni in n:
 		return result
 	# end def _node(self, t, n1, *n):
@@ -4691,74 +7417,201 @@ class LojbanParser:
 		# end if not tok:
 		while True:
 			tok = self._gettoken()
-			if tok().ttype == Constants.PA_672:
-				result().add(tok)
-			elif tok().ttype in [Constants.BY_513, Constants.LAU_559, Constants.TEI_605]:
+			if tok.ttype == Constants.PA_672:
+				result.add(tok)
+			elif tok.ttype in [Constants.BY_513, Constants.LAU_559, Constants.TEI_605]:
 				self._fail(tok)
 				tok = self._lerfu_word_987()
-				result().add(tok)
+				result.add(tok)
 			else:
 				self._fail(tok)
 				return result
-			# end if tok().ttype ?
+			# end if tok.ttype ?
 		# end while True:
 	#end def _number_root_961(self):
 
-	def _release(self, tok):
+	def _opensource(self, source):
 		"""
-		Release a token from the queue
+		Sets the source of the text to parse: source as an InputSource (made
+		from anything that an InputSource accepts), or a TokenStream, whose
+		tokens the compounder then returns, with an empty InputSource.
 		"""
-		t = tok().ttype
-		if (t == 0 or (t >= 500 and t <= 699)):
-			if self._tail:
-				self._tail().nextn = tok
-			else: # if self._tail:
-				self._head = tok
-			# end if not self._tail is None:
-			self._tail = tok
-			tok().right = tok().up = tok().nextn = None
-		else: # if (type == 0 or (t >= 500 and t <= 699)):
-			p = tok().downleft
-			while p:
-				nextp = p().right
-				self._release(p)
-				p = nextp
-			# end while not p is None:
+		if isinstance(source, TokenStream):
+			self._context.stream = source
+			source = InputSource("")
+		elif not isinstance(source, InputSource):
+			source = InputSource(source)
+		# end if isinstance(source, TokenStream):
+		self._source = source
+	# end def _opensource(self, source):
+
+	def _peek(self, n):
+		"""
+		Returns the token n places ahead (0 for the next one) of the compounder
+		without consuming it, reading the tokens up to it from absorb() into
+		the lookahead buffer.
+		"""
+		lookahead = self._lookahead
+		while len(lookahead) <= self._cursor + n:
+			tok = self._lexahead()
+			if self._parameters.D_cpd_lex:
+				print("compounder lexing: ", end = "")
+				self.print(tok)
+			# end if self._parameters.D_cpd_lex:
+			lookahead.append(tok)
+		# end while len(lookahead) <= self._cursor + n:
+		return lookahead[self._cursor + n]
+	# end def _peek(self, n):
+
+	def _readinput(self):
+		"""
+		Reads the next chunk of the InputSource into self._inbuf (a line at a
+		time in interactive mode), with ASCII upper case mashed to lower case,
+		and returns it; the empty string means EOF.
+		"""
+		if self._inbuf is None:
+			return ""
+		# end if self._inbuf is None:
+		if self._interactive:
+			self._inbuf = self._source.readline()
+		else: # if self._interactive:
+			self._inbuf = self._source.read()
+		# end if self._interactive:
+		self._inpos = 0
+		if not self._inbuf:
+			# EOF is remembered: the input stream is not read again
+			self._inbuf = None
+			return ""
+		# end if not self._inbuf:
+		self._inbuf = self._inbuf.translate(_LOWERTABLE)
+		return self._inbuf
+	# end def _readinput(self):
+
+	def _reclaim(self, nodes, tok):
+		"""
+		Releases to the freelist the compound tokens of the matches that
+		failed while the compounder made tok: those of nodes, the compound
+		tokens made meanwhile, that are not in tok (None when no match) or
+		kept by the packrat memo.  Fail() leaves them where they are, since
+		the links of their selma'o-level tokens change when those are read
+		again.
+		"""
+		live = self._context.compound_live
+		kept = set()
+		stack = [tok] if tok else []
+		while stack:
+			tok = stack.pop()
+			kept.add(tok)
+			child = tok.downleft
+			while child:
+				t = child.ttype
+				if not (t == 0 or (t >= 500 and t <= 699)):
+					stack.append(child)
+				# end if not (t == 0 or (t >= 500 and t <= 699)):
+				child = child.right
+			# end while child:
+		# end while stack:
+		for node in nodes:
+			if not (node in kept or node in live):
+				self._destroy(node)
+			# end if not (node in kept or node in live):
+		# end for node in nodes:
+	# end def _reclaim(self, nodes, tok):
+
+	def _recycle(self, tok):
+		"""
+		Releases all the tokens of a tree to the freelist.
+		"""
+		stack = [tok]
+		while stack:
+			tok = stack.pop()
+			child = tok.downleft
+			while not child is None:
+				stack.append(child)
+				child = child.right
+			# end while not child is None:
 			self._destroy(tok)
-		# end if (type == 0 or (t >= 500 and t <= 699)):
-	# end def _release(self, tok):
+		# end while stack:
+	# end def _recycle(self, tok):
+
+	def _reporterror(self):
+		"""
+		Records the last syntax error in self._errors and prints it.
+		"""
+		error = ParseError(self._errline, self._errcol, self._errtype, \
+			self._errlastreduce)
+		self._errors.append(error)
+		print(error, file = sys.stderr)
+	# end def _reporterror(self):
+
+	def _segmentlex(self):
+		"""
+		This method is used instead of compound() by _yylex when iterparse cuts
+		the text.  It passes the tokens through unchanged, except that a token
+		of a selma'o in self._context.segment_boundaries, outside LU, TO and
+		TUhE, is held back for the next part and FAhO and EOT are returned in
+		its place to end the current part, as termin() does at the end of the
+		text.
+		"""
+		context = self._context
+		if context.segment_closing:
+			tok = self._newtoken()
+			tok.ttype = 0
+			context.segment_extra.append(tok)
+			return tok
+		# end if context.segment_closing:
+		if context.segment_pending is None:
+			tok = self._compound()
+		else: # if context.segment_pending is None:
+			tok = context.segment_pending
+			context.segment_pending = None
+		# end if context.segment_pending is None:
+		ttype = tok.ttype
+		if ttype in context.segment_boundaries and context.segment_depth == 0 \
+			and context.segment_ntokens > 0:
+			context.segment_pending = tok
+			context.segment_closing = True
+			tok = self._newtoken()
+			tok.ttype = Constants.FAhO_529
+			tok.text = self._newstring("(fa'o)")
+			context.segment_extra.append(tok)
+			return tok
+		elif ttype == Constants.LU_571 or ttype == Constants.TO_606 \
+			or ttype == Constants.TUhE_610:
+			context.segment_depth += 1
+		elif (ttype == Constants.LIhU_567 or ttype == Constants.TOI_607 \
+			or ttype == Constants.TUhU_611) and context.segment_depth > 0:
+			context.segment_depth -= 1
+		elif ttype == 0:
+			context.segment_eof = True
+		# end if ttype in context.segment_boundaries and ...
+		context.segment_ntokens += 1
+		return tok
+	# end def _segmentlex(self):
 
 	def _selmao(self):
 		"""
-		This method assigns cmavo to their selmao using the table in selmao.i.
+		This method assigns cmavo to their selmao using the table in selmao.i
+		(through _CMAVOTYPES).
 		Tokens are collected from filter().  Any with types already assigned 
 		are not looked up.
 		"""
-		cons = (0, 1, 2, 3, 0, 4, 5, 0, 0, 6, 7, 8, 9, \
-			10, 0, 11, 0, 12, 13, 14, 0, 15, 0, 16, 0, 17 )
-
 		result = self._filter()
-		if (result().ttype != Constants.UNK_M1):
+		if (result.ttype != Constants.UNK_M1):
 			return result
 
-		i = result().text[0]
-		i = cons[ord(i) - ord('a')] if i.islower() else 0
-		# bumps pointer by 1 if i is nonzero (consonant)
-		j = Constants.get_vowels(result().text[(1 if (i != 0) else 0):])
-		if i != 0 and j > 34:
-			j = Constants.UNK_M1
-		if j != Constants.UNK_M1: 
-			result().ttype = Constants.cmavo[i][j]
-		if result().ttype == Constants.UNK_M1:
-			print("Unknown cmavo {:s}".format(result().text) + \
+		ttype = _CMAVOTYPES.get(result.text)
+		result.ttype = Constants.get_selmao(result.text) if ttype is None else ttype
+		if result.ttype == Constants.UNK_M1:
+			print("Unknown cmavo {:s}".format(result.text) + \
 				" at line {:d}, column {:d};".format(self._line, self._column) + \
 				" selma'o UI assumed", file = sys.stderr)
-			result().ttype = Constants.UI_612
-		elif (result().ttype == Constants.XAI_M2):
-			print("Experimental cmavo {:s}".format(result().text) + \
+			result.ttype = Constants.UI_612
+		elif (result.ttype == Constants.XAI_M2):
+			print("Experimental cmavo {:s}".format(result.text) + \
 				" at line {:d}, column {:d};".format(self._line, self._column) + \
 				" selma'o UI assumed\n", file = sys.stderr)
-			result().ttype = Constants.UI_612
+			result.ttype = Constants.UI_612
 		# end if
 		return result
 	# end def _selmao(self):
@@ -4779,7 +7632,7 @@ class LojbanParser:
 	def _simple_tag_971(self):
 		ttype = 971
 		tok = self._gettoken()
-		nexttype = tok().ttype
+		nexttype = tok.ttype
 		self._fail(tok)
 		if nexttype in [Constants.BAI_502, Constants.CAhA_514, Constants.CUhE_521, Constants.FAhA_528, Constants.FEhE_530, Constants.KI_554, Constants.MOhI_577, Constants.NAhE_583, Constants.PU_592, Constants.SE_596, Constants.TAhE_604, Constants.VA_613, Constants.VEhA_615, Constants.VIhA_616, Constants.ZAhO_621, Constants.ZEhA_622, Constants.ZI_624]:
 			tok = self._simple_tag_971_12()
@@ -4796,8 +7649,9 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		while True:
+			cursor = self._cursor
 			joikjek = self._simple_JOIK_JEK_957()
 			if not joikjek:
 				return result
@@ -4805,13 +7659,14 @@ class LojbanParser:
 			tok = self._simple_tense_modal_972()
 			if not tok:
 				self._fail(joikjek)
+				self._cursor = cursor
 				return result
 			#end if (!tok) :
-			result().add(joikjek)
-			result().add(tok)
-			result().ttype = 971
+			result.add(joikjek)
+			result.add(tok)
+			result.ttype = 971
 			tok = self._newtoken()
-			tok().add(result)
+			tok.add(result)
 			result = tok
 		# end while True:
 	#end def _simple_tag_971_12(self):
@@ -4843,7 +7698,7 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		return result
 	#end def _simple_tense_modal_972_1(self):
 
@@ -4857,7 +7712,7 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		return result
 	#end def _simple_tense_modal_972_2(self):
 
@@ -4902,7 +7757,7 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		return result
 	#end def _simple_tense_modal_A_973_1(self):
 
@@ -4912,7 +7767,7 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		tok = self._isnext(Constants.KI_554, result)
 		if not tok:
 			return self._fail(result)
@@ -4926,7 +7781,7 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		return result
 	#end def _simple_tense_modal_A_973_3(self):
 
@@ -4953,7 +7808,7 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		return result
 	#end def _space_1040_1(self):
 
@@ -4963,7 +7818,7 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		return result
 	#end def _space_1040_2(self):
 
@@ -4973,12 +7828,12 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		tok = self._space_motion_1041()
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		return result
 	#end def _space_1040_3(self):
 
@@ -4992,7 +7847,7 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		return result
 	#end def _space_motion_1041(self):
 
@@ -5032,7 +7887,7 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		return result
 	#end def _space_A_1042_2(self):
 
@@ -5042,7 +7897,7 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		return result
 	#end def _space_A_1042_3(self):
 
@@ -5069,7 +7924,7 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		return result
 	#end def _space_B_1043_1(self):
 
@@ -5079,7 +7934,7 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		return result
 	#end def _space_B_1043_2(self):
 
@@ -5089,12 +7944,12 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		tok = self._space_intval_1046()
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		return result
 	#end def _space_B_1043_3(self):
 
@@ -5104,13 +7959,13 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		while True:
 			tok = self._space_offset_1045()
 			if not tok:
 				return result
 			# end if not tok:
-			result().add(tok)
+			result.add(tok)
 		# end while True:
 	#end def _space_C_1044(self):
 
@@ -5133,7 +7988,7 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		return result
 	#end def _space_offset_1045_1(self):
 
@@ -5143,7 +7998,7 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		tok = self._isnext(Constants.VA_613, result)
 		if not tok:
 			return self._fail(result)
@@ -5182,7 +8037,7 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		return result
 	#end def _space_intval_1046_1(self):
 
@@ -5192,12 +8047,12 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		tok = self._space_direction_1048()
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		return result
 	#end def _space_intval_1046_2(self):
 
@@ -5211,7 +8066,7 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		return result
 	#end def _space_intval_1046_3(self):
 
@@ -5221,7 +8076,7 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		tok = self._isnext(Constants.FEhE_530, result)
 		if not tok:
 			return self._fail(result)
@@ -5230,7 +8085,7 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		return result
 	#end def _space_intval_1046_4(self):
 
@@ -5240,12 +8095,12 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		tok = self._space_direction_1048()
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		tok = self._isnext(Constants.FEhE_530, result)
 		if not tok:
 			return self._fail(result)
@@ -5254,7 +8109,7 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		return result
 	#end def _space_intval_1046_5(self):
 
@@ -5354,6 +8209,60 @@ class LojbanParser:
 		# end try except ValueError:
 	# end def _strchr(s, ch):
 
+	def _streamtoken(self):
+		"""
+		Returns the next token of the TokenStream being parsed (in place of
+		_compound), rebuilt with its subtree from new tokens, and sets the line
+		and column to those of the lexer when it delivered the token.
+		Past the end of the stream, EOT is returned (as termin does).
+		"""
+		context = self._context
+		stream = context.stream
+		index = context.stream_index
+		if index >= len(stream):
+			tok = self._newtoken()
+			tok.ttype = 0
+			return tok
+		# end if index >= len(stream):
+		context.stream_index = index + 1
+		self._line = stream.lines[index]
+		self._column = stream.columns[index]
+		node = context.stream_node
+		result = None
+		# parents whose children are being read, and how many are left
+		parents = []
+		counts = []
+		while True:
+			tok = self._newtoken()
+			tok.ttype = stream.ttype[node]
+			textid = stream.text[node]
+			if textid >= 0:
+				tok.text = self._newstring(stream.texts[textid])
+			# end if textid >= 0:
+			nchildren = stream.children[node]
+			node += 1
+			if parents:
+				parents[-1].add(tok)
+				counts[-1] -= 1
+			else: # if parents:
+				result = tok
+			# end if parents:
+			if nchildren > 0:
+				parents.append(tok)
+				counts.append(nchildren)
+			# end if nchildren > 0:
+			while counts and counts[-1] == 0:
+				parents.pop()
+				counts.pop()
+			# end while counts and counts[-1] == 0:
+			if not parents:
+				break
+			# end if not parents:
+		# end while True:
+		context.stream_node = node
+		return result
+	# end def _streamtoken(self):
+
 	def _tense_A_977(self):
 		ttype = 977
 		tok = self._tense_A_977_2()
@@ -5373,7 +8282,7 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		return result
 	#end def _tense_A_977_1(self):
 
@@ -5383,7 +8292,7 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		tok = self._isnext(Constants.KI_554, result)
 		if not tok:
 			return self._fail(result)
@@ -5414,7 +8323,7 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		return result
 	#end def _tense_B_978_1(self):
 
@@ -5433,7 +8342,7 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		tok = self._isnext(Constants.CAhA_514, result)
 		if not tok:
 			return self._fail(result)
@@ -5464,7 +8373,7 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		return result
 	#end def _tense_C_979_1(self):
 
@@ -5474,7 +8383,7 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		return result
 	#end def _tense_C_979_2(self):
 
@@ -5484,12 +8393,12 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		tok = self._space_1040()
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		return result
 	#end def _tense_C_979_3(self):
 
@@ -5500,21 +8409,18 @@ class LojbanParser:
 		the last token was not FAhO, a FAhO is generated.  After any FAhO, whether
 		real or generated, only EOT tokens will be returned.
 		"""
-		if not getattr(LojbanParser._termin, "_lasttype", None):
-			LojbanParser._termin._lasttype = -1
-		# end if not getattr(LojbanParser._termin, "_lasttype", None):
-		if LojbanParser._termin._lasttype == Constants.FAhO_529:
+		if self._context.termin_lasttype == Constants.FAhO_529:
 			tok = self._newtoken()
-			tok().ttype = 0
+			tok.ttype = 0
 			return tok
-		# end if LojbanParser._termin._lasttype == Constants.FAhO_529:
+		# end if self._context.termin_lasttype == Constants.FAhO_529:
 		tok = self._selmao()
-		if tok().ttype == 0:
+		if tok.ttype == 0:
 			tok = self._newtoken()
-			tok().ttype = Constants.FAhO_529
-			tok().text = self._newstring("(fa'o)")
-		# end if tok().ttype == 0:
-		LojbanParser._termin._lasttype = tok().ttype
+			tok.ttype = Constants.FAhO_529
+			tok.text = self._newstring("(fa'o)")
+		# end if tok.ttype == 0:
+		self._context.termin_lasttype = tok.ttype
 		return tok
 	# end def _termin(self):
 
@@ -5554,7 +8460,7 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		return result
 	#end def _time_1030_2(self):
 
@@ -5564,7 +8470,7 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		return result
 	#end def _time_1030_3(self):
 
@@ -5591,7 +8497,7 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		return result
 	#end def _time_A_1031_1(self):
 
@@ -5601,7 +8507,7 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		return result
 	#end def _time_A_1031_2(self):
 
@@ -5611,12 +8517,12 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		tok = self._time_interval_1034()
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		return result
 	#end def _time_A_1031_3(self):
 
@@ -5626,13 +8532,13 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		while True:
 			tok = self._time_offset_1033()
 			if not tok:
 				return result
 			# end if not tok:
-			result().add(tok)
+			result.add(tok)
 		# end while True:
 	#end def _time_B_1032(self):
 
@@ -5655,7 +8561,7 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		return result
 	#end def _time_offset_1033_1(self):
 
@@ -5665,7 +8571,7 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		tok = self._isnext(Constants.ZI_624, result)
 		if not tok:
 			return self._fail(result)
@@ -5717,7 +8623,7 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		return result
 	#end def _time_interval_1034_2(self):
 
@@ -5727,7 +8633,7 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		return result
 	#end def _time_interval_1034_3(self):
 
@@ -5741,7 +8647,7 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		return result
 	#end def _time_interval_1034_4(self):
 
@@ -5755,12 +8661,12 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		tok = self._interval_modifier_1050()
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		return result
 	#end def _time_interval_1034_5(self):
 
@@ -5827,7 +8733,7 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		tok = self._isnext(Constants.MAI_661, result)
 		if not tok:
 			return self._fail(result)
@@ -5841,7 +8747,7 @@ class LojbanParser:
 		if not tok:
 			return self._fail(result)
 		# end if not tok:
-		result().add(tok)
+		result.add(tok)
 		tok = self._isnext(Constants.MAI_661, result)
 		if not tok:
 			return self._fail(result)
@@ -5866,21 +8772,28 @@ class LojbanParser:
 		This is the parser's lexical analyzer.  It invokes compound() and
 		places the result in yylval.  Returns the node type.
 		"""
-		self._yylval = self._compound()
+		if self._context.segment_boundaries is None:
+			self._yylval = self._compound()
+		else: # if self._context.segment_boundaries is None:
+			self._yylval = self._segmentlex()
+		# end if self._context.segment_boundaries is None:
 		if self._parameters.D_lex:
-			print("lexing (selma'o {:s}): ".format(Constants.rulename(self._yylval().ttype)), end = "")
-			self.print(self._yylval())
+			print("lexing (selma'o {:s}): ".format(Constants.rulename(self._yylval.ttype)), end = "")
+			self.print(self._yylval)
 			# print() # TODO added for DEBUG
 		# end if self._parameters.D_lex:
-		return self._yylval().ttype
+		return self._yylval.ttype
 	# end def _yylex():
 
-	def _yyparse(self, yymaxdepth = 200, yyredmax = 1000, \
+	def _yyparse(self, yymaxdepth = 10000, yyredmax = 1000, \
 		yydebug = False, yytflag = False, yytfilen = "grammar.tmp"):
 		"""
 		Parses the document.
 		Returns true on success and false on error.
 		"""
+		if self._parameters.generated and not yydebug and not yytflag:
+			return self._yyparsestates(yymaxdepth)
+		# end if self._parameters.generated and not yydebug and not yytflag:
 		_YYMAXDEPTH = yymaxdepth
 		_YYREDMAX = yyredmax
 		_YYDEBUG = yydebug
@@ -5894,893 +8807,23 @@ class LojbanParser:
 		_WAS3ERR = 3
 		_YYLAST = 3903
 		_YYERRCODE = 256
-		_YYEXCA = (
-			-1, 1, \
-			0, -1, \
-			-2, 0, \
-			-1, 403, \
-			561, 179, \
-			657, 179, \
-			664, 179, \
-			666, 179, \
-			677, 179, \
-			935, 179, \
-			945, 179, \
-			960, 179, \
-			985, 179, \
-			-2, 169, \
-			0, \
-		)
-		_YYACT = (
-			75,	  74,	  67,	 276,	  28,	 152,	 299,	 330, \
-			283,	  27,	 448,	  34,	 300,	  26,	  81,	  51, \
-			79,	 502,	 296,	  30,	  36,	  45,	  27,	 101, \
-			31,	  67,	 525,	  69,	  79,	  28,	  79,	  11, \
-			37,	 494,	  27,	 581,	 578,	 332,	  86,	 154, \
-			331,	 333,	 548,	 145,	 232,	  27,	  51,	 143, \
-			354,	 239,	 370,	 119,	  45,	 377,	 112,	 155, \
-			506,	 117,	 121,	 187,	 385,	 152,	 113,	 205, \
-			179,	 133,	 178,	 129,	 367,	 473,	 146,	 495, \
-			86,	 290,	  68,	 509,	  68,	   7,	 252,	 139, \
-			31,	  87,	 155,	  93,	  79,	 490,	 502,	 241, \
-			532,	 250,	 243,	 302,	 150,	  47,	 284,	 154, \
-			443,	 139,	  41,	 145,	 459,	 300,	  39,	 143, \
-			75,	  74,	  65,	 284,	  33,	 152,	 150,	  31, \
-			229,	  42,	  35,	  87,	 157,	 406,	  75,	  51, \
-			437,	  74,	 132,	 131,	  47,	  45,	 146,	 101, \
-			34,	  41,	  68,	 434,	  79,	  39,	 440,	 139, \
-			375,	  36,	 155,	  51,	 471,	 137,	  86,	 154, \
-			42,	 201,	 334,	 145,	 150,	  37,	 187,	 143, \
-			546,	 100,	 336,	 119,	 151,	  99,	 112,	 297, \
-			282,	 117,	 121,	 147,	 431,	 225,	 113,	 187, \
-			66,	 133,	  62,	 129,	 107,	  81,	 146,	  63, \
-			265,	 520,	  68,	 266,	 135,	 304,	 312,	 139, \
-			31,	  87,	 155,	  93,	  77,	  17,	  75,	  74, \
-			20,	 262,	  58,	 152,	 150,	  47,	  49,	  14, \
-			71,	 130,	  41,	 164,	 117,	 248,	  39,	 118, \
-			70,	 298,	  65,	 280,	  10,	 101,	   6,	 434, \
-			152,	  42,	  79,	 147,	  16,	 383,	  98,	 518, \
-			165,	  33,	 132,	 131,	  86,	 154,	 529,	  35, \
-			56,	 145,	  18,	 435,	 488,	 143,	  95,	  79, \
-			204,	 119,	 223,	 197,	 112,	 202,	 128,	 117, \
-			121,	 407,	 154,	 196,	 113,	 182,	 145,	 133, \
-			530,	 129,	 143,	 127,	 146,	  19,	 126,	 122, \
-			68,	 200,	 177,	 147,	  73,	 139,	  31,	  87, \
-			155,	  93,	  15,	  46,	 254,	  81,	 277,	 199, \
-			173,	 146,	 150,	 275,	 153,	  68,	 117,	  75, \
-			74,	 149,	 139,	 286,	 152,	 155,	  13,	 247, \
-			65,	  80,	 399,	 368,	 259,	 244,	 507,	 150, \
-			324,	 148,	 504,	 258,	 139,	 257,	 101,	 501, \
-			132,	 131,	 142,	  79,	 342,	 337,	 335,	 134, \
-			81,	 150,	 125,	 328,	 285,	  86,	 154,	 311, \
-			123,	 186,	 145,	 306,	 232,	 441,	 143,	 379, \
-			410,	 438,	 119,	 115,	 329,	 112,	 114,	 482, \
-			117,	 121,	 111,	 106,	 502,	 113,	 410,	 104, \
-			133,	 147,	 129,	 237,	  91,	 146,	 164,	 371, \
-			92,	  68,	  85,	  81,	  84,	 152,	 139,	  31, \
-			87,	 155,	  93,	 508,	  83,	 289,	 147,	 505, \
-			230,	 295,	 274,	 150,	 501,	 433,	 259,	 101, \
-			81,	 391,	 472,	 265,	  79,	 258,	 266,	 257, \
-			369,	  65,	  88,	 436,	 489,	 442,	 246,	 154, \
-			28,	  43,	  81,	 145,	 262,	  27,	  67,	 143, \
-			414,	 132,	 131,	 119,	 416,	 254,	 112,	 384, \
-			439,	 117,	 121,	 366,	 186,	  28,	 113,	 117, \
-			90,	 133,	  27,	 129,	 232,	 152,	 146,	  96, \
-			43,	  96,	  68,	  29,	 141,	 186,	 430,	 139, \
-			432,	 124,	 155,	  93,	 238,	 139,	  94,	 286, \
-			376,	 365,	 147,	  30,	 150,	  86,	  78,	 152, \
-			80,	 415,	 150,	 412,	  81,	 547,	 417,	 154, \
-			74,	 433,	  78,	 145,	  78,	  51,	 228,	 143, \
-			254,	 404,	 249,	  45,	 323,	 497,	  79,	 469, \
-			285,	 125,	 132,	 131,	 224,	 468,	  69,	  96, \
-			527,	 154,	  38,	  29,	 141,	 145,	 146,	 373, \
-			87,	 143,	 533,	 403,	 484,	 397,	 410,	 139, \
-			139,	  43,	 155,	  40,	 510,	 422,	  67,	  97, \
-			25,	 533,	 445,	 152,	 150,	 150,	  24,	 259, \
-			146,	 156,	  78,	 147,	 265,	  28,	 258,	 266, \
-			257,	 139,	  27,	 355,	 155,	  81,	 462,	  96, \
-			496,	 561,	  79,	  81,	 141,	 262,	 150,	  48, \
-			405,	 124,	  23,	  47,	  86,	 154,	  94,	 109, \
-			41,	 145,	 571,	  30,	  39,	 143,	  22,	 568, \
-			80,	  21,	 423,	 424,	 168,	 552,	  51,	  42, \
-			12,	 116,	  78,	  53,	  45,	 548,	 549,	 550, \
-			52,	 156,	  96,	  50,	 146,	 553,	 554,	 265, \
-			68,	 125,	 266,	 147,	 124,	 139,	  69,	  87, \
-			155,	  44,	   4,	  29,	  67,	 555,	   1,	 519, \
-			262,	 152,	 150,	  80,	 565,	   0,	 254,	 564, \
-			522,	 523,	   0,	  28,	 419,	 147,	 536,	 573, \
-			27,	   0,	   0,	 586,	 569,	  96,	   0,	   0, \
-			102,	 156,	 141,	 589,	 125,	 533,	 594,	 124, \
-			592,	   0,	  54,	 154,	  94,	 240,	 139,	 145, \
-			0,	  30,	 501,	 143,	  47,	   0,	  80,	 141, \
-			485,	  41,	  28,	 150,	 595,	  39,	  64,	  27, \
-			78,	 491,	 492,	 286,	  96,	 538,	 152,	   0, \
-			42,	 141,	 146,	  80,	 187,	   0,	 124,	 125, \
-			516,	 147,	 517,	 139,	  69,	  78,	 155,	 307, \
-			0,	  29,	 217,	  81,	  51,	  80,	  28,	   0, \
-			150,	 209,	  45,	  27,	 285,	  67,	   0,	 344, \
-			154,	   0,	 599,	 600,	 145,	 579,	   0,	   0, \
-			214,	   0,	 405,	  75,	  74,	 208,	 125,	 156, \
-			152,	   0,	 539,	 540,	   0,	 265,	  96,	   0, \
-			266,	   0,	 209,	 141,	 209,	  32,	   0,	 146, \
-			124,	   0,	 101,	  68,	 156,	  94,	 262,	  79, \
-			139,	   0,	  30,	 155,	 284,	   0,	 273,	  80, \
-			381,	  86,	 154,	   0,	 382,	 150,	 145,	 318, \
-			0,	  78,	 143,	   0,	   0,	   0,	 119,	 147, \
-			0,	 112,	  47,	 213,	 117,	 121,	 344,	  41, \
-			125,	 113,	   0,	  39,	 133,	  69,	 129,	   0, \
-			284,	 146,	  29,	   0,	   0,	  68,	  42,	 209, \
-			0,	   0,	 139,	 287,	  87,	 155,	  93,	  96, \
-			0,	 450,	 453,	 254,	 141,	  96,	   0,	 150, \
-			152,	 124,	 141,	 350,	   0,	   0,	  94,	 124, \
-			156,	 464,	 465,	 230,	 483,	  65,	   0,	 584, \
-			80,	   0,	 101,	 184,	 147,	 253,	  80,	  79, \
-			0,	   0,	  78,	 139,	   0,	 132,	 131,	 405, \
-			0,	 152,	 154,	 378,	 313,	 217,	 145,	 388, \
-			150,	 125,	 143,	   0,	 209,	  28,	 119,	 125, \
-			0,	 112,	  27,	 101,	 117,	 121,	   0,	  43, \
-			79,	 113,	   0,	   0,	 133,	 141,	 129,	   0, \
-			208,	 146,	   0,	 154,	 254,	  68,	 147,	 145, \
-			486,	  72,	 139,	 143,	   0,	 155,	  93,	 119, \
-			81,	 156,	 112,	 140,	   0,	 117,	 121,	 150, \
-			152,	 541,	 113,	 543,	 544,	 133,	   0,	 129, \
-			0,	 308,	 146,	   0,	 139,	   0,	  68,	 428, \
-			0,	   0,	 265,	 139,	   0,	 266,	 155,	  93, \
-			0,	 150,	 307,	   0,	  78,	 132,	 131,	 224, \
-			150,	 152,	 154,	 262,	   0,	 380,	 145,	 409, \
-			0,	  26,	 143,	   0,	   0,	 386,	 227,	   3, \
-			0,	   0,	 186,	 387,	 158,	 160,	 161,	   0, \
-			79,	 156,	 141,	   0,	 267,	 269,	 132,	 131, \
-			43,	 146,	  86,	 154,	   0,	   0,	 147,	 145, \
-			272,	   0,	 139,	 143,	   0,	 155,	  80,	 119, \
-			81,	 349,	 112,	 156,	   0,	 117,	 121,	 150, \
-			78,	   2,	 113,	 265,	 254,	 133,	 266,	 129, \
-			0,	 162,	 146,	   0,	 152,	   0,	  68,	 147, \
-			547,	   0,	   0,	 139,	 262,	  87,	 155,	 230, \
-			358,	  81,	 361,	 363,	 105,	 245,	 101,	   0, \
-			150,	 392,	   0,	  79,	 139,	   0,	   0,	 217, \
-			0,	 191,	 360,	 281,	 338,	   0,	 154,	   0, \
-			0,	 150,	 145,	   0,	 345,	 347,	 143,	 156, \
-			141,	   0,	 119,	   0,	   0,	 112,	 132,	 131, \
-			117,	 121,	   0,	   0,	 320,	 113,	 147,	   0, \
-			133,	   0,	 129,	   0,	   0,	 146,	 152,	   0, \
-			307,	  68,	   0,	   0,	 215,	   0,	 139,	   0, \
-			0,	 155,	  93,	 227,	   0,	  76,	  43,	 447, \
-			449,	   0,	   0,	 150,	   0,	  79,	  28,	 147, \
-			152,	   0,	 209,	  27,	 227,	 426,	 427,	   0, \
-			154,	  81,	   0,	 265,	 145,	 141,	 266,	 357, \
-			143,	   0,	 101,	   0,	 475,	   0,	 562,	  79, \
-			402,	 132,	 131,	 327,	 262,	   0,	   0,	   0, \
-			487,	  67,	 154,	   0,	   0,	 156,	 145,	 146, \
-			0,	   0,	 143,	  68,	   0,	   0,	 119,	 152, \
-			139,	 112,	 226,	 155,	 117,	 121,	 499,	   0, \
-			0,	 113,	  96,	   0,	 133,	 150,	 129,	 141, \
-			0,	 146,	 147,	   0,	 124,	  68,	 388,	 476, \
-			477,	  94,	 139,	   0,	  81,	 155,	  93,	 278, \
-			0,	 154,	 500,	  80,	   0,	 145,	 227,	 150, \
-			152,	 214,	   0,	   0,	   0,	  78,	 108,	 413, \
-			0,	 227,	 156,	 512,	 513,	 207,	 514,	   0, \
-			141,	   0,	   0,	   0,	 125,	   0,	 215,	   0, \
-			146,	  69,	   0,	   0,	  68,	 132,	 131,	 215, \
-			0,	 139,	 154,	   0,	 155,	 152,	 145,	   0, \
-			0,	 542,	 143,	   0,	 147,	   0,	 150,	   0, \
-			215,	 551,	   0,	   0,	   0,	   0,	   0,	 338, \
-			0,	 215,	  96,	   0,	 156,	   0,	 503,	 141, \
-			0,	 146,	 222,	 320,	 124,	  68,	 147,	 154, \
-			0,	  94,	 139,	 145,	   0,	 155,	 400,	 143, \
-			81,	  28,	   0,	  80,	 411,	   0,	  27,	 150, \
-			0,	 141,	   0,	  96,	 418,	  78,	   0,	   0, \
-			141,	   0,	   0,	   0,	 152,	 124,	 146,	   0, \
-			0,	   0,	  94,	   0,	 125,	   0,	   0,	 139, \
-			226,	   0,	 155,	   0,	  80,	 147,	 101,	 315, \
-			0,	 278,	   0,	  79,	 150,	 152,	  78,	 394, \
-			315,	   0,	   0,	   0,	   0,	 278,	 154,	   0, \
-			0,	   0,	 145,	   0,	   0,	 125,	 143,	   0, \
-			0,	   0,	 119,	 574,	 156,	 112,	   0,	 141, \
-			117,	 121,	   0,	   0,	 400,	 113,	 147,	 154, \
-			133,	   0,	 129,	 145,	 227,	 146,	   0,	 143, \
-			0,	  68,	   0,	   0,	   0,	   0,	 139,	   0, \
-			444,	 155,	  93,	  96,	   0,	 156,	   0,	   0, \
-			141,	   0,	   0,	 150,	 152,	 124,	 146,	   0, \
-			0,	   0,	 596,	 147,	  26,	 222,	   0,	 139, \
-			0,	 141,	 155,	   0,	  80,	   0,	   9,	   0, \
-			461,	   0,	   0,	  79,	 150,	   0,	  78,	 163, \
-			400,	 132,	 131,	   0,	   0,	  86,	 154,	 171, \
-			172,	   0,	 145,	   0,	   0,	 125,	 143,	 254, \
-			0,	   0,	 119,	   0,	 156,	 112,	   0,	   0, \
-			117,	 121,	   0,	   0,	 531,	 113,	  96,	 537, \
-			133,	   0,	 129,	 141,	   0,	 146,	   0,	   0, \
-			124,	  68,	 147,	   0,	 206,	  94,	 139,	 139, \
-			87,	 155,	 400,	   0,	  81,	 156,	   0,	  80, \
-			0,	   0,	   0,	 150,	 150,	   0,	   0,	   0, \
-			0,	  78,	   0,	 147,	   0,	   0,	 535,	   0, \
-			0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
-			125,	   0,	   0,	 229,	   0,	   0,	   0,	 227, \
-			227,	 132,	 131,	   0,	   0,	   0,	   0,	   0, \
-			0,	 548,	   0,	   0,	   0,	 141,	   0,	   0, \
-			0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
-			0,	   0,	   0,	   0,	 152,	   0,	   0,	   0, \
-			156,	   0,	  96,	   0,	   0,	   0,	 265,	 141, \
-			0,	 266,	 147,	  78,	 124,	   0,	   0,	   0, \
-			0,	  94,	   0,	  79,	  81,	   0,	 401,	 262, \
-			0,	   0,	   0,	  80,	   0,	  86,	 154,	 585, \
-			0,	 370,	 145,	   0,	   0,	  78,	 143,	  28, \
-			0,	   0,	 119,	   0,	  27,	 112,	   0,	 524, \
-			117,	 121,	   0,	   0,	 125,	 113,	 141,	 152, \
-			133,	   0,	 129,	   0,	   0,	 146,	   0,	   0, \
-			0,	  68,	 156,	   0,	   0,	   0,	 139,	   0, \
-			87,	 155,	   0,	   0,	   0,	 545,	  79,	   0, \
-			28,	   0,	   0,	 150,	   0,	  27,	   0,	   0, \
-			0,	 154,	   0,	   0,	 156,	 145,	   0,	 141, \
-			0,	 143,	   0,	   0,	   0,	 119,	   0,	 560, \
-			112,	   0,	   0,	 117,	 121,	   0,	 566,	 567, \
-			113,	 132,	 131,	 133,	   0,	 129,	   0,	   0, \
-			146,	   0,	   0,	   0,	  68,	   0,	   0,	   0, \
-			0,	 139,	 119,	   0,	 155,	 112,	   0,	   0, \
-			117,	 121,	   0,	 156,	   0,	 113,	 150,	 101, \
-			133,	 577,	 129,	   0,	  79,	   0,	   0,	   0, \
-			0,	   0,	 147,	   0,	 290,	   0,	   0,	   0, \
-			0,	   0,	   0,	   0,	  81,	   0,	   0,	   0, \
-			0,	   0,	   0,	 119,	 132,	 131,	 112,	   0, \
-			0,	 117,	 121,	   0,	 156,	   0,	 113,	   0, \
-			152,	 133,	   0,	 129,	   0,	   0,	  96,	   0, \
-			0,	   0,	   0,	 141,	 588,	   0,	 590,	 591, \
-			124,	 132,	 131,	  93,	 460,	  94,	   0,	  79, \
-			0,	   0,	   0,	   0,	   0,	 147,	   0,	  80, \
-			0,	 156,	 154,	   0,	 141,	   0,	 145,	  81, \
-			0,	  78,	 143,	   0,	   0,	   0,	 119,	   0, \
-			0,	 112,	 101,	   0,	 117,	 121,	   0,	  79, \
-			125,	 113,	 132,	 131,	 133,	 254,	 129,	   0, \
-			0,	 146,	   0,	   0,	  81,	  68,	   0,	 117, \
-			0,	   0,	 139,	   0,	   0,	 155,	 119,	   0, \
-			0,	 112,	   0,	   0,	 117,	 121,	   0,	 150, \
-			254,	 113,	   0,	   0,	 133,	 139,	 129,	   0, \
-			156,	 101,	 117,	 141,	 141,	   0,	  79,	   0, \
-			124,	   0,	 150,	   0,	   0,	  81,	  93,	   0, \
-			0,	   0,	   0,	   0,	   0,	 132,	 131,	  80, \
-			139,	 156,	   0,	   0,	   0,	 119,	   0,	   0, \
-			112,	  78,	   0,	 117,	 121,	 150,	   0,	   0, \
-			113,	 228,	   0,	 133,	   0,	 129,	   0,	   0, \
-			125,	   0,	   0,	   0,	 119,	 132,	 131,	 112, \
-			0,	 254,	 117,	 121,	   0,	  93,	 147,	 113, \
-			0,	   0,	 133,	 117,	 129,	   0,	   0,	 259, \
-			534,	   0,	   0,	   0,	 265,	   0,	 258,	 266, \
-			257,	   0,	   0,	   0,	   0,	   0,	   0,	 246, \
-			156,	 139,	   0,	  81,	   0,	 262,	   0,	 369, \
-			0,	   0,	 259,	 254,	 132,	 131,	 150,	 265, \
-			81,	 258,	 266,	 257,	   0,	 117,	   0,	   0, \
-			0,	  86,	 246,	   0,	 547,	   0,	  81,	   0, \
-			262,	   0,	   0,	 132,	 131,	   0,	 119,	   0, \
-			0,	 112,	   0,	 139,	 117,	 121,	   0,	   0, \
-			0,	 113,	   0,	   0,	 133,	   0,	 129,	   0, \
-			150,	   0,	   0,	 141,	   0,	   0,	   0,	  81, \
-			124,	   0,	   0,	   0,	  87,	   0,	   0,	   0, \
-			0,	 242,	   0,	 259,	   0,	   0,	   0,	  80, \
-			265,	   0,	 258,	 266,	 257,	   0,	  81,	 119, \
-			289,	  78,	 112,	 246,	   0,	 117,	 121,	  81, \
-			0,	 262,	 113,	   0,	  60,	 133,	   0,	 129, \
-			125,	 119,	   0,	   0,	 112,	 132,	 131,	 117, \
-			121,	  96,	   0,	   0,	 113,	 259,	 141,	 133, \
-			0,	 129,	 265,	 124,	 258,	 266,	 257,	   0, \
-			0,	  82,	   0,	   0,	   0,	 246,	   0,	   0, \
-			0,	  81,	  80,	 262,	   0,	 193,	  96,	   0, \
-			156,	   0,	   0,	   0,	  78,	   0,	   0,	   0, \
-			124,	   0,	   0,	 210,	  61,	   0,	 132,	 131, \
-			81,	   0,	   0,	 125,	   0,	   0,	   0,	  80, \
-			183,	   0,	   0,	 195,	   0,	   0,	   0,	 232, \
-			132,	 131,	   0,	   0,	   0,	   0,	   0,	  96, \
-			0,	   0,	   0,	   0,	 210,	   0,	 210,	   0, \
-			125,	 124,	 292,	 181,	   0,	   0,	  94,	   0, \
-			0,	   0,	   0,	 156,	 303,	   0,	   0,	   0, \
-			80,	  81,	   0,	   0,	   0,	   0,	   0,	   0, \
-			0,	   0,	  78,	 279,	   0,	   0,	 288,	   0, \
-			0,	   0,	   0,	  81,	   0,	   0,	   0,	   0, \
-			0,	 125,	   0,	   0,	   0,	   0,	   0,	   0, \
-			309,	   0,	   0,	   0,	   0,	   0,	   0,	 141, \
-			0,	 210,	   0,	   0,	 124,	   0,	   0,	   0, \
-			0,	   0,	   0,	   0,	   0,	  96,	   0,	 305, \
-			0,	   0,	 141,	 310,	   0,	 314,	   0,	 124, \
-			0,	   0,	  96,	   0,	 348,	  78,	 314,	   0, \
-			0,	   0,	   0,	   0,	 124,	   0,	  80,	   0, \
-			96,	  94,	   0,	   0,	 125,	 141,	   0,	   0, \
-			0,	   0,	 124,	  80,	   0,	   0,	   0,	   0, \
-			0,	   0,	   0,	   0,	   0,	  78,	 210,	 125, \
-			0,	  80,	   0,	   0,	   0,	   0,	   0,	 364, \
-			0,	  96,	   0,	   0,	 125,	 374,	   0,	   0, \
-			0,	   0,	   0,	 124,	 156,	   0,	   0,	   0, \
-			94,	 359,	 125,	 362,	   0,	   0,	   0,	   0, \
-			96,	   0,	  80,	   0,	   0,	   0,	   0,	   0, \
-			0,	  96,	 124,	   0,	  78,	   0,	 141,	   0, \
-			0,	 364,	   0,	 124,	   0,	   0,	   0,	   0, \
-			0,	  80,	   8,	 125,	   0,	   0,	   0,	  55, \
-			0,	   0,	  80,	   0,	   0,	   0,	   0,	   0, \
-			0,	   0,	   0,	   0,	 421,	   0,	   0,	   0, \
-			458,	   0,	 125,	  96,	   0,	   0,	   0,	   0, \
-			141,	   0,	   0,	 125,	   0,	 124,	   0,	   0, \
-			0,	   0,	 451,	 452,	   0,	   0,	 185,	   0, \
-			194,	   0,	  96,	   0,	  80,	 279,	   0,	   0, \
-			0,	   0,	 216,	   0,	 124,	   0,	 211,	   0, \
-			0,	 220,	   0,	 185,	 211,	   0,	   0,	   0, \
-			474,	   0,	   0,	  80,	   0,	 125,	   0,	 481, \
-			0,	   0,	 268,	 268,	   0,	   0,	   0,	 185, \
-			0,	   0,	   0,	   0,	   0,	   0,	 268,	 211, \
-			0,	 211,	   0,	  96,	 125,	 268,	   0,	   0, \
-			478,	 479,	   0,	   0,	   0,	 124,	   0,	 268, \
-			0,	   0,	   0,	   0,	   0,	  96,	   0,	 319, \
-			185,	   0,	   0,	   0,	  80,	   0,	   0,	 124, \
-			0,	 185,	   0,	   0,	   0,	   0,	   0,	   0, \
-			0,	   0,	   0,	   0,	   0,	   0,	  80,	   0, \
-			0,	   0,	 185,	   0,	   0,	 125,	   0,	 351, \
-			0,	 346,	   0,	   0,	 211,	   0,	   0,	   0, \
-			0,	   0,	   0,	   0,	   0,	   0,	   0,	 125, \
-			0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
-			0,	   0,	 303,	   0,	 210,	 526,	   0,	   0, \
-			0,	   0,	   0,	   0,	 216,	 185,	   0,	   0, \
-			0,	   0,	   0,	 303,	 185,	 216,	 185,	   0, \
-			0,	 194,	   0,	   0,	   0,	   0,	   0,	   0, \
-			0,	   0,	   0,	   0,	   0,	   0,	 216,	   0, \
-			0,	 211,	 211,	   0,	 220,	   0,	 389,	 216, \
-			0,	   0,	   0,	 220,	   0,	   0,	   0,	   0, \
-			0,	 220,	   0,	   0,	 189,	  89,	   0,	 220, \
-			0,	  89,	  89,	  89,	  89,	  89,	   0,	   0, \
-			408,	   0,	   0,	   0,	   0,	  89,	  89,	  89, \
-			0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
-			0,	 185,	   0,	   0,	   0,	 575,	   0,	 216, \
-			0,	   0,	 185,	   0,	  89,	   0,	   0,	   0, \
-			0,	   0,	 220,	 220,	   0,	   0,	   0,	   0, \
-			0,	   0,	  89,	  89,	   0,	 303,	 219,	   0, \
-			0,	 231,	   0,	 268,	 268,	 120,	 597,	 220, \
-			0,	   0,	   0,	   0,	 260,	   0,	 319,	 268, \
-			0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
-			0,	   0,	 185,	 185,	  89,	 185,	  89,	   0, \
-			0,	 598,	 291,	   0,	   0,	   0,	   0,	   0, \
-			0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
-			198,	   0,	   0,	   0,	   0,	 216,	 260,	   0, \
-			0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
-			0,	   0,	   0,	   0,	   0,	   0,	  89,	   0, \
-			0,	   0,	   0,	   0,	   0,	 256,	   0,	   0, \
-			0,	   0,	   0,	 185,	   0,	   0,	   0,	   0, \
-			0,	  89,	   0,	   0,	   0,	   0,	   0,	   0, \
-			216,	   0,	   0,	   0,	  89,	   0,	 389,	   0, \
-			0,	   0,	   0,	 408,	   0,	   0,	   0,	   0, \
-			0,	   0,	   0,	   0,	   0,	   0,	 408,	 256, \
-			0,	   0,	   0,	   0,	   0,	 408,	   0,	   0, \
-			0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
-			0,	   0,	 260,	   0,	  89,	  89,	   0,	   0, \
-			0,	  89,	   0,	   0,	  89,	   0,	  89,	 231, \
-			0,	 219,	  89,	 219,	   0,	 268,	   0,	 211, \
-			219,	 220,	   5,	   0,	   0,	   0,	 219,	 159, \
-			0,	   0,	 268,	   0,	 231,	   0,	 268,	 166, \
-			167,	 169,	 170,	   0,	   0,	   0,	   0,	 260, \
-			0,	   0,	 260,	   0,	   0,	   0,	 185,	   0, \
-			174,	 175,	 176,	   0,	   0,	   0,	   0,	   0, \
-			260,	 260,	 260,	 256,	   0,	   0,	 260,	   0, \
-			0,	   0,	 203,	   0,	   0,	   0,	   0,	 219, \
-			219,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
-			0,	   0,	   0,	   0,	 233,	   0,	 234,	 235, \
-			236,	   0,	   0,	   0,	 219,	 389,	 408,	   0, \
-			0,	 270,	   0,	   0,	 408,	   0,	   0,	   0, \
-			256,	   0,	 138,	 256,	   0,	   0,	   0,	   0, \
-			0,	 293,	   0,	 294,	   0,	   0,	   0,	   0, \
-			301,	 256,	 256,	 256,	   0,	   0,	   0,	 256, \
-			268,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
-			321,	 268,	 322,	   0,	   0,	 325,	   0,	 326, \
-			0,	   0,	   0,	   0,	 408,	   0,	   0,	   0, \
-			0,	   0,	   0,	   0,	   0,	   0,	 341,	   0, \
-			343,	   0,	   0,	   0,	 268,	 268,	 268,	   0, \
-			352,	 353,	   0,	   0,	   0,	   0,	 356,	   0, \
-			0,	   0,	 251,	   0,	 110,	   0,	   0,	   0, \
-			0,	   0,	   0,	 219,	   0,	   0,	   0,	   0, \
-			0,	   0,	   0,	   0,	   0,	 260,	   0,	   0, \
-			0,	 260,	   0,	   0,	 260,	   0,	   0,	   0, \
-			260,	 260,	 260,	 260,	   0,	 260,	 260,	   0, \
-			190,	  59,	   0,	 260,	 251,	  59,	  59,	  59, \
-			59,	  59,	   0,	   0,	   0,	   0,	   0,	   0, \
-			0,	  59,	  59,	  59,	   0,	   0,	   0,	   0, \
-			136,	   0,	   0,	 393,	  89,	   0,	 219,	 395, \
-			0,	 396,	   0,	   0,	 261,	   0,	   0,	   0, \
-			59,	 398,	   0,	   0,	   0,	   0,	 256,	   0, \
-			0,	   0,	 256,	   0,	   0,	 256,	  59,	   0, \
-			0,	 256,	 256,	 256,	 256,	   0,	 256,	 256, \
-			0,	 425,	   0,	   0,	 256,	   0,	   0,	   0, \
-			255,	   0,	   0,	   0,	   0,	   0,	 261,	 446, \
-			0,	   0,	   0,	   0,	   0,	   0,	 454,	 455, \
-			251,	 456,	   0,	   0,	 457,	   0,	   0,	   0, \
-			264,	   0,	   0,	 463,	   0,	   0,	 466,	 467, \
-			0,	   0,	 219,	   0,	   0,	   0,	 260,	 470, \
-			260,	 317,	 255,	   0,	   0,	   0,	   0,	 260, \
-			0,	   0,	 317,	   0,	   0,	   0,	   0,	   0, \
-			0,	   0,	  59,	 251,	 260,	 493,	   0,	   0, \
-			251,	 251,	 264,	 498,	   0,	   0,	 251,	   0, \
-			0,	 251,	   0,	   0,	   0,	   0,	 251,	   0, \
-			0,	   0,	   0,	   0,	 251,	   0,	 511,	   0, \
-			59,	 339,	 261,	   0,	   0,	   0,	   0,	   0, \
-			0,	 339,	 339,	   0,	 264,	   0,	   0,	 256, \
-			0,	 256,	   0,	   0,	   0,	   0,	 317,	   0, \
-			256,	   0,	   0,	 521,	   0,	   0,	   0,	   0, \
-			0,	   0,	   0,	   0,	 144,	 256,	 255,	   0, \
-			59,	  59,	   0,	   0,	 528,	  59,	   0,	 261, \
-			59,	 251,	 261,	   0,	   0,	   0,	  59,	   0, \
-			0,	   0,	   0,	   0,	   0,	   0,	 264,	   0, \
-			261,	 261,	 261,	   0,	   0,	   0,	 261,	   0, \
-			0,	   0,	   0,	   0,	 556,	   0,	   0,	 557, \
-			0,	   0,	 558,	 255,	   0,	 559,	 255,	   0, \
-			0,	   0,	   0,	 563,	   0,	   0,	   0,	   0, \
-			0,	   0,	   0,	   0,	 255,	 255,	 255,	 570, \
-			0,	 264,	 255,	   0,	 263,	 251,	 264,	 264, \
-			0,	   0,	   0,	 572,	 264,	   0,	   0,	 264, \
-			0,	   0,	   0,	   0,	 264,	   0,	 576,	   0, \
-			264,	 264,	 264,	 251,	   0,	   0,	   0,	   0, \
-			0,	 251,	 251,	 251,	 251,	   0,	 251,	   0, \
-			580,	   0,	   0,	   0,	 582,	   0,	 263,	 583, \
-			0,	 251,	   0,	 317,	 317,	   0,	   0,	 251, \
-			0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
-			0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
-			0,	 587,	   0,	   0,	   0,	   0,	   0,	 264, \
-			263,	   0,	   0,	   0,	   0,	   0,	 593,	   0, \
-			0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
-			339,	   0,	   0,	   0,	 339,	 261,	   0,	   0, \
-			0,	 261,	   0,	 339,	 261,	   0,	   0,	   0, \
-			261,	 261,	 261,	 261,	   0,	 261,	 261,	   0, \
-			0,	   0,	   0,	 261,	   0,	   0,	   0,	   0, \
-			0,	   0,	 263,	   0,	   0,	   0,	   0,	   0, \
-			0,	 255,	   0,	 264,	   0,	 255,	   0,	   0, \
-			255,	   0,	   0,	   0,	 255,	 255,	 255,	 255, \
-			0,	 255,	 255,	   0,	 251,	   0,	 251,	 255, \
-			0,	 264,	   0,	   0,	   0,	 251,	   0,	 264, \
-			264,	 264,	 264,	   0,	 264,	 263,	   0,	   0, \
-			0,	   0,	 263,	 263,	   0,	   0,	   0,	 264, \
-			263,	   0,	   0,	 263,	   0,	 264,	   0,	   0, \
-			263,	   0,	   0,	   0,	 263,	 263,	 263,	 103, \
-			0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
-			0,	   0,	   0,	   0,	   0,	   0,	   0,	 317, \
-			188,	  57,	   0,	   0,	   0,	  57,	  57,	  57, \
-			57,	  57,	   0,	   0,	   0,	   0,	 261,	   0, \
-			261,	  57,	  57,	  57,	   0,	   0,	 180,	 261, \
-			192,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
-			0,	   0,	   0,	 263,	 261,	   0,	   0,	   0, \
-			57,	 218,	   0,	 221,	   0,	   0,	   0,	   0, \
-			0,	   0,	 255,	   0,	 255,	   0,	  57,	 212, \
-			0,	   0,	 212,	 255,	   0,	 212,	   0,	 271, \
-			0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
-			255,	   0,	 264,	   0,	 264,	   0,	   0,	   0, \
-			0,	   0,	   0,	 264,	   0,	   0,	   0,	 264, \
-			212,	   0,	 212,	   0,	   0,	   0,	   0,	 263, \
-			316,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
-			0,	 316,	   0,	   0,	   0,	   0,	   0,	   0, \
-			0,	   0,	   0,	   0,	   0,	 263,	   0,	   0, \
-			0,	   0,	 340,	 263,	 263,	 263,	 263,	   0, \
-			263,	   0,	  57,	   0,	   0,	   0,	   0,	   0, \
-			0,	   0,	   0,	 263,	   0,	   0,	   0,	   0, \
-			0,	 263,	   0,	   0,	   0,	 212,	   0,	   0, \
-			0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
-			57,	   0,	   0,	   0,	   0,	 316,	   0,	   0, \
-			0,	   0,	   0,	   0,	 218,	   0,	 221,	   0, \
-			0,	 372,	   0,	   0,	   0,	   0,	   0,	   0, \
-			0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
-			0,	   0,	   0,	   0,	 218,	   0,	   0,	   0, \
-			57,	  57,	   0,	   0,	   0,	  57,	   0,	   0, \
-			57,	   0,	 212,	 212,	   0,	 212,	  57,	 390, \
-			0,	   0,	   0,	   0,	 212,	   0,	   0,	   0, \
-			0,	   0,	 212,	   0,	   0,	   0,	   0,	   0, \
-			212,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
-			0,	 420,	   0,	   0,	   0,	   0,	 263,	   0, \
-			263,	   0,	 429,	   0,	   0,	   0,	   0,	 263, \
-			0,	   0,	   0,	 263,	   0,	   0,	   0,	   0, \
-			0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
-			0,	   0,	   0,	 212,	 212,	   0,	   0,	   0, \
-			0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
-			0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
-			212,	   0,	 316,	 316,	   0,	 480,	   0,	   0, \
-			0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
-			0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
-			0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
-			0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
-			0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
-			0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
-			0,	   0,	   0,	 515,	   0,	   0,	   0,	   0, \
-			0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
-			0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
-			0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
-			0,	   0,	   0,	   0,	   0,	   0,	   0,	 390, \
-			0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
-			0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
-			0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
-			0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
-			0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
-			0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
-			0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
-			212,	   0,	 212,	   0,	   0,	   0,	   0,	   0, \
-			0,	   0,	   0,	   0,	   0,	   0,	 316,	   0, \
-			0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
-			0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
-			0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
-			0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
-			0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
-			0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
-			0,	   0,	   0,	   0,	   0,	   0,	   0,	   0, \
-			0,	   0,	   0,	   0,	   0,	   0,	 390, \
-		)
-		_YYPACT = (
-			-504,   -1000,	-413,   -1000,	-400,	-314,	-314,	-504, \
-			-217,   -1000,	-387,	-387,	 165,	  47,	 165,	 165, \
-			-217,	-217,	 203,   -1000,   -1000,   -1000,   -1000,   -1000, \
-			-1000,   -1000,   -1000,   -1000,   -1000,	 165,	 165,	-473, \
-			-1000,	-515,	-517,   -1000,   -1000,   -1000,	 412,	-504, \
-			759,	1079,	-663,   -1000,	-560,   -1000,	-380,	 165, \
-			-1000,   -1000,	-936,	-518,   -1000,	-217,	 571,	 153, \
-			-1000,	-448,   -1000,	1179,	-144,	-581,   -1000,   -1000, \
-			-1000,	 165,   -1000,	 165,	 165,	 165,	-207,	1290, \
-			-1000,   -1000,	1258,	1258,   -1000,   -1000,	 165,	 545, \
-			-1000,   -1000,   -1000,   -1000,   -1000,   -1000,	1258,	 759, \
-			-963,	 759,   -1000,	-908,	1404,	1258,	 165,   -1000, \
-			165,   -1000,   -1000,	-947,	-909,	 165,   -1000,	1211, \
-			-1000,   -1000,	-470,   -1000,   -1000,	 379,	1355,   -1000, \
-			847,	1290,   -1000,   -1000,	-921,	 165,   -1000,	 165, \
-			-207,	 991,	 165,   -1000,	 165,   -1000,   -1000,   -1000, \
-			-1000,	-504,	-998,	-658,	-661,	-656,	-362,   -1000, \
-			784,   -1000,	 545,	 165,	-386,	 165,   -1000,	 784, \
-			696,	 -54,	1079,	-486,	 324,	 165,	 165,   -1000, \
-			-1000,   -1000,	-545,	 -50,   -1000,   -1000,   -1000,	-314, \
-			-1000,   -1000,   -1000,   -1000,   -1000,	-387,   -1000,   -1000, \
-			-1000,   -1000,   -1000,   -1000,   -1000,   -1000,   -1000,   -1000, \
-			-1000,   -1000,   -1000,   -1000,	 -89,	-293,	 -89,	-106, \
-			-1000,	 659,   -1000,   -1000,	 545,	1079,	1179,	-188, \
-			-206,	 479,	 659,	1281,	-203,	1290,	-203,	 203, \
-			203,   -1000,   -1000,   -1000,	 203,   -1000,	-196,	 203, \
-			-1000,	 759,	 291,	 618,	-448,	 203,	-448,   -1000, \
-			-516,   -1000,   -1000,	-448,	 618,	-183,   -1000,   -1000, \
-			165,	-448,   -1000,   -1000,	 165,   -1000,	 165,	1050, \
-			-470,   -1000,   -1000,   -1000,   -1000,   -1000,	 165,   -1000, \
-			848,   -1000,	-357,	-391,   -1000,	-275,	 429,	-908, \
-			-1000,   -1000,   -1000,	 429,	-909,   -1000,	 429,   -1000, \
-			-207,	 545,	1079,	1332,	-357,	-357,	 165,	-486, \
-			-486,	1290,	 545,	-384,	-896,	 -41,   -1000,	-136, \
-			-122,	-160,	-448,	-448,	 165,	-970,	-970,	-970, \
-			1079,	1079,	1079,	 165,	 165,   -1000,	 165,   -1000, \
-			-1000,	 165,   -1000,	1258,	1120,   -1000,   -1000,	-448, \
-			165,	1079,	1079,	 165,	 165,   -1000,   -1000,	1211, \
-			-1000,	-581,	 784,	-921,	 165,	-187,	1422,   -1000, \
-			-183,   -1000,	-293,	   6,	-470,	1050,	 244,	 784, \
-			784,   -1000,   -1000,   -1000,	-183,   -1000,   -1000,	-171, \
-			784,	 784,	 165,	-666,   -1000,	-494,	 784,	 696, \
-			165,   -1000,   -1000,	 696,	-970,   -1000,   -1000,   -1000, \
-			92,   -1000,	 -80,   -1000,	-200,   -1000,	-181,	-531, \
-			-1000,   -1000,   -1000,	 165,   -1000,   -1000,   -1000,	-197, \
-			-106,   -1000,	-197,   -1000,	-970,   -1000,   -1000,   -1000, \
-			-1000,   -1000,   -1000,	 545,	-206,   -1000,	-206,   -1000, \
-			-1000,   -1000,	 -79,   -1000,   -1000,   -1000,   -1000,   -1000, \
-			165,   -1000,	-196,	-196,	-170,	-525,	-502,   -1000, \
-			-470,   -1000,   -1000,   -1000,   -1000,   -1000,   -1000,   -1000, \
-			-275,	 165,   -1000,   -1000,	-357,   -1000,	 429,	1198, \
-			429,	 429,   -1000,	-275,	-357,	-357,	-357,	-970, \
-			-357,	-357,	-239,   -1000,	-214,	-214,	1225,	-970, \
-			-187,   -1000,   -1000,   -1000,	 317,	-214,   -1000,   -1000, \
-			-125,	 165,   -1000,   -1000,	 165,   -1000,   -1000,	 165, \
-			-1000,   -1000,	 165,   -1000,	-170,	1211,   -1000,	 759, \
-			165,	-448,	1079,	-170,	-170,   -1000,   -1000,   -1000, \
-			-1000,   -1000,	1120,	-885,	 165,   -1000,	1211,   -1000, \
-			-1000,   -1000,   -1000,   -1000,   -1000,   -1000,   -1000,   -1000, \
-			165,   -1000,	-187,   -1000,   -1000,   -1000,	-293,	-581, \
-			-470,   -1000,   -1000,	 165,   -1000,   -1000,	  92,   -1000, \
-			-1000,   -1000,   -1000,   -1000,   -1000,   -1000,	-662,   -1000, \
-			-1000,   -1000,   -1000,	 784,   -1000,	 165,   -1000,   -1000, \
-			-628,	 165,   -1000,   -1000,	 165,   -1000,   -1000,   -1000, \
-			-1000,   -1000,   -1000,	-206,   -1000,   -1000,   -1000,   -1000, \
-			-1000,   -1000,   -1000,   -1000,   -1000,	-502,	-581,   -1000, \
-			-1000,	-138,   -1000,	-275,   -1000,   -1000,	 165,   -1000, \
-			-1000,	-239,	1198,	-170,	-170,   -1000,	  55,   -1000, \
-			-1000,   -1000,   -1000,	 165,   -1000,   -1000,   -1000,	-357, \
-			-1000,   -1000,   -1000,   -1000,   -1000,   -1000,   -1000,   -1000, \
-			1211,   -1000,   -1000,   -1000,   -1000,   -1000,   -1000,   -1000, \
-			-970,	1258,   -1000,   -1000,   -1000,   -1000,   -1000,	-581, \
-			-1000,   -1000,   -1000,   -1000,   -1000,   -1000,   -1000,   -1000, \
-			-1000,	-921,   -1000,   -1000,   -1000,   -1000,   -1000,   -1000, \
-			-1000,   -1000,   -1000,   -1000,	1258,	1120,	1120,   -1000, \
-			-1000, \
-		)
-		_YYPGO = (
-				 0,	 598,	 977,	 935,	 594,	2698,	 214,	2242, \
-				1374,	 220,	 189,	 234,	 261,	 725,	 593,	 543, \
-				579,	 576,	 571,	 221,	 634,	2247,	 232,	3376, \
-				194,	2896,	1972,	 181,	2028,	 170,	 175,	 654, \
-				568,	 561,	 558,	 546,	 518,	 512,	 507,	3359, \
-				299,	2001,	 165,	 490,	 819,	 836,	 449,	1069, \
-				188,	2476,	 793,	 424,	 394,	 378,	1162,	  91, \
-				238,	 157,	 377,	 624,	 873,	 372,	 364,	 362, \
-				360,	 787,	 100,	 160,	 356,	 211,	 927,	 511, \
-				153,	 159,	 209,	 351,	 347,	1174,	2860,	 140, \
-				346,	 637,	 343,	 342,	 339,	 182,	 268,	 337, \
-				333,	1004,	 172,	 551,	 331,	 569,	 328,	 201, \
-				323,	 319,	 180,	2920,	2786,	 141,	 318,	 883, \
-				314,	3092,	 306,	 821,	 305,	 302,	 164,	 208, \
-				355,	 200,	 298,	  87,	1005,	 256,	  90,	 301, \
-				249,	  88,	 230,	 205,	  89,	 152,	 295,	 474, \
-				78,	2541,	 294,	 289,	 284,	 212,	 192,	 275, \
-				198,	 199,	 274,	 156,	 263,	 262,	 259,	 246, \
-				236,	 235,	 136,	 223,	 222,	 207,	 168, \
-			)
-		_YYR1 = (
-				 0,	   1,	   2,	   2,	   2,	   2,	   2,	   2, \
-				 3,	   3,	   8,	   8,	   8,	   8,	  12,	  12, \
-				13,	  13,	  14,	  14,	  14,	  15,	  15,	  15, \
-				16,	  16,	  16,	  16,	  17,	  17,	  17,	  17, \
-				17,	  17,	  17,	  17,	  17,	  17,	  20,	  20, \
-				 5,	   5,	  32,	  32,	  32,	  32,	  32,	  35, \
-				35,	  35,	  35,	  35,	  33,	  33,	  33,	  33, \
-				33,	  33,	  33,	  34,	  31,	  31,	  48,	  48, \
-				48,	  51,	  51,	  47,	  47,	  52,	  52,	  56, \
-				56,	  57,	  57,	  59,	  59,	  59,	  55,	  55, \
-				26,	  26,	  60,	  60,	  60,	  60,	  61,	  61, \
-				62,	  62,	  41,	  41,	  41,	  68,	  68,	  71, \
-				71,	  71,	  72,	  72,	  75,	  75,	  75,	  75, \
-				76,	  76,	  77,	  77,	  77,	  77,	  77,	  77, \
-				77,	  83,	  83,	  85,	  85,	  85,	  85,	  45, \
-				45,	  45,	  45,	  45,	  28,	  28,	  86,	  86, \
-				39,	  39,	  89,	  89,	  90,	  90,	  91,	  91, \
-				93,	  93,	  93,	  94,	  94,	  94,	  95,	  95, \
-				95,	  95,	  98,	  97,	  97,	 101,	 101,	 103, \
-				103,	 103,	 103,	 103,	 103,	 103,	 103,	 103, \
-				103,	  30,	  30,	  29,	  29,	  25,	  25,	  81, \
-				81,	  81,	 115,	 115,	 118,	 118,	 118,	 120, \
-				120,	 117,	 122,	 122,	 116,	 116,	 116,	 123, \
-				123,	 124,	 124,	 107,	 107,	 107,	 107,	 107, \
-				107,	 119,	 119,	 119,	 126,	 126,	 127,	 127, \
-				127,	 128,	 128,	 128,	 128,	 128,	 128,	 128, \
-				80,	  80,	  80,	   6,	   6,	 130,	 130,	 104, \
-				104,	 131,	 131,	 131,	 131,	  11,	  11,	  11, \
-				 4,	   4,	 133,	 133,	 134,	 134,	 134,	 134, \
-				134,	 134,	 134,	  43,	  43,	  43,	 135,	 135, \
-				136,	 136,	  67,	  67,	  67,	   7,	   7,	   7, \
-				 7,	 108,	 108,	 139,	 139,	 139,	 139,	  84, \
-				84,	 140,	 140,	 140,	 140,	 141,	 142,	 143, \
-				38,	  38,	  92,	  92,	 102,	 102,	  23,	  23, \
-				18,	  18,	 144,	 144,	  65,	  65,	  65,	  42, \
-				42,	 121,	 121,	 121,	 109,	 109,	 109,	  19, \
-				19,	  19,	  27,	  27,	  27,	  44,	  44,	 145, \
-				145,	 145,	  40,	  40,	  66,	  66,	  66,	 112, \
-				112,	 112,	 146,	 146,	  79,	  79,	  79,	  87, \
-				87,	  87,	 106,	 106,	 106,	  54,	  54,	  54, \
-				110,	 110,	 110,	  46,	  46,	  88,	  88,	  88, \
-				113,	 114,	 114,	 114,	  82,	  82,	  82,	 125, \
-				125,	 125,	 147,	 147,	 105,	 105,	 148,	 148, \
-				99,	  99,	  78,	  78,	  78,	  36,	  36,	  36, \
-				64,	  64,	  21,	  21,	  37,	  22,	  22,	  73, \
-				73,	  69,	  69,	 138,	 137,	  49,	  49,	 100, \
-				100,	 149,	 149,	  63,	  63,	  10,	  10,	 111, \
-				58,	  58,	  53,	  53,	 150,	 150,	 150,	  50, \
-				50,	 129,	  24,	  24,	   9,	   9,	  96,	  96, \
-				74,	  74,	  70,	  70,	 132, \
-			)
-		_YYR2 = (
-			0,	   2,	   1,	   2,	   2,	   2,	   3,	   2, \
-			2,	   1,	   2,	   2,	   2,	   1,	   1,	   0, \
-			1,	   3,	   1,	   3,	   2,	   1,	   3,	   2, \
-			1,	   3,	   4,	   4,	   1,	   1,	   1,	   1, \
-			2,	   1,	   1,	   1,	   1,	   1,	   2,	   3, \
-			1,	   2,	   1,	   1,	   1,	   1,	   1,	   3, \
-			3,	   4,	   5,	   4,	   3,	   4,	   4,	   3, \
-			4,	   3,	   2,	   3,	   1,	   1,	   4,	   2, \
-			1,	   3,	   2,	   1,	   5,	   1,	   4,	   1, \
-			4,	   1,	   2,	   4,	   4,	   2,	   2,	   1, \
-			1,	   2,	   1,	   1,	   1,	   1,	   2,	   2, \
-			7,	   6,	   1,	   4,	   4,	   1,	   3,	   1, \
-			3,	   3,	   1,	   4,	   1,	   2,	   3,	   4, \
-			1,	   2,	   3,	   4,	   1,	   2,	   3,	   1, \
-			1,	   3,	   3,	   1,	   2,	   2,	   3,	   1, \
-			2,	   2,	   3,	   2,	   1,	   3,	   3,	   3, \
-			2,	   1,	   1,	   2,	   1,	   3,	   1,	   2, \
-			1,	   3,	   4,	   1,	   3,	   3,	   1,	   3, \
-			1,	   2,	   4,	   1,	   3,	   1,	   2,	   1, \
-			3,	   2,	   3,	   2,	   3,	   4,	   2,	   2, \
-			3,	   3,	   4,	   2,	   3,	   2,	   3,	   1, \
-			3,	   2,	   1,	   4,	   1,	   3,	   4,	   1, \
-			2,	   3,	   1,	   1,	   1,	   3,	   4,	   1, \
-			4,	   1,	   3,	   1,	   2,	   2,	   2,	   3, \
-			3,	   1,	   4,	   4,	   1,	   3,	   1,	   3, \
-			3,	   1,	   2,	   3,	   3,	   3,	   4,	   3, \
-			1,	   2,	   2,	   1,	   2,	   1,	   2,	   1, \
-			2,	   1,	   1,	   1,	   2,	   1,	   2,	   2, \
-			1,	   2,	   1,	   2,	   1,	   1,	   2,	   2, \
-			1,	   1,	   1,	   1,	   1,	   2,	   1,	   2, \
-			1,	   2,	   1,	   1,	   2,	   1,	   2,	   1, \
-			2,	   1,	   3,	   1,	   2,	   2,	   3,	   1, \
-			2,	   1,	   1,	   1,	   3,	   4,	   2,	   3, \
-			1,	   2,	   1,	   2,	   1,	   2,	   1,	   2, \
-			1,	   2,	   1,	   1,	   1,	   2,	   1,	   1, \
-			2,	   1,	   2,	   1,	   1,	   2,	   1,	   1, \
-			2,	   1,	   1,	   2,	   1,	   1,	   1,	   1, \
-			2,	   1,	   1,	   1,	   1,	   2,	   1,	   1, \
-			2,	   1,	   1,	   1,	   1,	   2,	   1,	   1, \
-			2,	   1,	   1,	   2,	   1,	   1,	   2,	   1, \
-			1,	   2,	   1,	   1,	   1,	   1,	   2,	   1, \
-			1,	   1,	   2,	   1,	   1,	   2,	   1,	   1, \
-			2,	   1,	   1,	   1,	   1,	   2,	   1,	   2, \
-			1,	   2,	   1,	   2,	   1,	   3,	   4,	   3, \
-			1,	   1,	   1,	   3,	   1,	   1,	   2,	   1, \
-			2,	   1,	   2,	   1,	   1,	   1,	   2,	   1, \
-			2,	   1,	   2,	   1,	   2,	   1,	   2,	   1, \
-			1,	   2,	   1,	   2,	   1,	   2,	   3,	   1, \
-			2,	   1,	   1,	   2,	   1,	   2,	   1,	   2, \
-			1,	   2,	   1,	   2,	   1, \
-		)
-		_YYCHK = (
-			-1000,	  -1,	  -2,	  -3,	  -4,	  -5,	  -6,	 581, \
-			-7,	  -8,	-133,	 535,	 -32,	-130,	-137,	-138, \
-			-9,	 -10,	 -11,	 -12,	-134,	 -33,	 -34,	 -35, \
-			-36,	 -37,	 517,	 930,	 925,	 995,	 955,	 584, \
-			-13,	 612,	 515,	 618,	 524,	 536,	 -43,	 606, \
-			-38,	 602,	 617,	 905,	 -14,	 525,	-135,	 597, \
-			-15,	-136,	 -16,	 519,	 -17,	 -18,	 -20,	 -21, \
-			-22,	 -23,	 -24,	 -25,	 -26,	 -28,	 -29,	 -30, \
-			-31,	 610,	-150,	 910,	 578,	 990,	-111,	-113, \
-			-60,	 -86,	 505,	 504,	 -47,	 -48,	 970,	 532, \
-			960,	 677,	 -41,	 -61,	 -62,	 -63,	 542,	 585, \
-			-52,	 -49,	 -51,	 -68,	 -64,	 587,	 950,	 -56, \
-			935,	 -71,	-148,	 -57,	 -72,	 527,	 -59,	 -39, \
-			-75,	 -89,	 -76,	 -90,	 -77,	 -91,	 -78,	 -80, \
-			558,	 566,	 -83,	 -84,	 -93,	 561,	-149,	 555, \
-			-129,	 562,	-140,	 -94,	 945,	 985,	-141,	-142, \
-			-143,	 571,	 -95,	 627,	 626,	 569,	 -97,	 -98, \
-			-99,	-101,	-100,	 583,	-103,	 940,	-104,	 551, \
-			-105,	 547,	 574,	 667,	-108,	-131,	 596,	-139, \
-			509,	-132,	 543,	 586,	1025,	 529,	  -3,	  -5, \
-			-3,	  -3,	  -2,	  -8,	-134,	-133,	  -5,	  -5, \
-			517,	  -5,	  -5,	  -8,	  -8,	 -12,	  -5,	  -5, \
-			-5,	 -11,	 581,	 581,	 -39,	 -28,	  -6,	 -41, \
-			-44,	 -21,	 526,	 256,	 -23,	 -49,	 -25,	  -2, \
-			-39,	 -26,	 -21,	 -41,	-111,	-113,	-129,	 -11, \
-			-9,	 525,	-136,	  -5,	 -10,	 581,	  -8,	 610, \
-			-31,	 -20,	 -26,	 -21,	 -23,	 610,	 551,	 -89, \
-			-7,	 -59,	 -39,	 -49,	 -21,	 -39,	 -77,	 -27, \
-			628,	 -42,	 -47,	 -60,	 614,	 256,	 520,	 -49, \
-			625,	  -5,	  -5,	  -5,	  -5,	-112,	 651,	 256, \
-			-81,	-115,	 655,	-118,	-119,	-116,	 673,	-126, \
-			-123,	-127,	-124,	-100,	-128,	-107,	 551,	 -25, \
-			-129,	 666,	 664,	 657,	 -49,	 -78,	 679,	-105, \
-			-99,	 662,	 665,	 -60,	 -21,	 -60,	  -5,	 -39, \
-			-60,	 -31,	 -53,	 -24,	 966,	 -48,	 -47,	 -41, \
-			-69,	 -70,	 -67,	 916,	1015,	 -22,	-137,	 -65, \
-			-41,	 556,	 256,	 -49,	 -26,	  -5,	  -5,	 -58, \
-			965,	 -73,	 -74,	 915,	1010,	  -5,	 -55,	 -26, \
-			-27,	 -28,	 -92,	 -93,	 518,	 -41,	 -28,	  -6, \
-			-85,	 -45,	 -28,	 -77,	 -39,	 -25,	 -81,	  -7, \
-			-70,	  -5,	  -5,	-112,	 -85,	  -5,	  -5,	  -2, \
-			-96,	 -74,	1005,	 698,	 698,	 697,	 508,	-102, \
-			516,	 -98,	-103,	 -99,	 -39,	  -5,	 -30,	  -5, \
-			-91,	-103,	 -21,	-103,	 -41,	-107,	 -31,	  -7, \
-			-5,	  -5,	 593,	 581,	  -5,	  -3,	 -44,	 -28, \
-			-45,	 -44,	 -28,	 -44,	 -41,	 -46,	 607,	 256, \
-			-40,	 598,	 256,	 -42,	 -39,	 -40,	 -41,	-146, \
-			651,	 256,	 -81,	-146,	 -13,	 -15,	 -15,	 -19, \
-			611,	 256,	 -13,	 -13,	 -59,	 -21,	 -23,	-150, \
-			-65,	  -5,	 -47,	  -5,	  -5,	 -86,	  -5,	-114, \
-			-116,	 678,	 256,	-117,	-122,	-119,	 508,	-120, \
-			-7,	 -70,	-118,	-116,	 -69,	 -70,	 -67,	-123, \
-			-73,	 -74,	-116,	-112,	 -39,	 -41,	-120,	-119, \
-			-119,	  -5,	-107,	-107,	 -81,	 -39,	 -29,	-110, \
-			-29,	 506,	 256,	-145,	 531,	 256,	 -87,	 538, \
-			256,	 -88,	 557,	 256,	 -47,	 -56,	  -5,	 -50, \
-			980,	 -50,	 -50,	 -41,	 -41,	 -71,	  -5,	  -5, \
-			-5,	  -5,	 -26,	 -66,	 588,	 256,	 -56,	  -5, \
-			-71,	 -71,	  -5,	  -5,	 -27,	 -90,	  -5,	 -79, \
-			573,	 256,	 -41,	 -65,	 -45,	 -45,	 -28,	 -28, \
-			-39,	 -41,	 -82,	 568,	 256,	 -94,	 -91,	 -65, \
-			-144,	 567,	 256,	 -94,	 -94,	  -5,	 699,	 565, \
-			-95,	-101,	  -5,	 -50,	 -54,	 550,	 256,	-103, \
-			-106,	 575,	 256,	-109,	 552,	 256,	-139,	  -5, \
-			-44,	 -44,	 -44,	 -39,	 -40,	 -40,	-147,	 678, \
-			256,	  -5,	 -19,	 -19,	 -54,	 551,	 -28,	-115, \
-			-5,	-122,	-117,	-116,	-121,	-118,	 658,	 256, \
-			-123,	-116,	-120,	-119,	-119,	-127,	 -50,	-127, \
-			-127,	 -54,	-125,	 675,	 256,	-125,	-125,	 -50, \
-			-79,	-125,	-125,	-110,	  -5,	  -5,	  -5,	  -5, \
-			-54,	 -55,	 -31,	  -5,	 -57,	 -72,	 -54,	 -54, \
-			-66,	 -67,	  -5,	 -55,	  -5,	 -79,	 -45,	 -28, \
-			-5,	 -54,	 698,	 -95,	  -5,	 663,	  -5,	  -5, \
-			-40,	-116,	-115,	  -5,	 -54,	-121,	 -54,	 -54, \
-			-124,	  -5,	-128,	 -55,	 -50,	 -26,	 -26,	 -66, \
-			-66, \
-		)
-		_YYDEF = (
-			15,	  -2,	   0,	   2,	  15,	  15,	  15,	  15, \
-			15,	   9,	 224,	   0,	  40,	 211,	 245,	 247, \
-			15,	  15,	  15,	  13,	 226,	  42,	  43,	  44, \
-			45,	  46,	 213,	 364,	 363,	 388,	 373,	 221, \
-			14,	 228,	 229,	 232,	 233,	 234,	   0,	  15, \
-			 0,	   0,	   0,	 356,	  16,	 235,	 236,	 264, \
-			18,	 238,	  21,	 240,	  24,	  15,	  37,	 352, \
-			28,	  29,	  30,	  31,	   0,	  33,	  34,	  35, \
-			36,	 272,	 354,	 357,	 270,	 386,	   0,	   0, \
-			80,	 124,	   0,	   0,	  60,	  61,	 380,	   0, \
-			375,	 328,	  82,	  83,	  84,	  85,	   0,	   0, \
-			67,	   0,	  64,	  90,	   0,	   0,	 371,	  69, \
-			365,	  93,	 353,	  71,	  95,	 342,	  73,	   0, \
-			98,	 129,	 100,	 130,	 104,	 132,	   0,	 108, \
-			 0,	   0,	 111,	 112,	 134,	 346,	 348,	 208, \
-			 0,	   0,	 255,	 136,	 369,	 385,	 257,	 258, \
-			259,	  15,	 139,	   0,	   0,	   0,	 142,	 144, \
-			 0,	 147,	   0,	 344,	 149,	 367,	 151,	   0, \
-			 0,	   0,	   0,	   0,	   0,	 215,	 340,	 249, \
-			217,	 218,	 219,	 251,	 396,	   1,	   3,	  15, \
-			 4,	   5,	   7,	   8,	 227,	 225,	  41,	 212, \
-			214,	 246,	 248,	  10,	  11,	  12,	 389,	 374, \
-			222,	 223,	 230,	 231,	   0,	   0,	   0,	   0, \
-			58,	   0,	 293,	 294,	   0,	   0,	   0,	   0, \
-			 0,	   0,	 352,	   0,	   0,	   0,	   0,	   0, \
-			20,	 237,	 239,	 265,	  23,	 241,	   0,	   0, \
-			63,	   0,	   0,	 352,	   0,	   0,	   0,	 128, \
-			 0,	  77,	 131,	   0,	   0,	   0,	 105,	  32, \
-			38,	   0,	  66,	  81,	 290,	 292,	 279,	   0, \
-			 0,	 273,	 358,	 271,	 387,	 165,	 303,	 305, \
-			 0,	 167,	   0,	 170,	 172,	   0,	   0,	 193, \
-			180,	 196,	 183,	   0,	 198,	 185,	   0,	 201, \
-			 0,	   0,	   0,	   0,	   0,	   0,	 187,	   0, \
-			 0,	   0,	   0,	 163,	 352,	   0,	 381,	   0, \
-			 0,	   0,	   0,	   0,	 378,	   0,	   0,	  82, \
-			 0,	   0,	   0,	 361,	 394,	 242,	 243,	  86, \
-			87,	 276,	 278,	   0,	   0,	 372,	 366,	   0, \
-			376,	   0,	   0,	 359,	 392,	 343,	  74,	   0, \
-			79,	 101,	   0,	 135,	 266,	   0,	   0,	 109, \
-			 0,	 115,	   0,	   0,	 119,	   0,	   0,	   0, \
-			 0,	 347,	 209,	 210,	   0,	 256,	 370,	   0, \
-			 0,	   0,	 390,	   0,	 262,	   0,	   0,	   0, \
-			268,	 145,	 159,	   0,	   0,	 345,	 150,	 368, \
-			 0,	 153,	   0,	 155,	   0,	 158,	   0,	   0, \
-			216,	 341,	 220,	 252,	 253,	   6,	  52,	   0, \
-			 0,	  55,	   0,	  57,	   0,	  59,	 323,	 324, \
-			47,	 298,	 299,	   0,	   0,	  48,	   0,	 349, \
-			306,	 307,	   0,	 351,	  17,	  19,	  22,	  25, \
-			287,	 289,	   0,	   0,	   0,	   0,	   0,	 355, \
-			102,	  39,	  65,	 291,	 280,	 125,	 304,	 166, \
-			 0,	 329,	 331,	  -2,	   0,	 178,	   0,	   0, \
-			 0,	   0,	 175,	   0,	   0,	   0,	   0,	   0, \
-			 0,	   0,	   0,	 202,	   0,	   0,	   0,	   0, \
-			 0,	 188,	 189,	 190,	   0,	   0,	 164,	 161, \
-			 0,	 320,	 322,	 382,	 295,	 297,	 126,	 311, \
-			313,	 127,	 325,	 327,	   0,	   0,	 379,	   0, \
-			383,	   0,	   0,	   0,	   0,	  94,	 362,	 395, \
-			244,	 277,	   0,	   0,	 300,	 302,	   0,	 377, \
-			96,	  97,	 360,	 393,	  78,	 133,	 267,	 106, \
-			308,	 310,	   0,	 113,	 116,	 117,	   0,	 120, \
-			121,	 123,	 110,	 332,	 334,	 137,	   0,	 114, \
-			260,	 274,	 275,	 140,	 141,	 391,	   0,	 263, \
-			143,	 148,	 269,	   0,	 152,	 317,	 319,	 154, \
-			156,	 314,	 316,	 160,	 284,	 286,	 250,	 254, \
-			53,	  54,	  56,	   0,	  51,	  49,	 350,	 338, \
-			339,	 288,	  26,	  27,	  76,	   0,	 103,	 168, \
-			330,	   0,	 179,	   0,	 173,	 176,	 281,	 283, \
-			181,	   0,	   0,	   0,	   0,	 197,	   0,	 199, \
-			200,	 186,	 203,	 335,	 337,	 204,	 205,	   0, \
-			207,	 191,	 192,	 162,	 321,	 296,	 312,	 326, \
-			 0,	  70,	  62,	 384,	  75,	  99,	  91,	  92, \
-			 0,	   0,	 301,	  72,	 309,	 107,	 118,	 122, \
-			333,	 138,	 261,	 146,	 318,	 157,	 315,	 285, \
-			50,	 177,	 171,	 282,	 182,	 174,	 194,	 195, \
-			184,	 336,	 206,	  68,	   0,	   0,	   0,	  89, \
-			88, \
-		)
-
-		if not getattr(LojbanParser._yyparse, "_yyval", None):
-			LojbanParser._yyparse._yyval = None
-		# end if not getattr(LojbanParser._yyparse, "_yyval", None):
-		if not getattr(LojbanParser._yyparse, "_yyv", None):
-			LojbanParser._yyparse._yyv = [None] * _YYMAXDEPTH
-		# end if not getattr(LojbanParser._yyparse, "_yyv", None):
-		if not getattr(LojbanParser._yyparse, "_redseq", None):
-			LojbanParser._yyparse._redseq = [0] * _YYREDMAX
-		# end if not getattr(LojbanParser._yyparse, "_redseq", None):
-		if not getattr(LojbanParser._yyparse, "_redcnt", None):
-			LojbanParser._yyparse._redcnt = 0
-		# end if not getattr(LojbanParser._yyparse, "_redcnt", None):
-		if not getattr(LojbanParser._yyparse, "_pcyyerrct", None):
-			LojbanParser._yyparse._pcyyerrct = 0
-		# end if not getattr(LojbanParser._yyparse, "_pcyyerrct", None):
-		if not getattr(LojbanParser._yyparse, "_pcyyerrfl", None):
-			LojbanParser._yyparse._pcyyerrfl = False
-		# end if not getattr(LojbanParser._yyparse, "_pcyyerrfl", None):
-
-		statestack = [0] * _YYMAXDEPTH # state stack
+		yyexca = _YYEXCAMAP
+		yyact = _YYACT
+		yypact = _YYPACT
+		yypgo = _YYPGO
+		yyr1 = _YYR1
+		yyr2 = _YYR2
+		yychk = _YYCHK
+		yydef = _YYDEF
+
+		yyval = None
+		# the stacks start small and grow (doubling) up to _YYMAXDEPTH
+		yystacksize = min(_YYINITDEPTH, _YYMAXDEPTH)
+		yyv = [None] * yystacksize
+		redseq = [0] * _YYREDMAX if _YYTFLAG else None
+		redcnt = 0
+
+		statestack = [0] * yystacksize # state stack
 
 		tmpstate = 0;
 		self._pcyytoken = -1;
@@ -6791,7 +8834,7 @@ class LojbanParser:
 		pcyyerrfl = 0;
 		#// yyps = & statestack[-1];
 		yysidx = -1;
-		#// yypv = & LojbanParser._yyparse._yyv[-1];
+		#// yypv = & yyv[-1];
 		yyvidx = -1;
 
 		#// enstack: /* push stack */
@@ -6802,19 +8845,24 @@ class LojbanParser:
 				print("at state {:d}, next token {:d}".format( tmpstate, tmptoken));
 			# end if _YYDEBUG:
 			yysidx += 1;
-			if yysidx > _YYMAXDEPTH - 1:
-				self._yyerror("pcyacc internal stack overflow");
-				return True;
-			# end if yysidx > _YYMAXDEPTH - 1:
+			if yysidx == yystacksize:
+				if yysidx > _YYMAXDEPTH - 1:
+					self._yyerror("pcyacc internal stack overflow");
+					return True;
+				# end if yysidx > _YYMAXDEPTH - 1:
+				yystacksize = min(2 * yystacksize, _YYMAXDEPTH)
+				statestack.extend([0] * (yystacksize - yysidx))
+				yyv.extend([None] * (yystacksize - yysidx))
+			# end if yysidx == yystacksize:
 			statestack[yysidx] = tmpstate;
 			yyvidx += 1;
 			
-			LojbanParser._yyparse._yyv[yyvidx] = LojbanParser._yyparse._yyval;
+			yyv[yyvidx] = yyval;
 
 			loopnewstate = True;
 			while loopnewstate:
 				loopnewstate = False;
-				n = _YYPACT[tmpstate];
+				n = yypact[tmpstate];
 
 				if n > _PCYYFLAG:
 					if self._pcyytoken < 0:
@@ -6826,27 +8874,27 @@ class LojbanParser:
 					n += self._pcyytoken;
 
 					if n >= 0 and n < _YYLAST:
-						n = _YYACT[n];
-						if _YYCHK[n] == self._pcyytoken:
+						n = yyact[n];
+						if yychk[n] == self._pcyytoken:
 							# /* a shift */
 							if _YYDEBUG:
 								tmptoken = self._pcyytoken;
 							# end if _YYDEBUG:
 							self._pcyytoken = -1;
-							LojbanParser._yyparse._yyval = self._yylval;
+							yyval = self._yylval;
 							tmpstate = n;
 							if pcyyerrfl > 0:
 								pcyyerrfl -= 1
 							# end if pcyyerrfl > 0:
 							skipenstack = True;
 							#// goto enstack;
-						# end if _YYCHK[n] == self._pcyytoken:
+						# end if yychk[n] == self._pcyytoken:
 					# end if n >= 0 and n < _YYLAST:
 				# end if n > _PCYYFLAG:
 				if skipenstack:
 					break; #// newstate loop
 				# end if skipenstack:
-				n = _YYDEF[tmpstate];
+				n = yydef[tmpstate];
 				if n == -2:
 					if self._pcyytoken < 0:
 						self._pcyytoken = self._yylex();
@@ -6854,32 +8902,24 @@ class LojbanParser:
 							self._pcyytoken = 0;
 						# end if self._pcyytoken < 0:
 					# end if self._pcyytoken < 0:
-					yyxi = 0;
-					while(( _YYEXCA[yyxi] != (-1)) or (_YYEXCA[yyxi+1] != tmpstate)):
-						yyxi += 2;
-					# end while(( _YYEXCA[yyxi] != (-1)) or (_YYEXCA[yyxi+1] != tmpstate)):
-					yyxi += 2;
-					while ( _YYEXCA[yyxi] >= 0):
-						if _YYEXCA[yyxi] == self._pcyytoken:
-							break;
-						# end if _YYEXCA[yyxi] == self._pcyytoken:
-						yyxi += 2;
-					# end while ( _YYEXCA[yyxi] >= 0):
-					n = _YYEXCA[yyxi+1];
+					n = yyexca.get((tmpstate, self._pcyytoken));
+					if n is None:
+						n = yyexca[(tmpstate, -1)];
+					# end if n is None:
 
 					if (n < 0):
 						# /* an accept action */
 						if (_YYTFLAG):
 							try:
 								with open(_YYTFILEN, "w") as yytfilep:
-									for ti in range(LojbanParser._yyparse._redcnt - 1, -1, -1):
-										tj = svdprd[LojbanParser._yyparse._redseq[ti]];
+									for ti in range(redcnt - 1, -1, -1):
+										tj = svdprd[redseq[ti]];
 										while svdnams[tj] == "$EOP":
 											yytfilep.write("{:s} ".format(svdnams[tj]));
 											tj += 1
 										# end while svdnams[tj] == "$EOP":
 										yytfilep.write("\n");
-									# end for ti in range(LojbanParser._yyparse._redcnt - 1, -1, -1):
+									# end for ti in range(redcnt - 1, -1, -1):
 								# end with open(_YYTFILEN, "w") as yytfilep:
 							except Exception as e:
 								print("Can't open t file: {:s}".format(_YYTFILEN), file = sys.stderr);
@@ -6901,13 +8941,13 @@ class LojbanParser:
 						pcyyerrfl = 3;
 						# /* find a state for a legal shift action */
 						while (yysidx >= 0):
-							n = _YYPACT[statestack[yysidx]] + _YYERRCODE;
-							if (n >= 0 and n < _YYLAST and _YYCHK[_YYACT[n]] == _YYERRCODE):
-								tmpstate = _YYACT[n]; #/* simulate a shift of "error" */
+							n = yypact[statestack[yysidx]] + _YYERRCODE;
+							if (n >= 0 and n < _YYLAST and yychk[yyact[n]] == _YYERRCODE):
+								tmpstate = yyact[n]; #/* simulate a shift of "error" */
 								skipenstack = True;
 								break; #// while (yyps >= statestack)
-							# end if (n >= 0 and n < _YYLAST and _YYCHK[_YYACT[n]] == _YYERRCODE):
-							n = _YYPACT[statestack[yysidx]];
+							# end if (n >= 0 and n < _YYLAST and yychk[yyact[n]] == _YYERRCODE):
+							n = yypact[statestack[yysidx]];
 
 							# /* the current yyps has no shift on "error", pop stack */
 							if _YYDEBUG:
@@ -6921,14 +8961,14 @@ class LojbanParser:
 							if (_YYTFLAG):
 								try:
 									with open(_YYTFILEN, "w") as yytfilep:
-										for ti in range(LojbanParser._yyparse._redcnt - 1, -1, -1):
-											tj = svdprd[LojbanParser._yyparse._redseq[ti]];
+										for ti in range(redcnt - 1, -1, -1):
+											tj = svdprd[redseq[ti]];
 											while svdnams[tj] == "$EOP":
 												yytfilep.write("{:s} ".format(svdnams[tj]));
 												tj += 1
 											# end while svdnams[tj] == "$EOP":
 											yytfilep.write("\n");
-										# end for ti in range(LojbanParser._yyparse._redcnt - 1, -1, -1):
+										# end for ti in range(redcnt - 1, -1, -1):
 									# end with open(_YYTFILEN, "w") as yytfilep:
 								except Exception as e:
 									print("Can't open t file: {:s}".format(_YYTFILEN), file = sys.stderr);
@@ -6946,14 +8986,14 @@ class LojbanParser:
 							if (_YYTFLAG):
 								try:
 									with open(_YYTFILEN, "w") as yytfilep:
-										for ti in range(LojbanParser._yyparse._redcnt - 1, -1, -1):
-											tj = svdprd[LojbanParser._yyparse._redseq[ti]];
+										for ti in range(redcnt - 1, -1, -1):
+											tj = svdprd[redseq[ti]];
 											while svdnams[tj] == "$EOP":
 												yytfilep.write("{:s} ".format(svdnams[tj]));
 												tj += 1
 											# end while svdnams[tj] == "$EOP":
 											yytfilep.write("\n");
-										# end for ti in range(LojbanParser._yyparse._redcnt - 1, -1, -1):
+										# end for ti in range(redcnt - 1, -1, -1):
 									# end with open(_YYTFILEN, "w") as yytfilep:
 								except Exception as e:
 									print("Can't open t file: {:s}".format(_YYTFILEN), file = sys.stderr);
@@ -6973,847 +9013,109 @@ class LojbanParser:
 				if _YYDEBUG:
 					print("reduce with rule {:d}".format(n));
 				# end if _YYDEBUG:
-				if _YYTFLAG and LojbanParser._yyparse._redcnt < _YYREDMAX:
-					LojbanParser._yyparse._redseq[LojbanParser._yyparse._redcnt] = n;
-					LojbanParser._yyparse._redcnt += 1
-				# end if _YYTFLAG and LojbanParser._yyparse._redcnt < _YYREDMAX:
-				yysidx -= _YYR2[n];
+				if _YYTFLAG and redcnt < _YYREDMAX:
+					redseq[redcnt] = n;
+					redcnt += 1
+				# end if _YYTFLAG and redcnt < _YYREDMAX:
+				yysidx -= yyr2[n];
 				yyvtidx = yyvidx;
-				yyvidx -= _YYR2[n];
+				yyvidx -= yyr2[n];
 				
-				LojbanParser._yyparse._yyval = LojbanParser._yyparse._yyv[yyvidx+1];
+				yyval = yyv[yyvidx+1];
 
 				m = n;
 				# /* find next state from goto table */
-				n = _YYR1[n];
-				j = _YYPGO[n] + statestack[yysidx] + 1;
+				n = yyr1[n];
+				j = yypgo[n] + statestack[yysidx] + 1;
 	
 				if j < _YYLAST:
-					tmpstate = _YYACT[j];   
+					tmpstate = yyact[j];   
 				# end if j < _YYLAST:
-				if (j >= _YYLAST or _YYCHK[_YYACT[j]] != -n):
-					tmpstate = _YYACT[_YYPGO[n]];
-				# end if (j >= _YYLAST or _YYCHK[_YYACT[j]] != -n):
-				if m == 1:
-					LojbanParser._yyparse._yyval = self._toplevel(LojbanParser._yyparse._yyv[yyvtidx -1]);
-				elif m == 2:
-					LojbanParser._yyparse._yyval = self._node(10000, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 3:
-					LojbanParser._yyparse._yyval = self._node(10000, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 4:
-					LojbanParser._yyparse._yyval = self._node(10000, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 5:
-					LojbanParser._yyparse._yyval = self._node(10000, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 6:
-					LojbanParser._yyparse._yyval = self._node(10000, LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 7:
-					LojbanParser._yyparse._yyval = self._node(10000, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 8:
-					LojbanParser._yyparse._yyval = self._node(1, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 9:
-					LojbanParser._yyparse._yyval = self._node(1, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 10:
-					LojbanParser._yyparse._yyval = self._node(2, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 11:
-					LojbanParser._yyparse._yyval = self._node(2, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 12:
-					LojbanParser._yyparse._yyval = self._node(2, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 13:
-					LojbanParser._yyparse._yyval = self._node(2, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 14:
-					LojbanParser._yyparse._yyval = self._node(3, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 15:
-					LojbanParser._yyparse._yyval = self._elidable(Constants.FAhO_529);
-				elif m == 16:
-					LojbanParser._yyparse._yyval = self._node(4, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 17:
-					LojbanParser._yyparse._yyval = self._node(4, LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 18:
-					LojbanParser._yyparse._yyval = self._node(10, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 19:
-					LojbanParser._yyparse._yyval = self._node(10, LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 20:
-					LojbanParser._yyparse._yyval = self._node(10, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 21:
-					LojbanParser._yyparse._yyval = self._node(11, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 22:
-					LojbanParser._yyparse._yyval = self._node(11, LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 23:
-					LojbanParser._yyparse._yyval = self._node(11, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 24:
-					LojbanParser._yyparse._yyval = self._node(12, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 25:
-					LojbanParser._yyparse._yyval = self._node(12, LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 26:
-					LojbanParser._yyparse._yyval = self._node(12, LojbanParser._yyparse._yyv[yyvtidx -3], LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 27:
-					LojbanParser._yyparse._yyval = self._node(12, LojbanParser._yyparse._yyv[yyvtidx -3], LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 28:
-					LojbanParser._yyparse._yyval = self._node(20, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 29:
-					LojbanParser._yyparse._yyval = self._node(20, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 30:
-					LojbanParser._yyparse._yyval = self._node(20, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 31:
-					LojbanParser._yyparse._yyval = self._node(20, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 32:
-					LojbanParser._yyparse._yyval = self._node(20, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 33:
-					LojbanParser._yyparse._yyval = self._node(20, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 34:
-					LojbanParser._yyparse._yyval = self._node(20, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 35:
-					LojbanParser._yyparse._yyval = self._node(20, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 36:
-					LojbanParser._yyparse._yyval = self._node(20, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 37:
-					LojbanParser._yyparse._yyval = self._node(20, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 38:
-					LojbanParser._yyparse._yyval = self._node(30, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 39:
-					LojbanParser._yyparse._yyval = self._node(30, LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 40:
-					LojbanParser._yyparse._yyval = self._node(32, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 41:
-					LojbanParser._yyparse._yyval = self._node(32, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 42:
-					LojbanParser._yyparse._yyval = self._node(33, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 43:
-					LojbanParser._yyparse._yyval = self._node(33, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 44:
-					LojbanParser._yyparse._yyval = self._node(33, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 45:
-					LojbanParser._yyparse._yyval = self._node(33, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 46:
-					LojbanParser._yyparse._yyval = self._node(33, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 47:
-					LojbanParser._yyparse._yyval = self._node(34, LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 48:
-					LojbanParser._yyparse._yyval = self._node(34, LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 49:
-					LojbanParser._yyparse._yyval = self._node(34, LojbanParser._yyparse._yyv[yyvtidx -3], LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 50:
-					LojbanParser._yyparse._yyval = self._node(34, LojbanParser._yyparse._yyv[yyvtidx -4], LojbanParser._yyparse._yyv[yyvtidx -3], LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 51:
-					LojbanParser._yyparse._yyval = self._node(34, LojbanParser._yyparse._yyv[yyvtidx -3], LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 52:
-					LojbanParser._yyparse._yyval = self._node(35, LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 53:
-					LojbanParser._yyparse._yyval = self._node(35, LojbanParser._yyparse._yyv[yyvtidx -3], LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 54:
-					LojbanParser._yyparse._yyval = self._node(35, LojbanParser._yyparse._yyv[yyvtidx -3], LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 55:
-					LojbanParser._yyparse._yyval = self._node(35, LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 56:
-					LojbanParser._yyparse._yyval = self._node(35, LojbanParser._yyparse._yyv[yyvtidx -3], LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 57:
-					LojbanParser._yyparse._yyval = self._node(35, LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 58:
-					LojbanParser._yyparse._yyval = self._node(35, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 59:
-					LojbanParser._yyparse._yyval = self._node(36, LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 60:
-					LojbanParser._yyparse._yyval = self._node(40, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 61:
-					LojbanParser._yyparse._yyval = self._node(40, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 62:
-					LojbanParser._yyparse._yyval = self._node(41, LojbanParser._yyparse._yyv[yyvtidx -3], LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 63:
-					LojbanParser._yyparse._yyval = self._node(41, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 64:
-					LojbanParser._yyparse._yyval = self._node(41, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 65:
-					LojbanParser._yyparse._yyval = self._node(42, LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 66:
-					LojbanParser._yyparse._yyval = self._node(42, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 67:
-					LojbanParser._yyparse._yyval = self._node(50, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 68:
-					LojbanParser._yyparse._yyval = self._node(50, LojbanParser._yyparse._yyv[yyvtidx -4], LojbanParser._yyparse._yyv[yyvtidx -3], LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 69:
-					LojbanParser._yyparse._yyval = self._node(51, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 70:
-					LojbanParser._yyparse._yyval = self._node(51, LojbanParser._yyparse._yyv[yyvtidx -3], LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 71:
-					LojbanParser._yyparse._yyval = self._node(52, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 72:
-					LojbanParser._yyparse._yyval = self._node(52, LojbanParser._yyparse._yyv[yyvtidx -3], LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 73:
-					LojbanParser._yyparse._yyval = self._node(53, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 74:
-					LojbanParser._yyparse._yyval = self._node(53, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 75:
-					LojbanParser._yyparse._yyval = self._node(54, LojbanParser._yyparse._yyv[yyvtidx -3], LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 76:
-					LojbanParser._yyparse._yyval = self._node(54, LojbanParser._yyparse._yyv[yyvtidx -3], LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 77:
-					LojbanParser._yyparse._yyval = self._node(54, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 78:
-					LojbanParser._yyparse._yyval = self._node(71, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 79:
-					LojbanParser._yyparse._yyval = self._node(71, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 80:
-					LojbanParser._yyparse._yyval = self._node(80, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 81:
-					LojbanParser._yyparse._yyval = self._node(80, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 82:
-					LojbanParser._yyparse._yyval = self._node(81, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 83:
-					LojbanParser._yyparse._yyval = self._node(81, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 84:
-					LojbanParser._yyparse._yyval = self._node(81, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 85:
-					LojbanParser._yyparse._yyval = self._node(81, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 86:
-					LojbanParser._yyparse._yyval = self._node(82, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 87:
-					LojbanParser._yyparse._yyval = self._node(82, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 88:
-					LojbanParser._yyparse._yyval = self._node(83, LojbanParser._yyparse._yyv[yyvtidx -6], LojbanParser._yyparse._yyv[yyvtidx -5], LojbanParser._yyparse._yyv[yyvtidx -4], LojbanParser._yyparse._yyv[yyvtidx -3], LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 89:
-					LojbanParser._yyparse._yyval = self._node(83, LojbanParser._yyparse._yyv[yyvtidx -5], LojbanParser._yyparse._yyv[yyvtidx -4], LojbanParser._yyparse._yyv[yyvtidx -3], LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 90:
-					LojbanParser._yyparse._yyval = self._node(90, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 91:
-					LojbanParser._yyparse._yyval = self._node(90, LojbanParser._yyparse._yyv[yyvtidx -3], LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 92:
-					LojbanParser._yyparse._yyval = self._node(90, LojbanParser._yyparse._yyv[yyvtidx -3], LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 93:
-					LojbanParser._yyparse._yyval = self._node(91, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 94:
-					LojbanParser._yyparse._yyval = self._node(91, LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 95:
-					LojbanParser._yyparse._yyval = self._node(92, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 96:
-					LojbanParser._yyparse._yyval = self._node(92, LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 97:
-					LojbanParser._yyparse._yyval = self._node(92, LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 98:
-					LojbanParser._yyparse._yyval = self._node(93, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 99:
-					LojbanParser._yyparse._yyval = self._node(93, LojbanParser._yyparse._yyv[yyvtidx -3], LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 100:
-					LojbanParser._yyparse._yyval = self._node(94, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 101:
-					LojbanParser._yyparse._yyval = self._node(94, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 102:
-					LojbanParser._yyparse._yyval = self._node(94, LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 103:
-					LojbanParser._yyparse._yyval = self._node(94, LojbanParser._yyparse._yyv[yyvtidx -3], LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 104:
-					LojbanParser._yyparse._yyval = self._node(95, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 105:
-					LojbanParser._yyparse._yyval = self._node(95, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 106:
-					LojbanParser._yyparse._yyval = self._node(96, LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 107:
-					LojbanParser._yyparse._yyval = self._node(96, LojbanParser._yyparse._yyv[yyvtidx -3], LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 108:
-					LojbanParser._yyparse._yyval = self._node(96, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 109:
-					LojbanParser._yyparse._yyval = self._node(96, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 110:
-					LojbanParser._yyparse._yyval = self._node(96, LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 111:
-					LojbanParser._yyparse._yyval = self._node(96, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 112:
-					LojbanParser._yyparse._yyval = self._node(96, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 113:
-					LojbanParser._yyparse._yyval = self._node(110, LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 114:
-					LojbanParser._yyparse._yyval = self._node(110, LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 115:
-					LojbanParser._yyparse._yyval = self._node(111, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 116:
-					LojbanParser._yyparse._yyval = self._node(111, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 117:
-					LojbanParser._yyparse._yyval = self._node(111, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 118:
-					LojbanParser._yyparse._yyval = self._node(111, LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 119:
-					LojbanParser._yyparse._yyval = self._node(112, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 120:
-					LojbanParser._yyparse._yyval = self._node(112, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 121:
-					LojbanParser._yyparse._yyval = self._node(112, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 122:
-					LojbanParser._yyparse._yyval = self._node(112, LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 123:
-					LojbanParser._yyparse._yyval = self._node(112, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 124:
-					LojbanParser._yyparse._yyval = self._node(121, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 125:
-					LojbanParser._yyparse._yyval = self._node(121, LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 126:
-					LojbanParser._yyparse._yyval = self._node(122, LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 127:
-					LojbanParser._yyparse._yyval = self._node(122, LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 128:
-					LojbanParser._yyparse._yyval = self._node(130, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 129:
-					LojbanParser._yyparse._yyval = self._node(130, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 130:
-					LojbanParser._yyparse._yyval = self._node(131, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 131:
-					LojbanParser._yyparse._yyval = self._node(131, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 132:
-					LojbanParser._yyparse._yyval = self._node(132, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 133:
-					LojbanParser._yyparse._yyval = self._node(132, LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 134:
-					LojbanParser._yyparse._yyval = self._node(133, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 135:
-					LojbanParser._yyparse._yyval = self._node(133, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 136:
-					LojbanParser._yyparse._yyval = self._node(134, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 137:
-					LojbanParser._yyparse._yyval = self._node(134, LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 138:
-					LojbanParser._yyparse._yyval = self._node(134, LojbanParser._yyparse._yyv[yyvtidx -3], LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 139:
-					LojbanParser._yyparse._yyval = self._node(135, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 140:
-					LojbanParser._yyparse._yyval = self._node(135, LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 141:
-					LojbanParser._yyparse._yyval = self._node(135, LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 142:
-					LojbanParser._yyparse._yyval = self._node(136, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 143:
-					LojbanParser._yyparse._yyval = self._node(136, LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 144:
-					LojbanParser._yyparse._yyval = self._node(136, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 145:
-					LojbanParser._yyparse._yyval = self._node(136, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 146:
-					LojbanParser._yyparse._yyval = self._node(137, LojbanParser._yyparse._yyv[yyvtidx -3], LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 147:
-					LojbanParser._yyparse._yyval = self._node(150, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 148:
-					LojbanParser._yyparse._yyval = self._node(150, LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 149:
-					LojbanParser._yyparse._yyval = self._node(151, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 150:
-					LojbanParser._yyparse._yyval = self._node(151, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 151:
-					LojbanParser._yyparse._yyval = self._node(152, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 152:
-					LojbanParser._yyparse._yyval = self._node(152, LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 153:
-					LojbanParser._yyparse._yyval = self._node(152, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 154:
-					LojbanParser._yyparse._yyval = self._node(152, LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 155:
-					LojbanParser._yyparse._yyval = self._node(152, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 156:
-					LojbanParser._yyparse._yyval = self._node(152, LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 157:
-					LojbanParser._yyparse._yyval = self._node(152, LojbanParser._yyparse._yyv[yyvtidx -3], LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 158:
-					LojbanParser._yyparse._yyval = self._node(152, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 159:
-					LojbanParser._yyparse._yyval = self._node(152, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 160:
-					LojbanParser._yyparse._yyval = self._node(152, LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 161:
-					LojbanParser._yyparse._yyval = self._node(160, LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 162:
-					LojbanParser._yyparse._yyval = self._node(160, LojbanParser._yyparse._yyv[yyvtidx -3], LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 163:
-					LojbanParser._yyparse._yyval = self._node(161, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 164:
-					LojbanParser._yyparse._yyval = self._node(161, LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 165:
-					LojbanParser._yyparse._yyval = self._node(300, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 166:
-					LojbanParser._yyparse._yyval = self._node(300, LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 167:
-					LojbanParser._yyparse._yyval = self._node(310, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 168:
-					LojbanParser._yyparse._yyval = self._node(310, LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 169:
-					LojbanParser._yyparse._yyval = self._node(310, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 170:
-					LojbanParser._yyparse._yyval = self._node(311, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 171:
-					LojbanParser._yyparse._yyval = self._node(311, LojbanParser._yyparse._yyv[yyvtidx -3], LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 172:
-					LojbanParser._yyparse._yyval = self._node(312, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 173:
-					LojbanParser._yyparse._yyval = self._node(312, LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 174:
-					LojbanParser._yyparse._yyval = self._node(312, LojbanParser._yyparse._yyv[yyvtidx -3], LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 175:
-					LojbanParser._yyparse._yyval = self._node(313, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 176:
-					LojbanParser._yyparse._yyval = self._node(313, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 177:
-					LojbanParser._yyparse._yyval = self._node(330, LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 178:
-					LojbanParser._yyparse._yyval = self._node(332, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 179:
-					LojbanParser._yyparse._yyval = self._node(332, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 180:
-					LojbanParser._yyparse._yyval = self._node(370, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 181:
-					LojbanParser._yyparse._yyval = self._node(370, LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 182:
-					LojbanParser._yyparse._yyval = self._node(370, LojbanParser._yyparse._yyv[yyvtidx -3], LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 183:
-					LojbanParser._yyparse._yyval = self._node(371, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 184:
-					LojbanParser._yyparse._yyval = self._node(371, LojbanParser._yyparse._yyv[yyvtidx -3], LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 185:
-					LojbanParser._yyparse._yyval = self._node(372, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 186:
-					LojbanParser._yyparse._yyval = self._node(372, LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 187:
-					LojbanParser._yyparse._yyval = self._node(374, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 188:
-					LojbanParser._yyparse._yyval = self._node(374, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 189:
-					LojbanParser._yyparse._yyval = self._node(374, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 190:
-					LojbanParser._yyparse._yyval = self._node(374, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 191:
-					LojbanParser._yyparse._yyval = self._node(374, LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 192:
-					LojbanParser._yyparse._yyval = self._node(374, LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 193:
-					LojbanParser._yyparse._yyval = self._node(381, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 194:
-					LojbanParser._yyparse._yyval = self._node(381, LojbanParser._yyparse._yyv[yyvtidx -3], LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 195:
-					LojbanParser._yyparse._yyval = self._node(381, LojbanParser._yyparse._yyv[yyvtidx -3], LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 196:
-					LojbanParser._yyparse._yyval = self._node(382, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 197:
-					LojbanParser._yyparse._yyval = self._node(382, LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 198:
-					LojbanParser._yyparse._yyval = self._node(383, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 199:
-					LojbanParser._yyparse._yyval = self._node(383, LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 200:
-					LojbanParser._yyparse._yyval = self._node(383, LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 201:
-					LojbanParser._yyparse._yyval = self._node(385, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 202:
-					LojbanParser._yyparse._yyval = self._node(385, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 203:
-					LojbanParser._yyparse._yyval = self._node(385, LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 204:
-					LojbanParser._yyparse._yyval = self._node(385, LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 205:
-					LojbanParser._yyparse._yyval = self._node(385, LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 206:
-					LojbanParser._yyparse._yyval = self._node(385, LojbanParser._yyparse._yyv[yyvtidx -3], LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 207:
-					LojbanParser._yyparse._yyval = self._node(385, LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 208:
-					LojbanParser._yyparse._yyval = self._node(400, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 209:
-					LojbanParser._yyparse._yyval = self._node(400, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 210:
-					LojbanParser._yyparse._yyval = self._node(400, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 211:
-					LojbanParser._yyparse._yyval = self._node(404, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 212:
-					LojbanParser._yyparse._yyval = self._node(404, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 213:
-					LojbanParser._yyparse._yyval = self._node(405, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 214:
-					LojbanParser._yyparse._yyval = self._node(405, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 215:
-					LojbanParser._yyparse._yyval = self._node(407, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 216:
-					LojbanParser._yyparse._yyval = self._node(407, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 217:
-					LojbanParser._yyparse._yyval = self._node(408, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 218:
-					LojbanParser._yyparse._yyval = self._node(408, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 219:
-					LojbanParser._yyparse._yyval = self._node(408, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 220:
-					LojbanParser._yyparse._yyval = self._node(408, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 221:
-					LojbanParser._yyparse._yyval = self._node(410, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 222:
-					LojbanParser._yyparse._yyval = self._node(410, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 223:
-					LojbanParser._yyparse._yyval = self._node(410, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 224:
-					LojbanParser._yyparse._yyval = self._node(411, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 225:
-					LojbanParser._yyparse._yyval = self._node(411, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 226:
-					LojbanParser._yyparse._yyval = self._node(412, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 227:
-					LojbanParser._yyparse._yyval = self._node(412, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 228:
-					LojbanParser._yyparse._yyval = self._node(413, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 229:
-					LojbanParser._yyparse._yyval = self._node(413, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 230:
-					LojbanParser._yyparse._yyval = self._node(413, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 231:
-					LojbanParser._yyparse._yyval = self._node(413, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 232:
-					LojbanParser._yyparse._yyval = self._node(413, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 233:
-					LojbanParser._yyparse._yyval = self._node(413, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 234:
-					LojbanParser._yyparse._yyval = self._node(413, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 235:
-					LojbanParser._yyparse._yyval = self._node(415, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 236:
-					LojbanParser._yyparse._yyval = self._node(415, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 237:
-					LojbanParser._yyparse._yyval = self._node(415, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 238:
-					LojbanParser._yyparse._yyval = self._node(416, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 239:
-					LojbanParser._yyparse._yyval = self._node(416, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 240:
-					LojbanParser._yyparse._yyval = self._node(417, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 241:
-					LojbanParser._yyparse._yyval = self._node(417, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 242:
-					LojbanParser._yyparse._yyval = self._node(421, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 243:
-					LojbanParser._yyparse._yyval = self._node(421, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 244:
-					LojbanParser._yyparse._yyval = self._node(421, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 245:
-					LojbanParser._yyparse._yyval = self._node(422, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 246:
-					LojbanParser._yyparse._yyval = self._node(422, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 247:
-					LojbanParser._yyparse._yyval = self._node(422, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 248:
-					LojbanParser._yyparse._yyval = self._node(422, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 249:
-					LojbanParser._yyparse._yyval = self._node(425, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 250:
-					LojbanParser._yyparse._yyval = self._node(425, LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 251:
-					LojbanParser._yyparse._yyval = self._node(426, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 252:
-					LojbanParser._yyparse._yyval = self._node(426, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 253:
-					LojbanParser._yyparse._yyval = self._node(426, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 254:
-					LojbanParser._yyparse._yyval = self._node(426, LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 255:
-					LojbanParser._yyparse._yyval = self._node(432, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 256:
-					LojbanParser._yyparse._yyval = self._node(432, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 257:
-					LojbanParser._yyparse._yyval = self._node(433, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 258:
-					LojbanParser._yyparse._yyval = self._node(433, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 259:
-					LojbanParser._yyparse._yyval = self._node(433, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 260:
-					LojbanParser._yyparse._yyval = self._node(433, LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 261:
-					LojbanParser._yyparse._yyval = self._node(434, LojbanParser._yyparse._yyv[yyvtidx -3], LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 262:
-					LojbanParser._yyparse._yyval = self._node(435, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 263:
-					LojbanParser._yyparse._yyval = self._node(436, LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 264:
-					LojbanParser._yyparse._yyval = self._node(440, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 265:
-					LojbanParser._yyparse._yyval = self._node(440, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 266:
-					LojbanParser._yyparse._yyval = self._node(443, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 267:
-					LojbanParser._yyparse._yyval = self._node(443, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 268:
-					LojbanParser._yyparse._yyval = self._node(444, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 269:
-					LojbanParser._yyparse._yyval = self._node(444, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 270:
-					LojbanParser._yyparse._yyval = self._node(445, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 271:
-					LojbanParser._yyparse._yyval = self._node(445, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 272:
-					LojbanParser._yyparse._yyval = self._node(447, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 273:
-					LojbanParser._yyparse._yyval = self._node(447, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 274:
-					LojbanParser._yyparse._yyval = self._node(448, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 275:
-					LojbanParser._yyparse._yyval = self._elidable(Constants.LIhU_567);
-					pcyyerrfl = 0;
-				elif m == 276:
-					LojbanParser._yyparse._yyval = self._node(450, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 277:
-					LojbanParser._yyparse._yyval = self._node(450, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 278:
-					LojbanParser._yyparse._yyval = self._elidable(Constants.KU_556);
-					pcyyerrfl = 0;
-				elif m == 279:
-					LojbanParser._yyparse._yyval = self._node(451, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 280:
-					LojbanParser._yyparse._yyval = self._node(451, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 281:
-					LojbanParser._yyparse._yyval = self._node(452, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 282:
-					LojbanParser._yyparse._yyval = self._node(452, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 283:
-					LojbanParser._yyparse._yyval = self._elidable(Constants.KUhE_658);
-					pcyyerrfl = 0;
-				elif m == 284:
-					LojbanParser._yyparse._yyval = self._node(453, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 285:
-					LojbanParser._yyparse._yyval = self._node(453, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 286:
-					LojbanParser._yyparse._yyval = self._elidable(Constants.KEI_552);
-					pcyyerrfl = 0;
-				elif m == 287:
-					LojbanParser._yyparse._yyval = self._node(454, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 288:
-					LojbanParser._yyparse._yyval = self._node(454, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 289:
-					LojbanParser._yyparse._yyval = self._elidable(Constants.TUhU_611);
-					pcyyerrfl = 0;
-				elif m == 290:
-					LojbanParser._yyparse._yyval = self._node(456, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 291:
-					LojbanParser._yyparse._yyval = self._node(456, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 292:
-					LojbanParser._yyparse._yyval = self._elidable(Constants.VAU_614);
-					pcyyerrfl = 0;
-				elif m == 293:
-					LojbanParser._yyparse._yyval = self._node(457, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 294:
-					LojbanParser._yyparse._yyval = self._elidable(Constants.DOhU_526);
-					pcyyerrfl = 0;
-				elif m == 295:
-					LojbanParser._yyparse._yyval = self._node(458, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 296:
-					LojbanParser._yyparse._yyval = self._node(458, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 297:
-					LojbanParser._yyparse._yyval = self._elidable(Constants.FEhU_531);
-					pcyyerrfl = 0;
-				elif m == 298:
-					LojbanParser._yyparse._yyval = self._node(459, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 299:
-					LojbanParser._yyparse._yyval = self._elidable(Constants.SEhU_598);
-					pcyyerrfl = 0;
-				elif m == 300:
-					LojbanParser._yyparse._yyval = self._node(460, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 301:
-					LojbanParser._yyparse._yyval = self._node(460, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 302:
-					LojbanParser._yyparse._yyval = self._elidable(Constants.NUhU_588);
-					pcyyerrfl = 0;
-				elif m == 303:
-					LojbanParser._yyparse._yyval = self._node(461, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 304:
-					LojbanParser._yyparse._yyval = self._node(461, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 305:
-					LojbanParser._yyparse._yyval = self._elidable(Constants.BOI_651);
-					pcyyerrfl = 0;
-				elif m == 306:
-					LojbanParser._yyparse._yyval = self._node(462, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 307:
-					LojbanParser._yyparse._yyval = self._elidable(Constants.BOI_651);
-					pcyyerrfl = 0;
-				elif m == 308:
-					LojbanParser._yyparse._yyval = self._node(463, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 309:
-					LojbanParser._yyparse._yyval = self._node(463, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 310:
-					LojbanParser._yyparse._yyval = self._elidable(Constants.LUhU_573);
-					pcyyerrfl = 0;
-				elif m == 311:
-					LojbanParser._yyparse._yyval = self._node(464, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 312:
-					LojbanParser._yyparse._yyval = self._node(464, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 313:
-					LojbanParser._yyparse._yyval = self._elidable(Constants.GEhU_538);
-					pcyyerrfl = 0;
-				elif m == 314:
-					LojbanParser._yyparse._yyval = self._node(465, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 315:
-					LojbanParser._yyparse._yyval = self._node(465, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 316:
-					LojbanParser._yyparse._yyval = self._elidable(Constants.MEhU_575);
+				if (j >= _YYLAST or yychk[yyact[j]] != -n):
+					tmpstate = yyact[yypgo[n]];
+				# end if (j >= _YYLAST or yychk[yyact[j]] != -n):
+				# /* semantic action of rule m */
+				kind, ttype, first, last = _YYREDUCE[m];
+				if kind == _YYNODE:
+					yyval = self._node(ttype, \
+						*yyv[yyvtidx - first : yyvtidx - last + 1]);
+				elif kind == _YYELIDABLEOK:
+					yyval = self._elidable(ttype);
 					pcyyerrfl = 0;
-				elif m == 317:
-					LojbanParser._yyparse._yyval = self._node(466, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 318:
-					LojbanParser._yyparse._yyval = self._node(466, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 319:
-					LojbanParser._yyparse._yyval = self._elidable(Constants.KEhE_550);
-					pcyyerrfl = 0;
-				elif m == 320:
-					LojbanParser._yyparse._yyval = self._node(467, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 321:
-					LojbanParser._yyparse._yyval = self._node(467, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 322:
-					LojbanParser._yyparse._yyval = self._elidable(Constants.BEhO_506);
-					pcyyerrfl = 0;
-				elif m == 323:
-					LojbanParser._yyparse._yyval = self._node(468, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 324:
-					LojbanParser._yyparse._yyval = self._elidable(Constants.TOI_607);
-					pcyyerrfl = 0;
-				elif m == 325:
-					LojbanParser._yyparse._yyval = self._node(469, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 326:
-					LojbanParser._yyparse._yyval = self._node(469, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 327:
-					LojbanParser._yyparse._yyval = self._elidable(Constants.KUhO_557);
-					pcyyerrfl = 0;
-				elif m == 328:
-					LojbanParser._yyparse._yyval = self._node(470, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 329:
-					LojbanParser._yyparse._yyval = self._node(471, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 330:
-					LojbanParser._yyparse._yyval = self._node(471, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 331:
-					LojbanParser._yyparse._yyval = self._elidable(Constants.VEhO_678);
-					pcyyerrfl = 0;
-				elif m == 332:
-					LojbanParser._yyparse._yyval = self._node(472, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 333:
-					LojbanParser._yyparse._yyval = self._node(472, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 334:
-					LojbanParser._yyparse._yyval = self._elidable(Constants.LOhO_568);
-					pcyyerrfl = 0;
-				elif m == 335:
-					LojbanParser._yyparse._yyval = self._node(473, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 336:
-					LojbanParser._yyparse._yyval = self._node(473, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 337:
-					LojbanParser._yyparse._yyval = self._elidable(Constants.TEhU_675);
-					pcyyerrfl = 0;
-				elif m == 338:
-					LojbanParser._yyparse._yyval = self._node(474, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 339:
-					LojbanParser._yyparse._yyval = self._elidable(Constants.VEhO_678);
-					pcyyerrfl = 0;
-				elif m == 340:
-					LojbanParser._yyparse._yyval = self._node(480, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 341:
-					LojbanParser._yyparse._yyval = self._node(480, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 342:
-					LojbanParser._yyparse._yyval = self._node(481, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 343:
-					LojbanParser._yyparse._yyval = self._node(481, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 344:
-					LojbanParser._yyparse._yyval = self._node(482, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 345:
-					LojbanParser._yyparse._yyval = self._node(482, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 346:
-					LojbanParser._yyparse._yyval = self._node(483, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 347:
-					LojbanParser._yyparse._yyval = self._node(483, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 348:
-					LojbanParser._yyparse._yyval = self._node(483, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 349:
-					LojbanParser._yyparse._yyval = self._node(486, LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 350:
-					LojbanParser._yyparse._yyval = self._node(486, LojbanParser._yyparse._yyv[yyvtidx -3], LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 351:
-					LojbanParser._yyparse._yyval = self._node(486, LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 352:
-					LojbanParser._yyparse._yyval = self._node(490, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 353:
-					LojbanParser._yyparse._yyval = self._node(490, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 354:
-					LojbanParser._yyparse._yyval = self._node(491, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 355:
-					LojbanParser._yyparse._yyval = self._node(491, LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 356:
-					LojbanParser._yyparse._yyval = self._node(801, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 357:
-					LojbanParser._yyparse._yyval = self._node(802, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 358:
-					LojbanParser._yyparse._yyval = self._node(802, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 359:
-					LojbanParser._yyparse._yyval = self._node(803, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 360:
-					LojbanParser._yyparse._yyval = self._node(803, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 361:
-					LojbanParser._yyparse._yyval = self._node(804, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 362:
-					LojbanParser._yyparse._yyval = self._node(804, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 363:
-					LojbanParser._yyparse._yyval = self._node(805, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 364:
-					LojbanParser._yyparse._yyval = self._node(806, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 365:
-					LojbanParser._yyparse._yyval = self._node(807, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 366:
-					LojbanParser._yyparse._yyval = self._node(807, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 367:
-					LojbanParser._yyparse._yyval = self._node(808, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 368:
-					LojbanParser._yyparse._yyval = self._node(808, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 369:
-					LojbanParser._yyparse._yyval = self._node(809, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 370:
-					LojbanParser._yyparse._yyval = self._node(809, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 371:
-					LojbanParser._yyparse._yyval = self._node(810, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 372:
-					LojbanParser._yyparse._yyval = self._node(810, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 373:
-					LojbanParser._yyparse._yyval = self._node(811, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 374:
-					LojbanParser._yyparse._yyval = self._node(811, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 375:
-					LojbanParser._yyparse._yyval = self._node(812, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 376:
-					LojbanParser._yyparse._yyval = self._node(813, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 377:
-					LojbanParser._yyparse._yyval = self._node(813, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 378:
-					LojbanParser._yyparse._yyval = self._node(814, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 379:
-					LojbanParser._yyparse._yyval = self._node(814, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 380:
-					LojbanParser._yyparse._yyval = self._node(815, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 381:
-					LojbanParser._yyparse._yyval = self._node(815, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 382:
-					LojbanParser._yyparse._yyval = self._node(815, LojbanParser._yyparse._yyv[yyvtidx -2], LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 383:
-					LojbanParser._yyparse._yyval = self._node(816, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 384:
-					LojbanParser._yyparse._yyval = self._node(816, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 385:
-					LojbanParser._yyparse._yyval = self._node(817, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 386:
-					LojbanParser._yyparse._yyval = self._node(818, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 387:
-					LojbanParser._yyparse._yyval = self._node(818, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 388:
-					LojbanParser._yyparse._yyval = self._node(819, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 389:
-					LojbanParser._yyparse._yyval = self._node(819, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 390:
-					LojbanParser._yyparse._yyval = self._node(821, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 391:
-					LojbanParser._yyparse._yyval = self._node(821, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 392:
-					LojbanParser._yyparse._yyval = self._node(822, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 393:
-					LojbanParser._yyparse._yyval = self._node(822, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 394:
-					LojbanParser._yyparse._yyval = self._node(823, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 395:
-					LojbanParser._yyparse._yyval = self._node(823, LojbanParser._yyparse._yyv[yyvtidx -1], LojbanParser._yyparse._yyv[yyvtidx -0]);
-				elif m == 396:
-					LojbanParser._yyparse._yyval = self._node(824, LojbanParser._yyparse._yyv[yyvtidx -0]);
-				# end if m == ?
+				elif kind == _YYELIDABLE:
+					yyval = self._elidable(ttype);
+				else: # if kind == _YYNODE:
+					yyval = self._toplevel(yyv[yyvtidx - first]);
+				# end if kind == _YYNODE:
 			# end if not skipenstack:
 		# end while True:#// enstack loop
 	# end def _yyparse(self):
 
+	def _yyparsestates(self, yymaxdepth):
+		"""
+		Parses the document as _yyparse does, with the state functions of
+		lojbanParserStates (generated parameter) rather than the tables.
+		A state function is called with the state on top of the stacks, and
+		shifts or reduces; this loop only recovers from syntax errors.
+		"""
+		module = _statesmodule()
+		states = module.STATES
+		errorshifts = module.ERRORSHIFTS
+		statestack = [0]
+		valuestack = [None]
+		tmpstate = 0
+		pcyyerrfl = 0
+		self._pcyytoken = -1
+		while True:
+			tmpstate = states[tmpstate](self, statestack, valuestack)
+			if tmpstate <= _YYSTATEMASK:
+				continue
+			# end if tmpstate <= _YYSTATEMASK:
+			if tmpstate == _YYACCEPT:
+				return False
+			elif tmpstate == _YYERROR:
+				if pcyyerrfl == 0:
+					self._yyerror("syntax error")
+				# end if pcyyerrfl == 0:
+				if pcyyerrfl < 3:
+					# pop up to a state that shifts "error", and shift it with
+					# the last value
+					pcyyerrfl = 3
+					yyval = valuestack[-1]
+					while statestack and not statestack[-1] in errorshifts:
+						statestack.pop()
+						valuestack.pop()
+					# end while statestack and not statestack[-1] in errorshifts:
+					if not statestack:
+						return True
+					# end if not statestack:
+					tmpstate = errorshifts[statestack[-1]]
+					statestack.append(tmpstate)
+					valuestack.append(yyval)
+				else: # if pcyyerrfl < 3:
+					# discard the token
+					if self._pcyytoken == 0:
+						return True
+					# end if self._pcyytoken == 0:
+					self._pcyytoken = -1
+					tmpstate = statestack[-1]
+				# end if pcyyerrfl < 3:
+			else: # if tmpstate == _YYACCEPT:
+				if tmpstate & _YYSHIFTED and pcyyerrfl > 0:
+					pcyyerrfl -= 1
+				# end if tmpstate & _YYSHIFTED and pcyyerrfl > 0:
+				if tmpstate & _YYERROK:
+					pcyyerrfl = 0
+				# end if tmpstate & _YYERROK:
+				tmpstate &= _YYSTATEMASK
+			# end if tmpstate == _YYACCEPT:
+			if len(statestack) > yymaxdepth:
+				self._yyerror("pcyacc internal stack overflow")
+				return True
+			# end if len(statestack) > yymaxdepth:
+		# end while True:
+	# end def _yyparsestates(self, yymaxdepth):
+
 	#
 	# High level methods
 	# These can be called from any script
@@ -7858,9 +9160,10 @@ class LojbanParser:
 			MAXLINE should be an integer. Zero of negative values for no limit.
 			Defaults to 75.
 
-		--maxdepth MAXDEPTH sets maximum parsing tree depth
+		--maxdepth MAXDEPTH sets maximum parsing tree depth (the limit of the
+			parser stacks, which grow as needed up to it)
 			MAXDEPTH should be an integer. 
-			Zero of negative values for default value (200).
+			Zero of negative values for default value (10000).
 
 		--redmax REDMAX sets maximum number of pasring reductions
 			REDMAX should be an integer. 
@@ -7868,6 +9171,27 @@ class LojbanParser:
 
 		-d sets grammar debug mode on
 
+		--checktokens checks the type of every value stored in a token
+
+		--tokenstore keeps the parse tree in a TokenStore (arrays of integers)
+
+		--reusetokens reuses the tokens of a TokenArena from one parse to the
+			next (a parse overwrites the tree returned by the previous one)
+
+		--recover parses the text sentence by sentence, skipping the sentences
+			with syntax errors (parse then returns a list of trees)
+
+		--sharestrings interns the words of all parsers in one StringPool, kept
+			from one parse to the next until it holds 65536 words, when a new
+			one is started (each parser has its own otherwise)
+
+		--packrat memoizes the matches of the compounder rules at each token
+			position (packrat parsing), for texts with long tenses or connectives
+
+		--generated parses with the state functions of lojbanParserStates.py (written
+			by genLojbanParser.py) rather than by interpreting the YACC tables
+			(except with -d or -g, which trace the tables)
+
 		-g sets grammar error logging mode on
 
 		--tfile FILE sets grammar error logging file.
@@ -7888,9 +9212,34 @@ class LojbanParser:
 		"""
 		self._interactive = False
 
-		self._pushback = None # _gettoken _fail
-		self._head = None # _fail _release
-		self._tail = None # _fail _release
+		# state of the lexer pipeline stages
+		self._context = ParseContext()
+		self._context.compound_prune = not self._parameters.D_cpd_reduce
+		# the packrat memo goes between the compounder productions and their
+		# methods (but not with D_cpd_reduce, which shows every match)
+		packrat = self._parameters.packrat and not self._parameters.D_cpd_reduce
+		if packrat and not self._packrat:
+			for production in LojbanParser._MEMOPRODUCTIONS:
+				if production in LojbanParser._MEMOLOOPS:
+					method = functools.partial(LojbanParser._memoloop, \
+						production = production)
+				else: # if production in LojbanParser._MEMOLOOPS:
+					method = getattr(LojbanParser, production)
+				# end if production in LojbanParser._MEMOLOOPS:
+				setattr(self, production, functools.partial(self._memoized, \
+					production, method))
+			# end for production in LojbanParser._MEMOPRODUCTIONS:
+			self._packrat = True
+		elif self._packrat and not packrat:
+			for production in LojbanParser._MEMOPRODUCTIONS:
+				delattr(self, production)
+			# end for production in LojbanParser._MEMOPRODUCTIONS:
+			self._packrat = False
+		# end if packrat and not self._packrat:
+		# selma'o-level tokens read by the compounder and index of the next one
+		# (the position of the compounder, for the packrat memo)
+		self._lookahead = [] # _gettoken _fail _peek
+		self._cursor = 0 # _gettoken _fail _peek
 
 		# variables (those that were global in C code)
 		# value assigned during parsing (defined in grammar.c)
@@ -7902,6 +9251,11 @@ class LojbanParser:
 		# line and column of input (globals defined in getword.c)		
 		self._line = 1
 		self._column = 0
+		# InputSource being parsed (set by parse)
+		self._source = None
+		# input buffer of _getword and position in it (filled by _readinput)
+		self._inbuf = ""
+		self._inpos = 0
 		# index of last reduction (defined in node.c)
 		self._lastreduce = -1
 		# error identifiers (defined in node.c)
@@ -7909,88 +9263,860 @@ class LojbanParser:
 		self._errcol = -1
 		self._errtype = -1
 		self._errlastreduce = -1
+		# ParseError of each syntax error
+		self._errors = []
 		# memory used by tokens
 		self._tokspace = 0
-		# memory used for strings
+		# memory used for strings, which are interned in a StringPool, shared
+		# by the parsers with the sharestrings parameter (up to a bound)
 		self._stringspace = 0
+		self._strings = _sharedstrings() if self._parameters.sharestrings else StringPool()
 		# token objects
 		self._freelist = None
 		self._newtoken_result = None
 		self._results = None
 		# the actual list of token objects generated in each call of makefree
 		self._tokenslist = []
+		# or the store of all tokens, with the tokenstore parameter
+		self._tokenstore = TokenStore(self._strings) if self._parameters.tokenstore else None
+		# or the arena kept from one parse to the next, with the reusetokens parameter
+		tokenclass = CheckedToken if self._parameters.checktokens else Token
+		if not self._parameters.reusetokens or self._tokenstore is not None:
+			self._tokenarena = None
+		elif self._tokenarena is None or self._tokenarena.tokenclass != tokenclass:
+			self._tokenarena = TokenArena(tokenclass)
+		else: # if not self._parameters.reusetokens or self._tokenstore is not None:
+			self._tokenarena.rewind()
+		# end if not self._parameters.reusetokens or self._tokenstore is not None:
 	# end def reset(self):
 
+	def trimtokens(self, capacity = 0):
+		"""
+		Releases the tokens of the token arena (reusetokens parameter) beyond
+		capacity; the tokens of the last parse are kept.
+		"""
+		if not self._tokenarena is None:
+			self._tokenarena.trim(capacity)
+		# end if not self._tokenarena is None:
+	# end def trimtokens(self, capacity = 0):
+
 	#
 	# Delegate methods
 	#
-	def print(self, tok, endline = True):
+	def print(self, tok, endline = True, file = None):
 		Token.print(tok, endline, singlemode = self._parameters.singlemode, \
-			maxline = self._parameters.maxline)
-	# end def print(tok, endline = True):
+			maxline = self._parameters.maxline, file = file)
+	# end def print(self, tok, endline = True, file = None):
 	
-	def rprint(self, tok, endline = True):
+	def rprint(self, tok, endline = True, file = None):
 		Token.rprint(tok, endline, singlemode = self._parameters.singlemode, \
-			maxline = self._parameters.maxline)
-	# end def rprint(self, tok, endline = True):
+			maxline = self._parameters.maxline, file = file)
+	# end def rprint(self, tok, endline = True, file = None):
 
-	def tprint(self, tok):
-		Token.tprint(tok)
-	# end def tprint(tok):
+	def tprint(self, tok, file = None):
+		Token.tprint(tok, file = file)
+	# end def tprint(self, tok, file = None):
 
 	#
 	# Utility methods for parsing
 	#
-	def parseString(self, s):
+	def iterparse(self, source, unit = "sentence"):
 		"""
-		Parses a string.
+		Parses the text of source (anything that parse accepts) piece by piece
+		and yields the tree of each piece as soon as it is complete.
+		With unit "sentence" the text is cut before each I (or ijek, which the
+		compounder makes into lexer_S) and NIhO, with unit "paragraph" before
+		each NIhO; I BO (lexer_K) keeps sentences together, and cuts are only
+		made outside LU ... LIhU, TO ... TOI and TUhE ... TUhU.  Each piece is
+		parsed as a text of its own (starting with its I or NIhO).
+		The tokens of a tree are reused for the next pieces, so that memory
+		does not grow with the length of the text: a tree is only valid until
+		the next one is requested.
+		Syntax errors are reported as parse does; iteration stops at the first
+		one, unless the recover parameter is set (see parse).
 		"""
+		if not unit in LojbanParser._SEGMENTBOUNDARIES:
+			raise LojbanException(self, "unit should be \"sentence\" or" + \
+				" \"paragraph\" (is {:s})".format(str(unit)))
+		# end if not unit in LojbanParser._SEGMENTBOUNDARIES:
+		return self._iterparse(source, LojbanParser._SEGMENTBOUNDARIES[unit], True)
+	# end def iterparse(self, source, unit = "sentence"):
+
+	def parse(self, source):
+		"""
+		Parses the text of source, an InputSource or anything that an
+		InputSource accepts (a string, bytes, an os.PathLike file path, a file
+		object or an iterator of lines), or the tokens of a text saved in a
+		TokenStream (see tokenize).
+		Returns the tree of the text, or None on a syntax error.
+		If the recover parameter is set, the text is parsed sentence by sentence
+		(see iterparse) and a syntax error only loses the sentence it is in:
+		parsing resumes at the next I, NIhO or end of text, and parse returns
+		the list of the trees of the sentences that parsed.
+		In both cases the errors are listed in self.errors.
+		"""
+		if self._parameters.recover:
+			return list(self._iterparse(source, \
+				LojbanParser._SEGMENTBOUNDARIES["sentence"], False))
+		# end if self._parameters.recover:
 		self.reset()
-		#  backup stdin 
-		sysstdin = sys.stdin
-		self._interactive = False
-
-		sys.stdin = StringIO(s)
-		if self._yyparse(yymaxdepth = self._parameters.yymaxdepth, 
-			yyredmax = self._parameters.yyredmax, 
-			yydebug = self._parameters.yydebug, 
-			yytflag = self._parameters.yytflag, 
-			yytfilen = self._parameters.yytfilen):
-			print( \
-				"Problem with selma'o {:s} at or before line {:d} column {:d}".format(\
-					Constants.rulename(self._errtype), self._errline, \
-					self._errcol), file = sys.stderr)
-			print("Last good construct was: {:s}".format( \
-				Constants.rulename(self._errlastreduce)), file = sys.stderr)
-			#  reset stdin 
+		self._opensource(source)
+		try:
+			failed = self._yyparse(yymaxdepth = self._parameters.yymaxdepth, 
+				yyredmax = self._parameters.yyredmax, 
+				yydebug = self._parameters.yydebug, 
+				yytflag = self._parameters.yytflag, 
+				yytfilen = self._parameters.yytfilen)
+		finally:
+			self._source.close()
+			self._source = None
+		# end try finally:
+		if failed:
+			self._reporterror()
 			self._results = None
-		# end if yyparse():
+		# end if failed:
+		return self._results if self._results else None
+	# end def parse(self, source):
+
+	def parseFile(self, path, encoding = "utf-8"):
+		"""
+		Parses a file, read in large buffered chunks.
+		"""
+		return self.parse(InputSource(path, encoding, path = True))
+	# end def parseFile(self, path, encoding = "utf-8"):
+
+	def parseMany(self, texts, workers = None, ordered = True, chunksize = 16, \
+		trees = False, shared = False):
+		"""
+		Parses a collection of documents, texts being an iterable of strings,
+		bytes or os.PathLike file paths, in workers processes (default one
+		per CPU), each with one LojbanParser with the parameters of this one.
+		Yields a tuple (index, output, errors) for each document: index is its
+		position in texts, output the printed tree as testLojbanParser prints
+		it (-t or -p as set, None on a syntax error), or with trees the tree
+		as Token.dumps returns it (to be read with Token.loads), or with shared
+		a read-only TokenStore (fromshared) whose tree is that of the document,
+		written by the worker into shared memory and not copied, to be closed
+		when done with (the memory is released at exit otherwise; the blocks
+		of the documents not yielded, when the generator is closed before
+		the end, are released by parseMany); errors is
+		the list of its ParseError, with the lines that its parse printed
+		(unknown cmavo, illegal cmene, debugging traces) as strings, in the
+		order in which they were printed: the workers keep them from their
+		own sys.stdout and sys.stderr.  An exception raised while parsing a
+		document is returned last in errors (with output None) and does not
+		stop the others.
+		The results come in the order of texts, or as soon as they are ready
+		if ordered is False.  Documents are sent to the workers by chunks of
+		chunksize, with at most 4 chunks pending per worker, so that texts
+		may be a long stream.
+		"""
+		workers = workers if workers else (os.cpu_count() or 1)
+		mode = "shared" if shared else "dump" if trees else "print"
+		if shared:
+			# the workers share this tracker of shared memory blocks, which
+			# then does not unlink their blocks when they exit
+			resource_tracker.ensure_running()
+		# end if shared:
+		documents = enumerate(texts)
+		pending = []
+		# results received and not yielded yet
+		results = []
+		executor = ProcessPoolExecutor(max_workers = workers, \
+			initializer = _batchinit, initargs = (self._parameters,))
+		try:
+			while True:
+				while len(pending) < 4 * workers:
+					chunk = list(itertools.islice(documents, chunksize))
+					if not chunk:
+						break
+					# end if not chunk:
+					pending.append(executor.submit(_batchparse, chunk, mode))
+				# end while len(pending) < 4 * workers:
+				if not pending:
+					break
+				# end if not pending:
+				if ordered:
+					finished = [pending.pop(0)]
+				else: # if ordered:
+					(finished, pending) = wait(pending, return_when = FIRST_COMPLETED)
+					pending = list(pending)
+				# end if ordered:
+				for future in finished:
+					results.extend(future.result())
+				# end for future in finished:
+				results.reverse()
+				while results:
+					(index, output, errors) = results.pop()
+					if shared and not output is None:
+						output = TokenStore.fromshared(*output)
+					# end if shared and not output is None:
+					yield (index, output, errors)
+				# end while results:
+			# end while True:
+		finally:
+			# waits for the chunks being parsed, the others are cancelled
+			executor.shutdown(cancel_futures = True)
+			if shared:
+				# the shared memory blocks of the documents not yielded would
+				# be left to the resource tracker, which warns at exit
+				for future in pending:
+					if not future.cancelled() and future.exception() is None:
+						results.extend(future.result())
+					# end if not future.cancelled() and ...:
+				# end for future in pending:
+				for (index, output, errors) in results:
+					if not output is None:
+						TokenStore.unlinkshared(output[0])
+					# end if not output is None:
+				# end for (index, output, errors) in results:
+			# end if shared:
+		# end try finally:
+	# end def parseMany(self, texts, workers = None, ordered = True, chunksize = 16, ...):
 
-		sys.stdin = sysstdin
-		return self._results() if self._results else None
+	def parseString(self, s):
+		"""
+		Parses a string.
+		"""
+		return self.parse(InputSource(s))
 	# end def parseString(self, s):
 
 	def parseStdin(self):
 		"""
 		Parses standard input.
 		"""
-		if self._yyparse(yymaxdepth = self._parameters.yymaxdepth, 
-			yyredmax = self._parameters.yyredmax, 
-			yydebug = self._parameters.yydebug, 
-			yytflag = self._parameters.yytflag, 
-			yytfilen = self._parameters.yytfilen):
-			print( \
-				"Problem with selma'o {:s} at or before line {:d} column {:d}".format(\
-					Constants.rulename(self._errtype), self._errline, \
-					self._errcol), file = sys.stderr)
-			print("Last good construct was: {:s}".format( \
-				Constants.rulename(self._errlastreduce)), file = sys.stderr)
-			#  reset stdin 
-			self._results = None
-		# end if yyparse():
-		return self._results() if self._results else None
+		return self.parse(InputSource(sys.stdin))
 	# end def parseStdin(self):
+
+	def tokenize(self, source):
+		"""
+		Runs the lexer and the compounder over the text of source (anything
+		that parse accepts) and returns the tokens that they deliver to the
+		YACC parser, up to EOT, as a TokenStream.  Parsing the TokenStream
+		gives the same results as parsing the text (with any output
+		parameters), without lexing it again; only the messages of the lexer
+		and compounder (unknown cmavo, -dv, -dL and -dR) are not repeated.
+		The stream is stamped with streamstamp and, when source is a string
+		or bytes, with its size and CRC-32 in UTF-8.
+		"""
+		self.reset()
+		self._opensource(source)
+		stream = TokenStream()
+		stream.stamp = self.streamstamp
+		if isinstance(source, (str, bytes, bytearray, memoryview)):
+			data = source.encode("utf-8") if isinstance(source, str) else source
+			stream.sourcesize = len(data)
+			stream.sourcecrc = zlib.crc32(data)
+		# end if isinstance(source, (str, bytes, bytearray, memoryview)):
+		try:
+			while True:
+				tok = self._compound()
+				stream.append(tok, self._line, self._column)
+				if tok.ttype == 0:
+					break
+				# end if tok.ttype == 0:
+			# end while True:
+		finally:
+			self._source.close()
+			self._source = None
+		# end try finally:
+		return stream
+	# end def tokenize(self, source):
+
+	# The lexer rule drivers that _compound tries, in order, for each type of
+	# first token (the if ... elif chain of compound() in the C code).
+	# The drivers are plain functions, called with the parser as argument.
+	_COMPOUNDDRIVERS = MappingProxyType({ \
+		Constants.A_501 : (_lexer_C_915_driver, _lexer_D_916_driver, \
+			_lexer_B_910_driver), \
+		Constants.BAI_502 : (_lexer_G_935_driver, _lexer_O_970_driver), \
+		Constants.BIhI_507 : (_lexer_G_935_driver, _lexer_V_1010_driver, \
+			_lexer_W_1015_driver, _lexer_F_930_driver), \
+		Constants.BY_513 : (_lexer_A_905_driver, _lexer_Y_1025_driver, \
+			_lexer_Q_985_driver), \
+		Constants.CAhA_514 : (_lexer_G_935_driver, _lexer_O_970_driver), \
+		Constants.CUhE_521 : (_lexer_G_935_driver, _lexer_O_970_driver), \
+		Constants.FAhA_528 : (_lexer_G_935_driver, _lexer_O_970_driver), \
+		Constants.FEhE_530 : (_lexer_G_935_driver, _lexer_O_970_driver), \
+		Constants.GA_537 : (_lexer_G_935_driver,), \
+		Constants.GI_539 : (_lexer_P_980_driver,), \
+		Constants.GIhA_541 : (_lexer_M_965_driver, _lexer_N_966_driver, \
+			_lexer_R_990_driver), \
+		Constants.GUhA_544 : (_lexer_H_940_driver,), \
+		Constants.I_545 : (_lexer_K_955_driver, _lexer_S_995_driver), \
+		Constants.JA_546 : (_lexer_U_1005_driver, _lexer_E_925_driver), \
+		Constants.JOI_548 : (_lexer_G_935_driver, _lexer_V_1010_driver, \
+			_lexer_W_1015_driver, _lexer_F_930_driver), \
+		Constants.KI_554 : (_lexer_G_935_driver, _lexer_O_970_driver), \
+		Constants.LAU_559 : (_lexer_A_905_driver, _lexer_Y_1025_driver, \
+			_lexer_Q_985_driver), \
+		Constants.MOhI_577 : (_lexer_G_935_driver, _lexer_O_970_driver), \
+		Constants.NA_578 : (_lexer_C_915_driver, _lexer_D_916_driver, \
+			_lexer_B_910_driver, _lexer_U_1005_driver, _lexer_E_925_driver, \
+			_lexer_J_950_driver, _lexer_M_965_driver, _lexer_N_966_driver, \
+			_lexer_R_990_driver), \
+		Constants.NAhE_583 : (_lexer_I_945_driver, _lexer_G_935_driver, \
+			_lexer_O_970_driver), \
+		Constants.PU_592 : (_lexer_G_935_driver, _lexer_O_970_driver), \
+		Constants.SE_596 : (_lexer_C_915_driver, _lexer_D_916_driver, \
+			_lexer_B_910_driver, _lexer_U_1005_driver, _lexer_E_925_driver, \
+			_lexer_H_940_driver, _lexer_M_965_driver, _lexer_N_966_driver, \
+			_lexer_G_935_driver, _lexer_O_970_driver, _lexer_V_1010_driver, \
+			_lexer_W_1015_driver, _lexer_F_930_driver, _lexer_R_990_driver), \
+		Constants.TAhE_604 : (_lexer_G_935_driver, _lexer_O_970_driver), \
+		Constants.TEI_605 : (_lexer_A_905_driver, _lexer_Y_1025_driver, \
+			_lexer_Q_985_driver), \
+		Constants.VA_613 : (_lexer_G_935_driver, _lexer_O_970_driver), \
+		Constants.VEhA_615 : (_lexer_G_935_driver, _lexer_O_970_driver), \
+		Constants.VIhA_616 : (_lexer_G_935_driver, _lexer_O_970_driver), \
+		Constants.ZAhO_621 : (_lexer_G_935_driver, _lexer_O_970_driver), \
+		Constants.ZEhA_622 : (_lexer_G_935_driver, _lexer_O_970_driver), \
+		Constants.ZI_624 : (_lexer_G_935_driver, _lexer_O_970_driver), \
+		Constants.GAhO_656 : (_lexer_G_935_driver, _lexer_V_1010_driver, \
+			_lexer_W_1015_driver, _lexer_F_930_driver), \
+		Constants.PA_672 : (_lexer_A_905_driver, _lexer_Y_1025_driver, \
+			_lexer_O_970_driver, _lexer_L_960_driver), \
+		})
+
+	# The productions of the compounder (the methods of the lexer rules and of
+	# their alternatives), as far as their FIRST sets need them: the
+	# alternatives of each, in turn a selma'o, a production or a tuple of
+	# them for a sequence.  A sequence can be cut after its second item, and
+	# a loop is given as its first pass alone and with the start of a second
+	# one.  _simple_tag_971 is given without the check of the next selma'o
+	# that it makes first.  _prunecompounder works out the FIRST sets into
+	# _COMPOUNDFIRST when the class is created.
+	_COMPOUNDRULES = MappingProxyType({ \
+		_BIhI_root_932 : (_BIhI_root_932_2, _BIhI_root_932_1, \
+			_BIhI_root_932_4, _BIhI_root_932_3), \
+		_BIhI_root_932_1 : (Constants.BIhI_507,), \
+		_BIhI_root_932_2 : ((Constants.BIhI_507, Constants.NAI_581),), \
+		_BIhI_root_932_3 : ((Constants.SE_596, Constants.BIhI_507),), \
+		_BIhI_root_932_4 : ((Constants.SE_596, Constants.BIhI_507, \
+			Constants.NAI_581),), \
+		_EK_root_911 : (_EK_root_911_4, _EK_root_911_5, _EK_root_911_6, \
+			_EK_root_911_8, _EK_root_911_1, _EK_root_911_2, _EK_root_911_3, \
+			_EK_root_911_7), \
+		_EK_root_911_1 : (Constants.A_501,), \
+		_EK_root_911_2 : ((Constants.SE_596, Constants.A_501),), \
+		_EK_root_911_3 : ((Constants.NA_578, Constants.A_501),), \
+		_EK_root_911_4 : ((Constants.A_501, Constants.NAI_581),), \
+		_EK_root_911_5 : ((Constants.SE_596, Constants.A_501, \
+			Constants.NAI_581),), \
+		_EK_root_911_6 : ((Constants.NA_578, Constants.A_501, \
+			Constants.NAI_581),), \
+		_EK_root_911_7 : ((Constants.NA_578, Constants.SE_596, \
+			Constants.A_501),), \
+		_EK_root_911_8 : ((Constants.NA_578, Constants.SE_596, \
+			Constants.A_501, Constants.NAI_581),), \
+		_event_mod_1052 : (_event_mod_1052_2, _event_mod_1052_1), \
+		_event_mod_1052_1 : (_event_mod_A_1053,), \
+		_event_mod_1052_2 : ((_event_mod_A_1053, _event_mod_1052),), \
+		_event_mod_A_1053 : (_event_mod_A_1053_4, _event_mod_A_1053_3, \
+			_event_mod_A_1053_2, _event_mod_A_1053_1), \
+		_event_mod_A_1053_1 : (Constants.ZAhO_621,), \
+		_event_mod_A_1053_2 : ((Constants.ZAhO_621, Constants.NAI_581),), \
+		_event_mod_A_1053_3 : ((Constants.ZAhO_621, \
+			_interval_property_1051),), \
+		_event_mod_A_1053_4 : ((Constants.ZAhO_621, Constants.NAI_581, \
+			_interval_property_1051),), \
+		_GIK_root_981 : (_GIK_root_981_2, _GIK_root_981_1), \
+		_GIK_root_981_1 : (Constants.GI_539,), \
+		_GIK_root_981_2 : ((Constants.GI_539, Constants.NAI_581),), \
+		_GIhEK_root_991 : (_GIhEK_root_991_4, _GIhEK_root_991_5, \
+			_GIhEK_root_991_6, _GIhEK_root_991_8, _GIhEK_root_991_1, \
+			_GIhEK_root_991_2, _GIhEK_root_991_3, _GIhEK_root_991_7), \
+		_GIhEK_root_991_1 : (Constants.GIhA_541,), \
+		_GIhEK_root_991_2 : ((Constants.SE_596, Constants.GIhA_541),), \
+		_GIhEK_root_991_3 : ((Constants.NA_578, Constants.GIhA_541),), \
+		_GIhEK_root_991_4 : ((Constants.GIhA_541, Constants.NAI_581),), \
+		_GIhEK_root_991_5 : ((Constants.SE_596, Constants.GIhA_541, \
+			Constants.NAI_581),), \
+		_GIhEK_root_991_6 : ((Constants.NA_578, Constants.GIhA_541, \
+			Constants.NAI_581),), \
+		_GIhEK_root_991_7 : ((Constants.NA_578, Constants.SE_596, \
+			Constants.GIhA_541),), \
+		_GIhEK_root_991_8 : ((Constants.NA_578, Constants.SE_596, \
+			Constants.GIhA_541, Constants.NAI_581),), \
+		_I_root_956 : (_I_root_956_2, _I_root_956_1), \
+		_I_root_956_1 : (Constants.I_545,), \
+		_I_root_956_2 : ((Constants.I_545, _simple_JOIK_JEK_957),), \
+		_interval_modifier_1050 : (_interval_modifier_1050_2, \
+			_interval_modifier_1050_1, _interval_modifier_1050_3), \
+		_interval_modifier_1050_1 : (_interval_property_1051,), \
+		_interval_modifier_1050_2 : ((_interval_property_1051, \
+			_event_mod_1052),), \
+		_interval_modifier_1050_3 : (_event_mod_1052,), \
+		_interval_property_1051 : (_interval_property_1051_2, \
+			_interval_property_1051_1, _interval_property_1051_4, \
+			_interval_property_1051_3), \
+		_interval_property_1051_1 : ((_number_root_961, \
+			Constants.ROI_594),), \
+		_interval_property_1051_2 : ((_number_root_961, Constants.ROI_594, \
+			Constants.NAI_581),), \
+		_interval_property_1051_3 : (Constants.TAhE_604,), \
+		_interval_property_1051_4 : ((Constants.TAhE_604, \
+			Constants.NAI_581),), \
+		_JEK_root_926 : (_JEK_root_926_4, _JEK_root_926_5, _JEK_root_926_6, \
+			_JEK_root_926_8, _JEK_root_926_1, _JEK_root_926_2, \
+			_JEK_root_926_3, _JEK_root_926_7), \
+		_JEK_root_926_1 : (Constants.JA_546,), \
+		_JEK_root_926_2 : ((Constants.SE_596, Constants.JA_546),), \
+		_JEK_root_926_3 : ((Constants.NA_578, Constants.JA_546),), \
+		_JEK_root_926_4 : ((Constants.JA_546, Constants.NAI_581),), \
+		_JEK_root_926_5 : ((Constants.SE_596, Constants.JA_546, \
+			Constants.NAI_581),), \
+		_JEK_root_926_6 : ((Constants.NA_578, Constants.JA_546, \
+			Constants.NAI_581),), \
+		_JEK_root_926_7 : ((Constants.NA_578, Constants.SE_596, \
+			Constants.JA_546),), \
+		_JEK_root_926_8 : ((Constants.NA_578, Constants.SE_596, \
+			Constants.JA_546, Constants.NAI_581),), \
+		_JOIK_root_931 : (_JOIK_root_931_2, _JOIK_root_931_1, \
+			_JOIK_root_931_4, _JOIK_root_931_3, _JOIK_root_931_5, \
+			_JOIK_root_931_6), \
+		_JOIK_root_931_1 : (Constants.JOI_548,), \
+		_JOIK_root_931_2 : ((Constants.JOI_548, Constants.NAI_581),), \
+		_JOIK_root_931_3 : ((Constants.SE_596, Constants.JOI_548),), \
+		_JOIK_root_931_4 : ((Constants.SE_596, Constants.JOI_548, \
+			Constants.NAI_581),), \
+		_JOIK_root_931_5 : (_BIhI_root_932,), \
+		_JOIK_root_931_6 : ((Constants.GAhO_656, _BIhI_root_932, \
+			Constants.GAhO_656),), \
+		_lerfu_string_root_986 : (_lerfu_word_987, (_lerfu_word_987, \
+			Constants.PA_672), (_lerfu_word_987, _lerfu_word_987)), \
+		_lerfu_word_987 : (_lerfu_word_987_1, _lerfu_word_987_2, \
+			_lerfu_word_987_3), \
+		_lerfu_word_987_1 : (Constants.BY_513,), \
+		_lerfu_word_987_2 : ((Constants.LAU_559, _lerfu_word_987),), \
+		_lerfu_word_987_3 : ((Constants.TEI_605, _lerfu_string_root_986, \
+			Constants.FOI_533),), \
+		_lexer_A_905_driver : (_utt_ordinal_root_906,), \
+		_lexer_B_910_driver : (_EK_root_911,), \
+		_lexer_C_915_driver : (_lexer_C_915_1, _lexer_C_915_2), \
+		_lexer_C_915_1 : ((_EK_root_911, Constants.BO_508),), \
+		_lexer_C_915_2 : ((_EK_root_911, _simple_tag_971, \
+			Constants.BO_508),), \
+		_lexer_D_916_driver : (_lexer_D_916_1, _lexer_D_916_2), \
+		_lexer_D_916_1 : ((_EK_root_911, Constants.KE_551),), \
+		_lexer_D_916_2 : ((_EK_root_911, _simple_tag_971, \
+			Constants.KE_551),), \
+		_lexer_E_925_driver : (_JEK_root_926,), \
+		_lexer_F_930_driver : (_JOIK_root_931,), \
+		_lexer_G_935_driver : (_lexer_G_935_3, _lexer_G_935_1, \
+			_lexer_G_935_4, _lexer_G_935_2, _lexer_G_935_5, _lexer_G_935_6), \
+		_lexer_G_935_1 : (Constants.GA_537,), \
+		_lexer_G_935_2 : ((Constants.SE_596, Constants.GA_537),), \
+		_lexer_G_935_3 : ((Constants.GA_537, Constants.NAI_581),), \
+		_lexer_G_935_4 : ((Constants.SE_596, Constants.GA_537, \
+			Constants.NAI_581),), \
+		_lexer_G_935_5 : ((_simple_tag_971, _GIK_root_981),), \
+		_lexer_G_935_6 : ((_JOIK_root_931, Constants.GI_539),), \
+		_lexer_H_940_driver : (_lexer_H_940_3, _lexer_H_940_1, \
+			_lexer_H_940_4, _lexer_H_940_2), \
+		_lexer_H_940_1 : (Constants.GUhA_544,), \
+		_lexer_H_940_2 : ((Constants.SE_596, Constants.GUhA_544),), \
+		_lexer_H_940_3 : ((Constants.GUhA_544, Constants.NAI_581),), \
+		_lexer_H_940_4 : ((Constants.SE_596, Constants.GUhA_544, \
+			Constants.NAI_581),), \
+		_lexer_I_945_driver : (_lexer_I_945_1,), \
+		_lexer_I_945_1 : ((Constants.NAhE_583, Constants.BO_508),), \
+		_lexer_J_950_driver : (_lexer_J_950_1,), \
+		_lexer_J_950_1 : ((Constants.NA_578, Constants.KU_556),), \
+		_lexer_K_955_driver : (_lexer_K_955_1, _lexer_K_955_2), \
+		_lexer_K_955_1 : ((_I_root_956, Constants.BO_508),), \
+		_lexer_K_955_2 : ((_I_root_956, _simple_tag_971, \
+			Constants.BO_508),), \
+		_lexer_L_960_driver : (_number_root_961,), \
+		_lexer_M_965_driver : (_lexer_M_965_1, _lexer_M_965_2), \
+		_lexer_M_965_1 : ((_GIhEK_root_991, Constants.BO_508),), \
+		_lexer_M_965_2 : ((_GIhEK_root_991, _simple_tag_971, \
+			Constants.BO_508),), \
+		_lexer_N_966_driver : (_lexer_N_966_1, _lexer_N_966_2), \
+		_lexer_N_966_1 : ((_GIhEK_root_991, Constants.KE_551),), \
+		_lexer_N_966_2 : ((_GIhEK_root_991, _simple_tag_971, \
+			Constants.KE_551),), \
+		_lexer_O_970_driver : (_simple_tense_modal_972,), \
+		_lexer_P_980_driver : (_GIK_root_981,), \
+		_lexer_Q_985_driver : (_lerfu_string_root_986,), \
+		_lexer_R_990_driver : (_GIhEK_root_991,), \
+		_lexer_S_995_driver : (_I_root_956,), \
+		_lexer_U_1005_driver : (_lexer_U_1005_2, _lexer_U_1005_1), \
+		_lexer_U_1005_1 : ((_JEK_root_926, Constants.BO_508),), \
+		_lexer_U_1005_2 : ((_JEK_root_926, _simple_tag_971, \
+			Constants.BO_508),), \
+		_lexer_V_1010_driver : (_lexer_V_1010_2, _lexer_V_1010_1), \
+		_lexer_V_1010_1 : ((_JOIK_root_931, Constants.BO_508),), \
+		_lexer_V_1010_2 : ((_JOIK_root_931, _simple_tag_971, \
+			Constants.BO_508),), \
+		_lexer_W_1015_driver : (_lexer_W_1015_2, _lexer_W_1015_1), \
+		_lexer_W_1015_1 : ((_JOIK_root_931, Constants.KE_551),), \
+		_lexer_W_1015_2 : ((_JOIK_root_931, _simple_tag_971, \
+			Constants.KE_551),), \
+		_lexer_Y_1025_driver : (_lexer_Y_1025_1, _lexer_Y_1025_2), \
+		_lexer_Y_1025_1 : ((_number_root_961, Constants.MOI_663),), \
+		_lexer_Y_1025_2 : ((_lerfu_string_root_986, Constants.MOI_663),), \
+		_modal_974 : (_modal_974_2, _modal_974_1), \
+		_modal_974_1 : (_modal_A_975,), \
+		_modal_974_2 : ((_modal_A_975, Constants.NAI_581),), \
+		_modal_A_975 : (_modal_A_975_1, _modal_A_975_2), \
+		_modal_A_975_1 : (Constants.BAI_502,), \
+		_modal_A_975_2 : ((Constants.SE_596, Constants.BAI_502),), \
+		_number_root_961 : (Constants.PA_672, (Constants.PA_672, \
+			Constants.PA_672), (Constants.PA_672, _lerfu_word_987)), \
+		_simple_JOIK_JEK_957 : (_JOIK_root_931, _JEK_root_926), \
+		_simple_tag_971 : (_simple_tag_971_12,), \
+		_simple_tag_971_12 : (_simple_tense_modal_972, \
+			(_simple_tense_modal_972, _simple_JOIK_JEK_957)), \
+		_simple_tense_modal_972 : (_simple_tense_modal_972_1, \
+			_simple_tense_modal_972_2, _simple_tense_modal_972_3, \
+			_simple_tense_modal_972_4), \
+		_simple_tense_modal_972_1 : (_simple_tense_modal_A_973,), \
+		_simple_tense_modal_972_2 : ((Constants.NAhE_583, \
+			_simple_tense_modal_A_973),), \
+		_simple_tense_modal_972_3 : (Constants.CUhE_521,), \
+		_simple_tense_modal_972_4 : (Constants.KI_554,), \
+		_simple_tense_modal_A_973 : (_simple_tense_modal_A_973_2, \
+			_simple_tense_modal_A_973_1, _simple_tense_modal_A_973_3), \
+		_simple_tense_modal_A_973_1 : (_modal_974,), \
+		_simple_tense_modal_A_973_2 : ((_modal_974, Constants.KI_554),), \
+		_simple_tense_modal_A_973_3 : (_tense_A_977,), \
+		_space_1040 : (_space_1040_3, _space_1040_1, _space_1040_2), \
+		_space_1040_1 : (_space_A_1042,), \
+		_space_1040_2 : (_space_motion_1041,), \
+		_space_1040_3 : ((_space_A_1042, _space_motion_1041),), \
+		_space_motion_1041 : ((Constants.MOhI_577, _space_offset_1045),), \
+		_space_A_1042 : (_space_A_1042_2, _space_A_1042_1, _space_A_1042_3), \
+		_space_A_1042_1 : (Constants.VA_613,), \
+		_space_A_1042_2 : ((Constants.VA_613, _space_B_1043),), \
+		_space_A_1042_3 : (_space_B_1043,), \
+		_space_B_1043 : (_space_B_1043_3, _space_B_1043_1, _space_B_1043_2), \
+		_space_B_1043_1 : (_space_C_1044,), \
+		_space_B_1043_2 : (_space_intval_1046,), \
+		_space_B_1043_3 : ((_space_C_1044, _space_intval_1046),), \
+		_space_C_1044 : (_space_offset_1045, (_space_offset_1045, \
+			_space_offset_1045)), \
+		_space_offset_1045 : (_space_offset_1045_2, _space_offset_1045_1), \
+		_space_offset_1045_1 : (_space_direction_1048,), \
+		_space_offset_1045_2 : ((_space_direction_1048, Constants.VA_613),), \
+		_space_intval_1046 : (_space_intval_1046_5, _space_intval_1046_4, \
+			_space_intval_1046_3, _space_intval_1046_2, \
+			_space_intval_1046_1), \
+		_space_intval_1046_1 : (_space_intval_A_1047,), \
+		_space_intval_1046_2 : ((_space_intval_A_1047, \
+			_space_direction_1048),), \
+		_space_intval_1046_3 : ((Constants.FEhE_530, \
+			_interval_modifier_1050),), \
+		_space_intval_1046_4 : ((_space_intval_A_1047, Constants.FEhE_530, \
+			_interval_modifier_1050),), \
+		_space_intval_1046_5 : ((_space_intval_A_1047, \
+			_space_direction_1048, Constants.FEhE_530, \
+			_interval_modifier_1050),), \
+		_space_intval_A_1047 : (_space_intval_A_1047_3, \
+			_space_intval_A_1047_1, _space_intval_A_1047_2), \
+		_space_intval_A_1047_1 : (Constants.VEhA_615,), \
+		_space_intval_A_1047_2 : (Constants.VIhA_616,), \
+		_space_intval_A_1047_3 : ((Constants.VEhA_615, \
+			Constants.VIhA_616),), \
+		_space_direction_1048 : (_space_direction_1048_2, \
+			_space_direction_1048_1), \
+		_space_direction_1048_1 : (Constants.FAhA_528,), \
+		_space_direction_1048_2 : ((Constants.FAhA_528, \
+			Constants.NAI_581),), \
+		_tense_A_977 : (_tense_A_977_2, _tense_A_977_1), \
+		_tense_A_977_1 : (_tense_B_978,), \
+		_tense_A_977_2 : ((_tense_B_978, Constants.KI_554),), \
+		_tense_B_978 : (_tense_B_978_3, _tense_B_978_1, _tense_B_978_2), \
+		_tense_B_978_1 : (_tense_C_979,), \
+		_tense_B_978_2 : (Constants.CAhA_514,), \
+		_tense_B_978_3 : ((_tense_C_979, Constants.CAhA_514),), \
+		_tense_C_979 : (_tense_C_979_3, _tense_C_979_1, _tense_C_979_2), \
+		_tense_C_979_1 : (_time_1030,), \
+		_tense_C_979_2 : (_space_1040,), \
+		_tense_C_979_3 : ((_time_1030, _space_1040),), \
+		_time_1030 : (_time_1030_2, _time_1030_1, _time_1030_3), \
+		_time_1030_1 : (Constants.ZI_624,), \
+		_time_1030_2 : ((Constants.ZI_624, _time_A_1031),), \
+		_time_1030_3 : (_time_A_1031,), \
+		_time_A_1031 : (_time_A_1031_3, _time_A_1031_1, _time_A_1031_2), \
+		_time_A_1031_1 : (_time_B_1032,), \
+		_time_A_1031_2 : (_time_interval_1034,), \
+		_time_A_1031_3 : ((_time_B_1032, _time_interval_1034),), \
+		_time_B_1032 : (_time_offset_1033, (_time_offset_1033, \
+			_time_offset_1033)), \
+		_time_offset_1033 : (_time_offset_1033_2, _time_offset_1033_1), \
+		_time_offset_1033_1 : (_time_direction_1035,), \
+		_time_offset_1033_2 : ((_time_direction_1035, Constants.ZI_624),), \
+		_time_interval_1034 : (_time_interval_1034_5, _time_interval_1034_4, \
+			_time_interval_1034_3, _time_interval_1034_2, \
+			_time_interval_1034_1), \
+		_time_interval_1034_1 : (Constants.ZEhA_622,), \
+		_time_interval_1034_2 : ((Constants.ZEhA_622, \
+			_time_direction_1035),), \
+		_time_interval_1034_3 : (_interval_modifier_1050,), \
+		_time_interval_1034_4 : ((Constants.ZEhA_622, \
+			_interval_modifier_1050),), \
+		_time_interval_1034_5 : ((Constants.ZEhA_622, _time_direction_1035, \
+			_interval_modifier_1050),), \
+		_time_direction_1035 : (_time_direction_1035_2, \
+			_time_direction_1035_1), \
+		_time_direction_1035_1 : (Constants.PU_592,), \
+		_time_direction_1035_2 : ((Constants.PU_592, Constants.NAI_581),), \
+		_utt_ordinal_root_906 : (_utt_ordinal_root_906_1, \
+			_utt_ordinal_root_906_2), \
+		_utt_ordinal_root_906_1 : ((_lerfu_string_root_986, \
+			Constants.MAI_661),), \
+		_utt_ordinal_root_906_2 : ((_number_root_961, Constants.MAI_661),), \
+		})
+
+	# The compounder productions that the packrat memo goes between (see
+	# _memoized): those with several alternatives, which the tenses, modals
+	# and connectives call again and again at the same token.
+	_MEMOPRODUCTIONS = ( \
+		"_BIhI_root_932", "_EK_root_911", "_event_mod_1052", \
+		"_event_mod_A_1053", "_GIK_root_981", "_GIhEK_root_991", \
+		"_I_root_956", "_interval_modifier_1050", "_interval_property_1051", \
+		"_JEK_root_926", "_JOIK_root_931", "_lerfu_string_root_986", \
+		"_lerfu_word_987", "_modal_974", "_modal_A_975", "_number_root_961", \
+		"_simple_JOIK_JEK_957", "_simple_tag_971", "_simple_tag_971_12", \
+		"_simple_tense_modal_972", "_simple_tense_modal_A_973", \
+		"_space_1040", "_space_motion_1041", "_space_A_1042", \
+		"_space_B_1043", "_space_C_1044", "_space_offset_1045", \
+		"_space_intval_1046", "_space_intval_A_1047", \
+		"_space_direction_1048", "_tense_A_977", "_tense_B_978", \
+		"_tense_C_979", "_time_1030", "_time_A_1031", "_time_B_1032", \
+		"_time_offset_1033", "_time_interval_1034", "_time_direction_1035", \
+		"_utt_ordinal_root_906", \
+		)
+
+	# The loops of the compounder productions, which the packrat memo makes
+	# in its own way (see _memoloop): production -> (first, between, type of
+	# the left-nested tokens made along the loop or None for one token with
+	# all the matches as children).  first and between are in
+	# _MEMOPRODUCTIONS.
+	_MEMOLOOPS = MappingProxyType({ \
+		"_simple_tag_971_12" : ("_simple_tense_modal_972", \
+			("_simple_JOIK_JEK_957",), 971), \
+		"_space_C_1044" : ("_space_offset_1045", (), None), \
+		"_time_B_1032" : ("_time_offset_1033", (), None), \
+		})
 # end class LojbanParser:
+
+
+#######################################################################
+## FIRST sets of the compounder
+#######################################################################
+
+def _compoundfirst(rules):
+	"""
+	Works out the FIRST sets of the productions of the compounder from
+	rules (see LojbanParser._COMPOUNDRULES): for each of them, the selma'o
+	that a match can start with and, for those of them that are followed
+	by another selma'o in every match, the selma'o that can come second
+	(None when there are no such selma'o).  As the productions can be
+	recursive, the sets are grown until they stop changing.
+	"""
+	def _grow(target, source):
+		"""
+		Adds set source to set target; tells whether target grew.
+		"""
+		if source <= target:
+			return False
+		# end if source <= target:
+		target |= source
+		return True
+	# end def _grow(target, source):
+
+	# production -> selma'o that can start a match, that can be all of a
+	# match, and selma'o -> selma'o that can come after it in a match
+	first = {production : set() for production in rules}
+	whole = {production : set() for production in rules}
+	second = {production : {} for production in rules}
+	changed = True
+	while changed:
+		changed = False
+		for (production, alternatives) in rules.items():
+			for alternative in alternatives:
+				items = alternative if isinstance(alternative, tuple) \
+					else (alternative,)
+				if isinstance(items[0], int):
+					(itemfirst, itemwhole, itemsecond) = \
+						({items[0]}, {items[0]}, {})
+				else: # if isinstance(items[0], int):
+					(itemfirst, itemwhole, itemsecond) = \
+						(first[items[0]], whole[items[0]], second[items[0]])
+				# end if isinstance(items[0], int):
+				follows = list(itemsecond.items())
+				if len(items) == 1:
+					changed |= _grow(whole[production], itemwhole)
+				else: # if len(items) == 1:
+					after = {items[1]} if isinstance(items[1], int) \
+						else first[items[1]]
+					follows += [(t, after) for t in itemwhole]
+				# end if len(items) == 1:
+				changed |= _grow(first[production], itemfirst)
+				for (t, follow) in follows:
+					changed |= _grow(second[production].setdefault(t, set()), \
+						follow)
+				# end for (t, follow) in follows:
+			# end for alternative in alternatives:
+		# end for (production, alternatives) in rules.items():
+	# end while changed:
+	return MappingProxyType({production : (frozenset(first[production]), \
+		{t : frozenset(follow) for (t, follow) in second[production].items() \
+			if not t in whole[production]} or None) for production in rules})
+# end def _compoundfirst(rules):
+
+def _attempt(production, first, second):
+	"""
+	Returns production, a method of the compounder, made to put the cursor
+	of the lookahead buffer back where it started when it fails, which gives
+	back at once all the tokens that its match read (see fail()), and to fail
+	at once, without allocating a token or calling fail(), when the next
+	tokens cannot start a match of it: the next selma'o is not in first, or
+	is in second and the one after it is already in the lookahead buffer and
+	not in its set there.  Only the next token, which the match would read
+	first anyway, is read ahead for it: reading the one after would move
+	the lexer, and so the positions of the errors, ahead of the parse.
+	Nothing is ruled out with the D_cpd_reduce debugging on, so that it
+	still shows the compounds reduced in the matches that fail later.
+	"""
+	@functools.wraps(production)
+	def _attempted(self):
+		"""
+		Calls production unless the next tokens rule it out, and backtracks
+		over what it read if it fails.
+		"""
+		context = self._context
+		if context.compound_prune:
+			lookahead = self._lookahead
+			i = self._cursor
+			t = (lookahead[i] if i < len(lookahead) else self._peek(0)).ttype
+			if not t in first:
+				context.compound_pruned += 1
+				return None
+			# end if not t in first:
+			i += 1
+			if second is not None and i < len(lookahead) and t in second and \
+				not lookahead[i].ttype in second[t]:
+				context.compound_pruned += 1
+				return None
+			# end if second is not None and i < len(lookahead) and t in second and \
+		# end if context.compound_prune:
+		cursor = self._cursor
+		tok = production(self)
+		if not tok:
+			self._cursor = cursor
+		# end if not tok:
+		return tok
+	# end def _attempted(self):
+	return _attempted
+# end def _attempt(production, first, second):
+
+def _prunecompounder():
+	"""
+	Works out LojbanParser._COMPOUNDFIRST from LojbanParser._COMPOUNDRULES,
+	and puts in the place of each production of the compounder, in the class
+	and in _COMPOUNDDRIVERS, its version made by _attempt.
+	"""
+	compoundfirst = _compoundfirst(LojbanParser._COMPOUNDRULES)
+	pruned = {production : _attempt(production, first, second) \
+		for (production, (first, second)) in compoundfirst.items()}
+	for (production, method) in pruned.items():
+		setattr(LojbanParser, production.__name__, method)
+	# end for (production, method) in pruned.items():
+	LojbanParser._COMPOUNDFIRST = compoundfirst
+	LojbanParser._COMPOUNDDRIVERS = MappingProxyType({ttype : \
+		tuple(pruned.get(driver, driver) for driver in drivers) \
+		for (ttype, drivers) in LojbanParser._COMPOUNDDRIVERS.items()})
+# end def _prunecompounder():
+
+_prunecompounder()
+
+
+#######################################################################
+## Worker processes of LojbanParser.parseMany
+#######################################################################
+
+# the parser of the worker process
+_batchparser = None
+
+def _batchinit(parameters):
+	"""
+	Creates the parser of a worker process and warms it up.
+	"""
+	global _batchparser
+	_batchparser = LojbanParser(parameters)
+	with redirect_stderr(StringIO()):
+		_batchparser.parseString("coi")
+	# end with redirect_stderr(StringIO()):
+# end def _batchinit(parameters):
+
+def _batchmessages(text, errors):
+	"""
+	Returns the errors of a document, its ParseError, with the lines of
+	text, all that its parse printed, as strings around them in the order
+	in which they were printed (a ParseError prints itself when recorded).
+	"""
+	entries = []
+	start = 0
+	for error in errors:
+		printed = str(error) + "\n"
+		end = text.find(printed, start)
+		if end >= 0:
+			entries.extend(text[start:end].splitlines())
+			start = end + len(printed)
+		# end if end >= 0:
+		entries.append(error)
+	# end for error in errors:
+	entries.extend(text[start:].splitlines())
+	return entries
+# end def _batchmessages(text, errors):
+
+def _batchparse(chunk, mode):
+	"""
+	Parses the documents of chunk, a list of (index, text), and returns the
+	list of their (index, output, errors), output being the tree printed
+	(mode "print"), dumped ("dump") or written to shared memory ("shared",
+	the name and size of the block), and errors made by _batchmessages
+	from what the parse printed to sys.stdout and sys.stderr, which the
+	worker keeps from its own streams.
+	"""
+	parser = _batchparser
+	results = []
+	for (index, text) in chunk:
+		messages = StringIO()
+		try:
+			with redirect_stdout(messages), redirect_stderr(messages):
+				tree = parser.parse(text)
+			# end with redirect_stdout(messages), redirect_stderr(messages):
+			if tree is None:
+				output = None
+			elif mode == "dump":
+				output = Token.dumps(tree)
+			elif mode == "shared":
+				output = TokenStore.fromtree(tree).toshared()
+			else: # if tree is None:
+				buffer = StringIO()
+				for t in (tree if isinstance(tree, list) else [tree]):
+					if parser.treemode:
+						parser.tprint(t, file = buffer)
+					elif parser.rulemode:
+						parser.rprint(t, file = buffer)
+					else:
+						parser.print(t, file = buffer)
+				# end for t in (tree if isinstance(tree, list) else [tree]):
+				output = buffer.getvalue()
+			# end if tree is None:
+			results.append((index, output, \
+				_batchmessages(messages.getvalue(), parser.errors)))
+		except Exception as e:
+			results.append((index, None, \
+				_batchmessages(messages.getvalue(), []) + [e]))
+		# end try except Exception as e:
+	# end for (index, text) in chunk:
+	return results
+# end def _batchparse(chunk, mode):
 		
 
 if __name__ == '__main__':
@@ -0,0 +1,8019 @@
+#######################################################################
+# lojbanParserStates: the YACC parser of lojbanParser as one function per
+# state.  Generated by genLojbanParser.py, do not edit.
+#######################################################################
+
+# checksum of the parser tables this module was generated from
+CHECKSUM = 2939496435
+
+# codes added to the next state returned by a state function
+_SHIFTED = 1024
+_GREW = 2048
+_ERROK = 4096
+_ERROR = 8192
+_ACCEPT = 16384
+
+# shifts of the states that have several: {token: next state}
+_SHIFT0 = { \
+	504 : 75, 505 : 74, 509 : 152, 515 : 34, 517 : 26, 519 : 51, 524 : 36, 525 : 45, \
+	527 : 101, 532 : 79, 535 : 11, 536 : 37, 542 : 86, 543 : 154, 547 : 145, 551 : 143, \
+	555 : 119, 558 : 112, 561 : 117, 562 : 121, 566 : 113, 569 : 133, 571 : 129, 574 : 146, \
+	578 : 68, 581 : 7, 583 : 139, 584 : 31, 585 : 87, 586 : 155, 587 : 93, 596 : 150, \
+	597 : 47, 602 : 41, 606 : 39, 610 : 65, 612 : 33, 617 : 42, 618 : 35, 626 : 132, \
+	627 : 131, 667 : 147, 677 : 81, 905 : 43, 910 : 67, 925 : 28, 930 : 27, 935 : 96, \
+	940 : 141, 945 : 124, 950 : 94, 955 : 30, 960 : 80, 970 : 78, 985 : 125, 990 : 69, \
+	995 : 29, 1025 : 156, \
+	}
+_SHIFT4 = { \
+	504 : 75, 505 : 74, 509 : 152, 519 : 51, 525 : 45, 527 : 101, 532 : 79, 542 : 86, \
+	543 : 154, 547 : 145, 551 : 143, 555 : 119, 558 : 112, 561 : 117, 562 : 121, 566 : 113, \
+	569 : 133, 571 : 129, 574 : 146, 578 : 68, 583 : 139, 584 : 31, 585 : 87, 586 : 155, \
+	587 : 93, 596 : 150, 597 : 47, 602 : 41, 606 : 39, 610 : 65, 617 : 42, 626 : 132, \
+	627 : 131, 667 : 147, 677 : 81, 905 : 43, 910 : 67, 925 : 28, 930 : 27, 935 : 96, \
+	940 : 141, 945 : 124, 950 : 94, 955 : 30, 960 : 80, 970 : 78, 985 : 125, 990 : 69, \
+	995 : 29, 1025 : 156, \
+	}
+_SHIFT5 = { \
+	504 : 75, 505 : 74, 509 : 152, 527 : 101, 532 : 79, 542 : 86, 543 : 154, 547 : 145, \
+	551 : 143, 555 : 119, 558 : 112, 561 : 117, 562 : 121, 566 : 113, 569 : 133, 571 : 129, \
+	574 : 146, 578 : 68, 583 : 139, 584 : 31, 585 : 87, 586 : 155, 587 : 93, 596 : 150, \
+	610 : 65, 626 : 132, 627 : 131, 667 : 147, 677 : 81, 910 : 67, 925 : 28, 930 : 27, \
+	935 : 96, 940 : 141, 945 : 124, 950 : 94, 955 : 30, 960 : 80, 970 : 78, 985 : 125, \
+	990 : 69, 995 : 29, 1025 : 156, \
+	}
+_SHIFT8 = { \
+	504 : 75, 505 : 74, 509 : 152, 527 : 101, 532 : 79, 542 : 86, 543 : 154, 547 : 145, \
+	551 : 143, 555 : 119, 558 : 112, 561 : 117, 562 : 121, 566 : 113, 569 : 133, 571 : 129, \
+	574 : 146, 578 : 68, 583 : 139, 584 : 31, 585 : 87, 586 : 155, 587 : 93, 596 : 150, \
+	610 : 65, 626 : 132, 627 : 131, 667 : 147, 677 : 81, 910 : 67, 935 : 96, 940 : 141, \
+	945 : 124, 950 : 94, 955 : 30, 960 : 80, 970 : 78, 985 : 125, 990 : 69, 995 : 29, \
+	1025 : 156, \
+	}
+_SHIFT10 = { \
+	515 : 34, 524 : 36, 536 : 37, 612 : 33, 618 : 35, \
+	}
+_SHIFT12 = { \
+	519 : 51, 525 : 45, 597 : 47, 602 : 41, 606 : 39, 617 : 42, 905 : 43, \
+	}
+_SHIFT13 = { \
+	517 : 168, 519 : 51, 525 : 45, 597 : 47, 602 : 41, 606 : 39, 617 : 42, 905 : 43, \
+	}
+_SHIFT18 = { \
+	504 : 75, 505 : 74, 509 : 152, 527 : 101, 532 : 79, 542 : 86, 543 : 154, 547 : 145, \
+	551 : 143, 555 : 119, 558 : 112, 561 : 117, 562 : 121, 566 : 113, 569 : 133, 571 : 129, \
+	574 : 146, 578 : 68, 583 : 139, 585 : 87, 586 : 155, 587 : 93, 596 : 150, 610 : 65, \
+	626 : 132, 627 : 131, 667 : 147, 677 : 81, 910 : 67, 935 : 96, 940 : 141, 945 : 124, \
+	950 : 94, 960 : 80, 970 : 78, 985 : 125, 990 : 69, 1025 : 156, \
+	}
+_SHIFT31 = { \
+	519 : 51, 525 : 45, 584 : 31, 597 : 47, 602 : 41, 606 : 39, 617 : 42, 905 : 43, \
+	}
+_SHIFT38 = { \
+	256 : 187, 509 : 152, 517 : 26, 526 : 186, 532 : 79, 542 : 86, 543 : 154, 547 : 145, \
+	551 : 143, 555 : 119, 558 : 112, 561 : 117, 562 : 121, 566 : 113, 569 : 133, 571 : 129, \
+	574 : 146, 578 : 68, 583 : 139, 585 : 87, 586 : 155, 596 : 150, 626 : 132, 627 : 131, \
+	667 : 147, 677 : 81, 935 : 96, 940 : 141, 945 : 124, 960 : 80, 970 : 78, 985 : 125, \
+	1025 : 156, \
+	}
+_SHIFT40 = { \
+	509 : 152, 527 : 101, 532 : 79, 543 : 154, 547 : 145, 551 : 143, 555 : 119, 558 : 112, \
+	561 : 117, 562 : 121, 566 : 113, 569 : 133, 571 : 129, 574 : 146, 578 : 68, 583 : 139, \
+	586 : 155, 587 : 93, 596 : 150, 626 : 132, 627 : 131, 667 : 147, 677 : 81, 935 : 96, \
+	940 : 141, 945 : 124, 950 : 94, 960 : 80, 970 : 78, 985 : 125, 1025 : 156, \
+	}
+_SHIFT41 = { \
+	555 : 119, 558 : 112, 561 : 117, 562 : 121, 566 : 113, 569 : 133, 571 : 129, 626 : 132, \
+	627 : 131, 677 : 81, 935 : 96, 945 : 124, 960 : 80, 985 : 125, \
+	}
+_SHIFT42 = { \
+	677 : 81, 960 : 80, 985 : 125, \
+	}
+_SHIFT44 = { \
+	584 : 31, 995 : 29, \
+	}
+_SHIFT46 = { \
+	519 : 51, 525 : 201, \
+	}
+_SHIFT54 = { \
+	509 : 152, 527 : 101, 532 : 79, 543 : 154, 547 : 145, 551 : 143, 555 : 119, 558 : 112, \
+	561 : 117, 562 : 121, 566 : 113, 569 : 133, 571 : 129, 574 : 146, 578 : 68, 583 : 139, \
+	586 : 155, 587 : 93, 596 : 150, 610 : 207, 626 : 132, 627 : 131, 667 : 147, 677 : 81, \
+	935 : 96, 940 : 141, 945 : 124, 950 : 94, 960 : 80, 970 : 78, 985 : 125, 1025 : 156, \
+	}
+_SHIFT55 = { \
+	509 : 152, 543 : 154, 547 : 145, 551 : 214, 574 : 146, 578 : 68, 583 : 139, 586 : 155, \
+	596 : 150, 610 : 213, 667 : 147, 925 : 28, 930 : 27, 940 : 141, 1025 : 156, \
+	}
+_SHIFT57 = { \
+	509 : 152, 532 : 79, 543 : 154, 547 : 145, 551 : 143, 574 : 146, 578 : 68, 583 : 139, \
+	586 : 155, 596 : 150, 667 : 147, 935 : 96, 940 : 141, 970 : 78, 1025 : 156, \
+	}
+_SHIFT59 = { \
+	509 : 152, 532 : 79, 543 : 154, 547 : 145, 551 : 143, 555 : 119, 558 : 112, 561 : 117, \
+	562 : 121, 566 : 113, 569 : 133, 571 : 129, 574 : 146, 578 : 68, 583 : 139, 586 : 155, \
+	596 : 150, 626 : 132, 627 : 131, 667 : 147, 940 : 141, 945 : 124, 970 : 78, 985 : 125, \
+	1025 : 156, \
+	}
+_SHIFT60 = { \
+	256 : 229, 509 : 152, 520 : 230, 527 : 101, 532 : 79, 543 : 154, 547 : 145, 551 : 143, \
+	555 : 119, 558 : 112, 561 : 117, 562 : 121, 566 : 113, 569 : 133, 571 : 129, 574 : 146, \
+	578 : 68, 583 : 139, 586 : 155, 587 : 93, 596 : 150, 614 : 228, 626 : 132, 627 : 131, \
+	628 : 224, 667 : 147, 677 : 81, 935 : 96, 940 : 141, 945 : 124, 950 : 94, 960 : 80, \
+	970 : 78, 985 : 125, 1025 : 156, \
+	}
+_SHIFT70 = { \
+	256 : 239, 651 : 238, \
+	}
+_SHIFT71 = { \
+	551 : 254, 561 : 117, 583 : 139, 596 : 150, 655 : 242, 657 : 259, 662 : 265, 664 : 258, \
+	665 : 266, 666 : 257, 673 : 246, 677 : 81, 679 : 262, 935 : 96, 940 : 141, 945 : 124, \
+	960 : 80, 985 : 125, \
+	}
+_SHIFT74 = { \
+	527 : 101, 532 : 79, 555 : 119, 558 : 112, 561 : 117, 562 : 121, 566 : 113, 569 : 133, \
+	571 : 129, 587 : 93, 626 : 132, 627 : 131, 677 : 81, 935 : 96, 945 : 124, 950 : 94, \
+	960 : 80, 970 : 78, 985 : 125, \
+	}
+_SHIFT79 = { \
+	509 : 152, 532 : 79, 543 : 154, 547 : 145, 551 : 143, 574 : 146, 578 : 68, 583 : 139, \
+	586 : 155, 596 : 150, 667 : 147, 940 : 141, 970 : 78, 1025 : 156, \
+	}
+_SHIFT88 = { \
+	966 : 276, 990 : 69, \
+	}
+_SHIFT91 = { \
+	910 : 67, 916 : 283, 930 : 27, 1015 : 284, \
+	}
+_SHIFT92 = { \
+	256 : 290, 555 : 119, 556 : 289, 558 : 112, 561 : 117, 562 : 121, 566 : 113, 569 : 133, \
+	571 : 129, 626 : 132, 627 : 131, 677 : 81, 935 : 96, 945 : 124, 960 : 80, 985 : 125, \
+	}
+_SHIFT100 = { \
+	915 : 299, 1010 : 300, \
+	}
+_SHIFT103 = { \
+	256 : 229, 527 : 101, 532 : 79, 555 : 119, 558 : 112, 561 : 117, 562 : 121, 566 : 113, \
+	569 : 133, 571 : 129, 587 : 93, 614 : 228, 626 : 132, 627 : 131, 677 : 81, 935 : 96, \
+	945 : 124, 950 : 94, 960 : 80, 970 : 78, 985 : 125, \
+	}
+_SHIFT106 = { \
+	542 : 86, 585 : 87, \
+	}
+_SHIFT109 = { \
+	509 : 152, 518 : 308, 543 : 154, 547 : 145, 551 : 143, 574 : 146, 583 : 139, 586 : 155, \
+	596 : 150, 667 : 147, 940 : 141, 1025 : 156, \
+	}
+_SHIFT110 = { \
+	542 : 86, 555 : 119, 558 : 112, 561 : 117, 562 : 121, 566 : 113, 569 : 133, 571 : 129, \
+	585 : 87, 626 : 132, 627 : 131, 677 : 81, 935 : 96, 945 : 124, 960 : 80, 985 : 125, \
+	}
+_SHIFT112 = { \
+	509 : 152, 517 : 26, 532 : 79, 542 : 86, 543 : 154, 547 : 145, 551 : 143, 555 : 119, \
+	558 : 112, 561 : 117, 562 : 121, 566 : 113, 569 : 133, 571 : 129, 574 : 146, 578 : 68, \
+	583 : 139, 585 : 87, 586 : 155, 596 : 150, 626 : 132, 627 : 131, 667 : 147, 677 : 81, \
+	940 : 141, 945 : 124, 960 : 80, 970 : 78, 985 : 125, 1025 : 156, \
+	}
+_SHIFT116 = { \
+	925 : 28, 930 : 27, 1015 : 284, \
+	}
+_SHIFT121 = { \
+	509 : 152, 532 : 79, 542 : 86, 543 : 154, 547 : 145, 551 : 143, 555 : 119, 558 : 112, \
+	561 : 117, 562 : 121, 566 : 113, 569 : 133, 571 : 129, 574 : 146, 578 : 68, 583 : 139, \
+	585 : 87, 586 : 155, 596 : 150, 626 : 132, 627 : 131, 667 : 147, 677 : 81, 940 : 141, \
+	945 : 124, 960 : 80, 970 : 78, 985 : 125, 1025 : 156, \
+	}
+_SHIFT130 = { \
+	1005 : 330, 1010 : 300, \
+	}
+_SHIFT134 = { \
+	508 : 334, 516 : 336, \
+	}
+_SHIFT136 = { \
+	509 : 152, 543 : 154, 547 : 145, 551 : 143, 574 : 146, 583 : 139, 586 : 155, 596 : 150, \
+	667 : 147, 940 : 141, 1025 : 156, \
+	}
+_SHIFT144 = { \
+	509 : 152, 543 : 154, 547 : 145, 551 : 143, 574 : 146, 583 : 139, 586 : 155, 596 : 150, \
+	667 : 147, 1025 : 156, \
+	}
+_SHIFT145 = { \
+	509 : 152, 532 : 79, 543 : 154, 547 : 145, 551 : 143, 574 : 146, 583 : 139, 586 : 155, \
+	596 : 150, 667 : 147, 970 : 78, 1025 : 156, \
+	}
+_SHIFT147 = { \
+	583 : 139, 596 : 150, 662 : 265, 665 : 266, 679 : 262, \
+	}
+_SHIFT148 = { \
+	509 : 152, 527 : 101, 532 : 79, 543 : 154, 547 : 145, 551 : 143, 555 : 119, 558 : 112, \
+	561 : 117, 562 : 121, 566 : 113, 569 : 133, 571 : 129, 574 : 146, 578 : 68, 583 : 139, \
+	586 : 155, 587 : 93, 596 : 150, 626 : 132, 627 : 131, 667 : 147, 677 : 81, 925 : 28, \
+	930 : 27, 935 : 96, 940 : 141, 945 : 124, 950 : 94, 960 : 80, 970 : 78, 985 : 125, \
+	1025 : 156, \
+	}
+_SHIFT155 = { \
+	519 : 51, 525 : 45, 581 : 355, 597 : 47, 602 : 41, 606 : 39, 617 : 42, 905 : 43, \
+	}
+_SHIFT180 = { \
+	256 : 187, 526 : 186, 542 : 86, 585 : 87, \
+	}
+_SHIFT181 = { \
+	509 : 152, 532 : 79, 543 : 154, 547 : 145, 551 : 143, 574 : 146, 578 : 68, 583 : 139, \
+	586 : 155, 596 : 150, 625 : 232, 667 : 147, 677 : 81, 940 : 141, 960 : 80, 970 : 78, \
+	1025 : 156, \
+	}
+_SHIFT183 = { \
+	256 : 187, 526 : 186, \
+	}
+_SHIFT185 = { \
+	509 : 152, 543 : 154, 547 : 145, 551 : 143, 574 : 146, 578 : 68, 583 : 139, 586 : 155, \
+	596 : 150, 667 : 147, 925 : 28, 930 : 27, 940 : 141, 1025 : 156, \
+	}
+_SHIFT191 = { \
+	256 : 367, 607 : 366, \
+	}
+_SHIFT192 = { \
+	256 : 370, 598 : 369, \
+	}
+_SHIFT193 = { \
+	509 : 152, 520 : 230, 527 : 101, 532 : 79, 543 : 154, 547 : 145, 551 : 143, 555 : 119, \
+	558 : 112, 561 : 117, 562 : 121, 566 : 113, 569 : 133, 571 : 129, 574 : 146, 578 : 68, \
+	583 : 139, 586 : 155, 587 : 93, 596 : 150, 626 : 132, 627 : 131, 667 : 147, 677 : 81, \
+	935 : 96, 940 : 141, 945 : 124, 950 : 94, 960 : 80, 970 : 78, 985 : 125, 1025 : 156, \
+	}
+_SHIFT195 = { \
+	256 : 370, 555 : 119, 558 : 112, 561 : 117, 562 : 121, 566 : 113, 569 : 133, 571 : 129, \
+	598 : 369, 626 : 132, 627 : 131, 677 : 81, 935 : 96, 945 : 124, 960 : 80, 985 : 125, \
+	}
+_SHIFT196 = { \
+	256 : 377, 651 : 376, \
+	}
+_SHIFT206 = { \
+	256 : 385, 611 : 384, \
+	}
+_SHIFT210 = { \
+	509 : 152, 520 : 230, 527 : 101, 532 : 79, 543 : 154, 547 : 145, 551 : 143, 555 : 119, \
+	558 : 112, 561 : 117, 562 : 121, 566 : 113, 569 : 133, 571 : 129, 574 : 146, 578 : 68, \
+	583 : 139, 586 : 155, 587 : 93, 596 : 150, 626 : 132, 627 : 131, 628 : 224, 667 : 147, \
+	677 : 81, 935 : 96, 940 : 141, 945 : 124, 950 : 94, 960 : 80, 970 : 78, 985 : 125, \
+	1025 : 156, \
+	}
+_SHIFT211 = { \
+	509 : 152, 543 : 154, 547 : 145, 551 : 214, 574 : 146, 578 : 68, 583 : 139, 586 : 155, \
+	596 : 150, 667 : 147, 925 : 28, 930 : 27, 940 : 141, 1025 : 156, \
+	}
+_SHIFT216 = { \
+	532 : 79, 970 : 78, \
+	}
+_SHIFT221 = { \
+	256 : 290, 556 : 289, \
+	}
+_SHIFT231 = { \
+	509 : 152, 532 : 79, 543 : 154, 547 : 145, 551 : 143, 555 : 119, 558 : 112, 561 : 117, \
+	562 : 121, 566 : 113, 569 : 133, 571 : 129, 574 : 146, 578 : 68, 583 : 139, 586 : 155, \
+	596 : 150, 626 : 132, 627 : 131, 667 : 147, 677 : 81, 935 : 96, 940 : 141, 945 : 124, \
+	960 : 80, 970 : 78, 985 : 125, 1025 : 156, \
+	}
+_SHIFT240 = { \
+	256 : 402, 551 : 254, 583 : 139, 596 : 150, 662 : 265, 665 : 266, 678 : 401, 679 : 262, \
+	940 : 141, \
+	}
+_SHIFT242 = { \
+	561 : 117, 657 : 259, 664 : 258, 666 : 257, 677 : 81, 935 : 96, 945 : 124, 960 : 80, \
+	985 : 125, \
+	}
+_SHIFT245 = { \
+	551 : 254, 561 : 117, 583 : 139, 596 : 150, 657 : 259, 662 : 265, 664 : 258, 665 : 266, \
+	666 : 257, 673 : 246, 677 : 81, 679 : 262, 925 : 28, 930 : 27, 935 : 96, 940 : 141, \
+	945 : 124, 960 : 80, 985 : 125, 1015 : 284, \
+	}
+_SHIFT246 = { \
+	551 : 254, 583 : 139, 596 : 150, 662 : 265, 665 : 266, 679 : 262, 940 : 141, \
+	}
+_SHIFT259 = { \
+	551 : 254, 561 : 117, 583 : 139, 596 : 150, 657 : 259, 662 : 265, 664 : 258, 665 : 266, \
+	666 : 257, 673 : 246, 677 : 81, 679 : 262, 935 : 96, 940 : 141, 945 : 124, 960 : 80, \
+	985 : 125, \
+	}
+_SHIFT268 = { \
+	925 : 28, 930 : 27, \
+	}
+_SHIFT269 = { \
+	256 : 434, 505 : 74, 506 : 433, \
+	}
+_SHIFT271 = { \
+	256 : 437, 531 : 436, \
+	}
+_SHIFT272 = { \
+	256 : 440, 538 : 439, \
+	}
+_SHIFT273 = { \
+	256 : 443, 557 : 442, \
+	}
+_SHIFT292 = { \
+	256 : 461, 527 : 101, 532 : 79, 555 : 119, 558 : 112, 561 : 117, 562 : 121, 566 : 113, \
+	569 : 133, 571 : 129, 587 : 93, 588 : 460, 626 : 132, 627 : 131, 677 : 81, 935 : 96, \
+	945 : 124, 950 : 94, 960 : 80, 970 : 78, 985 : 125, \
+	}
+_SHIFT309 = { \
+	256 : 473, 573 : 472, \
+	}
+_SHIFT310 = { \
+	555 : 119, 558 : 112, 561 : 117, 562 : 121, 566 : 113, 569 : 133, 571 : 129, 625 : 232, \
+	626 : 132, 627 : 131, 677 : 81, 935 : 96, 945 : 124, 960 : 80, 985 : 125, \
+	}
+_SHIFT315 = { \
+	509 : 152, 532 : 79, 542 : 86, 543 : 154, 547 : 145, 551 : 143, 574 : 146, 578 : 68, \
+	583 : 139, 585 : 87, 586 : 155, 596 : 150, 667 : 147, 677 : 81, 940 : 141, 960 : 80, \
+	970 : 78, 1025 : 156, \
+	}
+_SHIFT318 = { \
+	256 : 484, 551 : 254, 568 : 483, 583 : 139, 596 : 150, 662 : 265, 665 : 266, 679 : 262, \
+	940 : 141, \
+	}
+_SHIFT327 = { \
+	256 : 490, 567 : 489, \
+	}
+_SHIFT344 = { \
+	256 : 502, 509 : 152, 543 : 154, 547 : 145, 550 : 501, 551 : 143, 574 : 146, 583 : 139, \
+	586 : 155, 596 : 150, 667 : 147, 940 : 141, 1025 : 156, \
+	}
+_SHIFT346 = { \
+	509 : 152, 543 : 154, 547 : 145, 551 : 143, 574 : 146, 583 : 139, 586 : 155, 596 : 150, \
+	667 : 147, 925 : 28, 930 : 27, 1025 : 156, \
+	}
+_SHIFT348 = { \
+	256 : 506, 575 : 505, \
+	}
+_SHIFT350 = { \
+	256 : 509, 552 : 508, \
+	}
+_SHIFT359 = { \
+	256 : 187, 526 : 186, 625 : 232, \
+	}
+_SHIFT378 = { \
+	256 : 520, 551 : 254, 583 : 139, 596 : 150, 662 : 265, 665 : 266, 678 : 519, 679 : 262, \
+	940 : 141, \
+	}
+_SHIFT388 = { \
+	256 : 502, 550 : 501, \
+	}
+_SHIFT389 = { \
+	551 : 525, 925 : 28, 930 : 27, \
+	}
+_SHIFT390 = { \
+	532 : 79, 578 : 68, 935 : 96, 970 : 78, \
+	}
+_SHIFT407 = { \
+	256 : 535, 551 : 254, 561 : 117, 583 : 139, 596 : 150, 657 : 259, 658 : 534, 662 : 265, \
+	664 : 258, 665 : 266, 666 : 257, 673 : 246, 677 : 81, 679 : 262, 935 : 96, 940 : 141, \
+	945 : 124, 960 : 80, 985 : 125, \
+	}
+_SHIFT418 = { \
+	256 : 502, 550 : 501, 925 : 28, 930 : 27, 1015 : 284, \
+	}
+_SHIFT420 = { \
+	256 : 548, 675 : 547, \
+	}
+_SHIFT422 = { \
+	256 : 548, 551 : 254, 561 : 117, 583 : 139, 596 : 150, 657 : 259, 662 : 265, 664 : 258, \
+	665 : 266, 666 : 257, 673 : 246, 675 : 547, 677 : 81, 679 : 262, 935 : 96, 940 : 141, \
+	945 : 124, 960 : 80, 985 : 125, \
+	}
+_SHIFT428 = { \
+	256 : 548, 551 : 254, 583 : 139, 596 : 150, 662 : 265, 665 : 266, 675 : 547, 679 : 262, \
+	940 : 141, \
+	}
+_SHIFT432 = { \
+	256 : 434, 506 : 433, \
+	}
+_SHIFT459 = { \
+	910 : 67, 930 : 27, \
+	}
+_SHIFT529 = { \
+	551 : 254, 561 : 117, 583 : 139, 596 : 150, 657 : 259, 662 : 265, 664 : 258, 665 : 266, \
+	666 : 257, 677 : 81, 679 : 262, 935 : 96, 940 : 141, 945 : 124, 960 : 80, 985 : 125, \
+	}
+_SHIFT542 = { \
+	551 : 254, 583 : 139, 596 : 150, 662 : 265, 665 : 266, 679 : 262, \
+	}
+
+# gotos on the nonterminals: {state below: next state}, for the states
+# below whose next state is not the default (written in the reductions)
+_GOTO2 = { \
+	7 : 162, 39 : 191, 129 : 327, \
+	}
+_GOTO3 = { \
+	4 : 158, 5 : 160, 6 : 161, 159 : 357, \
+	}
+_GOTO5 = { \
+	4 : 159, 12 : 166, 13 : 167, 14 : 169, 15 : 170, 29 : 174, 30 : 175, 31 : 176, \
+	47 : 203, 65 : 233, 67 : 234, 68 : 235, 69 : 236, 78 : 270, 94 : 293, 96 : 294, \
+	101 : 301, 117 : 321, 119 : 322, 122 : 325, 124 : 326, 139 : 341, 141 : 343, 149 : 352, \
+	150 : 353, 155 : 356, 224 : 393, 228 : 395, 230 : 396, 238 : 398, 262 : 425, 276 : 446, \
+	283 : 454, 284 : 455, 286 : 456, 289 : 457, 296 : 463, 299 : 466, 300 : 467, 308 : 470, \
+	330 : 493, 336 : 498, 355 : 511, 384 : 521, 401 : 528, 433 : 556, 436 : 557, 439 : 558, \
+	442 : 559, 448 : 563, 460 : 570, 472 : 572, 483 : 576, 501 : 580, 505 : 582, 508 : 583, \
+	534 : 587, 547 : 593, \
+	}
+_GOTO6 = { \
+	38 : 182, 112 : 311, \
+	}
+_GOTO7 = { \
+	55 : 216, 116 : 319, 148 : 351, 185 : 216, 194 : 216, 211 : 216, 220 : 216, 245 : 408, \
+	268 : 216, 307 : 319, 346 : 216, 389 : 216, 400 : 408, 411 : 408, 418 : 408, 531 : 408, \
+	537 : 408, 585 : 408, \
+	}
+_GOTO8 = { \
+	8 : 163, 16 : 171, 17 : 172, 53 : 206, \
+	}
+_GOTO9 = { \
+	44 : 200, \
+	}
+_GOTO10 = { \
+	50 : 204, \
+	}
+_GOTO11 = { \
+	31 : 177, 44 : 199, \
+	}
+_GOTO12 = { \
+	18 : 173, \
+	}
+_GOTO13 = { \
+	199 : 380, 207 : 386, 213 : 387, \
+	}
+_GOTO15 = { \
+	200 : 381, 204 : 382, \
+	}
+_GOTO19 = { \
+	386 : 522, 387 : 523, \
+	}
+_GOTO20 = { \
+	54 : 209, 87 : 209, 89 : 209, 148 : 209, 209 : 209, 447 : 209, \
+	}
+_GOTO21 = { \
+	38 : 185, 40 : 194, 54 : 211, 57 : 220, 59 : 185, 60 : 211, 74 : 268, 75 : 268, \
+	79 : 185, 86 : 268, 87 : 211, 89 : 211, 93 : 268, 103 : 268, 112 : 185, 121 : 185, \
+	138 : 185, 145 : 346, 148 : 211, 181 : 185, 188 : 185, 190 : 185, 193 : 194, 209 : 211, \
+	210 : 211, 212 : 220, 214 : 389, 219 : 220, 225 : 220, 231 : 220, 257 : 185, 266 : 185, \
+	274 : 220, 275 : 220, 291 : 268, 292 : 268, 295 : 220, 303 : 268, 314 : 185, 315 : 185, \
+	317 : 185, 371 : 185, 390 : 389, 445 : 268, 447 : 211, 449 : 220, 458 : 268, 462 : 268, \
+	478 : 185, 525 : 389, 560 : 268, 569 : 268, 596 : 268, 597 : 268, 598 : 268, \
+	}
+_GOTO22 = { \
+	91 : 285, 247 : 285, 459 : 285, \
+	}
+_GOTO23 = { \
+	0 : 57, 4 : 57, 5 : 57, 6 : 57, 7 : 57, 8 : 57, 16 : 57, 17 : 57, \
+	18 : 57, 39 : 57, 53 : 57, 54 : 212, 57 : 212, 60 : 212, 87 : 212, 89 : 212, \
+	129 : 57, 148 : 212, 159 : 57, 199 : 57, 200 : 57, 204 : 57, 207 : 57, 209 : 212, \
+	210 : 212, 212 : 212, 213 : 57, 214 : 390, 219 : 212, 225 : 212, 231 : 212, 274 : 212, \
+	275 : 212, 295 : 212, 390 : 390, 447 : 212, 449 : 212, 525 : 390, \
+	}
+_GOTO24 = { \
+	88 : 275, \
+	}
+_GOTO25 = { \
+	0 : 59, 4 : 59, 5 : 59, 6 : 59, 7 : 59, 8 : 59, 16 : 59, 17 : 59, \
+	18 : 59, 39 : 59, 53 : 59, 71 : 255, 112 : 317, 113 : 255, 121 : 317, 129 : 59, \
+	159 : 59, 181 : 317, 197 : 255, 199 : 59, 200 : 59, 204 : 59, 207 : 59, 213 : 59, \
+	242 : 255, 245 : 255, 259 : 255, 260 : 255, 261 : 255, 265 : 255, 314 : 317, 315 : 317, \
+	400 : 255, 404 : 255, 407 : 255, 411 : 255, 412 : 255, 413 : 255, 414 : 255, 416 : 255, \
+	417 : 255, 422 : 255, 478 : 317, 529 : 255, 531 : 255, 538 : 255, 551 : 255, \
+	}
+_GOTO26 = { \
+	40 : 193, 54 : 210, 87 : 210, 89 : 210, 93 : 292, 103 : 303, 148 : 210, 209 : 210, \
+	291 : 458, 445 : 303, 447 : 210, 462 : 303, 560 : 303, 569 : 597, 596 : 598, \
+	}
+_GOTO27 = { \
+	60 : 223, 303 : 468, \
+	}
+_GOTO28 = { \
+	38 : 181, 106 : 305, 110 : 310, 112 : 314, 121 : 314, 180 : 359, 182 : 362, 315 : 478, \
+	316 : 479, 392 : 526, 480 : 575, \
+	}
+_GOTO29 = { \
+	267 : 430, 269 : 432, \
+	}
+_GOTO30 = { \
+	140 : 342, \
+	}
+_GOTO31 = { \
+	54 : 208, 87 : 273, 148 : 350, 209 : 208, 447 : 562, \
+	}
+_GOTO39 = { \
+	38 : 180, 40 : 192, 57 : 218, 59 : 221, 79 : 271, 112 : 316, 121 : 316, 138 : 340, \
+	181 : 316, 188 : 218, 190 : 221, 193 : 372, 212 : 218, 257 : 420, 266 : 429, 314 : 316, \
+	315 : 316, 317 : 480, 371 : 515, 478 : 316, \
+	}
+_GOTO40 = { \
+	195 : 373, 372 : 516, 374 : 517, 515 : 584, \
+	}
+_GOTO41 = { \
+	38 : 183, 41 : 195, 89 : 279, 92 : 288, 110 : 309, 146 : 348, 189 : 364, 195 : 374, \
+	231 : 364, 258 : 421, 280 : 451, 281 : 452, 291 : 279, 310 : 474, 317 : 481, \
+	}
+_GOTO42 = { \
+	193 : 371, \
+	}
+_GOTO44 = { \
+	180 : 358, 182 : 361, 183 : 363, 359 : 512, 360 : 513, 362 : 514, \
+	}
+_GOTO45 = { \
+	181 : 360, 314 : 476, 315 : 477, 478 : 574, \
+	}
+_GOTO47 = { \
+	60 : 226, 89 : 278, 210 : 226, 219 : 278, 225 : 394, 231 : 278, 274 : 444, \
+	}
+_GOTO48 = { \
+	89 : 277, \
+	}
+_GOTO49 = { \
+	0 : 89, 4 : 89, 5 : 89, 6 : 89, 7 : 89, 8 : 89, 16 : 89, 17 : 89, \
+	18 : 89, 39 : 89, 53 : 89, 54 : 89, 57 : 219, 60 : 231, 71 : 260, 87 : 89, \
+	89 : 89, 93 : 291, 113 : 260, 129 : 89, 148 : 89, 159 : 89, 197 : 260, 199 : 89, \
+	200 : 89, 204 : 89, 207 : 89, 209 : 89, 210 : 231, 212 : 219, 213 : 89, 214 : 219, \
+	219 : 219, 225 : 219, 231 : 231, 242 : 260, 245 : 260, 259 : 260, 260 : 260, 261 : 260, \
+	265 : 260, 274 : 219, 275 : 219, 295 : 219, 390 : 219, 400 : 260, 404 : 260, 407 : 260, \
+	411 : 260, 412 : 260, 413 : 260, 414 : 260, 416 : 260, 417 : 260, 422 : 260, 447 : 89, \
+	449 : 219, 525 : 219, 529 : 260, 531 : 260, 538 : 260, 551 : 260, \
+	}
+_GOTO50 = { \
+	277 : 447, 278 : 449, 340 : 499, 415 : 542, 423 : 551, 568 : 596, \
+	}
+_GOTO54 = { \
+	388 : 524, 418 : 545, 444 : 560, 451 : 566, 452 : 567, 486 : 577, 537 : 588, 539 : 590, \
+	540 : 591, \
+	}
+_GOTO55 = { \
+	445 : 561, 462 : 571, 560 : 595, \
+	}
+_GOTO56 = { \
+	275 : 445, 295 : 462, \
+	}
+_GOTO57 = { \
+	449 : 564, \
+	}
+_GOTO59 = { \
+	57 : 217, 212 : 217, 214 : 388, 390 : 217, 525 : 388, \
+	}
+_GOTO60 = { \
+	60 : 227, 74 : 267, 75 : 269, 86 : 272, 193 : 227, 210 : 227, 292 : 227, 303 : 227, \
+	458 : 227, 597 : 227, 598 : 227, \
+	}
+_GOTO65 = { \
+	221 : 392, 312 : 475, 324 : 487, \
+	}
+_GOTO66 = { \
+	458 : 568, 597 : 599, 598 : 600, \
+	}
+_GOTO67 = { \
+	247 : 414, 459 : 569, \
+	}
+_GOTO69 = { \
+	247 : 412, \
+	}
+_GOTO70 = { \
+	91 : 281, 116 : 320, 247 : 413, 307 : 320, \
+	}
+_GOTO71 = { \
+	282 : 453, 297 : 464, 298 : 465, \
+	}
+_GOTO72 = { \
+	450 : 565, \
+	}
+_GOTO73 = { \
+	252 : 416, \
+	}
+_GOTO74 = { \
+	130 : 329, 252 : 417, \
+	}
+_GOTO77 = { \
+	59 : 222, 112 : 315, 121 : 315, 190 : 222, \
+	}
+_GOTO78 = { \
+	71 : 261, 113 : 261, 197 : 261, 242 : 261, 245 : 261, 259 : 261, 260 : 261, 261 : 261, \
+	265 : 261, 400 : 261, 404 : 261, 407 : 261, 411 : 261, 412 : 261, 413 : 261, 414 : 261, \
+	416 : 261, 417 : 261, 422 : 261, 529 : 261, 531 : 261, 538 : 261, 551 : 261, \
+	}
+_GOTO79 = { \
+	424 : 552, 474 : 573, \
+	}
+_GOTO81 = { \
+	113 : 318, 197 : 378, 265 : 428, \
+	}
+_GOTO85 = { \
+	121 : 324, \
+	}
+_GOTO86 = { \
+	232 : 397, \
+	}
+_GOTO89 = { \
+	55 : 215, 185 : 215, 194 : 215, 211 : 215, 220 : 215, \
+	}
+_GOTO90 = { \
+	306 : 469, \
+	}
+_GOTO91 = { \
+	143 : 344, 214 : 344, 320 : 486, \
+	}
+_GOTO93 = { \
+	109 : 307, 344 : 307, 486 : 307, \
+	}
+_GOTO94 = { \
+	319 : 485, 328 : 491, 329 : 492, \
+	}
+_GOTO95 = { \
+	334 : 496, 499 : 579, \
+	}
+_GOTO98 = { \
+	136 : 337, \
+	}
+_GOTO99 = { \
+	71 : 264, 113 : 264, 136 : 339, 144 : 339, 145 : 339, 147 : 264, 197 : 264, 240 : 264, \
+	245 : 264, 246 : 264, 251 : 264, 254 : 264, 259 : 264, 263 : 264, 264 : 264, 265 : 264, \
+	318 : 264, 335 : 339, 339 : 339, 346 : 339, 378 : 264, 400 : 264, 406 : 264, 407 : 264, \
+	408 : 264, 409 : 264, 411 : 264, 422 : 264, 428 : 264, 529 : 264, 531 : 264, 538 : 264, \
+	542 : 264, \
+	}
+_GOTO100 = { \
+	71 : 251, 113 : 251, 197 : 251, 240 : 251, 245 : 251, 246 : 251, 251 : 251, 254 : 251, \
+	259 : 251, 265 : 251, 318 : 251, 378 : 251, 400 : 251, 406 : 251, 407 : 251, 408 : 251, \
+	409 : 251, 411 : 251, 422 : 251, 428 : 251, 529 : 251, 531 : 251, 538 : 251, \
+	}
+_GOTO101 = { \
+	335 : 497, \
+	}
+_GOTO103 = { \
+	136 : 338, 144 : 345, 145 : 347, 339 : 338, 346 : 503, \
+	}
+_GOTO105 = { \
+	71 : 263, 113 : 263, 147 : 263, 197 : 263, 240 : 263, 245 : 263, 246 : 263, 251 : 263, \
+	254 : 263, 259 : 263, 263 : 263, 264 : 263, 265 : 263, 318 : 263, 378 : 263, 400 : 263, \
+	406 : 263, 407 : 263, 408 : 263, 409 : 263, 411 : 263, 422 : 263, 428 : 263, 529 : 263, \
+	531 : 263, 538 : 263, 542 : 263, \
+	}
+_GOTO107 = { \
+	147 : 349, 263 : 426, 264 : 427, \
+	}
+_GOTO110 = { \
+	432 : 555, \
+	}
+_GOTO111 = { \
+	42 : 196, \
+	}
+_GOTO112 = { \
+	120 : 323, 256 : 419, \
+	}
+_GOTO113 = { \
+	42 : 197, \
+	}
+_GOTO115 = { \
+	400 : 527, 531 : 586, \
+	}
+_GOTO116 = { \
+	240 : 400, 246 : 411, 254 : 418, 318 : 400, 378 : 400, 406 : 531, 409 : 537, 428 : 400, \
+	529 : 585, \
+	}
+_GOTO117 = { \
+	242 : 403, \
+	}
+_GOTO118 = { \
+	245 : 410, 259 : 410, 407 : 533, 411 : 410, 422 : 533, 538 : 533, \
+	}
+_GOTO119 = { \
+	242 : 405, 260 : 423, 261 : 424, 404 : 405, 412 : 539, 413 : 540, 529 : 405, \
+	}
+_GOTO120 = { \
+	259 : 422, 411 : 538, \
+	}
+_GOTO121 = { \
+	538 : 589, \
+	}
+_GOTO122 = { \
+	242 : 404, \
+	}
+_GOTO123 = { \
+	251 : 415, 408 : 536, \
+	}
+_GOTO124 = { \
+	542 : 592, \
+	}
+_GOTO125 = { \
+	421 : 549, 422 : 550, 428 : 553, 429 : 554, \
+	}
+_GOTO127 = { \
+	414 : 541, 416 : 543, 417 : 544, \
+	}
+_GOTO128 = { \
+	551 : 594, \
+	}
+_GOTO129 = { \
+	42 : 198, 71 : 256, 113 : 256, 197 : 256, 242 : 256, 245 : 256, 259 : 256, 260 : 256, \
+	261 : 256, 265 : 256, 400 : 256, 404 : 256, 407 : 256, 411 : 256, 412 : 256, 413 : 256, \
+	414 : 256, 416 : 256, 417 : 256, 422 : 256, 529 : 256, 531 : 256, 538 : 256, 551 : 256, \
+	}
+_GOTO133 = { \
+	11 : 165, \
+	}
+_GOTO134 = { \
+	10 : 164, 165 : 164, \
+	}
+_GOTO136 = { \
+	46 : 202, \
+	}
+_GOTO137 = { \
+	91 : 286, 247 : 286, 459 : 286, \
+	}
+_GOTO139 = { \
+	351 : 510, \
+	}
+_GOTO146 = { \
+	198 : 379, \
+	}
+_GOTO150 = { \
+	216 : 391, \
+	}
+
+# state reached by shifting "error" in each state that can
+ERRORSHIFTS = { \
+	38 : 187, 60 : 229, 70 : 239, 92 : 290, 103 : 229, 120 : 239, 180 : 187, 182 : 187, \
+	183 : 187, 191 : 367, 192 : 370, 195 : 370, 196 : 377, 198 : 377, 206 : 385, 221 : 290, \
+	240 : 402, 256 : 239, 269 : 434, 271 : 437, 272 : 440, 273 : 443, 292 : 461, 303 : 229, \
+	309 : 473, 312 : 290, 318 : 484, 324 : 290, 327 : 490, 344 : 502, 348 : 506, 350 : 509, \
+	359 : 187, 360 : 187, 362 : 187, 372 : 370, 374 : 370, 378 : 520, 386 : 385, 387 : 385, \
+	388 : 502, 407 : 535, 418 : 502, 420 : 548, 421 : 548, 422 : 548, 424 : 473, 428 : 548, \
+	429 : 548, 432 : 434, 444 : 502, 445 : 229, 451 : 502, 452 : 502, 458 : 461, 462 : 229, \
+	474 : 473, 486 : 502, 515 : 370, 537 : 502, 538 : 535, 539 : 502, 540 : 502, 560 : 229, \
+	597 : 461, 598 : 461, \
+	}
+
+
+def _state0(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT0.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 15 (FA'O)
+	v = p._elidable(529)
+	n = _GOTO12.get(ss[-1], 19)
+	ss.append(n)
+	vs.append(v)
+	return n | _GREW
+# end def _state0(p, ss, vs):
+
+def _state1(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	if tok == 0:
+		return _ACCEPT
+	# end if tok == 0:
+	return _ERROR
+# end def _state1(p, ss, vs):
+
+def _state2(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	if tok == 529:
+		p._pcyytoken = -1
+		ss.append(157)
+		vs.append(p._yylval)
+		return 157 | _SHIFTED
+	# end if tok == 529:
+	return _ERROR
+# end def _state2(p, ss, vs):
+
+def _state3(p, ss, vs):
+	# reduce rule 2 (text_0)
+	v = p._node(10000, vs[-1])
+	n = _GOTO2.get(ss[-2], 2)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state3(p, ss, vs):
+
+def _state4(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT4.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 15 (FA'O)
+	v = p._elidable(529)
+	n = _GOTO12.get(ss[-1], 19)
+	ss.append(n)
+	vs.append(v)
+	return n | _GREW
+# end def _state4(p, ss, vs):
+
+def _state5(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT5.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 15 (FA'O)
+	v = p._elidable(529)
+	n = _GOTO12.get(ss[-1], 19)
+	ss.append(n)
+	vs.append(v)
+	return n | _GREW
+# end def _state5(p, ss, vs):
+
+def _state8(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT8.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 15 (FA'O)
+	v = p._elidable(529)
+	n = _GOTO12.get(ss[-1], 19)
+	ss.append(n)
+	vs.append(v)
+	return n | _GREW
+# end def _state8(p, ss, vs):
+
+def _state9(p, ss, vs):
+	# reduce rule 9 (text_A_1)
+	v = p._node(1, vs[-1])
+	n = _GOTO3.get(ss[-2], 3)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state9(p, ss, vs):
+
+def _state10(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT10.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 224 (indicators_411)
+	v = p._node(411, vs[-1])
+	n = 4
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state10(p, ss, vs):
+
+def _state11(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT10.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state11(p, ss, vs):
+
+def _state12(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT12.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 40 (free_modifier_32)
+	v = p._node(32, vs[-1])
+	n = _GOTO5.get(ss[-2], 5)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state12(p, ss, vs):
+
+def _state13(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT13.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 211 (cmene_404)
+	v = p._node(404, vs[-1])
+	n = _GOTO6.get(ss[-2], 6)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state13(p, ss, vs):
+
+def _state14(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT12.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 245 (JOIK_JEK_422)
+	v = p._node(422, vs[-1])
+	n = _GOTO7.get(ss[-2], 8)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state14(p, ss, vs):
+
+def _state15(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT12.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 247 (JOIK_JEK_422)
+	v = p._node(422, vs[-1])
+	n = _GOTO7.get(ss[-2], 8)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state15(p, ss, vs):
+
+def _state18(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT18.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 15 (FA'O)
+	v = p._elidable(529)
+	n = _GOTO12.get(ss[-1], 19)
+	ss.append(n)
+	vs.append(v)
+	return n | _GREW
+# end def _state18(p, ss, vs):
+
+def _state19(p, ss, vs):
+	# reduce rule 13 (text_B_2)
+	v = p._node(2, vs[-1])
+	n = _GOTO8.get(ss[-2], 9)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state19(p, ss, vs):
+
+def _state20(p, ss, vs):
+	# reduce rule 226 (indicators_A_412)
+	v = p._node(412, vs[-1])
+	n = _GOTO133.get(ss[-2], 10)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state20(p, ss, vs):
+
+def _state21(p, ss, vs):
+	# reduce rule 42 (free_modifier_A_33)
+	v = p._node(33, vs[-1])
+	n = 12
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state21(p, ss, vs):
+
+def _state22(p, ss, vs):
+	# reduce rule 43 (free_modifier_A_33)
+	v = p._node(33, vs[-1])
+	n = 12
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state22(p, ss, vs):
+
+def _state23(p, ss, vs):
+	# reduce rule 44 (free_modifier_A_33)
+	v = p._node(33, vs[-1])
+	n = 12
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state23(p, ss, vs):
+
+def _state24(p, ss, vs):
+	# reduce rule 45 (free_modifier_A_33)
+	v = p._node(33, vs[-1])
+	n = 12
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state24(p, ss, vs):
+
+def _state25(p, ss, vs):
+	# reduce rule 46 (free_modifier_A_33)
+	v = p._node(33, vs[-1])
+	n = 12
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state25(p, ss, vs):
+
+def _state26(p, ss, vs):
+	# reduce rule 213 (cmene_A_405)
+	v = p._node(405, vs[-1])
+	n = 13
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state26(p, ss, vs):
+
+def _state27(p, ss, vs):
+	# reduce rule 364 (JOIK_806)
+	v = p._node(806, vs[-1])
+	n = _GOTO137.get(ss[-2], 14)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state27(p, ss, vs):
+
+def _state28(p, ss, vs):
+	# reduce rule 363 (JEK_805)
+	v = p._node(805, vs[-1])
+	n = 15
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state28(p, ss, vs):
+
+def _state29(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT12.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 388 (I_819)
+	v = p._node(819, vs[-1])
+	n = _GOTO9.get(ss[-2], 16)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state29(p, ss, vs):
+
+def _state30(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT12.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 373 (I_BO_811)
+	v = p._node(811, vs[-1])
+	n = _GOTO10.get(ss[-2], 17)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state30(p, ss, vs):
+
+def _state31(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT31.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 221 (para_mark_410)
+	v = p._node(410, vs[-1])
+	n = _GOTO11.get(ss[-2], 18)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state31(p, ss, vs):
+
+def _state32(p, ss, vs):
+	# reduce rule 14 (text_C_3)
+	v = p._node(3, vs[-1])
+	n = _GOTO12.get(ss[-2], 19)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state32(p, ss, vs):
+
+def _state33(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	if tok == 581:
+		p._pcyytoken = -1
+		ss.append(178)
+		vs.append(p._yylval)
+		return 178 | _SHIFTED
+	# end if tok == 581:
+	# reduce rule 228 (indicator_413)
+	v = p._node(413, vs[-1])
+	n = _GOTO134.get(ss[-2], 20)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state33(p, ss, vs):
+
+def _state34(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	if tok == 581:
+		p._pcyytoken = -1
+		ss.append(179)
+		vs.append(p._yylval)
+		return 179 | _SHIFTED
+	# end if tok == 581:
+	# reduce rule 229 (indicator_413)
+	v = p._node(413, vs[-1])
+	n = _GOTO134.get(ss[-2], 20)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state34(p, ss, vs):
+
+def _state35(p, ss, vs):
+	# reduce rule 232 (indicator_413)
+	v = p._node(413, vs[-1])
+	n = _GOTO134.get(ss[-2], 20)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state35(p, ss, vs):
+
+def _state36(p, ss, vs):
+	# reduce rule 233 (indicator_413)
+	v = p._node(413, vs[-1])
+	n = _GOTO134.get(ss[-2], 20)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state36(p, ss, vs):
+
+def _state37(p, ss, vs):
+	# reduce rule 234 (indicator_413)
+	v = p._node(413, vs[-1])
+	n = _GOTO134.get(ss[-2], 20)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state37(p, ss, vs):
+
+def _state38(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT38.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state38(p, ss, vs):
+
+def _state40(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT40.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state40(p, ss, vs):
+
+def _state41(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT41.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state41(p, ss, vs):
+
+def _state42(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT42.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state42(p, ss, vs):
+
+def _state43(p, ss, vs):
+	# reduce rule 356 (utterance_ordinal_801)
+	v = p._node(801, vs[-1])
+	n = 25
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state43(p, ss, vs):
+
+def _state44(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT44.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 16 (paragraphs_4)
+	v = p._node(4, vs[-1])
+	n = _GOTO13.get(ss[-2], 32)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state44(p, ss, vs):
+
+def _state45(p, ss, vs):
+	# reduce rule 235 (DOI_415)
+	v = p._node(415, vs[-1])
+	n = 38
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state45(p, ss, vs):
+
+def _state46(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT46.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 236 (DOI_415)
+	v = p._node(415, vs[-1])
+	n = 38
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state46(p, ss, vs):
+
+def _state47(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT12.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 264 (SEI_440)
+	v = p._node(440, vs[-1])
+	n = 40
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state47(p, ss, vs):
+
+def _state48(p, ss, vs):
+	# reduce rule 18 (paragraph_10)
+	v = p._node(10, vs[-1])
+	n = 44
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state48(p, ss, vs):
+
+def _state49(p, ss, vs):
+	# reduce rule 238 (COI_416)
+	v = p._node(416, vs[-1])
+	n = 46
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state49(p, ss, vs):
+
+def _state50(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	if tok == 955:
+		p._pcyytoken = -1
+		ss.append(30)
+		vs.append(p._yylval)
+		return 30 | _SHIFTED
+	# end if tok == 955:
+	# reduce rule 21 (paragraph_A_11)
+	v = p._node(11, vs[-1])
+	n = _GOTO15.get(ss[-2], 48)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state50(p, ss, vs):
+
+def _state51(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	if tok == 581:
+		p._pcyytoken = -1
+		ss.append(205)
+		vs.append(p._yylval)
+		return 205 | _SHIFTED
+	# end if tok == 581:
+	# reduce rule 240 (COI_A_417)
+	v = p._node(417, vs[-1])
+	n = _GOTO136.get(ss[-2], 49)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state51(p, ss, vs):
+
+def _state52(p, ss, vs):
+	# reduce rule 24 (paragraph_B_12)
+	v = p._node(12, vs[-1])
+	n = 50
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state52(p, ss, vs):
+
+def _state54(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT54.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 37 (utterance_20)
+	v = p._node(20, vs[-1])
+	n = 52
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state54(p, ss, vs):
+
+def _state55(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT55.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 352 (mod_head_490)
+	v = p._node(490, vs[-1])
+	n = 92
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state55(p, ss, vs):
+
+def _state56(p, ss, vs):
+	# reduce rule 28 (utterance_20)
+	v = p._node(20, vs[-1])
+	n = 52
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state56(p, ss, vs):
+
+def _state57(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT57.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 29 (utterance_20)
+	v = p._node(20, vs[-1])
+	n = 52
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state57(p, ss, vs):
+
+def _state58(p, ss, vs):
+	# reduce rule 30 (utterance_20)
+	v = p._node(20, vs[-1])
+	n = 52
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state58(p, ss, vs):
+
+def _state59(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT59.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 31 (utterance_20)
+	v = p._node(20, vs[-1])
+	n = 52
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state59(p, ss, vs):
+
+def _state60(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT60.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state60(p, ss, vs):
+
+def _state61(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	if tok == 625:
+		p._pcyytoken = -1
+		ss.append(232)
+		vs.append(p._yylval)
+		return 232 | _SHIFTED
+	# end if tok == 625:
+	# reduce rule 33 (utterance_20)
+	v = p._node(20, vs[-1])
+	n = 52
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state61(p, ss, vs):
+
+def _state62(p, ss, vs):
+	# reduce rule 34 (utterance_20)
+	v = p._node(20, vs[-1])
+	n = 52
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state62(p, ss, vs):
+
+def _state63(p, ss, vs):
+	# reduce rule 35 (utterance_20)
+	v = p._node(20, vs[-1])
+	n = 52
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state63(p, ss, vs):
+
+def _state64(p, ss, vs):
+	# reduce rule 36 (utterance_20)
+	v = p._node(20, vs[-1])
+	n = 52
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state64(p, ss, vs):
+
+def _state65(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT12.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 272 (TUhE_447)
+	v = p._node(447, vs[-1])
+	n = 53
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state65(p, ss, vs):
+
+def _state66(p, ss, vs):
+	# reduce rule 354 (tag_491)
+	v = p._node(491, vs[-1])
+	n = _GOTO21.get(ss[-2], 55)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state66(p, ss, vs):
+
+def _state67(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT12.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 357 (EK_802)
+	v = p._node(802, vs[-1])
+	n = _GOTO22.get(ss[-2], 56)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state67(p, ss, vs):
+
+def _state68(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT12.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 270 (NA_445)
+	v = p._node(445, vs[-1])
+	n = _GOTO23.get(ss[-2], 188)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state68(p, ss, vs):
+
+def _state69(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT12.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 386 (GIhEK_818)
+	v = p._node(818, vs[-1])
+	n = _GOTO24.get(ss[-2], 58)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state69(p, ss, vs):
+
+def _state70(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT70.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state70(p, ss, vs):
+
+def _state71(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT71.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state71(p, ss, vs):
+
+def _state72(p, ss, vs):
+	# reduce rule 80 (terms_80)
+	v = p._node(80, vs[-1])
+	n = _GOTO26.get(ss[-2], 60)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state72(p, ss, vs):
+
+def _state73(p, ss, vs):
+	# reduce rule 124 (relative_clauses_121)
+	v = p._node(121, vs[-1])
+	n = _GOTO28.get(ss[-2], 61)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state73(p, ss, vs):
+
+def _state74(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT74.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state74(p, ss, vs):
+
+def _state76(p, ss, vs):
+	# reduce rule 60 (sentence_40)
+	v = p._node(40, vs[-1])
+	n = _GOTO31.get(ss[-2], 64)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state76(p, ss, vs):
+
+def _state77(p, ss, vs):
+	# reduce rule 61 (sentence_40)
+	v = p._node(40, vs[-1])
+	n = _GOTO31.get(ss[-2], 64)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state77(p, ss, vs):
+
+def _state78(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT12.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 380 (tense_modal_815)
+	v = p._node(815, vs[-1])
+	n = _GOTO150.get(ss[-2], 66)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state78(p, ss, vs):
+
+def _state79(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT79.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state79(p, ss, vs):
+
+def _state80(p, ss, vs):
+	# reduce rule 375 (number_812)
+	v = p._node(812, vs[-1])
+	n = _GOTO111.get(ss[-2], 70)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state80(p, ss, vs):
+
+def _state81(p, ss, vs):
+	# reduce rule 328 (left_bracket_470)
+	v = p._node(470, vs[-1])
+	n = _GOTO113.get(ss[-2], 71)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state81(p, ss, vs):
+
+def _state82(p, ss, vs):
+	# reduce rule 82 (term_81)
+	v = p._node(81, vs[-1])
+	n = _GOTO60.get(ss[-2], 72)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state82(p, ss, vs):
+
+def _state83(p, ss, vs):
+	# reduce rule 83 (term_81)
+	v = p._node(81, vs[-1])
+	n = _GOTO60.get(ss[-2], 72)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state83(p, ss, vs):
+
+def _state84(p, ss, vs):
+	# reduce rule 84 (term_81)
+	v = p._node(81, vs[-1])
+	n = _GOTO60.get(ss[-2], 72)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state84(p, ss, vs):
+
+def _state85(p, ss, vs):
+	# reduce rule 85 (term_81)
+	v = p._node(81, vs[-1])
+	n = _GOTO60.get(ss[-2], 72)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state85(p, ss, vs):
+
+def _state88(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT88.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 67 (bridi_tail_50)
+	v = p._node(50, vs[-1])
+	n = _GOTO47.get(ss[-2], 76)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state88(p, ss, vs):
+
+def _state90(p, ss, vs):
+	# reduce rule 64 (sentence_A_41)
+	v = p._node(41, vs[-1])
+	n = _GOTO48.get(ss[-2], 77)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state90(p, ss, vs):
+
+def _state91(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT91.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 90 (sumti_90)
+	v = p._node(90, vs[-1])
+	n = _GOTO41.get(ss[-2], 82)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state91(p, ss, vs):
+
+def _state92(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT92.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state92(p, ss, vs):
+
+def _state94(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT12.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 371 (NA_KU_810)
+	v = p._node(810, vs[-1])
+	n = 85
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state94(p, ss, vs):
+
+def _state95(p, ss, vs):
+	# reduce rule 69 (bridi_tail_A_51)
+	v = p._node(51, vs[-1])
+	n = 88
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state95(p, ss, vs):
+
+def _state96(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT12.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 365 (GEK_807)
+	v = p._node(807, vs[-1])
+	n = _GOTO49.get(ss[-2], 189)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state96(p, ss, vs):
+
+def _state97(p, ss, vs):
+	# reduce rule 93 (sumti_A_91)
+	v = p._node(91, vs[-1])
+	n = 91
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state97(p, ss, vs):
+
+def _state98(p, ss, vs):
+	# reduce rule 353 (mod_head_490)
+	v = p._node(490, vs[-1])
+	n = 92
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state98(p, ss, vs):
+
+def _state99(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	if tok == 965:
+		p._pcyytoken = -1
+		ss.append(296)
+		vs.append(p._yylval)
+		return 296 | _SHIFTED
+	# end if tok == 965:
+	# reduce rule 71 (bridi_tail_B_52)
+	v = p._node(52, vs[-1])
+	n = _GOTO56.get(ss[-2], 95)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state99(p, ss, vs):
+
+def _state100(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT100.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 95 (sumti_B_92)
+	v = p._node(92, vs[-1])
+	n = _GOTO71.get(ss[-2], 97)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state100(p, ss, vs):
+
+def _state101(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT12.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 342 (FA_481)
+	v = p._node(481, vs[-1])
+	n = 98
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state101(p, ss, vs):
+
+def _state102(p, ss, vs):
+	# reduce rule 73 (bridi_tail_C_53)
+	v = p._node(53, vs[-1])
+	n = _GOTO57.get(ss[-2], 99)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state102(p, ss, vs):
+
+def _state103(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT103.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state103(p, ss, vs):
+
+def _state104(p, ss, vs):
+	# reduce rule 98 (sumti_C_93)
+	v = p._node(93, vs[-1])
+	n = _GOTO72.get(ss[-2], 100)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state104(p, ss, vs):
+
+def _state105(p, ss, vs):
+	# reduce rule 129 (selbri_130)
+	v = p._node(130, vs[-1])
+	n = _GOTO39.get(ss[-2], 103)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state105(p, ss, vs):
+
+def _state106(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT106.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 100 (sumti_D_94)
+	v = p._node(94, vs[-1])
+	n = 104
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state106(p, ss, vs):
+
+def _state107(p, ss, vs):
+	# reduce rule 130 (selbri_A_131)
+	v = p._node(131, vs[-1])
+	n = _GOTO89.get(ss[-2], 105)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state107(p, ss, vs):
+
+def _state108(p, ss, vs):
+	# reduce rule 104 (sumti_E_95)
+	v = p._node(95, vs[-1])
+	n = 106
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state108(p, ss, vs):
+
+def _state109(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT109.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 132 (selbri_B_132)
+	v = p._node(132, vs[-1])
+	n = _GOTO90.get(ss[-2], 107)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state109(p, ss, vs):
+
+def _state110(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT110.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state110(p, ss, vs):
+
+def _state111(p, ss, vs):
+	# reduce rule 108 (sumti_F_96)
+	v = p._node(96, vs[-1])
+	n = _GOTO77.get(ss[-2], 108)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state111(p, ss, vs):
+
+def _state112(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT112.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state112(p, ss, vs):
+
+def _state114(p, ss, vs):
+	# reduce rule 111 (sumti_F_96)
+	v = p._node(96, vs[-1])
+	n = _GOTO77.get(ss[-2], 108)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state114(p, ss, vs):
+
+def _state115(p, ss, vs):
+	# reduce rule 112 (sumti_F_96)
+	v = p._node(96, vs[-1])
+	n = _GOTO77.get(ss[-2], 108)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state115(p, ss, vs):
+
+def _state116(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT116.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 134 (selbri_C_133)
+	v = p._node(133, vs[-1])
+	n = _GOTO91.get(ss[-2], 109)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state116(p, ss, vs):
+
+def _state117(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT12.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 346 (qualifier_483)
+	v = p._node(483, vs[-1])
+	n = _GOTO78.get(ss[-2], 110)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state117(p, ss, vs):
+
+def _state118(p, ss, vs):
+	# reduce rule 348 (qualifier_483)
+	v = p._node(483, vs[-1])
+	n = _GOTO78.get(ss[-2], 110)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state118(p, ss, vs):
+
+def _state119(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT12.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 208 (anaphora_400)
+	v = p._node(400, vs[-1])
+	n = 111
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state119(p, ss, vs):
+
+def _state121(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT121.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state121(p, ss, vs):
+
+def _state122(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT12.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 255 (quote_arg_432)
+	v = p._node(432, vs[-1])
+	n = 115
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state122(p, ss, vs):
+
+def _state123(p, ss, vs):
+	# reduce rule 136 (selbri_D_134)
+	v = p._node(134, vs[-1])
+	n = _GOTO93.get(ss[-2], 116)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state123(p, ss, vs):
+
+def _state124(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT12.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 369 (NAhE_BO_809)
+	v = p._node(809, vs[-1])
+	n = 118
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state124(p, ss, vs):
+
+def _state125(p, ss, vs):
+	# reduce rule 385 (lerfu_string_817)
+	v = p._node(817, vs[-1])
+	n = _GOTO129.get(ss[-2], 120)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state125(p, ss, vs):
+
+def _state126(p, ss, vs):
+	# reduce rule 257 (quote_arg_A_433)
+	v = p._node(433, vs[-1])
+	n = 122
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state126(p, ss, vs):
+
+def _state127(p, ss, vs):
+	# reduce rule 258 (quote_arg_A_433)
+	v = p._node(433, vs[-1])
+	n = 122
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state127(p, ss, vs):
+
+def _state128(p, ss, vs):
+	# reduce rule 259 (quote_arg_A_433)
+	v = p._node(433, vs[-1])
+	n = 122
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state128(p, ss, vs):
+
+def _state130(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT130.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 139 (selbri_E_135)
+	v = p._node(135, vs[-1])
+	n = _GOTO94.get(ss[-2], 123)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state130(p, ss, vs):
+
+def _state131(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	if tok == 698:
+		p._pcyytoken = -1
+		ss.append(331)
+		vs.append(p._yylval)
+		return 331 | _SHIFTED
+	# end if tok == 698:
+	return _ERROR
+# end def _state131(p, ss, vs):
+
+def _state132(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	if tok == 698:
+		p._pcyytoken = -1
+		ss.append(332)
+		vs.append(p._yylval)
+		return 332 | _SHIFTED
+	# end if tok == 698:
+	return _ERROR
+# end def _state132(p, ss, vs):
+
+def _state133(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	if tok == 697:
+		p._pcyytoken = -1
+		ss.append(333)
+		vs.append(p._yylval)
+		return 333 | _SHIFTED
+	# end if tok == 697:
+	return _ERROR
+# end def _state133(p, ss, vs):
+
+def _state134(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT134.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 142 (selbri_F_136)
+	v = p._node(136, vs[-1])
+	n = _GOTO95.get(ss[-2], 130)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state134(p, ss, vs):
+
+def _state135(p, ss, vs):
+	# reduce rule 144 (selbri_F_136)
+	v = p._node(136, vs[-1])
+	n = _GOTO95.get(ss[-2], 130)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state135(p, ss, vs):
+
+def _state136(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT136.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state136(p, ss, vs):
+
+def _state137(p, ss, vs):
+	# reduce rule 147 (tanru_unit_150)
+	v = p._node(150, vs[-1])
+	n = 134
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state137(p, ss, vs):
+
+def _state139(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT12.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 344 (NAhE_482)
+	v = p._node(482, vs[-1])
+	n = _GOTO99.get(ss[-2], 136)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state139(p, ss, vs):
+
+def _state140(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	if tok == 504:
+		p._pcyytoken = -1
+		ss.append(75)
+		vs.append(p._yylval)
+		return 75 | _SHIFTED
+	# end if tok == 504:
+	# reduce rule 149 (tanru_unit_A_151)
+	v = p._node(151, vs[-1])
+	n = _GOTO101.get(ss[-2], 137)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state140(p, ss, vs):
+
+def _state141(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT12.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 367 (GUhEK_808)
+	v = p._node(808, vs[-1])
+	n = _GOTO100.get(ss[-2], 138)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state141(p, ss, vs):
+
+def _state142(p, ss, vs):
+	# reduce rule 151 (tanru_unit_B_152)
+	v = p._node(152, vs[-1])
+	n = _GOTO103.get(ss[-2], 140)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state142(p, ss, vs):
+
+def _state144(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT144.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state144(p, ss, vs):
+
+def _state145(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT145.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state145(p, ss, vs):
+
+def _state147(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT147.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state147(p, ss, vs):
+
+def _state148(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT148.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state148(p, ss, vs):
+
+def _state149(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT12.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 215 (bridi_valsi_407)
+	v = p._node(407, vs[-1])
+	n = 142
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state149(p, ss, vs):
+
+def _state150(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT12.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 340 (SE_480)
+	v = p._node(480, vs[-1])
+	n = _GOTO105.get(ss[-2], 144)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state150(p, ss, vs):
+
+def _state151(p, ss, vs):
+	# reduce rule 249 (NU_425)
+	v = p._node(425, vs[-1])
+	n = 148
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state151(p, ss, vs):
+
+def _state152(p, ss, vs):
+	# reduce rule 217 (bridi_valsi_A_408)
+	v = p._node(408, vs[-1])
+	n = 149
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state152(p, ss, vs):
+
+def _state153(p, ss, vs):
+	# reduce rule 218 (bridi_valsi_A_408)
+	v = p._node(408, vs[-1])
+	n = 149
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state153(p, ss, vs):
+
+def _state154(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	if tok == 593:
+		p._pcyytoken = -1
+		ss.append(354)
+		vs.append(p._yylval)
+		return 354 | _SHIFTED
+	# end if tok == 593:
+	# reduce rule 219 (bridi_valsi_A_408)
+	v = p._node(408, vs[-1])
+	n = 149
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state154(p, ss, vs):
+
+def _state155(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT155.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 251 (NU_A_426)
+	v = p._node(426, vs[-1])
+	n = _GOTO139.get(ss[-2], 151)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state155(p, ss, vs):
+
+def _state156(p, ss, vs):
+	# reduce rule 396 (PA_MOI_824)
+	v = p._node(824, vs[-1])
+	n = 153
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state156(p, ss, vs):
+
+def _state157(p, ss, vs):
+	# reduce rule 1 (EOT)
+	v = p._toplevel(vs[-2])
+	del ss[-1:]
+	del vs[-1:]
+	n = 1
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state157(p, ss, vs):
+
+def _state158(p, ss, vs):
+	# reduce rule 3 (text_0)
+	v = p._node(10000, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO2.get(ss[-2], 2)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state158(p, ss, vs):
+
+def _state160(p, ss, vs):
+	# reduce rule 4 (text_0)
+	v = p._node(10000, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO2.get(ss[-2], 2)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state160(p, ss, vs):
+
+def _state161(p, ss, vs):
+	# reduce rule 5 (text_0)
+	v = p._node(10000, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO2.get(ss[-2], 2)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state161(p, ss, vs):
+
+def _state162(p, ss, vs):
+	# reduce rule 7 (text_0)
+	v = p._node(10000, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO2.get(ss[-2], 2)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state162(p, ss, vs):
+
+def _state163(p, ss, vs):
+	# reduce rule 8 (text_A_1)
+	v = p._node(1, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO3.get(ss[-2], 3)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state163(p, ss, vs):
+
+def _state164(p, ss, vs):
+	# reduce rule 227 (indicators_A_412)
+	v = p._node(412, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO133.get(ss[-2], 10)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state164(p, ss, vs):
+
+def _state165(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT10.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 225 (indicators_411)
+	v = p._node(411, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = 4
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state165(p, ss, vs):
+
+def _state166(p, ss, vs):
+	# reduce rule 41 (free_modifier_32)
+	v = p._node(32, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO5.get(ss[-2], 5)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state166(p, ss, vs):
+
+def _state167(p, ss, vs):
+	# reduce rule 212 (cmene_404)
+	v = p._node(404, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO6.get(ss[-2], 6)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state167(p, ss, vs):
+
+def _state168(p, ss, vs):
+	# reduce rule 214 (cmene_A_405)
+	v = p._node(405, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = 13
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state168(p, ss, vs):
+
+def _state169(p, ss, vs):
+	# reduce rule 246 (JOIK_JEK_422)
+	v = p._node(422, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO7.get(ss[-2], 8)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state169(p, ss, vs):
+
+def _state170(p, ss, vs):
+	# reduce rule 248 (JOIK_JEK_422)
+	v = p._node(422, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO7.get(ss[-2], 8)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state170(p, ss, vs):
+
+def _state171(p, ss, vs):
+	# reduce rule 10 (text_B_2)
+	v = p._node(2, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO8.get(ss[-2], 9)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state171(p, ss, vs):
+
+def _state172(p, ss, vs):
+	# reduce rule 11 (text_B_2)
+	v = p._node(2, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO8.get(ss[-2], 9)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state172(p, ss, vs):
+
+def _state173(p, ss, vs):
+	# reduce rule 12 (text_B_2)
+	v = p._node(2, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO8.get(ss[-2], 9)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state173(p, ss, vs):
+
+def _state174(p, ss, vs):
+	# reduce rule 389 (I_819)
+	v = p._node(819, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO9.get(ss[-2], 16)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state174(p, ss, vs):
+
+def _state175(p, ss, vs):
+	# reduce rule 374 (I_BO_811)
+	v = p._node(811, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO10.get(ss[-2], 17)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state175(p, ss, vs):
+
+def _state176(p, ss, vs):
+	# reduce rule 222 (para_mark_410)
+	v = p._node(410, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO11.get(ss[-2], 18)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state176(p, ss, vs):
+
+def _state177(p, ss, vs):
+	# reduce rule 223 (para_mark_410)
+	v = p._node(410, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO11.get(ss[-2], 18)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state177(p, ss, vs):
+
+def _state178(p, ss, vs):
+	# reduce rule 230 (indicator_413)
+	v = p._node(413, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO134.get(ss[-2], 20)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state178(p, ss, vs):
+
+def _state179(p, ss, vs):
+	# reduce rule 231 (indicator_413)
+	v = p._node(413, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO134.get(ss[-2], 20)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state179(p, ss, vs):
+
+def _state180(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT180.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state180(p, ss, vs):
+
+def _state181(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT181.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state181(p, ss, vs):
+
+def _state183(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT183.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state183(p, ss, vs):
+
+def _state184(p, ss, vs):
+	# reduce rule 58 (vocative_35)
+	v = p._node(35, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = 21
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state184(p, ss, vs):
+
+def _state185(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT185.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state185(p, ss, vs):
+
+def _state186(p, ss, vs):
+	# reduce rule 293 (DOhU_gap_457)
+	v = p._node(457, vs[-1])
+	n = _GOTO44.get(ss[-2], 184)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state186(p, ss, vs):
+
+def _state187(p, ss, vs):
+	# reduce rule 294 (DO'U)
+	v = p._elidable(526)
+	n = _GOTO44.get(ss[-2], 184)
+	ss[-1] = n
+	vs[-1] = v
+	return n | _ERROK
+# end def _state187(p, ss, vs):
+
+def _state190(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT59.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state190(p, ss, vs):
+
+def _state191(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT191.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state191(p, ss, vs):
+
+def _state192(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT192.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state192(p, ss, vs):
+
+def _state193(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT193.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state193(p, ss, vs):
+
+def _state194(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT185.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 352 (mod_head_490)
+	v = p._node(490, vs[-1])
+	n = 92
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state194(p, ss, vs):
+
+def _state195(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT195.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state195(p, ss, vs):
+
+def _state196(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT196.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state196(p, ss, vs):
+
+def _state199(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT18.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state199(p, ss, vs):
+
+def _state200(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT18.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 20 (paragraph_10)
+	v = p._node(10, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = 44
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state200(p, ss, vs):
+
+def _state201(p, ss, vs):
+	# reduce rule 237 (DOI_415)
+	v = p._node(415, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = 38
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state201(p, ss, vs):
+
+def _state202(p, ss, vs):
+	# reduce rule 239 (COI_416)
+	v = p._node(416, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = 46
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state202(p, ss, vs):
+
+def _state203(p, ss, vs):
+	# reduce rule 265 (SEI_440)
+	v = p._node(440, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = 40
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state203(p, ss, vs):
+
+def _state204(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT18.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 23 (paragraph_A_11)
+	v = p._node(11, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO15.get(ss[-2], 48)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state204(p, ss, vs):
+
+def _state205(p, ss, vs):
+	# reduce rule 241 (COI_A_417)
+	v = p._node(417, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO136.get(ss[-2], 49)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state205(p, ss, vs):
+
+def _state206(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT206.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state206(p, ss, vs):
+
+def _state208(p, ss, vs):
+	# reduce rule 63 (sentence_A_41)
+	v = p._node(41, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO48.get(ss[-2], 77)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state208(p, ss, vs):
+
+def _state210(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT210.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state210(p, ss, vs):
+
+def _state211(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT211.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 352 (mod_head_490)
+	v = p._node(490, vs[-1])
+	n = 92
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state211(p, ss, vs):
+
+def _state212(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT57.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state212(p, ss, vs):
+
+def _state215(p, ss, vs):
+	# reduce rule 128 (selbri_130)
+	v = p._node(130, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO39.get(ss[-2], 103)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state215(p, ss, vs):
+
+def _state216(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT216.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state216(p, ss, vs):
+
+def _state217(p, ss, vs):
+	# reduce rule 77 (gek_bridi_tail_54)
+	v = p._node(54, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO59.get(ss[-2], 102)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state217(p, ss, vs):
+
+def _state218(p, ss, vs):
+	# reduce rule 131 (selbri_A_131)
+	v = p._node(131, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO89.get(ss[-2], 105)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state218(p, ss, vs):
+
+def _state220(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT211.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state220(p, ss, vs):
+
+def _state221(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT221.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state221(p, ss, vs):
+
+def _state222(p, ss, vs):
+	# reduce rule 105 (sumti_E_95)
+	v = p._node(95, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = 106
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state222(p, ss, vs):
+
+def _state223(p, ss, vs):
+	# reduce rule 32 (utterance_20)
+	v = p._node(20, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = 52
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state223(p, ss, vs):
+
+def _state224(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT12.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 38 (prenex_30)
+	v = p._node(30, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO20.get(ss[-2], 54)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state224(p, ss, vs):
+
+def _state226(p, ss, vs):
+	# reduce rule 66 (statement_42)
+	v = p._node(42, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = 90
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state226(p, ss, vs):
+
+def _state227(p, ss, vs):
+	# reduce rule 81 (terms_80)
+	v = p._node(80, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO26.get(ss[-2], 60)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state227(p, ss, vs):
+
+def _state228(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT12.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 290 (VAU_gap_456)
+	v = p._node(456, vs[-1])
+	n = _GOTO27.get(ss[-2], 304)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state228(p, ss, vs):
+
+def _state229(p, ss, vs):
+	# reduce rule 292 (VAU)
+	v = p._elidable(614)
+	n = _GOTO27.get(ss[-2], 304)
+	ss[-1] = n
+	vs[-1] = v
+	return n | _ERROK
+# end def _state229(p, ss, vs):
+
+def _state230(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT12.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 279 (front_gap_451)
+	v = p._node(451, vs[-1])
+	n = _GOTO42.get(ss[-2], 225)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state230(p, ss, vs):
+
+def _state231(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT231.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state231(p, ss, vs):
+
+def _state232(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT106.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state232(p, ss, vs):
+
+def _state233(p, ss, vs):
+	# reduce rule 273 (TUhE_447)
+	v = p._node(447, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = 53
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state233(p, ss, vs):
+
+def _state234(p, ss, vs):
+	# reduce rule 358 (EK_802)
+	v = p._node(802, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO22.get(ss[-2], 56)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state234(p, ss, vs):
+
+def _state235(p, ss, vs):
+	# reduce rule 271 (NA_445)
+	v = p._node(445, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO23.get(ss[-2], 188)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state235(p, ss, vs):
+
+def _state236(p, ss, vs):
+	# reduce rule 387 (GIhEK_818)
+	v = p._node(818, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO24.get(ss[-2], 58)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state236(p, ss, vs):
+
+def _state237(p, ss, vs):
+	# reduce rule 165 (quantifier_300)
+	v = p._node(300, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO25.get(ss[-2], 190)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state237(p, ss, vs):
+
+def _state238(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT12.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 303 (BOI_gap_461)
+	v = p._node(461, vs[-1])
+	n = _GOTO112.get(ss[-2], 237)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state238(p, ss, vs):
+
+def _state239(p, ss, vs):
+	# reduce rule 305 (BOI)
+	v = p._elidable(651)
+	n = _GOTO112.get(ss[-2], 237)
+	ss[-1] = n
+	vs[-1] = v
+	return n | _ERROK
+# end def _state239(p, ss, vs):
+
+def _state240(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT240.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state240(p, ss, vs):
+
+def _state241(p, ss, vs):
+	# reduce rule 167 (MEX_310)
+	v = p._node(310, vs[-1])
+	n = _GOTO81.get(ss[-2], 240)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state241(p, ss, vs):
+
+def _state242(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT242.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state242(p, ss, vs):
+
+def _state243(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	if tok == 508:
+		p._pcyytoken = -1
+		ss.append(406)
+		vs.append(p._yylval)
+		return 406 | _SHIFTED
+	# end if tok == 508:
+	# reduce rule 170 (MEX_A_311)
+	v = p._node(311, vs[-1])
+	n = _GOTO115.get(ss[-2], 241)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state243(p, ss, vs):
+
+def _state244(p, ss, vs):
+	# reduce rule 172 (MEX_B_312)
+	v = p._node(312, vs[-1])
+	n = _GOTO118.get(ss[-2], 243)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state244(p, ss, vs):
+
+def _state245(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT245.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state245(p, ss, vs):
+
+def _state246(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT246.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state246(p, ss, vs):
+
+def _state247(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT91.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 193 (operand_381)
+	v = p._node(381, vs[-1])
+	n = _GOTO119.get(ss[-2], 244)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state247(p, ss, vs):
+
+def _state248(p, ss, vs):
+	# reduce rule 180 (operator_370)
+	v = p._node(370, vs[-1])
+	n = _GOTO116.get(ss[-2], 245)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state248(p, ss, vs):
+
+def _state249(p, ss, vs):
+	# reduce rule 196 (operand_A_382)
+	v = p._node(382, vs[-1])
+	n = 247
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state249(p, ss, vs):
+
+def _state250(p, ss, vs):
+	# reduce rule 183 (operator_A_371)
+	v = p._node(371, vs[-1])
+	n = _GOTO123.get(ss[-2], 248)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state250(p, ss, vs):
+
+def _state252(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT100.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 198 (operand_B_383)
+	v = p._node(383, vs[-1])
+	n = _GOTO127.get(ss[-2], 249)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state252(p, ss, vs):
+
+def _state253(p, ss, vs):
+	# reduce rule 185 (operator_B_372)
+	v = p._node(372, vs[-1])
+	n = _GOTO124.get(ss[-2], 250)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state253(p, ss, vs):
+
+def _state255(p, ss, vs):
+	# reduce rule 201 (operand_C_385)
+	v = p._node(385, vs[-1])
+	n = _GOTO128.get(ss[-2], 252)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state255(p, ss, vs):
+
+def _state259(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT259.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state259(p, ss, vs):
+
+def _state262(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT12.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 187 (MEX_operator_374)
+	v = p._node(374, vs[-1])
+	n = _GOTO107.get(ss[-2], 253)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state262(p, ss, vs):
+
+def _state267(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	if tok == 505:
+		p._pcyytoken = -1
+		ss.append(74)
+		vs.append(p._yylval)
+		return 74 | _SHIFTED
+	# end if tok == 505:
+	# reduce rule 163 (links_161)
+	v = p._node(161, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO29.get(ss[-2], 62)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state267(p, ss, vs):
+
+def _state268(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT268.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 352 (mod_head_490)
+	v = p._node(490, vs[-1])
+	n = 92
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state268(p, ss, vs):
+
+def _state269(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT269.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state269(p, ss, vs):
+
+def _state270(p, ss, vs):
+	# reduce rule 381 (tense_modal_815)
+	v = p._node(815, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO150.get(ss[-2], 66)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state270(p, ss, vs):
+
+def _state271(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT271.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state271(p, ss, vs):
+
+def _state272(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT272.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state272(p, ss, vs):
+
+def _state273(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT273.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state273(p, ss, vs):
+
+def _state276(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT12.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 378 (GIhEK_KE_814)
+	v = p._node(814, vs[-1])
+	n = 274
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state276(p, ss, vs):
+
+def _state277(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	if tok == 980:
+		p._pcyytoken = -1
+		ss.append(448)
+		vs.append(p._yylval)
+		return 448 | _SHIFTED
+	# end if tok == 980:
+	return _ERROR
+# end def _state277(p, ss, vs):
+
+def _state279(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	if tok == 980:
+		p._pcyytoken = -1
+		ss.append(448)
+		vs.append(p._yylval)
+		return 448 | _SHIFTED
+	# end if tok == 980:
+	# reduce rule 82 (term_81)
+	v = p._node(81, vs[-1])
+	n = _GOTO60.get(ss[-2], 72)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state279(p, ss, vs):
+
+def _state283(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT12.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 361 (EK_KE_804)
+	v = p._node(804, vs[-1])
+	n = _GOTO69.get(ss[-2], 280)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state283(p, ss, vs):
+
+def _state284(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT12.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 394 (JOIK_KE_823)
+	v = p._node(823, vs[-1])
+	n = _GOTO70.get(ss[-2], 409)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state284(p, ss, vs):
+
+def _state285(p, ss, vs):
+	# reduce rule 242 (JOIK_EK_421)
+	v = p._node(421, vs[-1])
+	n = _GOTO67.get(ss[-2], 282)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state285(p, ss, vs):
+
+def _state286(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT12.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 243 (JOIK_EK_421)
+	v = p._node(421, vs[-1])
+	n = _GOTO67.get(ss[-2], 282)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state286(p, ss, vs):
+
+def _state287(p, ss, vs):
+	# reduce rule 86 (modifier_82)
+	v = p._node(82, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = 83
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state287(p, ss, vs):
+
+def _state288(p, ss, vs):
+	# reduce rule 87 (modifier_82)
+	v = p._node(82, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = 83
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state288(p, ss, vs):
+
+def _state289(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT12.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 276 (gap_450)
+	v = p._node(450, vs[-1])
+	n = _GOTO65.get(ss[-2], 287)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state289(p, ss, vs):
+
+def _state290(p, ss, vs):
+	# reduce rule 278 (KU)
+	v = p._elidable(556)
+	n = _GOTO65.get(ss[-2], 287)
+	ss[-1] = n
+	vs[-1] = v
+	return n | _ERROK
+# end def _state290(p, ss, vs):
+
+def _state292(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT292.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state292(p, ss, vs):
+
+def _state293(p, ss, vs):
+	# reduce rule 372 (NA_KU_810)
+	v = p._node(810, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = 85
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state293(p, ss, vs):
+
+def _state294(p, ss, vs):
+	# reduce rule 366 (GEK_807)
+	v = p._node(807, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO49.get(ss[-2], 189)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state294(p, ss, vs):
+
+def _state296(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT12.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 376 (GIhEK_BO_813)
+	v = p._node(813, vs[-1])
+	n = 295
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state296(p, ss, vs):
+
+def _state299(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT12.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 359 (EK_BO_803)
+	v = p._node(803, vs[-1])
+	n = _GOTO73.get(ss[-2], 297)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state299(p, ss, vs):
+
+def _state300(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT12.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 392 (JOIK_BO_822)
+	v = p._node(822, vs[-1])
+	n = _GOTO74.get(ss[-2], 298)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state300(p, ss, vs):
+
+def _state301(p, ss, vs):
+	# reduce rule 343 (FA_481)
+	v = p._node(481, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = 98
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state301(p, ss, vs):
+
+def _state302(p, ss, vs):
+	# reduce rule 74 (bridi_tail_C_53)
+	v = p._node(53, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO57.get(ss[-2], 99)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state302(p, ss, vs):
+
+def _state304(p, ss, vs):
+	# reduce rule 79 (tail_terms_71)
+	v = p._node(71, vs[-1])
+	n = _GOTO55.get(ss[-2], 302)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state304(p, ss, vs):
+
+def _state305(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	if tok == 625:
+		p._pcyytoken = -1
+		ss.append(232)
+		vs.append(p._yylval)
+		return 232 | _SHIFTED
+	# end if tok == 625:
+	# reduce rule 101 (sumti_D_94)
+	v = p._node(94, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = 104
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state305(p, ss, vs):
+
+def _state307(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT116.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 135 (selbri_C_133)
+	v = p._node(133, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO91.get(ss[-2], 109)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state307(p, ss, vs):
+
+def _state308(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT12.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 266 (CO_443)
+	v = p._node(443, vs[-1])
+	n = 306
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state308(p, ss, vs):
+
+def _state309(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT309.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state309(p, ss, vs):
+
+def _state310(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT310.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state310(p, ss, vs):
+
+def _state311(p, ss, vs):
+	# reduce rule 109 (sumti_F_96)
+	v = p._node(96, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO77.get(ss[-2], 108)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state311(p, ss, vs):
+
+def _state313(p, ss, vs):
+	# reduce rule 115 (sumti_tail_111)
+	v = p._node(111, vs[-1])
+	n = _GOTO85.get(ss[-2], 312)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state313(p, ss, vs):
+
+def _state315(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT315.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state315(p, ss, vs):
+
+def _state316(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT106.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 119 (sumti_tail_A_112)
+	v = p._node(112, vs[-1])
+	n = _GOTO45.get(ss[-2], 313)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state316(p, ss, vs):
+
+def _state318(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT318.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state318(p, ss, vs):
+
+def _state321(p, ss, vs):
+	# reduce rule 347 (qualifier_483)
+	v = p._node(483, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO78.get(ss[-2], 110)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state321(p, ss, vs):
+
+def _state322(p, ss, vs):
+	# reduce rule 209 (anaphora_400)
+	v = p._node(400, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = 111
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state322(p, ss, vs):
+
+def _state323(p, ss, vs):
+	# reduce rule 210 (anaphora_400)
+	v = p._node(400, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = 111
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state323(p, ss, vs):
+
+def _state325(p, ss, vs):
+	# reduce rule 256 (quote_arg_432)
+	v = p._node(432, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = 115
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state325(p, ss, vs):
+
+def _state326(p, ss, vs):
+	# reduce rule 370 (NAhE_BO_809)
+	v = p._node(809, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = 118
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state326(p, ss, vs):
+
+def _state327(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT327.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state327(p, ss, vs):
+
+def _state330(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT12.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 390 (JEK_BO_821)
+	v = p._node(821, vs[-1])
+	n = 328
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state330(p, ss, vs):
+
+def _state331(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	if tok == 699:
+		p._pcyytoken = -1
+		ss.append(494)
+		vs.append(p._yylval)
+		return 494 | _SHIFTED
+	# end if tok == 699:
+	return _ERROR
+# end def _state331(p, ss, vs):
+
+def _state332(p, ss, vs):
+	# reduce rule 262 (ZO_quote_435)
+	v = p._node(435, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = 127
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state332(p, ss, vs):
+
+def _state333(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	if tok == 565:
+		p._pcyytoken = -1
+		ss.append(495)
+		vs.append(p._yylval)
+		return 495 | _SHIFTED
+	# end if tok == 565:
+	return _ERROR
+# end def _state333(p, ss, vs):
+
+def _state336(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT12.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 268 (CEI_444)
+	v = p._node(444, vs[-1])
+	n = 335
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state336(p, ss, vs):
+
+def _state337(p, ss, vs):
+	# reduce rule 145 (selbri_F_136)
+	v = p._node(136, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO95.get(ss[-2], 130)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state337(p, ss, vs):
+
+def _state338(p, ss, vs):
+	# reduce rule 159 (tanru_unit_B_152)
+	v = p._node(152, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO103.get(ss[-2], 140)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state338(p, ss, vs):
+
+def _state341(p, ss, vs):
+	# reduce rule 345 (NAhE_482)
+	v = p._node(482, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO99.get(ss[-2], 136)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state341(p, ss, vs):
+
+def _state342(p, ss, vs):
+	# reduce rule 150 (tanru_unit_A_151)
+	v = p._node(151, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO101.get(ss[-2], 137)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state342(p, ss, vs):
+
+def _state343(p, ss, vs):
+	# reduce rule 368 (GUhEK_808)
+	v = p._node(808, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO100.get(ss[-2], 138)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state343(p, ss, vs):
+
+def _state344(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT344.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state344(p, ss, vs):
+
+def _state345(p, ss, vs):
+	# reduce rule 153 (tanru_unit_B_152)
+	v = p._node(152, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO103.get(ss[-2], 140)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state345(p, ss, vs):
+
+def _state346(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT346.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state346(p, ss, vs):
+
+def _state347(p, ss, vs):
+	# reduce rule 155 (tanru_unit_B_152)
+	v = p._node(152, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO103.get(ss[-2], 140)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state347(p, ss, vs):
+
+def _state348(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT348.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state348(p, ss, vs):
+
+def _state349(p, ss, vs):
+	# reduce rule 158 (tanru_unit_B_152)
+	v = p._node(152, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO103.get(ss[-2], 140)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state349(p, ss, vs):
+
+def _state350(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT350.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state350(p, ss, vs):
+
+def _state351(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	if tok == 586:
+		p._pcyytoken = -1
+		ss.append(155)
+		vs.append(p._yylval)
+		return 155 | _SHIFTED
+	# end if tok == 586:
+	return _ERROR
+# end def _state351(p, ss, vs):
+
+def _state352(p, ss, vs):
+	# reduce rule 216 (bridi_valsi_407)
+	v = p._node(407, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = 142
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state352(p, ss, vs):
+
+def _state353(p, ss, vs):
+	# reduce rule 341 (SE_480)
+	v = p._node(480, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO105.get(ss[-2], 144)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state353(p, ss, vs):
+
+def _state354(p, ss, vs):
+	# reduce rule 220 (bridi_valsi_A_408)
+	v = p._node(408, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = 149
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state354(p, ss, vs):
+
+def _state355(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT12.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 252 (NU_A_426)
+	v = p._node(426, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO139.get(ss[-2], 151)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state355(p, ss, vs):
+
+def _state356(p, ss, vs):
+	# reduce rule 253 (NU_A_426)
+	v = p._node(426, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO139.get(ss[-2], 151)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state356(p, ss, vs):
+
+def _state357(p, ss, vs):
+	# reduce rule 6 (text_0)
+	v = p._node(10000, vs[-3], vs[-2], vs[-1])
+	del ss[-2:]
+	del vs[-2:]
+	n = _GOTO2.get(ss[-2], 2)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state357(p, ss, vs):
+
+def _state358(p, ss, vs):
+	# reduce rule 52 (vocative_35)
+	v = p._node(35, vs[-3], vs[-2], vs[-1])
+	del ss[-2:]
+	del vs[-2:]
+	n = 21
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state358(p, ss, vs):
+
+def _state359(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT359.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state359(p, ss, vs):
+
+def _state361(p, ss, vs):
+	# reduce rule 55 (vocative_35)
+	v = p._node(35, vs[-3], vs[-2], vs[-1])
+	del ss[-2:]
+	del vs[-2:]
+	n = 21
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state361(p, ss, vs):
+
+def _state363(p, ss, vs):
+	# reduce rule 57 (vocative_35)
+	v = p._node(35, vs[-3], vs[-2], vs[-1])
+	del ss[-2:]
+	del vs[-2:]
+	n = 21
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state363(p, ss, vs):
+
+def _state365(p, ss, vs):
+	# reduce rule 59 (parenthetical_36)
+	v = p._node(36, vs[-3], vs[-2], vs[-1])
+	del ss[-2:]
+	del vs[-2:]
+	n = 22
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state365(p, ss, vs):
+
+def _state366(p, ss, vs):
+	# reduce rule 323 (TOI_gap_468)
+	v = p._node(468, vs[-1])
+	n = 365
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state366(p, ss, vs):
+
+def _state367(p, ss, vs):
+	# reduce rule 324 (TOI)
+	v = p._elidable(607)
+	n = 365
+	ss[-1] = n
+	vs[-1] = v
+	return n | _ERROK
+# end def _state367(p, ss, vs):
+
+def _state368(p, ss, vs):
+	# reduce rule 47 (discursive_bridi_34)
+	v = p._node(34, vs[-3], vs[-2], vs[-1])
+	del ss[-2:]
+	del vs[-2:]
+	n = 23
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state368(p, ss, vs):
+
+def _state369(p, ss, vs):
+	# reduce rule 298 (SEhU_gap_459)
+	v = p._node(459, vs[-1])
+	n = _GOTO40.get(ss[-2], 368)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state369(p, ss, vs):
+
+def _state370(p, ss, vs):
+	# reduce rule 299 (SE'U)
+	v = p._elidable(598)
+	n = _GOTO40.get(ss[-2], 368)
+	ss[-1] = n
+	vs[-1] = v
+	return n | _ERROK
+# end def _state370(p, ss, vs):
+
+def _state373(p, ss, vs):
+	# reduce rule 48 (discursive_bridi_34)
+	v = p._node(34, vs[-3], vs[-2], vs[-1])
+	del ss[-2:]
+	del vs[-2:]
+	n = 23
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state373(p, ss, vs):
+
+def _state375(p, ss, vs):
+	# reduce rule 349 (subscript_486)
+	v = p._node(486, vs[-3], vs[-2], vs[-1])
+	del ss[-2:]
+	del vs[-2:]
+	n = 24
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state375(p, ss, vs):
+
+def _state376(p, ss, vs):
+	# reduce rule 306 (sub_gap_462)
+	v = p._node(462, vs[-1])
+	n = _GOTO146.get(ss[-2], 375)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state376(p, ss, vs):
+
+def _state377(p, ss, vs):
+	# reduce rule 307 (BOI)
+	v = p._elidable(651)
+	n = _GOTO146.get(ss[-2], 375)
+	ss[-1] = n
+	vs[-1] = v
+	return n | _ERROK
+# end def _state377(p, ss, vs):
+
+def _state378(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT378.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state378(p, ss, vs):
+
+def _state379(p, ss, vs):
+	# reduce rule 351 (subscript_486)
+	v = p._node(486, vs[-3], vs[-2], vs[-1])
+	del ss[-2:]
+	del vs[-2:]
+	n = 24
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state379(p, ss, vs):
+
+def _state380(p, ss, vs):
+	# reduce rule 17 (paragraphs_4)
+	v = p._node(4, vs[-3], vs[-2], vs[-1])
+	del ss[-2:]
+	del vs[-2:]
+	n = _GOTO13.get(ss[-2], 32)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state380(p, ss, vs):
+
+def _state381(p, ss, vs):
+	# reduce rule 19 (paragraph_10)
+	v = p._node(10, vs[-3], vs[-2], vs[-1])
+	del ss[-2:]
+	del vs[-2:]
+	n = 44
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state381(p, ss, vs):
+
+def _state382(p, ss, vs):
+	# reduce rule 22 (paragraph_A_11)
+	v = p._node(11, vs[-3], vs[-2], vs[-1])
+	del ss[-2:]
+	del vs[-2:]
+	n = _GOTO15.get(ss[-2], 48)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state382(p, ss, vs):
+
+def _state383(p, ss, vs):
+	# reduce rule 25 (paragraph_B_12)
+	v = p._node(12, vs[-3], vs[-2], vs[-1])
+	del ss[-2:]
+	del vs[-2:]
+	n = 50
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state383(p, ss, vs):
+
+def _state384(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT12.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 287 (TUhU_gap_454)
+	v = p._node(454, vs[-1])
+	n = _GOTO19.get(ss[-2], 383)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state384(p, ss, vs):
+
+def _state385(p, ss, vs):
+	# reduce rule 289 (TU'U)
+	v = p._elidable(611)
+	n = _GOTO19.get(ss[-2], 383)
+	ss[-1] = n
+	vs[-1] = v
+	return n | _ERROK
+# end def _state385(p, ss, vs):
+
+def _state388(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT388.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state388(p, ss, vs):
+
+def _state389(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT389.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state389(p, ss, vs):
+
+def _state390(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT390.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state390(p, ss, vs):
+
+def _state391(p, ss, vs):
+	# reduce rule 355 (tag_491)
+	v = p._node(491, vs[-3], vs[-2], vs[-1])
+	del ss[-2:]
+	del vs[-2:]
+	n = _GOTO21.get(ss[-2], 55)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state391(p, ss, vs):
+
+def _state392(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT106.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 102 (sumti_D_94)
+	v = p._node(94, vs[-3], vs[-2], vs[-1])
+	del ss[-2:]
+	del vs[-2:]
+	n = 104
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state392(p, ss, vs):
+
+def _state393(p, ss, vs):
+	# reduce rule 39 (prenex_30)
+	v = p._node(30, vs[-3], vs[-2], vs[-1])
+	del ss[-2:]
+	del vs[-2:]
+	n = _GOTO20.get(ss[-2], 54)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state393(p, ss, vs):
+
+def _state394(p, ss, vs):
+	# reduce rule 65 (statement_42)
+	v = p._node(42, vs[-3], vs[-2], vs[-1])
+	del ss[-2:]
+	del vs[-2:]
+	n = 90
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state394(p, ss, vs):
+
+def _state395(p, ss, vs):
+	# reduce rule 291 (VAU_gap_456)
+	v = p._node(456, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO27.get(ss[-2], 304)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state395(p, ss, vs):
+
+def _state396(p, ss, vs):
+	# reduce rule 280 (front_gap_451)
+	v = p._node(451, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO42.get(ss[-2], 225)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state396(p, ss, vs):
+
+def _state397(p, ss, vs):
+	# reduce rule 125 (relative_clauses_121)
+	v = p._node(121, vs[-3], vs[-2], vs[-1])
+	del ss[-2:]
+	del vs[-2:]
+	n = _GOTO28.get(ss[-2], 61)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state397(p, ss, vs):
+
+def _state398(p, ss, vs):
+	# reduce rule 304 (BOI_gap_461)
+	v = p._node(461, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO112.get(ss[-2], 237)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state398(p, ss, vs):
+
+def _state399(p, ss, vs):
+	# reduce rule 166 (quantifier_300)
+	v = p._node(300, vs[-3], vs[-2], vs[-1])
+	del ss[-2:]
+	del vs[-2:]
+	n = _GOTO25.get(ss[-2], 190)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state399(p, ss, vs):
+
+def _state401(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT12.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 329 (right_bracket_gap_471)
+	v = p._node(471, vs[-1])
+	n = 399
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state401(p, ss, vs):
+
+def _state402(p, ss, vs):
+	# reduce rule 331 (VE'O)
+	v = p._elidable(678)
+	n = 399
+	ss[-1] = n
+	vs[-1] = v
+	return n | _ERROK
+# end def _state402(p, ss, vs):
+
+def _state403(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	if tok in (561, 657, 664, 666, 677, 935, 945, 960, 985):
+		# reduce rule 179 (rp_operand_332)
+		v = p._node(332, vs[-1])
+		n = _GOTO122.get(ss[-2], 529)
+		ss[-1] = n
+		vs[-1] = v
+		return n
+	# end if tok in (561, 657, 664, 666, 677, 935, 945, 960, 985):
+	# reduce rule 169 (MEX_310)
+	v = p._node(310, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO81.get(ss[-2], 240)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state403(p, ss, vs):
+
+def _state405(p, ss, vs):
+	# reduce rule 178 (rp_operand_332)
+	v = p._node(332, vs[-1])
+	n = _GOTO122.get(ss[-2], 529)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state405(p, ss, vs):
+
+def _state407(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT407.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state407(p, ss, vs):
+
+def _state410(p, ss, vs):
+	# reduce rule 175 (MEX_C_313)
+	v = p._node(313, vs[-1])
+	n = _GOTO120.get(ss[-2], 407)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state410(p, ss, vs):
+
+def _state418(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT418.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state418(p, ss, vs):
+
+def _state419(p, ss, vs):
+	# reduce rule 202 (operand_C_385)
+	v = p._node(385, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO128.get(ss[-2], 252)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state419(p, ss, vs):
+
+def _state420(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT420.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state420(p, ss, vs):
+
+def _state422(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT422.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state422(p, ss, vs):
+
+def _state425(p, ss, vs):
+	# reduce rule 188 (MEX_operator_374)
+	v = p._node(374, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO107.get(ss[-2], 253)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state425(p, ss, vs):
+
+def _state426(p, ss, vs):
+	# reduce rule 189 (MEX_operator_374)
+	v = p._node(374, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO107.get(ss[-2], 253)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state426(p, ss, vs):
+
+def _state427(p, ss, vs):
+	# reduce rule 190 (MEX_operator_374)
+	v = p._node(374, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO107.get(ss[-2], 253)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state427(p, ss, vs):
+
+def _state428(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT428.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state428(p, ss, vs):
+
+def _state430(p, ss, vs):
+	# reduce rule 164 (links_161)
+	v = p._node(161, vs[-3], vs[-2], vs[-1])
+	del ss[-2:]
+	del vs[-2:]
+	n = _GOTO29.get(ss[-2], 62)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state430(p, ss, vs):
+
+def _state431(p, ss, vs):
+	# reduce rule 161 (linkargs_160)
+	v = p._node(160, vs[-3], vs[-2], vs[-1])
+	del ss[-2:]
+	del vs[-2:]
+	n = _GOTO30.get(ss[-2], 63)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state431(p, ss, vs):
+
+def _state432(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT432.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state432(p, ss, vs):
+
+def _state433(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT12.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 320 (BEhO_gap_467)
+	v = p._node(467, vs[-1])
+	n = _GOTO110.get(ss[-2], 431)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state433(p, ss, vs):
+
+def _state434(p, ss, vs):
+	# reduce rule 322 (BE'O)
+	v = p._elidable(506)
+	n = _GOTO110.get(ss[-2], 431)
+	ss[-1] = n
+	vs[-1] = v
+	return n | _ERROK
+# end def _state434(p, ss, vs):
+
+def _state435(p, ss, vs):
+	# reduce rule 382 (tense_modal_815)
+	v = p._node(815, vs[-3], vs[-2], vs[-1])
+	del ss[-2:]
+	del vs[-2:]
+	n = _GOTO150.get(ss[-2], 66)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state435(p, ss, vs):
+
+def _state436(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT12.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 295 (FEhU_gap_458)
+	v = p._node(458, vs[-1])
+	n = 435
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state436(p, ss, vs):
+
+def _state437(p, ss, vs):
+	# reduce rule 297 (FE'U)
+	v = p._elidable(531)
+	n = 435
+	ss[-1] = n
+	vs[-1] = v
+	return n | _ERROK
+# end def _state437(p, ss, vs):
+
+def _state438(p, ss, vs):
+	# reduce rule 126 (relative_clause_122)
+	v = p._node(122, vs[-3], vs[-2], vs[-1])
+	del ss[-2:]
+	del vs[-2:]
+	n = _GOTO86.get(ss[-2], 73)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state438(p, ss, vs):
+
+def _state439(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT12.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 311 (GEhU_gap_464)
+	v = p._node(464, vs[-1])
+	n = 438
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state439(p, ss, vs):
+
+def _state440(p, ss, vs):
+	# reduce rule 313 (GE'U)
+	v = p._elidable(538)
+	n = 438
+	ss[-1] = n
+	vs[-1] = v
+	return n | _ERROK
+# end def _state440(p, ss, vs):
+
+def _state441(p, ss, vs):
+	# reduce rule 127 (relative_clause_122)
+	v = p._node(122, vs[-3], vs[-2], vs[-1])
+	del ss[-2:]
+	del vs[-2:]
+	n = _GOTO86.get(ss[-2], 73)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state441(p, ss, vs):
+
+def _state442(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT12.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 325 (KUhO_gap_469)
+	v = p._node(469, vs[-1])
+	n = 441
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state442(p, ss, vs):
+
+def _state443(p, ss, vs):
+	# reduce rule 327 (KU'O)
+	v = p._elidable(557)
+	n = 441
+	ss[-1] = n
+	vs[-1] = v
+	return n | _ERROK
+# end def _state443(p, ss, vs):
+
+def _state446(p, ss, vs):
+	# reduce rule 379 (GIhEK_KE_814)
+	v = p._node(814, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = 274
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state446(p, ss, vs):
+
+def _state448(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT12.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 383 (GIK_816)
+	v = p._node(816, vs[-1])
+	n = _GOTO50.get(ss[-2], 450)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state448(p, ss, vs):
+
+def _state453(p, ss, vs):
+	# reduce rule 94 (sumti_A_91)
+	v = p._node(91, vs[-3], vs[-2], vs[-1])
+	del ss[-2:]
+	del vs[-2:]
+	n = 91
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state453(p, ss, vs):
+
+def _state454(p, ss, vs):
+	# reduce rule 362 (EK_KE_804)
+	v = p._node(804, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO69.get(ss[-2], 280)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state454(p, ss, vs):
+
+def _state455(p, ss, vs):
+	# reduce rule 395 (JOIK_KE_823)
+	v = p._node(823, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO70.get(ss[-2], 409)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state455(p, ss, vs):
+
+def _state456(p, ss, vs):
+	# reduce rule 244 (JOIK_EK_421)
+	v = p._node(421, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO67.get(ss[-2], 282)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state456(p, ss, vs):
+
+def _state457(p, ss, vs):
+	# reduce rule 277 (gap_450)
+	v = p._node(450, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO65.get(ss[-2], 287)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state457(p, ss, vs):
+
+def _state459(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT459.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state459(p, ss, vs):
+
+def _state460(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT12.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 300 (NUhU_gap_460)
+	v = p._node(460, vs[-1])
+	n = _GOTO66.get(ss[-2], 459)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state460(p, ss, vs):
+
+def _state461(p, ss, vs):
+	# reduce rule 302 (NU'U)
+	v = p._elidable(588)
+	n = _GOTO66.get(ss[-2], 459)
+	ss[-1] = n
+	vs[-1] = v
+	return n | _ERROK
+# end def _state461(p, ss, vs):
+
+def _state463(p, ss, vs):
+	# reduce rule 377 (GIhEK_BO_813)
+	v = p._node(813, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = 295
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state463(p, ss, vs):
+
+def _state464(p, ss, vs):
+	# reduce rule 96 (sumti_B_92)
+	v = p._node(92, vs[-3], vs[-2], vs[-1])
+	del ss[-2:]
+	del vs[-2:]
+	n = _GOTO71.get(ss[-2], 97)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state464(p, ss, vs):
+
+def _state465(p, ss, vs):
+	# reduce rule 97 (sumti_B_92)
+	v = p._node(92, vs[-3], vs[-2], vs[-1])
+	del ss[-2:]
+	del vs[-2:]
+	n = _GOTO71.get(ss[-2], 97)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state465(p, ss, vs):
+
+def _state466(p, ss, vs):
+	# reduce rule 360 (EK_BO_803)
+	v = p._node(803, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO73.get(ss[-2], 297)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state466(p, ss, vs):
+
+def _state467(p, ss, vs):
+	# reduce rule 393 (JOIK_BO_822)
+	v = p._node(822, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO74.get(ss[-2], 298)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state467(p, ss, vs):
+
+def _state468(p, ss, vs):
+	# reduce rule 78 (tail_terms_71)
+	v = p._node(71, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO55.get(ss[-2], 302)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state468(p, ss, vs):
+
+def _state469(p, ss, vs):
+	# reduce rule 133 (selbri_B_132)
+	v = p._node(132, vs[-3], vs[-2], vs[-1])
+	del ss[-2:]
+	del vs[-2:]
+	n = _GOTO90.get(ss[-2], 107)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state469(p, ss, vs):
+
+def _state470(p, ss, vs):
+	# reduce rule 267 (CO_443)
+	v = p._node(443, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = 306
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state470(p, ss, vs):
+
+def _state471(p, ss, vs):
+	# reduce rule 106 (sumti_F_96)
+	v = p._node(96, vs[-3], vs[-2], vs[-1])
+	del ss[-2:]
+	del vs[-2:]
+	n = _GOTO77.get(ss[-2], 108)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state471(p, ss, vs):
+
+def _state472(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT12.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 308 (LUhU_gap_463)
+	v = p._node(463, vs[-1])
+	n = _GOTO79.get(ss[-2], 471)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state472(p, ss, vs):
+
+def _state473(p, ss, vs):
+	# reduce rule 310 (LU'U)
+	v = p._elidable(573)
+	n = _GOTO79.get(ss[-2], 471)
+	ss[-1] = n
+	vs[-1] = v
+	return n | _ERROK
+# end def _state473(p, ss, vs):
+
+def _state475(p, ss, vs):
+	# reduce rule 113 (description_110)
+	v = p._node(110, vs[-3], vs[-2], vs[-1])
+	del ss[-2:]
+	del vs[-2:]
+	n = 114
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state475(p, ss, vs):
+
+def _state476(p, ss, vs):
+	# reduce rule 116 (sumti_tail_111)
+	v = p._node(111, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO85.get(ss[-2], 312)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state476(p, ss, vs):
+
+def _state477(p, ss, vs):
+	# reduce rule 117 (sumti_tail_111)
+	v = p._node(111, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO85.get(ss[-2], 312)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state477(p, ss, vs):
+
+def _state479(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	if tok == 625:
+		p._pcyytoken = -1
+		ss.append(232)
+		vs.append(p._yylval)
+		return 232 | _SHIFTED
+	# end if tok == 625:
+	# reduce rule 120 (sumti_tail_A_112)
+	v = p._node(112, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO45.get(ss[-2], 313)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state479(p, ss, vs):
+
+def _state480(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT106.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 121 (sumti_tail_A_112)
+	v = p._node(112, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO45.get(ss[-2], 313)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state480(p, ss, vs):
+
+def _state481(p, ss, vs):
+	# reduce rule 123 (sumti_tail_A_112)
+	v = p._node(112, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO45.get(ss[-2], 313)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state481(p, ss, vs):
+
+def _state482(p, ss, vs):
+	# reduce rule 110 (sumti_F_96)
+	v = p._node(96, vs[-3], vs[-2], vs[-1])
+	del ss[-2:]
+	del vs[-2:]
+	n = _GOTO77.get(ss[-2], 108)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state482(p, ss, vs):
+
+def _state483(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT12.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 332 (LOhO_gap_472)
+	v = p._node(472, vs[-1])
+	n = 482
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state483(p, ss, vs):
+
+def _state484(p, ss, vs):
+	# reduce rule 334 (LO'O)
+	v = p._elidable(568)
+	n = 482
+	ss[-1] = n
+	vs[-1] = v
+	return n | _ERROK
+# end def _state484(p, ss, vs):
+
+def _state485(p, ss, vs):
+	# reduce rule 137 (selbri_D_134)
+	v = p._node(134, vs[-3], vs[-2], vs[-1])
+	del ss[-2:]
+	del vs[-2:]
+	n = _GOTO93.get(ss[-2], 116)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state485(p, ss, vs):
+
+def _state487(p, ss, vs):
+	# reduce rule 114 (description_110)
+	v = p._node(110, vs[-3], vs[-2], vs[-1])
+	del ss[-2:]
+	del vs[-2:]
+	n = 114
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state487(p, ss, vs):
+
+def _state488(p, ss, vs):
+	# reduce rule 260 (quote_arg_A_433)
+	v = p._node(433, vs[-3], vs[-2], vs[-1])
+	del ss[-2:]
+	del vs[-2:]
+	n = 122
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state488(p, ss, vs):
+
+def _state489(p, ss, vs):
+	# reduce rule 274 (LIhU_gap_448)
+	v = p._node(448, vs[-1])
+	n = 488
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state489(p, ss, vs):
+
+def _state490(p, ss, vs):
+	# reduce rule 275 (LI'U)
+	v = p._elidable(567)
+	n = 488
+	ss[-1] = n
+	vs[-1] = v
+	return n | _ERROK
+# end def _state490(p, ss, vs):
+
+def _state491(p, ss, vs):
+	# reduce rule 140 (selbri_E_135)
+	v = p._node(135, vs[-3], vs[-2], vs[-1])
+	del ss[-2:]
+	del vs[-2:]
+	n = _GOTO94.get(ss[-2], 123)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state491(p, ss, vs):
+
+def _state492(p, ss, vs):
+	# reduce rule 141 (selbri_E_135)
+	v = p._node(135, vs[-3], vs[-2], vs[-1])
+	del ss[-2:]
+	del vs[-2:]
+	n = _GOTO94.get(ss[-2], 123)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state492(p, ss, vs):
+
+def _state493(p, ss, vs):
+	# reduce rule 391 (JEK_BO_821)
+	v = p._node(821, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = 328
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state493(p, ss, vs):
+
+def _state494(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	if tok == 698:
+		p._pcyytoken = -1
+		ss.append(578)
+		vs.append(p._yylval)
+		return 578 | _SHIFTED
+	# end if tok == 698:
+	return _ERROR
+# end def _state494(p, ss, vs):
+
+def _state495(p, ss, vs):
+	# reduce rule 263 (LOhU_quote_436)
+	v = p._node(436, vs[-3], vs[-2], vs[-1])
+	del ss[-2:]
+	del vs[-2:]
+	n = 128
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state495(p, ss, vs):
+
+def _state496(p, ss, vs):
+	# reduce rule 143 (selbri_F_136)
+	v = p._node(136, vs[-3], vs[-2], vs[-1])
+	del ss[-2:]
+	del vs[-2:]
+	n = _GOTO95.get(ss[-2], 130)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state496(p, ss, vs):
+
+def _state497(p, ss, vs):
+	# reduce rule 148 (tanru_unit_150)
+	v = p._node(150, vs[-3], vs[-2], vs[-1])
+	del ss[-2:]
+	del vs[-2:]
+	n = 134
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state497(p, ss, vs):
+
+def _state498(p, ss, vs):
+	# reduce rule 269 (CEI_444)
+	v = p._node(444, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = 335
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state498(p, ss, vs):
+
+def _state500(p, ss, vs):
+	# reduce rule 152 (tanru_unit_B_152)
+	v = p._node(152, vs[-3], vs[-2], vs[-1])
+	del ss[-2:]
+	del vs[-2:]
+	n = _GOTO103.get(ss[-2], 140)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state500(p, ss, vs):
+
+def _state501(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT12.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 317 (KEhE_gap_466)
+	v = p._node(466, vs[-1])
+	n = _GOTO54.get(ss[-2], 500)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state501(p, ss, vs):
+
+def _state502(p, ss, vs):
+	# reduce rule 319 (KE'E)
+	v = p._elidable(550)
+	n = _GOTO54.get(ss[-2], 500)
+	ss[-1] = n
+	vs[-1] = v
+	return n | _ERROK
+# end def _state502(p, ss, vs):
+
+def _state503(p, ss, vs):
+	# reduce rule 154 (tanru_unit_B_152)
+	v = p._node(152, vs[-3], vs[-2], vs[-1])
+	del ss[-2:]
+	del vs[-2:]
+	n = _GOTO103.get(ss[-2], 140)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state503(p, ss, vs):
+
+def _state504(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	if tok == 663:
+		p._pcyytoken = -1
+		ss.append(581)
+		vs.append(p._yylval)
+		return 581 | _SHIFTED
+	# end if tok == 663:
+	# reduce rule 156 (tanru_unit_B_152)
+	v = p._node(152, vs[-3], vs[-2], vs[-1])
+	del ss[-2:]
+	del vs[-2:]
+	n = _GOTO103.get(ss[-2], 140)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state504(p, ss, vs):
+
+def _state505(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT12.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 314 (MEhU_gap_465)
+	v = p._node(465, vs[-1])
+	n = 504
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state505(p, ss, vs):
+
+def _state506(p, ss, vs):
+	# reduce rule 316 (ME'U)
+	v = p._elidable(575)
+	n = 504
+	ss[-1] = n
+	vs[-1] = v
+	return n | _ERROK
+# end def _state506(p, ss, vs):
+
+def _state507(p, ss, vs):
+	# reduce rule 160 (tanru_unit_B_152)
+	v = p._node(152, vs[-3], vs[-2], vs[-1])
+	del ss[-2:]
+	del vs[-2:]
+	n = _GOTO103.get(ss[-2], 140)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state507(p, ss, vs):
+
+def _state508(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT12.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 284 (KEI_gap_453)
+	v = p._node(453, vs[-1])
+	n = 507
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state508(p, ss, vs):
+
+def _state509(p, ss, vs):
+	# reduce rule 286 (KEI)
+	v = p._elidable(552)
+	n = 507
+	ss[-1] = n
+	vs[-1] = v
+	return n | _ERROK
+# end def _state509(p, ss, vs):
+
+def _state510(p, ss, vs):
+	# reduce rule 250 (NU_425)
+	v = p._node(425, vs[-3], vs[-2], vs[-1])
+	del ss[-2:]
+	del vs[-2:]
+	n = 148
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state510(p, ss, vs):
+
+def _state511(p, ss, vs):
+	# reduce rule 254 (NU_A_426)
+	v = p._node(426, vs[-3], vs[-2], vs[-1])
+	del ss[-2:]
+	del vs[-2:]
+	n = _GOTO139.get(ss[-2], 151)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state511(p, ss, vs):
+
+def _state512(p, ss, vs):
+	# reduce rule 53 (vocative_35)
+	v = p._node(35, vs[-4], vs[-3], vs[-2], vs[-1])
+	del ss[-3:]
+	del vs[-3:]
+	n = 21
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state512(p, ss, vs):
+
+def _state513(p, ss, vs):
+	# reduce rule 54 (vocative_35)
+	v = p._node(35, vs[-4], vs[-3], vs[-2], vs[-1])
+	del ss[-3:]
+	del vs[-3:]
+	n = 21
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state513(p, ss, vs):
+
+def _state514(p, ss, vs):
+	# reduce rule 56 (vocative_35)
+	v = p._node(35, vs[-4], vs[-3], vs[-2], vs[-1])
+	del ss[-3:]
+	del vs[-3:]
+	n = 21
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state514(p, ss, vs):
+
+def _state516(p, ss, vs):
+	# reduce rule 51 (discursive_bridi_34)
+	v = p._node(34, vs[-4], vs[-3], vs[-2], vs[-1])
+	del ss[-3:]
+	del vs[-3:]
+	n = 23
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state516(p, ss, vs):
+
+def _state517(p, ss, vs):
+	# reduce rule 49 (discursive_bridi_34)
+	v = p._node(34, vs[-4], vs[-3], vs[-2], vs[-1])
+	del ss[-3:]
+	del vs[-3:]
+	n = 23
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state517(p, ss, vs):
+
+def _state518(p, ss, vs):
+	# reduce rule 350 (subscript_486)
+	v = p._node(486, vs[-4], vs[-3], vs[-2], vs[-1])
+	del ss[-3:]
+	del vs[-3:]
+	n = 24
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state518(p, ss, vs):
+
+def _state519(p, ss, vs):
+	# reduce rule 338 (right_br_no_free_474)
+	v = p._node(474, vs[-1])
+	n = 518
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state519(p, ss, vs):
+
+def _state520(p, ss, vs):
+	# reduce rule 339 (VE'O)
+	v = p._elidable(678)
+	n = 518
+	ss[-1] = n
+	vs[-1] = v
+	return n | _ERROK
+# end def _state520(p, ss, vs):
+
+def _state521(p, ss, vs):
+	# reduce rule 288 (TUhU_gap_454)
+	v = p._node(454, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO19.get(ss[-2], 383)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state521(p, ss, vs):
+
+def _state522(p, ss, vs):
+	# reduce rule 26 (paragraph_B_12)
+	v = p._node(12, vs[-4], vs[-3], vs[-2], vs[-1])
+	del ss[-3:]
+	del vs[-3:]
+	n = 50
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state522(p, ss, vs):
+
+def _state523(p, ss, vs):
+	# reduce rule 27 (paragraph_B_12)
+	v = p._node(12, vs[-4], vs[-3], vs[-2], vs[-1])
+	del ss[-3:]
+	del vs[-3:]
+	n = 50
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state523(p, ss, vs):
+
+def _state524(p, ss, vs):
+	# reduce rule 76 (gek_bridi_tail_54)
+	v = p._node(54, vs[-4], vs[-3], vs[-2], vs[-1])
+	del ss[-3:]
+	del vs[-3:]
+	n = _GOTO59.get(ss[-2], 102)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state524(p, ss, vs):
+
+def _state526(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	if tok == 625:
+		p._pcyytoken = -1
+		ss.append(232)
+		vs.append(p._yylval)
+		return 232 | _SHIFTED
+	# end if tok == 625:
+	# reduce rule 103 (sumti_D_94)
+	v = p._node(94, vs[-4], vs[-3], vs[-2], vs[-1])
+	del ss[-3:]
+	del vs[-3:]
+	n = 104
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state526(p, ss, vs):
+
+def _state527(p, ss, vs):
+	# reduce rule 168 (MEX_310)
+	v = p._node(310, vs[-3], vs[-2], vs[-1])
+	del ss[-2:]
+	del vs[-2:]
+	n = _GOTO81.get(ss[-2], 240)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state527(p, ss, vs):
+
+def _state528(p, ss, vs):
+	# reduce rule 330 (right_bracket_gap_471)
+	v = p._node(471, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = 399
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state528(p, ss, vs):
+
+def _state529(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT529.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state529(p, ss, vs):
+
+def _state530(p, ss, vs):
+	# reduce rule 179 (rp_operand_332)
+	v = p._node(332, vs[-1])
+	n = _GOTO122.get(ss[-2], 529)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state530(p, ss, vs):
+
+def _state532(p, ss, vs):
+	# reduce rule 173 (MEX_B_312)
+	v = p._node(312, vs[-3], vs[-2], vs[-1])
+	del ss[-2:]
+	del vs[-2:]
+	n = _GOTO118.get(ss[-2], 243)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state532(p, ss, vs):
+
+def _state533(p, ss, vs):
+	# reduce rule 176 (MEX_C_313)
+	v = p._node(313, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO120.get(ss[-2], 407)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state533(p, ss, vs):
+
+def _state534(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT12.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 281 (MEX_gap_452)
+	v = p._node(452, vs[-1])
+	n = _GOTO121.get(ss[-2], 532)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state534(p, ss, vs):
+
+def _state535(p, ss, vs):
+	# reduce rule 283 (KU'E)
+	v = p._elidable(658)
+	n = _GOTO121.get(ss[-2], 532)
+	ss[-1] = n
+	vs[-1] = v
+	return n | _ERROK
+# end def _state535(p, ss, vs):
+
+def _state536(p, ss, vs):
+	# reduce rule 181 (operator_370)
+	v = p._node(370, vs[-3], vs[-2], vs[-1])
+	del ss[-2:]
+	del vs[-2:]
+	n = _GOTO116.get(ss[-2], 245)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state536(p, ss, vs):
+
+def _state541(p, ss, vs):
+	# reduce rule 197 (operand_A_382)
+	v = p._node(382, vs[-3], vs[-2], vs[-1])
+	del ss[-2:]
+	del vs[-2:]
+	n = 247
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state541(p, ss, vs):
+
+def _state542(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT542.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	return _ERROR
+# end def _state542(p, ss, vs):
+
+def _state543(p, ss, vs):
+	# reduce rule 199 (operand_B_383)
+	v = p._node(383, vs[-3], vs[-2], vs[-1])
+	del ss[-2:]
+	del vs[-2:]
+	n = _GOTO127.get(ss[-2], 249)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state543(p, ss, vs):
+
+def _state544(p, ss, vs):
+	# reduce rule 200 (operand_B_383)
+	v = p._node(383, vs[-3], vs[-2], vs[-1])
+	del ss[-2:]
+	del vs[-2:]
+	n = _GOTO127.get(ss[-2], 249)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state544(p, ss, vs):
+
+def _state545(p, ss, vs):
+	# reduce rule 186 (operator_B_372)
+	v = p._node(372, vs[-3], vs[-2], vs[-1])
+	del ss[-2:]
+	del vs[-2:]
+	n = _GOTO124.get(ss[-2], 250)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state545(p, ss, vs):
+
+def _state546(p, ss, vs):
+	# reduce rule 203 (operand_C_385)
+	v = p._node(385, vs[-3], vs[-2], vs[-1])
+	del ss[-2:]
+	del vs[-2:]
+	n = _GOTO128.get(ss[-2], 252)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state546(p, ss, vs):
+
+def _state547(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT12.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 335 (TEhU_gap_473)
+	v = p._node(473, vs[-1])
+	n = _GOTO125.get(ss[-2], 546)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state547(p, ss, vs):
+
+def _state548(p, ss, vs):
+	# reduce rule 337 (TE'U)
+	v = p._elidable(675)
+	n = _GOTO125.get(ss[-2], 546)
+	ss[-1] = n
+	vs[-1] = v
+	return n | _ERROK
+# end def _state548(p, ss, vs):
+
+def _state549(p, ss, vs):
+	# reduce rule 204 (operand_C_385)
+	v = p._node(385, vs[-3], vs[-2], vs[-1])
+	del ss[-2:]
+	del vs[-2:]
+	n = _GOTO128.get(ss[-2], 252)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state549(p, ss, vs):
+
+def _state550(p, ss, vs):
+	# reduce rule 205 (operand_C_385)
+	v = p._node(385, vs[-3], vs[-2], vs[-1])
+	del ss[-2:]
+	del vs[-2:]
+	n = _GOTO128.get(ss[-2], 252)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state550(p, ss, vs):
+
+def _state552(p, ss, vs):
+	# reduce rule 207 (operand_C_385)
+	v = p._node(385, vs[-3], vs[-2], vs[-1])
+	del ss[-2:]
+	del vs[-2:]
+	n = _GOTO128.get(ss[-2], 252)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state552(p, ss, vs):
+
+def _state553(p, ss, vs):
+	# reduce rule 191 (MEX_operator_374)
+	v = p._node(374, vs[-3], vs[-2], vs[-1])
+	del ss[-2:]
+	del vs[-2:]
+	n = _GOTO107.get(ss[-2], 253)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state553(p, ss, vs):
+
+def _state554(p, ss, vs):
+	# reduce rule 192 (MEX_operator_374)
+	v = p._node(374, vs[-3], vs[-2], vs[-1])
+	del ss[-2:]
+	del vs[-2:]
+	n = _GOTO107.get(ss[-2], 253)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state554(p, ss, vs):
+
+def _state555(p, ss, vs):
+	# reduce rule 162 (linkargs_160)
+	v = p._node(160, vs[-4], vs[-3], vs[-2], vs[-1])
+	del ss[-3:]
+	del vs[-3:]
+	n = _GOTO30.get(ss[-2], 63)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state555(p, ss, vs):
+
+def _state556(p, ss, vs):
+	# reduce rule 321 (BEhO_gap_467)
+	v = p._node(467, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO110.get(ss[-2], 431)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state556(p, ss, vs):
+
+def _state557(p, ss, vs):
+	# reduce rule 296 (FEhU_gap_458)
+	v = p._node(458, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = 435
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state557(p, ss, vs):
+
+def _state558(p, ss, vs):
+	# reduce rule 312 (GEhU_gap_464)
+	v = p._node(464, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = 438
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state558(p, ss, vs):
+
+def _state559(p, ss, vs):
+	# reduce rule 326 (KUhO_gap_469)
+	v = p._node(469, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = 441
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state559(p, ss, vs):
+
+def _state561(p, ss, vs):
+	# reduce rule 70 (bridi_tail_A_51)
+	v = p._node(51, vs[-4], vs[-3], vs[-2], vs[-1])
+	del ss[-3:]
+	del vs[-3:]
+	n = 88
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state561(p, ss, vs):
+
+def _state562(p, ss, vs):
+	# reduce rule 62 (sentence_A_41)
+	v = p._node(41, vs[-4], vs[-3], vs[-2], vs[-1])
+	del ss[-3:]
+	del vs[-3:]
+	n = _GOTO48.get(ss[-2], 77)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state562(p, ss, vs):
+
+def _state563(p, ss, vs):
+	# reduce rule 384 (GIK_816)
+	v = p._node(816, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO50.get(ss[-2], 450)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state563(p, ss, vs):
+
+def _state564(p, ss, vs):
+	# reduce rule 75 (gek_bridi_tail_54)
+	v = p._node(54, vs[-4], vs[-3], vs[-2], vs[-1])
+	del ss[-3:]
+	del vs[-3:]
+	n = _GOTO59.get(ss[-2], 102)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state564(p, ss, vs):
+
+def _state565(p, ss, vs):
+	# reduce rule 99 (sumti_C_93)
+	v = p._node(93, vs[-4], vs[-3], vs[-2], vs[-1])
+	del ss[-3:]
+	del vs[-3:]
+	n = _GOTO72.get(ss[-2], 100)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state565(p, ss, vs):
+
+def _state566(p, ss, vs):
+	# reduce rule 91 (sumti_90)
+	v = p._node(90, vs[-4], vs[-3], vs[-2], vs[-1])
+	del ss[-3:]
+	del vs[-3:]
+	n = _GOTO41.get(ss[-2], 82)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state566(p, ss, vs):
+
+def _state567(p, ss, vs):
+	# reduce rule 92 (sumti_90)
+	v = p._node(90, vs[-4], vs[-3], vs[-2], vs[-1])
+	del ss[-3:]
+	del vs[-3:]
+	n = _GOTO41.get(ss[-2], 82)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state567(p, ss, vs):
+
+def _state570(p, ss, vs):
+	# reduce rule 301 (NUhU_gap_460)
+	v = p._node(460, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO66.get(ss[-2], 459)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state570(p, ss, vs):
+
+def _state571(p, ss, vs):
+	# reduce rule 72 (bridi_tail_B_52)
+	v = p._node(52, vs[-4], vs[-3], vs[-2], vs[-1])
+	del ss[-3:]
+	del vs[-3:]
+	n = _GOTO56.get(ss[-2], 95)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state571(p, ss, vs):
+
+def _state572(p, ss, vs):
+	# reduce rule 309 (LUhU_gap_463)
+	v = p._node(463, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO79.get(ss[-2], 471)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state572(p, ss, vs):
+
+def _state573(p, ss, vs):
+	# reduce rule 107 (sumti_F_96)
+	v = p._node(96, vs[-4], vs[-3], vs[-2], vs[-1])
+	del ss[-3:]
+	del vs[-3:]
+	n = _GOTO77.get(ss[-2], 108)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state573(p, ss, vs):
+
+def _state574(p, ss, vs):
+	# reduce rule 118 (sumti_tail_111)
+	v = p._node(111, vs[-3], vs[-2], vs[-1])
+	del ss[-2:]
+	del vs[-2:]
+	n = _GOTO85.get(ss[-2], 312)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state574(p, ss, vs):
+
+def _state575(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	if tok == 625:
+		p._pcyytoken = -1
+		ss.append(232)
+		vs.append(p._yylval)
+		return 232 | _SHIFTED
+	# end if tok == 625:
+	# reduce rule 122 (sumti_tail_A_112)
+	v = p._node(112, vs[-3], vs[-2], vs[-1])
+	del ss[-2:]
+	del vs[-2:]
+	n = _GOTO45.get(ss[-2], 313)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state575(p, ss, vs):
+
+def _state576(p, ss, vs):
+	# reduce rule 333 (LOhO_gap_472)
+	v = p._node(472, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = 482
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state576(p, ss, vs):
+
+def _state577(p, ss, vs):
+	# reduce rule 138 (selbri_D_134)
+	v = p._node(134, vs[-4], vs[-3], vs[-2], vs[-1])
+	del ss[-3:]
+	del vs[-3:]
+	n = _GOTO93.get(ss[-2], 116)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state577(p, ss, vs):
+
+def _state578(p, ss, vs):
+	# reduce rule 261 (ZOI_quote_434)
+	v = p._node(434, vs[-4], vs[-3], vs[-2], vs[-1])
+	del ss[-3:]
+	del vs[-3:]
+	n = 126
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state578(p, ss, vs):
+
+def _state579(p, ss, vs):
+	# reduce rule 146 (GUhEK_selbri_137)
+	v = p._node(137, vs[-4], vs[-3], vs[-2], vs[-1])
+	del ss[-3:]
+	del vs[-3:]
+	n = _GOTO98.get(ss[-2], 135)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state579(p, ss, vs):
+
+def _state580(p, ss, vs):
+	# reduce rule 318 (KEhE_gap_466)
+	v = p._node(466, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO54.get(ss[-2], 500)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state580(p, ss, vs):
+
+def _state581(p, ss, vs):
+	# reduce rule 157 (tanru_unit_B_152)
+	v = p._node(152, vs[-4], vs[-3], vs[-2], vs[-1])
+	del ss[-3:]
+	del vs[-3:]
+	n = _GOTO103.get(ss[-2], 140)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state581(p, ss, vs):
+
+def _state582(p, ss, vs):
+	# reduce rule 315 (MEhU_gap_465)
+	v = p._node(465, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = 504
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state582(p, ss, vs):
+
+def _state583(p, ss, vs):
+	# reduce rule 285 (KEI_gap_453)
+	v = p._node(453, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = 507
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state583(p, ss, vs):
+
+def _state584(p, ss, vs):
+	# reduce rule 50 (discursive_bridi_34)
+	v = p._node(34, vs[-5], vs[-4], vs[-3], vs[-2], vs[-1])
+	del ss[-4:]
+	del vs[-4:]
+	n = 23
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state584(p, ss, vs):
+
+def _state585(p, ss, vs):
+	tok = p._pcyytoken
+	if tok < 0:
+		tok = p._yylex()
+		if tok < 0:
+			tok = 0
+		# end if tok < 0:
+		p._pcyytoken = tok
+	# end if tok < 0:
+	n = _SHIFT116.get(tok)
+	if not n is None:
+		p._pcyytoken = -1
+		ss.append(n)
+		vs.append(p._yylval)
+		return n | _SHIFTED
+	# end if not n is None:
+	# reduce rule 177 (rp_expression_330)
+	v = p._node(330, vs[-3], vs[-2], vs[-1])
+	del ss[-2:]
+	del vs[-2:]
+	n = _GOTO117.get(ss[-2], 530)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state585(p, ss, vs):
+
+def _state586(p, ss, vs):
+	# reduce rule 171 (MEX_A_311)
+	v = p._node(311, vs[-4], vs[-3], vs[-2], vs[-1])
+	del ss[-3:]
+	del vs[-3:]
+	n = _GOTO115.get(ss[-2], 241)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state586(p, ss, vs):
+
+def _state587(p, ss, vs):
+	# reduce rule 282 (MEX_gap_452)
+	v = p._node(452, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO121.get(ss[-2], 532)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state587(p, ss, vs):
+
+def _state588(p, ss, vs):
+	# reduce rule 182 (operator_370)
+	v = p._node(370, vs[-4], vs[-3], vs[-2], vs[-1])
+	del ss[-3:]
+	del vs[-3:]
+	n = _GOTO116.get(ss[-2], 245)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state588(p, ss, vs):
+
+def _state589(p, ss, vs):
+	# reduce rule 174 (MEX_B_312)
+	v = p._node(312, vs[-4], vs[-3], vs[-2], vs[-1])
+	del ss[-3:]
+	del vs[-3:]
+	n = _GOTO118.get(ss[-2], 243)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state589(p, ss, vs):
+
+def _state590(p, ss, vs):
+	# reduce rule 194 (operand_381)
+	v = p._node(381, vs[-4], vs[-3], vs[-2], vs[-1])
+	del ss[-3:]
+	del vs[-3:]
+	n = _GOTO119.get(ss[-2], 244)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state590(p, ss, vs):
+
+def _state591(p, ss, vs):
+	# reduce rule 195 (operand_381)
+	v = p._node(381, vs[-4], vs[-3], vs[-2], vs[-1])
+	del ss[-3:]
+	del vs[-3:]
+	n = _GOTO119.get(ss[-2], 244)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state591(p, ss, vs):
+
+def _state592(p, ss, vs):
+	# reduce rule 184 (operator_A_371)
+	v = p._node(371, vs[-4], vs[-3], vs[-2], vs[-1])
+	del ss[-3:]
+	del vs[-3:]
+	n = _GOTO123.get(ss[-2], 248)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state592(p, ss, vs):
+
+def _state593(p, ss, vs):
+	# reduce rule 336 (TEhU_gap_473)
+	v = p._node(473, vs[-2], vs[-1])
+	del ss[-1:]
+	del vs[-1:]
+	n = _GOTO125.get(ss[-2], 546)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state593(p, ss, vs):
+
+def _state594(p, ss, vs):
+	# reduce rule 206 (operand_C_385)
+	v = p._node(385, vs[-4], vs[-3], vs[-2], vs[-1])
+	del ss[-3:]
+	del vs[-3:]
+	n = _GOTO128.get(ss[-2], 252)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state594(p, ss, vs):
+
+def _state595(p, ss, vs):
+	# reduce rule 68 (bridi_tail_50)
+	v = p._node(50, vs[-5], vs[-4], vs[-3], vs[-2], vs[-1])
+	del ss[-4:]
+	del vs[-4:]
+	n = _GOTO47.get(ss[-2], 76)
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state595(p, ss, vs):
+
+def _state599(p, ss, vs):
+	# reduce rule 89 (term_set_83)
+	v = p._node(83, vs[-6], vs[-5], vs[-4], vs[-3], vs[-2], vs[-1])
+	del ss[-5:]
+	del vs[-5:]
+	n = 84
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state599(p, ss, vs):
+
+def _state600(p, ss, vs):
+	# reduce rule 88 (term_set_83)
+	v = p._node(83, vs[-7], vs[-6], vs[-5], vs[-4], vs[-3], vs[-2], vs[-1])
+	del ss[-6:]
+	del vs[-6:]
+	n = 84
+	ss[-1] = n
+	vs[-1] = v
+	return n
+# end def _state600(p, ss, vs):
+
+# function of each state, called with the parser, the state stack and
+# the value stack (the state being on top); returns the next state
+STATES = ( \
+	_state0, _state1, _state2, _state3, _state4, _state5, _state5, _state0, \
+	_state8, _state9, _state10, _state11, _state12, _state13, _state14, _state15, \
+	_state8, _state8, _state18, _state19, _state20, _state21, _state22, _state23, \
+	_state24, _state25, _state26, _state27, _state28, _state29, _state30, _state31, \
+	_state32, _state33, _state34, _state35, _state36, _state37, _state38, _state0, \
+	_state40, _state41, _state42, _state43, _state44, _state45, _state46, _state47, \
+	_state48, _state49, _state50, _state51, _state52, _state8, _state54, _state55, \
+	_state56, _state57, _state58, _state59, _state60, _state61, _state62, _state63, \
+	_state64, _state65, _state66, _state67, _state68, _state69, _state70, _state71, \
+	_state72, _state73, _state74, _state74, _state76, _state77, _state78, _state79, \
+	_state80, _state81, _state82, _state83, _state84, _state85, _state74, _state40, \
+	_state88, _state40, _state90, _state91, _state92, _state74, _state94, _state95, \
+	_state96, _state97, _state98, _state99, _state100, _state101, _state102, _state103, \
+	_state104, _state105, _state106, _state107, _state108, _state109, _state110, _state111, \
+	_state112, _state71, _state114, _state115, _state116, _state117, _state118, _state119, \
+	_state70, _state121, _state122, _state123, _state124, _state125, _state126, _state127, \
+	_state128, _state0, _state130, _state131, _state132, _state133, _state134, _state135, \
+	_state136, _state137, _state79, _state139, _state140, _state141, _state142, _state136, \
+	_state144, _state145, _state41, _state147, _state148, _state149, _state150, _state151, \
+	_state152, _state153, _state154, _state155, _state156, _state157, _state158, _state5, \
+	_state160, _state161, _state162, _state163, _state164, _state165, _state166, _state167, \
+	_state168, _state169, _state170, _state171, _state172, _state173, _state174, _state175, \
+	_state176, _state177, _state178, _state179, _state180, _state181, _state180, _state183, \
+	_state184, _state185, _state186, _state187, _state79, _state41, _state190, _state191, \
+	_state192, _state193, _state194, _state195, _state196, _state71, _state196, _state199, \
+	_state200, _state201, _state202, _state203, _state204, _state205, _state206, _state199, \
+	_state208, _state40, _state210, _state211, _state212, _state199, _state212, _state215, \
+	_state216, _state217, _state218, _state212, _state220, _state221, _state222, _state223, \
+	_state224, _state212, _state226, _state227, _state228, _state229, _state230, _state231, \
+	_state232, _state233, _state234, _state235, _state236, _state237, _state238, _state239, \
+	_state240, _state241, _state242, _state243, _state244, _state245, _state246, _state247, \
+	_state248, _state249, _state250, _state246, _state252, _state253, _state246, _state255, \
+	_state70, _state79, _state41, _state259, _state242, _state242, _state262, _state147, \
+	_state147, _state71, _state79, _state267, _state268, _state269, _state270, _state271, \
+	_state272, _state273, _state212, _state212, _state276, _state277, _state277, _state279, \
+	_state41, _state41, _state41, _state283, _state284, _state285, _state286, _state287, \
+	_state288, _state289, _state290, _state74, _state292, _state293, _state294, _state212, \
+	_state296, _state41, _state41, _state299, _state300, _state301, _state302, _state103, \
+	_state304, _state305, _state136, _state307, _state308, _state309, _state310, _state311, \
+	_state221, _state313, _state181, _state315, _state316, _state231, _state318, _state136, \
+	_state136, _state321, _state322, _state323, _state221, _state325, _state326, _state327, \
+	_state136, _state136, _state330, _state331, _state332, _state333, _state136, _state144, \
+	_state336, _state337, _state338, _state144, _state277, _state341, _state342, _state343, \
+	_state344, _state345, _state346, _state347, _state348, _state349, _state350, _state351, \
+	_state352, _state353, _state354, _state355, _state356, _state357, _state358, _state359, \
+	_state183, _state361, _state359, _state363, _state277, _state365, _state366, _state367, \
+	_state368, _state369, _state370, _state79, _state192, _state373, _state192, _state375, \
+	_state376, _state377, _state378, _state379, _state380, _state381, _state382, _state383, \
+	_state384, _state385, _state206, _state206, _state388, _state389, _state390, _state391, \
+	_state392, _state393, _state394, _state395, _state396, _state397, _state398, _state399, \
+	_state245, _state401, _state402, _state403, _state242, _state405, _state246, _state407, \
+	_state246, _state246, _state410, _state245, _state242, _state242, _state242, _state277, \
+	_state242, _state242, _state418, _state419, _state420, _state420, _state422, _state277, \
+	_state309, _state425, _state426, _state427, _state428, _state420, _state430, _state431, \
+	_state432, _state433, _state434, _state435, _state436, _state437, _state438, _state439, \
+	_state440, _state441, _state442, _state443, _state388, _state103, _state446, _state40, \
+	_state448, _state212, _state41, _state388, _state388, _state453, _state454, _state455, \
+	_state456, _state457, _state292, _state459, _state460, _state461, _state103, _state463, \
+	_state464, _state465, _state466, _state467, _state468, _state469, _state470, _state471, \
+	_state472, _state473, _state309, _state475, _state476, _state477, _state181, _state479, \
+	_state480, _state481, _state482, _state483, _state484, _state485, _state344, _state487, \
+	_state488, _state489, _state490, _state491, _state492, _state493, _state494, _state495, \
+	_state496, _state497, _state498, _state136, _state500, _state501, _state502, _state503, \
+	_state504, _state505, _state506, _state507, _state508, _state509, _state510, _state511, \
+	_state512, _state513, _state514, _state192, _state516, _state517, _state518, _state519, \
+	_state520, _state521, _state522, _state523, _state524, _state390, _state526, _state527, \
+	_state528, _state529, _state530, _state245, _state532, _state533, _state534, _state535, \
+	_state536, _state418, _state407, _state388, _state388, _state541, _state542, _state543, \
+	_state544, _state545, _state546, _state547, _state548, _state549, _state550, _state242, \
+	_state552, _state553, _state554, _state555, _state556, _state557, _state558, _state559, \
+	_state103, _state561, _state562, _state563, _state564, _state565, _state566, _state567, \
+	_state277, _state74, _state570, _state571, _state572, _state573, _state574, _state575, \
+	_state576, _state577, _state578, _state579, _state580, _state581, _state582, _state583, \
+	_state584, _state585, _state586, _state587, _state588, _state589, _state590, _state591, \
+	_state592, _state593, _state594, _state595, _state74, _state292, _state292, _state599, \
+	_state600, \
+)
@@ -2,44 +2,109 @@
 
 import lojbanParser
 import sys
+import zlib
+from pathlib import Path
 from datetime import datetime
 
 if __name__ == '__main__':
 	starttime = datetime.now()
-	txt = ""
 	argv = sys.argv[1:]
-	infile = None
+	# --workers N parses each input file as a separate document in N processes
+	workers = None
+	if "--workers" in argv:
+		iarg = argv.index("--workers")
+		try:
+			workers = int(argv[iarg + 1])
+		except (IndexError, ValueError) as e:
+			print("Error: argument --workers requires an integer value.")
+			sys.exit(1)
+		# end try except (IndexError, ValueError) as e:
+		del argv[iarg:iarg + 2]
+	# end if "--workers" in argv:
+	# --tokencache FILE keeps the lexed tokens of the input file in FILE, and
+	# replays them instead of lexing again while the stamps of FILE (version,
+	# lexer and parameters, size and CRC-32 of the input) still match
+	tokencache = None
+	if "--tokencache" in argv:
+		iarg = argv.index("--tokencache")
+		if iarg + 1 >= len(argv):
+			print("Error: argument --tokencache requires a file name.")
+			sys.exit(1)
+		# end if iarg + 1 >= len(argv):
+		tokencache = Path(argv[iarg + 1])
+		del argv[iarg:iarg + 2]
+	# end if "--tokencache" in argv:
+	infiles = []
 	for arg in argv:
 		if not arg.startswith("-"):
-			if not infile:
-				infile = arg
-			else: # if not infile:
-				print("Error: multiple input files (infile=" + infile + " current arg=" + arg+ ".")
+			if not infiles or workers:
+				infiles.append(arg)
+			else: # if not infiles or workers:
+				print("Error: multiple input files (infile=" + infiles[0] + " current arg=" + arg+ ".")
 				sys.exit(1)
-			# end if not infile:
+			# end if not infiles or workers:
 		# end if not arg.startswith("-"):
 	# end for arg in argv:
-	if infile:
-		del argv[argv.index(infile)]
-	else: # if infile:
+	if infiles:
+		for infile in infiles:
+			del argv[argv.index(infile)]
+		# end for infile in infiles:
+	else: # if infiles:
 		print("No input file given.")
 		sys.exit(1)
-	# end if infile:
-	try:
-		with open(infile, "r") as file:
-			txt = file.read()
-		# end with open(infile, "r") as file:
-	except Exception as e:
-		print(e)
-		sys.exit(1)
-	# end try except Exception as e:
+	# end if infiles:
 
 	parser = lojbanParser.LojbanParser()
 	parser.setparameters(*argv)
+	if workers:
+		starttimep = datetime.now()
+		failures = 0
+		for (index, output, errors) in parser.parseMany( \
+				[Path(infile) for infile in infiles], workers):
+			if len(infiles) > 1:
+				print("==> {:s} <==".format(infiles[index]))
+			# end if len(infiles) > 1:
+			if not output is None:
+				print(output, end = "")
+			# end if not output is None:
+			for error in errors:
+				print("{:s}: {:s}".format(infiles[index], str(error)), file = sys.stderr)
+			# end for error in errors:
+			failures += 1 if output is None else 0
+		# end for (index, output, errors) in parser.parseMany(...):
+		endtime = datetime.now()
+		print("Documents: {:d}, failed: {:d}.".format(len(infiles), failures), \
+			file = sys.stderr)
+		print("Time for parsing: {:s}.".format(str(endtime - starttimep)), file = sys.stderr) 
+		sys.exit(0)
+	# end if workers:
+	infile = infiles[0]
 	starttimep = datetime.now()
-	t = parser.parseString(txt)
+	try:
+		if tokencache is None:
+			t = parser.parseFile(infile)
+		else: # if tokencache is None:
+			data = Path(infile).read_bytes()
+			try:
+				source = lojbanParser.TokenStream.fromfile(tokencache)
+			except (OSError, lojbanParser.LojbanException) as e:
+				source = None
+			# end try except (OSError, lojbanParser.LojbanException) as e:
+			if source is None or source.stamp != parser.streamstamp or \
+					source.sourcesize != len(data) or \
+					source.sourcecrc != zlib.crc32(data):
+				source = parser.tokenize(data)
+				source.tofile(tokencache)
+			# end if source is None or ...:
+			t = parser.parse(source)
+		# end if tokencache is None:
+	except OSError as e:
+		print(e)
+		sys.exit(1)
+	# end try except OSError as e:
 	endtimep = datetime.now()
-	if t:
+	# with --recover, t is the list of the trees of the sentences that parsed
+	for t in (t if isinstance(t, list) else [t] if t else []):
 		if parser.treemode:
 			parser.tprint(t)
 		elif parser.rulemode:
@@ -47,8 +112,8 @@ if __name__ == '__main__':
 		else:
 			parser.print(t)
 	endtime = datetime.now()
-	print("Space used: {:d} bytes for tokens, {:d} bytes for strings.".format(\
-		parser.tokspace, parser.stringspace), file = sys.stderr) 
+	print("Space used: {:d} bytes for tokens, {:d} bytes for strings ({:d} before interning).".format(\
+		parser.tokspace, parser.stringspace, parser.stringtotalspace), file = sys.stderr) 
 	print("Time for parsing: {:s}.".format(str(endtimep - starttimep)), file = sys.stderr) 
 	print("Time total      : {:s}.".format(str(endtime - starttime)), file = sys.stderr) ## TODO removed for DEBUG
 